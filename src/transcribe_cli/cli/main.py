@@ -7,13 +7,17 @@ Implements ADR-004: CLI Framework Selection (Typer)
 """
 
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, Union
 
 import typer
 from rich.console import Console
 
 from transcribe_cli import __version__
 
+if TYPE_CHECKING:
+    from transcribe_cli.config import Settings
+    from transcribe_cli.core import EventStream
+
 app = typer.Typer(
     name="transcribe",
     help="Transcribe audio and video files using OpenAI Whisper API.",
@@ -23,6 +27,34 @@ app = typer.Typer(
 console = Console()
 
 
+def _open_events(target: Optional[str]) -> "Optional[EventStream]":
+    """Open the --events-jsonl stream.
+
+    With "-" the records own stdout, so console output moves to stderr
+    until the command's finally block moves it back.
+    """
+    if target is None:
+        return None
+    from transcribe_cli.core import EventStream
+
+    if target == "-":
+        console.stderr = True
+    return EventStream.open(target)
+
+
+def _settings() -> "Settings":
+    """Config file and environment values for options not given on the line."""
+    from pydantic import ValidationError
+
+    from transcribe_cli.config import get_settings
+
+    try:
+        return get_settings(require_api_key=False)
+    except ValidationError as e:
+        console.print(f"[red]Error:[/red] Invalid configuration: {e}")
+        raise typer.Exit(1)
+
+
 def version_callback(value: bool) -> None:
     """Display version and exit."""
     if value:
@@ -75,6 +107,29 @@ def transcribe(
         "-l",
         help="Language code (e.g., 'en', 'es') or 'auto' for detection.",
     ),
+    chunk_minutes: Optional[int] = typer.Option(
+        None,
+        "--chunk-minutes",
+        help="Chunk length in minutes for audio over the 25MB API limit "
+        "(default: chunk_size_minutes from config, 10).",
+        min=1,
+    ),
+    profile: str = typer.Option(
+        "speech-mp3",
+        "--profile",
+        "-p",
+        help="Encoding for extracted audio: speech-mp3, speech-opus, speech-webm, mp3, wav, fit",
+    ),
+    no_remux: bool = typer.Option(
+        False,
+        "--no-remux",
+        help="Always re-encode video audio instead of copying compatible streams.",
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Bypass the transcript cache.",
+    ),
     verbose: bool = typer.Option(
         False,
         "--verbose",
@@ -91,22 +146,34 @@ def transcribe(
     from transcribe_cli.core import (
         APIKeyMissingError,
         FFmpegNotFoundError,
+        PROFILE_NAMES,
         FileTooLargeError,
+        TranscriptCache,
         TranscriptionError,
         UnsupportedFormatError,
         get_media_info,
         is_video_file,
         save_transcript,
+        sweep_orphans,
         transcribe_file,
     )
 
     from transcribe_cli.output import save_formatted_transcript
 
+    settings = _settings()
+    if chunk_minutes is None:
+        chunk_minutes = settings.chunk_size_minutes
+
     # Validate output format
     if format not in ("txt", "srt"):
         console.print(f"[red]Error:[/red] Unsupported format '{format}'. Use 'txt' or 'srt'.")
         raise typer.Exit(1)
 
+    if profile not in PROFILE_NAMES:
+        choices = ", ".join(PROFILE_NAMES)
+        console.print(f"[red]Error:[/red] Unknown profile '{profile}'. Use one of: {choices}.")
+        raise typer.Exit(1)
+
     try:
         # Show file info if verbose
         if verbose:
@@ -122,6 +189,9 @@ def transcribe(
             except Exception:
                 pass  # Don't fail on info gathering
 
+        # Remove chunk directories left behind by killed runs
+        sweep_orphans()
+
         console.print(f"[bold blue]Transcribing:[/bold blue] {file}")
 
         # Determine output path
@@ -139,6 +209,10 @@ def transcribe(
                 input_path=file,
                 output_path=output_path,
                 language=language,
+                chunk_size_minutes=chunk_minutes,
+                cache=None if no_cache else TranscriptCache.default(),
+                encoding_profile=profile,
+                stream_copy=not no_remux,
             )
 
         # Save transcript with formatter (supports SRT)
@@ -185,11 +259,17 @@ def extract(
         "-o",
         help="Output audio file path.",
     ),
-    format: str = typer.Option(
-        "mp3",
+    format: Optional[str] = typer.Option(
+        None,
         "--format",
         "-f",
-        help="Output audio format: mp3, wav",
+        help="Output audio format: mp3, wav (default: copy compatible audio, else mp3)",
+    ),
+    profile: Optional[str] = typer.Option(
+        None,
+        "--profile",
+        "-p",
+        help="Encoding profile (overrides --format): speech-mp3, speech-opus, speech-webm, mp3, wav, fit",
     ),
     verbose: bool = typer.Option(
         False,
@@ -203,8 +283,10 @@ def extract(
         transcribe extract video.mkv
         transcribe extract video.mp4 --output audio.mp3
         transcribe extract video.avi --format wav
+        transcribe extract lecture.mkv --profile fit
     """
     from transcribe_cli.core import (
+        PROFILE_NAMES,
         ExtractionError,
         FFmpegNotFoundError,
         FFmpegVersionError,
@@ -212,13 +294,20 @@ def extract(
         UnsupportedFormatError,
         extract_audio,
         get_media_info,
+        resolve_profile,
     )
+    from transcribe_cli.core.transcriber import MAX_FILE_SIZE_BYTES
 
     # Validate format
-    if format not in ("mp3", "wav"):
+    if format is not None and format not in ("mp3", "wav"):
         console.print(f"[red]Error:[/red] Unsupported format '{format}'. Use 'mp3' or 'wav'.")
         raise typer.Exit(1)
 
+    if profile is not None and profile not in PROFILE_NAMES:
+        choices = ", ".join(PROFILE_NAMES)
+        console.print(f"[red]Error:[/red] Unknown profile '{profile}'. Use one of: {choices}.")
+        raise typer.Exit(1)
+
     try:
         # Show file info if verbose
         if verbose:
@@ -230,15 +319,26 @@ def extract(
 
         console.print(f"[bold blue]Extracting audio from:[/bold blue] {file}")
 
+        # "fit" needs the duration to choose a bitrate under the API limit
+        encoding = None
+        if profile is not None:
+            duration = get_media_info(file).duration if profile == "fit" else None
+            encoding = resolve_profile(profile, duration, MAX_FILE_SIZE_BYTES)
+            if verbose and encoding.bitrate:
+                console.print(f"[dim]  Profile: {encoding.name} ({encoding.bitrate})[/dim]")
+
         # Perform extraction
         result = extract_audio(
             input_path=file,
             output_path=output,
-            output_format=format,  # type: ignore
+            output_format=format or "mp3",  # type: ignore
+            profile=encoding,
+            stream_copy=format is None and profile is None,
         )
 
         console.print(f"[green]Success![/green] Audio extracted to: {result.output_path}")
         if verbose:
+            console.print(f"[dim]  Method: {result.method}[/dim]")
             console.print(f"[dim]  Size: {result.file_size_display}[/dim]")
             if result.duration:
                 console.print(f"[dim]  Duration: {result.duration:.1f}s[/dim]")
@@ -284,13 +384,54 @@ def batch(
         "-f",
         help="Output format: txt, srt",
     ),
-    concurrency: int = typer.Option(
-        5,
+    concurrency: str = typer.Option(
+        "5",
         "--concurrency",
         "-c",
-        help="Maximum concurrent transcriptions (1-20).",
+        help="Maximum concurrent transcriptions (1-20), or 'auto' to adapt to the API.",
+    ),
+    max_concurrency: int = typer.Option(
+        64,
+        "--max-concurrency",
+        help="Ceiling for --concurrency auto.",
         min=1,
-        max=20,
+        max=256,
+    ),
+    extract_jobs: Optional[int] = typer.Option(
+        None,
+        "--extract-jobs",
+        help="Concurrent FFmpeg extractions (default: one per available CPU).",
+        min=1,
+    ),
+    extract_timeout: float = typer.Option(
+        3600,
+        "--extract-timeout",
+        help="Kill an FFmpeg job running longer than this many seconds (0 = no limit).",
+        min=0,
+    ),
+    stall_timeout: float = typer.Option(
+        60,
+        "--stall-timeout",
+        help="Kill an FFmpeg job that makes no progress for this many seconds (0 = no limit).",
+        min=0,
+    ),
+    max_inflight_mb: int = typer.Option(
+        256,
+        "--max-inflight-mb",
+        help="Budget for extracted audio and upload bodies held at once (0 = no limit).",
+        min=0,
+    ),
+    scratch_dir: Optional[Path] = typer.Option(
+        None,
+        "--scratch-dir",
+        help="Directory for chunk files (default: tmpfs if it has room, else the temp dir).",
+        file_okay=False,
+    ),
+    scratch_budget_mb: int = typer.Option(
+        2048,
+        "--scratch-budget-mb",
+        help="Chunk files held in scratch at once; splits wait for room (0 = no limit).",
+        min=0,
     ),
     recursive: bool = typer.Option(
         False,
@@ -298,6 +439,72 @@ def batch(
         "-r",
         help="Recursively scan subdirectories.",
     ),
+    chunk_minutes: Optional[int] = typer.Option(
+        None,
+        "--chunk-minutes",
+        help="Chunk length in minutes for audio over the 25MB API limit "
+        "(default: chunk_size_minutes from config, 10).",
+        min=1,
+    ),
+    profile: str = typer.Option(
+        "speech-mp3",
+        "--profile",
+        "-p",
+        help="Encoding for extracted audio: speech-mp3, speech-opus, speech-webm, mp3, wav, fit",
+    ),
+    no_remux: bool = typer.Option(
+        False,
+        "--no-remux",
+        help="Always re-encode video audio instead of copying compatible streams.",
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Bypass the transcript cache.",
+    ),
+    requests_per_minute: int = typer.Option(
+        500,
+        "--requests-per-minute",
+        help="Maximum API requests per minute across all workers.",
+        min=1,
+    ),
+    audio_seconds_per_minute: Optional[int] = typer.Option(
+        None,
+        "--audio-seconds-per-minute",
+        help="Maximum seconds of audio uploaded per minute (default: no limit).",
+        min=1,
+    ),
+    resume: bool = typer.Option(
+        False,
+        "--resume",
+        help="Skip files completed by an earlier run and retry failed ones last.",
+    ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help="Skip files whose transcript is newer than the source.",
+    ),
+    check_hash: bool = typer.Option(
+        False,
+        "--check-hash",
+        help="With --incremental, also skip sources whose content is unchanged.",
+    ),
+    schedule: str = typer.Option(
+        "scan",
+        "--schedule",
+        help="Dispatch order: scan, path, longest, shortest, largest, newest, round-robin",
+    ),
+    dedup: bool = typer.Option(
+        False,
+        "--dedup",
+        help="Transcribe byte-identical files once and write every copy's transcript.",
+    ),
+    events_jsonl: Optional[str] = typer.Option(
+        None,
+        "--events-jsonl",
+        help="Append a JSON line per stage transition and finished file to PATH ('-' = stdout).",
+        metavar="PATH",
+    ),
     dry_run: bool = typer.Option(
         False,
         "--dry-run",
@@ -315,75 +522,134 @@ def batch(
         transcribe batch ./recordings
         transcribe batch ./videos --format srt --concurrency 3
         transcribe batch ./media --recursive --dry-run
+        transcribe batch ./archive --output-dir ./transcripts --resume
+        transcribe batch ./archive --recursive --incremental
+        transcribe batch ./lectures --schedule longest --concurrency 8
+        transcribe batch ./archive --concurrency auto --max-concurrency 40
+        transcribe batch ./ingest --recursive --dedup
     """
     from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 
     from transcribe_cli.core import (
+        PROFILE_NAMES,
+        SCHEDULE_POLICIES,
         APIKeyMissingError,
+        BatchJournal,
+        JobTimeouts,
+        TranscriptCache,
+        available_cpus,
+        configure_rate_limiter,
+        configure_scratch,
+        iter_media_files,
+        order_files,
+        plan_incremental,
         process_directory,
-        scan_directory,
+        sweep_orphans,
     )
 
+    settings = _settings()
+    if chunk_minutes is None:
+        chunk_minutes = settings.chunk_size_minutes
+
     # Validate output format
     if format not in ("txt", "srt"):
         console.print(f"[red]Error:[/red] Unsupported format '{format}'. Use 'txt' or 'srt'.")
         raise typer.Exit(1)
 
-    # Scan directory first to show file count
-    try:
-        files = scan_directory(directory, recursive=recursive)
-    except FileNotFoundError as e:
-        console.print(f"[red]Error:[/red] {e}")
+    if profile not in PROFILE_NAMES:
+        choices = ", ".join(PROFILE_NAMES)
+        console.print(f"[red]Error:[/red] Unknown profile '{profile}'. Use one of: {choices}.")
         raise typer.Exit(1)
 
-    if not files:
+    jobs: Union[int, str] = "auto"
+    if concurrency != "auto":
+        try:
+            jobs = int(concurrency)
+        except ValueError:
+            jobs = 0
+        if not 1 <= jobs <= 20:
+            console.print(
+                f"[red]Error:[/red] Invalid concurrency '{concurrency}'. "
+                "Use 1-20 or 'auto'."
+            )
+            raise typer.Exit(1)
+
+    if schedule not in SCHEDULE_POLICIES:
+        choices = ", ".join(SCHEDULE_POLICIES)
+        console.print(f"[red]Error:[/red] Unknown schedule '{schedule}'. Use one of: {choices}.")
+        raise typer.Exit(1)
+
+    if check_hash and not incremental:
+        console.print("[red]Error:[/red] --check-hash requires --incremental.")
+        raise typer.Exit(1)
+
+    def report_empty() -> None:
         console.print(f"[yellow]No audio/video files found in:[/yellow] {directory}")
         if recursive:
             console.print("[dim]  (searched recursively)[/dim]")
-        raise typer.Exit(0)
-
-    # Calculate total size for display
-    total_size = sum(f.stat().st_size for f in files)
-    size_mb = total_size / (1024 * 1024)
 
     console.print(f"[bold blue]Batch processing:[/bold blue] {directory}")
-    console.print(f"[dim]Found {len(files)} file(s) ({size_mb:.1f} MB total)[/dim]")
     if recursive:
         console.print("[dim]  (recursive scan)[/dim]")
 
-    # Dry run mode - show files and exit
+    # Dry run mode - scan (one stat per file), show files and exit
     if dry_run:
+        try:
+            entries = sorted(iter_media_files(directory, recursive), key=lambda e: e.path)
+        except FileNotFoundError as e:
+            console.print(f"[red]Error:[/red] {e}")
+            raise typer.Exit(1)
+
+        if not entries:
+            report_empty()
+            raise typer.Exit(0)
+
+        size_mb = sum(e.size for e in entries) / (1024 * 1024)
+        console.print(f"[dim]Found {len(entries)} file(s) ({size_mb:.1f} MB total)[/dim]")
         console.print()
         console.print("[bold yellow]DRY RUN[/bold yellow] - No files will be processed")
         console.print()
-        for f in files:
-            file_size = f.stat().st_size / (1024 * 1024)
-            rel_path = f.relative_to(directory) if recursive else f.name
-            console.print(f"  [dim]{rel_path}[/dim] ({file_size:.2f} MB)")
+        if schedule != "scan":
+            entries = order_files(entries, schedule)
+        root = directory.resolve()
+        for e in entries:
+            rel_path = e.path.relative_to(root) if recursive else e.path.name
+            console.print(f"  [dim]{rel_path}[/dim] ({e.size / (1024 * 1024):.2f} MB)")
         console.print()
-        console.print(f"[dim]Would process {len(files)} files with concurrency {concurrency}[/dim]")
+        files = [e.path for e in entries]
+        pending = files
+        if incremental:
+            pending, current = plan_incremental(
+                files,
+                output_dir.resolve() if output_dir else None,
+                format,
+                BatchJournal.for_directory(output_dir or directory),
+                check_hash,
+            )
+            console.print(f"[dim]Up to date: {len(current)} file(s) would be skipped[/dim]")
+        console.print(f"[dim]Would process {len(pending)} files with concurrency {concurrency}[/dim]")
         console.print(f"[dim]Output format: {format}[/dim]")
         raise typer.Exit(0)
 
+    events = None
     try:
-        console.print(f"[dim]Concurrency: {concurrency}[/dim]")
-
+        events = _open_events(events_jsonl)
+        if jobs == "auto":
+            console.print(f"[dim]Concurrency: auto (up to {max_concurrency})[/dim]")
+        else:
+            console.print(f"[dim]Concurrency: {jobs}[/dim]")
+        cpus = available_cpus()
+        console.print(f"[dim]Extraction: {extract_jobs or cpus} job(s) on {cpus} CPU(s)[/dim]")
+        configure_rate_limiter(requests_per_minute, audio_seconds_per_minute)
+        space = configure_scratch(scratch_dir, scratch_budget_mb * 1024 * 1024 or None)
+        swept = sweep_orphans()
         if verbose:
-            for f in files:
-                console.print(f"[dim]  - {f.name}[/dim]")
+            console.print(f"[dim]Scratch: {space.root}[/dim]")
+            if swept:
+                console.print(f"[dim]Removed {swept} orphaned scratch directories[/dim]")
 
-        # Track progress
-        completed = 0
-        failed_files: list[tuple[Path, str]] = []
-
-        def progress_callback(path: Path, status: str) -> None:
-            nonlocal completed
-            if status == "completed":
-                completed += 1
-            elif status == "failed":
-                completed += 1
-
-        # Process with progress bar
+        # Process with progress bar; the scan feeds workers as it goes, so
+        # the total grows until the scan finishes
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -391,15 +657,21 @@ def batch(
             TaskProgressColumn(),
             console=console,
         ) as progress:
-            task = progress.add_task(
-                f"[green]Processing {len(files)} files...",
-                total=len(files),
-            )
+            task = progress.add_task("[green]Scanning...", total=None)
+            found = 0
 
-            # Custom callback to update progress
             def update_progress(path: Path, status: str) -> None:
-                progress_callback(path, status)
-                if status in ("completed", "failed"):
+                nonlocal found
+                if status == "found":
+                    found += 1
+                    progress.update(
+                        task,
+                        total=found,
+                        description=f"[green]Processing {found} files...",
+                    )
+                    if verbose:
+                        progress.console.print(f"[dim]  - {path.name}[/dim]")
+                elif status in ("completed", "failed", "skipped"):
                     progress.update(task, advance=1)
 
             # Run batch processing
@@ -407,30 +679,121 @@ def batch(
                 directory=directory,
                 output_dir=output_dir,
                 output_format=format,  # type: ignore
-                concurrency=concurrency,
+                concurrency=jobs,  # type: ignore
+                max_concurrency=max_concurrency,
+                max_in_flight_bytes=max_inflight_mb * 1024 * 1024 or None,
+                extract_jobs=extract_jobs,
+                extract_timeouts=JobTimeouts(extract_timeout, stall_timeout),
                 recursive=recursive,
                 progress_callback=update_progress,
+                chunk_size_minutes=chunk_minutes,
+                warm_up=True,
+                cache=None if no_cache else TranscriptCache.default(),
+                encoding_profile=profile,
+                stream_copy=not no_remux,
+                journal=BatchJournal.for_directory(output_dir or directory),
+                resume=resume,
+                incremental=incremental,
+                check_hash=check_hash,
+                keep_results=False,
+                schedule=schedule,
+                dedup=dedup,
+                events=events,
             )
 
+        if summary.total_files == 0:
+            report_empty()
+            raise typer.Exit(0)
+
+        size_mb = summary.total_bytes / (1024 * 1024)
+        console.print(f"[dim]Found {summary.total_files} file(s) ({size_mb:.1f} MB total)[/dim]")
+
         # Show summary
         console.print()
         console.print("[bold]Batch Processing Complete[/bold]")
         console.print(f"  [green]Successful:[/green] {summary.successful}")
         console.print(f"  [red]Failed:[/red] {summary.failed}")
+        if summary.skipped:
+            console.print(f"  [dim]Skipped (up to date):[/dim] {summary.skipped}")
         console.print(f"  [dim]Total:[/dim] {summary.total_files}")
 
+        pacing = summary.rate_limit
+        if pacing is not None and (pacing.throttled or pacing.total_wait_seconds >= 1):
+            console.print(
+                f"  [dim]Rate limited:[/dim] {pacing.throttled} throttled response(s), "
+                f"{pacing.total_wait_seconds:.1f}s waiting, "
+                f"pacing {pacing.requests_per_minute:.0f}/"
+                f"{pacing.configured_requests_per_minute:.0f} req/min"
+            )
+
+        trajectory = summary.concurrency_trajectory
+        if trajectory:
+            peak = max(limit for _, limit in trajectory)
+            console.print(
+                f"  [dim]Concurrency:[/dim] {trajectory[0][1]} → {trajectory[-1][1]} "
+                f"(peak {peak}, {len(trajectory) - 1} change(s))"
+            )
+            if verbose:
+                steps = ", ".join(f"{limit}@{seconds:.0f}s" for seconds, limit in trajectory)
+                console.print(f"    [dim]{steps}[/dim]")
+
+        if summary.byte_budget_wait_seconds >= 1:
+            console.print(
+                f"  [dim]Byte budget:[/dim] peak "
+                f"{summary.peak_in_flight_bytes / (1024 * 1024):.1f} MB in flight, "
+                f"{summary.byte_budget_wait_seconds:.1f}s waiting for room"
+            )
+
+        if summary.duplicates:
+            console.print(
+                f"  [dim]Duplicates:[/dim] {summary.duplicates} file(s) reused a "
+                f"transcript, {summary.duplicate_bytes_saved / (1024 * 1024):.1f} MB "
+                f"and {summary.api_calls_saved} API call(s) saved"
+            )
+
+        if summary.extraction_timeouts:
+            console.print(
+                f"  [dim]Extraction timeouts:[/dim] {summary.extraction_timeouts} "
+                "file(s) killed for running too long or stalling"
+            )
+
+        idle = summary.worker_idle_seconds
+        if idle and summary.total_files > summary.skipped:
+            console.print(
+                f"  [dim]Worker idle:[/dim] avg {sum(idle) / len(idle):.1f}s, "
+                f"max {max(idle):.1f}s of {summary.elapsed_seconds:.1f}s"
+            )
+            if verbose:
+                for i, seconds in enumerate(idle, 1):
+                    console.print(f"    [dim]worker {i}: {seconds:.1f}s idle[/dim]")
+
+        if verbose and summary.stages:
+            console.print("  [dim]Stages:[/dim]")
+            for stage in summary.stages:
+                console.print(
+                    f"    [dim]{stage.name}: {stage.completed} file(s), "
+                    f"limit {stage.limit}, peak {stage.peak_active}, "
+                    f"busy {stage.busy_seconds:.1f}s, waiting {stage.wait_seconds:.1f}s, "
+                    f"blocked {stage.blocked_seconds:.1f}s[/dim]"
+                )
+
         if summary.failed > 0:
             console.print()
             console.print("[bold red]Failed files:[/bold red]")
             for result in summary.results:
                 if not result.success:
-                    console.print(f"  [red]✗[/red] {result.input_path.name}")
+                    note = " [dim](timed out)[/dim]" if result.timed_out else ""
+                    if result.duplicate_of is not None:
+                        note = f" [dim](copy of {result.duplicate_of.name})[/dim]"
+                    console.print(f"  [red]✗[/red] {result.input_path.name}{note}")
                     if verbose and result.error:
                         console.print(f"    [dim]{result.error}[/dim]")
 
         if summary.failed > 0:
             raise typer.Exit(1)
 
+    except typer.Exit:
+        raise
     except APIKeyMissingError as e:
         console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(1)
@@ -440,6 +803,317 @@ def batch(
     except Exception as e:
         console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(1)
+    finally:
+        if events is not None:
+            events.close()
+        console.stderr = False
+
+
+@app.command()
+def watch(
+    directory: Path = typer.Argument(
+        ...,
+        help="Directory to watch for new audio/video files.",
+        exists=True,
+        file_okay=False,
+        dir_okay=True,
+    ),
+    output_dir: Optional[Path] = typer.Option(
+        None,
+        "--output-dir",
+        "-o",
+        help="Output directory for transcripts.",
+    ),
+    format: str = typer.Option(
+        "txt",
+        "--format",
+        "-f",
+        help="Output format: txt, srt",
+    ),
+    concurrency: int = typer.Option(
+        5,
+        "--concurrency",
+        "-c",
+        help="Maximum concurrent transcriptions (1-20).",
+        min=1,
+        max=20,
+    ),
+    extract_jobs: Optional[int] = typer.Option(
+        None,
+        "--extract-jobs",
+        help="Concurrent FFmpeg extractions (default: one per available CPU).",
+        min=1,
+    ),
+    recursive: bool = typer.Option(
+        False,
+        "--recursive",
+        "-r",
+        help="Also watch subdirectories, including new ones.",
+    ),
+    settle_seconds: float = typer.Option(
+        2.0,
+        "--settle-seconds",
+        help="Wait until a file's size and mtime are unchanged for this long.",
+        min=0,
+    ),
+    poll_seconds: float = typer.Option(
+        5.0,
+        "--poll-seconds",
+        help="Rescan interval when polling instead of using inotify.",
+        min=0.1,
+    ),
+    polling: bool = typer.Option(
+        False,
+        "--polling",
+        help="Poll the directory even where inotify is available (e.g. network mounts).",
+    ),
+    chunk_minutes: Optional[int] = typer.Option(
+        None,
+        "--chunk-minutes",
+        help="Chunk length in minutes for audio over the 25MB API limit "
+        "(default: chunk_size_minutes from config, 10).",
+        min=1,
+    ),
+    profile: str = typer.Option(
+        "speech-mp3",
+        "--profile",
+        "-p",
+        help="Encoding for extracted audio: speech-mp3, speech-opus, speech-webm, mp3, wav, fit",
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Bypass the transcript cache.",
+    ),
+    events_jsonl: Optional[str] = typer.Option(
+        None,
+        "--events-jsonl",
+        help="Append a JSON line per stage transition and finished file to PATH ('-' = stdout).",
+        metavar="PATH",
+    ),
+    verbose: bool = typer.Option(
+        False,
+        "--verbose",
+        help="Enable verbose output.",
+    ),
+) -> None:
+    """Transcribe audio/video files as they land in a directory.
+
+    Files already present are transcribed first unless their transcript is
+    up to date. Runs until interrupted; press Ctrl-C once to finish the
+    files in progress and print a summary.
+
+    Examples:
+        transcribe watch ./inbox
+        transcribe watch ./ingest --recursive --output-dir ./transcripts
+        transcribe watch /mnt/share/uploads --polling --poll-seconds 30
+    """
+    import signal
+
+    from transcribe_cli.core import (
+        DEFAULT_KEEP_WARM_SECONDS,
+        POLLING,
+        PROFILE_NAMES,
+        APIKeyMissingError,
+        BatchJournal,
+        BatchResult,
+        FFmpegNotFoundError,
+        FFmpegVersionError,
+        MediaWatcher,
+        TranscriptCache,
+        process_batch,
+        sweep_orphans,
+        validate_ffmpeg,
+    )
+
+    settings = _settings()
+    if chunk_minutes is None:
+        chunk_minutes = settings.chunk_size_minutes
+
+    if format not in ("txt", "srt"):
+        console.print(f"[red]Error:[/red] Unsupported format '{format}'. Use 'txt' or 'srt'.")
+        raise typer.Exit(1)
+
+    if profile not in PROFILE_NAMES:
+        choices = ", ".join(PROFILE_NAMES)
+        console.print(f"[red]Error:[/red] Unknown profile '{profile}'. Use one of: {choices}.")
+        raise typer.Exit(1)
+
+    events = None
+    try:
+        events = _open_events(events_jsonl)
+        watcher = MediaWatcher(
+            directory,
+            recursive=recursive,
+            settle_seconds=settle_seconds,
+            poll_seconds=poll_seconds,
+            backend=POLLING if polling else None,
+        )
+
+        # Resolve the toolchain once; every file reuses it
+        try:
+            info = validate_ffmpeg()
+            if verbose:
+                console.print(f"[dim]FFmpeg {info.version_string}[/dim]")
+        except (FFmpegNotFoundError, FFmpegVersionError) as e:
+            console.print(f"[yellow]Warning:[/yellow] {e}")
+            console.print("[dim]  Video files will fail until FFmpeg is available.[/dim]")
+        sweep_orphans()
+
+        console.print(f"[bold blue]Watching:[/bold blue] {watcher.directory}")
+        console.print(
+            f"[dim]  ({watcher.backend}{', recursive' if recursive else ''}; "
+            "Ctrl-C to stop)[/dim]"
+        )
+
+        def on_result(result: BatchResult) -> None:
+            if result.success:
+                console.print(f"  [green]✓[/green] {result.input_path.name} → {result.output_path}")
+            else:
+                note = " [dim](timed out)[/dim]" if result.timed_out else ""
+                console.print(f"  [red]✗[/red] {result.input_path.name}{note}")
+                if verbose and result.error:
+                    console.print(f"    [dim]{result.error}[/dim]")
+
+        def on_progress(path: Path, status: str) -> None:
+            if verbose and status == "started":
+                console.print(f"[dim]  - {path.name}[/dim]")
+
+        def request_stop(signum: int, frame: object) -> None:
+            console.print("[dim]Stopping after the files in progress...[/dim]")
+            watcher.stop()
+            # A second Ctrl-C interrupts immediately
+            signal.signal(signal.SIGINT, previous)
+
+        previous = signal.signal(signal.SIGINT, request_stop)
+        try:
+            summary = process_batch(
+                files=watcher,
+                output_dir=output_dir,
+                output_format=format,  # type: ignore
+                concurrency=concurrency,
+                extract_jobs=extract_jobs,
+                progress_callback=on_progress,
+                result_callback=on_result,
+                chunk_size_minutes=chunk_minutes,
+                cache=None if no_cache else TranscriptCache.default(),
+                encoding_profile=profile,
+                journal=BatchJournal.for_directory(output_dir or directory),
+                incremental=True,
+                keep_results=False,
+                keep_warm_seconds=DEFAULT_KEEP_WARM_SECONDS,
+                events=events,
+            )
+        finally:
+            signal.signal(signal.SIGINT, previous)
+
+        console.print()
+        console.print("[bold]Watch Stopped[/bold]")
+        console.print(f"  [green]Successful:[/green] {summary.successful}")
+        console.print(f"  [red]Failed:[/red] {summary.failed}")
+        if summary.skipped:
+            console.print(f"  [dim]Skipped (up to date):[/dim] {summary.skipped}")
+
+        if summary.failed > 0:
+            raise typer.Exit(1)
+
+    except typer.Exit:
+        raise
+    except APIKeyMissingError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    except (FileNotFoundError, ValueError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    finally:
+        if events is not None:
+            events.close()
+        console.stderr = False
+
+
+cache_app = typer.Typer(
+    name="cache",
+    help="Manage the transcript cache.",
+    no_args_is_help=True,
+)
+app.add_typer(cache_app)
+
+
+@cache_app.command("stats")
+def cache_stats() -> None:
+    """Show transcript cache location, entry count and size.
+
+    Examples:
+        transcribe cache stats
+    """
+    from transcribe_cli.core import ProbeCache, TranscriptCache
+
+    stats = TranscriptCache.default().stats()
+    console.print("[bold]Transcript Cache[/bold]")
+    console.print(f"  [bold]Location:[/bold] {stats.directory}")
+    console.print(f"  [bold]Entries:[/bold] {stats.entries}")
+    console.print(f"  [bold]Size:[/bold] {stats.total_mb:.1f} MB / {stats.max_mb:.0f} MB")
+
+    probes = ProbeCache.default()
+    console.print("[bold]Probe Cache[/bold]")
+    console.print(f"  [bold]Location:[/bold] {probes.path}")
+    console.print(f"  [bold]Entries:[/bold] {probes.count()}")
+
+
+@cache_app.command("prune")
+def cache_prune(
+    max_mb: Optional[int] = typer.Option(
+        None,
+        "--max-mb",
+        help="Evict least recently used entries until the cache fits this size.",
+        min=0,
+    ),
+) -> None:
+    """Evict least recently used entries over the size limit.
+
+    Examples:
+        transcribe cache prune
+        transcribe cache prune --max-mb 100
+    """
+    from transcribe_cli.core import TranscriptCache
+
+    cache = TranscriptCache.default()
+    limit = None if max_mb is None else max_mb * 1024 * 1024
+    removed = cache.prune(max_bytes=limit)
+    stats = cache.stats()
+    console.print(
+        f"[green]Pruned {removed} entr{'y' if removed == 1 else 'ies'}.[/green] "
+        f"{stats.entries} remaining ({stats.total_mb:.1f} MB)"
+    )
+
+
+@cache_app.command("clear")
+def cache_clear(
+    yes: bool = typer.Option(
+        False,
+        "--yes",
+        "-y",
+        help="Do not ask for confirmation.",
+    ),
+) -> None:
+    """Remove every cached transcript and media probe.
+
+    Examples:
+        transcribe cache clear --yes
+    """
+    from transcribe_cli.core import ProbeCache, TranscriptCache
+
+    cache = TranscriptCache.default()
+    if not yes and not typer.confirm(f"Remove all cached transcripts in {cache.directory}?"):
+        raise typer.Exit(1)
+    removed = cache.clear()
+    probes = ProbeCache.default().clear()
+    console.print(f"[green]Cleared {removed} cached transcript(s).[/green]")
+    if probes:
+        console.print(f"[dim]Cleared {probes} cached media probe(s).[/dim]")
 
 
 @app.command()
@@ -522,6 +1196,7 @@ def config(
         console.print("  [bold]Defaults:[/bold]")
         console.print("    Output format: txt")
         console.print("    Concurrency: 5")
+        console.print("    Encoding profile: speech-mp3")
         console.print("    Language: auto")
         console.print("    Recursive: false")
     else:
@@ -555,20 +1230,33 @@ def setup(
     import subprocess
     import sys
 
-    from transcribe_cli.core import check_ffmpeg_available, validate_ffmpeg
+    from transcribe_cli.core import (
+        ENCODING_PROFILES,
+        find_ffmpeg,
+        find_ffprobe,
+        validate_ffmpeg,
+    )
 
     if check or (not install_ffmpeg):
         console.print("[bold]Dependency Check[/bold]")
         console.print()
 
         # Check FFmpeg
-        ffmpeg_path = shutil.which("ffmpeg")
-        ffprobe_path = shutil.which("ffprobe")
+        ffmpeg_path = find_ffmpeg()
+        ffprobe_path = find_ffprobe()
 
         if ffmpeg_path and ffprobe_path:
             try:
                 info = validate_ffmpeg()
                 console.print(f"  [green]✓[/green] FFmpeg {info.version_display} ({ffmpeg_path})")
+                console.print(f"  [green]✓[/green] ffprobe ({ffprobe_path})")
+                if info.encoders:
+                    codecs = {p.codec for p in ENCODING_PROFILES.values()}
+                    missing = sorted(c for c in codecs if not info.has_encoder(c))
+                    if missing:
+                        console.print(
+                            f"  [yellow]⚠[/yellow] FFmpeg lacks encoders: {', '.join(missing)}"
+                        )
             except Exception as e:
                 console.print(f"  [yellow]⚠[/yellow] FFmpeg found but has issues: {e}")
         else:
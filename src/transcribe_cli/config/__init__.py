@@ -5,6 +5,7 @@ from .settings import (
     Settings,
     create_default_config,
     find_config_file,
+    flatten_config,
     get_config_locations,
     get_settings,
     load_config_file,
@@ -15,6 +16,7 @@ __all__ = [
     "Settings",
     "create_default_config",
     "find_config_file",
+    "flatten_config",
     "get_config_locations",
     "get_settings",
     "load_config_file",
@@ -8,9 +8,9 @@ Implements ADR-005: Configuration Management Strategy
 
 import tomllib
 from pathlib import Path
-from typing import Any, Literal, Optional
+from typing import Any, Literal, Optional, Union
 
-from pydantic import Field, SecretStr, field_validator
+from pydantic import Field, SecretStr, ValidationError, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -84,10 +84,13 @@ class Settings(BaseSettings):
     output_format: Literal["txt", "srt"] = "txt"
 
     # Processing settings
-    concurrency: int = 5
+    concurrency: Union[int, Literal["auto"]] = 5
     language: str = "auto"
     chunk_size_minutes: int = 10
     recursive: bool = False
+    encoding_profile: Literal[
+        "speech-mp3", "speech-opus", "speech-webm", "mp3", "wav", "fit"
+    ] = "speech-mp3"
 
     # Logging settings
     verbose: bool = False
@@ -95,14 +98,24 @@ class Settings(BaseSettings):
 
     @field_validator("concurrency")
     @classmethod
-    def validate_concurrency(cls, v: int) -> int:
-        """Ensure concurrency is within reasonable bounds."""
+    def validate_concurrency(cls, v: Union[int, str]) -> Union[int, str]:
+        """Ensure concurrency is "auto" or within reasonable bounds."""
+        if v == "auto":
+            return v
         if v < 1:
             raise ValueError("Concurrency must be at least 1")
         if v > 20:
             raise ValueError("Concurrency cannot exceed 20 (API rate limits)")
         return v
 
+    @field_validator("chunk_size_minutes")
+    @classmethod
+    def validate_chunk_size_minutes(cls, v: int) -> int:
+        """Ensure chunk length is positive."""
+        if v < 1:
+            raise ValueError("Chunk size must be at least 1 minute")
+        return v
+
     @field_validator("output_dir")
     @classmethod
     def validate_output_dir(cls, v: Path) -> Path:
@@ -113,11 +126,39 @@ class Settings(BaseSettings):
         return v
 
 
-def get_settings(config_path: Optional[Path] = None) -> Settings:
+def flatten_config(config: dict[str, Any]) -> dict[str, Any]:
+    """Map config file tables onto Settings field names.
+
+    Keys in [output] gain an "output_" prefix (format -> output_format);
+    keys in other tables ([processing], [logging]) are used as they are.
+
+    Args:
+        config: Parsed config file.
+
+    Returns:
+        Flat dictionary of Settings fields.
+    """
+    flat: dict[str, Any] = {}
+    for key, value in config.items():
+        if not isinstance(value, dict):
+            flat[key] = value
+            continue
+        prefix = "output_" if key == "output" else ""
+        for name, item in value.items():
+            flat[f"{prefix}{name}"] = item
+    return flat
+
+
+def get_settings(
+    config_path: Optional[Path] = None, require_api_key: bool = True
+) -> Settings:
     """Load settings from environment and config file.
 
     Args:
         config_path: Explicit path to config file (optional).
+        require_api_key: Fail when OPENAI_API_KEY is missing. The CLI reads
+            its option defaults with this off, so commands that never call
+            the API still work without a key.
 
     Returns:
         Settings: Validated application settings.
@@ -126,10 +167,17 @@ def get_settings(config_path: Optional[Path] = None) -> Settings:
         ValidationError: If required settings are missing or invalid.
     """
     # Load config file values first
-    file_config = load_config_file(config_path)
+    file_config = flatten_config(load_config_file(config_path))
 
     # Create settings - env vars will override file config
-    return Settings(**file_config)  # type: ignore[arg-type]
+    try:
+        return Settings(**file_config)
+    except ValidationError as e:
+        missing_key = all(err["loc"] == ("openai_api_key",) for err in e.errors())
+        if require_api_key or not missing_key:
+            raise
+        # Placeholder key; the API client still reads OPENAI_API_KEY itself
+        return Settings(**{**file_config, "OPENAI_API_KEY": ""})
 
 
 def get_config_locations() -> list[Path]:
@@ -172,6 +220,13 @@ language = "auto"
 # Recursively scan directories
 recursive = false
 
+# Chunk length in minutes for audio over the 25MB API limit
+chunk_size_minutes = 10
+
+# Encoding for extracted audio: "speech-mp3", "speech-opus", "speech-webm",
+# "mp3", "wav" or "fit" (highest bitrate that fits the 25MB API limit)
+encoding_profile = "speech-mp3"
+
 [logging]
 # Enable verbose output
 verbose = false
@@ -1,23 +1,43 @@
 """Core processing modules for transcribe-cli."""
 
 from .batch import (
+    DEFAULT_KEEP_WARM_SECONDS,
     BatchResult,
     BatchSummary,
     process_batch,
+    plan_incremental,
+    plan_resume,
     process_directory,
     scan_directory,
 )
+from .cache import (
+    CacheStats,
+    TranscriptCache,
+    hash_file,
+    make_cache_key,
+)
+from .chunker import (
+    AudioChunk,
+    merge_chunk_responses,
+    plan_chunks,
+    split_audio,
+)
 from .extractor import (
     AUDIO_EXTENSIONS,
     SUPPORTED_EXTENSIONS,
     VIDEO_EXTENSIONS,
+    AudioBuffer,
     ExtractionError,
     ExtractionResult,
+    ExtractionTimeoutError,
     MediaInfo,
     NoAudioStreamError,
     UnsupportedFormatError,
     extract_audio,
+    extract_audio_to_buffer,
+    extract_audio_to_buffer_async,
     get_media_info,
+    get_media_info_async,
     is_audio_file,
     is_supported_file,
     is_video_file,
@@ -26,17 +46,55 @@ from .ffmpeg import (
     FFmpegInfo,
     FFmpegNotFoundError,
     FFmpegVersionError,
+    ToolchainRegistry,
     check_ffmpeg_available,
+    find_ffmpeg,
+    find_ffprobe,
+    get_toolchain,
     validate_ffmpeg,
 )
+from .adaptive import DEFAULT_MAX_CONCURRENCY, AdaptiveConcurrency
+from .budget import DEFAULT_MAX_INFLIGHT_MB, ByteBudget
+from .executor import ExtractionExecutor, available_cpus
+from .watchdog import JobTimeouts
+from .scratch import ScratchSpace, configure_scratch, get_scratch_space, sweep_orphans
+from .dedup import DuplicatePlan, find_duplicates
+from .watcher import INOTIFY, POLLING, MediaWatcher, inotify_available
+from .events import EventStream
+from .pipeline import PIPELINE_STAGES, StagePipeline, StageStats
+from .journal import BatchJournal, JournalEntry
+from .probe_cache import ProbeCache
+from .scanner import ScannedFile, iter_media_files
+from .schedule import SCHEDULE_POLICIES, order_files
+from .profiles import (
+    COPY_PROFILES,
+    ENCODING_PROFILES,
+    PROFILE_NAMES,
+    EncodingProfile,
+    copy_profile,
+    fit_profile,
+    resolve_profile,
+)
+from .ratelimit import (
+    RateLimiter,
+    RateLimitStats,
+    configure_rate_limiter,
+    get_rate_limiter,
+)
 from .transcriber import (
     APIKeyMissingError,
     FileTooLargeError,
     TranscriptionError,
     TranscriptionResult,
     TranscriptionSegment,
+    create_async_client,
+    create_client,
+    estimate_in_flight_bytes,
     save_transcript,
     transcribe_file,
+    transcribe_file_async,
+    warm_async_client,
+    warm_client,
 )
 
 __all__ = [
@@ -44,16 +102,25 @@ __all__ = [
     "FFmpegInfo",
     "FFmpegNotFoundError",
     "FFmpegVersionError",
+    "ToolchainRegistry",
     "validate_ffmpeg",
     "check_ffmpeg_available",
+    "find_ffmpeg",
+    "find_ffprobe",
+    "get_toolchain",
     # Extractor
+    "AudioBuffer",
     "ExtractionError",
     "ExtractionResult",
+    "ExtractionTimeoutError",
     "MediaInfo",
     "NoAudioStreamError",
     "UnsupportedFormatError",
     "extract_audio",
+    "extract_audio_to_buffer",
+    "extract_audio_to_buffer_async",
     "get_media_info",
+    "get_media_info_async",
     "is_audio_file",
     "is_video_file",
     "is_supported_file",
@@ -63,14 +130,74 @@ __all__ = [
     "TranscriptionError",
     "TranscriptionResult",
     "TranscriptionSegment",
+    "create_async_client",
+    "create_client",
     "transcribe_file",
+    "transcribe_file_async",
+    "estimate_in_flight_bytes",
     "save_transcript",
+    "warm_async_client",
+    "warm_client",
+    # Cache
+    "CacheStats",
+    "TranscriptCache",
+    "hash_file",
+    "make_cache_key",
+    "ProbeCache",
+    # Chunking
+    "AudioChunk",
+    "merge_chunk_responses",
+    "plan_chunks",
+    "split_audio",
+    # Encoding profiles
+    "COPY_PROFILES",
+    "ENCODING_PROFILES",
+    "PROFILE_NAMES",
+    "EncodingProfile",
+    "copy_profile",
+    "fit_profile",
+    "resolve_profile",
+    # Rate limiting
+    "RateLimiter",
+    "RateLimitStats",
+    "configure_rate_limiter",
+    "get_rate_limiter",
     # Batch
     "BatchResult",
     "BatchSummary",
+    "DEFAULT_KEEP_WARM_SECONDS",
+    "BatchJournal",
+    "JournalEntry",
+    "plan_incremental",
+    "plan_resume",
     "process_batch",
     "process_directory",
     "scan_directory",
+    "ScannedFile",
+    "iter_media_files",
+    "SCHEDULE_POLICIES",
+    "order_files",
+    "AdaptiveConcurrency",
+    "DEFAULT_MAX_CONCURRENCY",
+    "ByteBudget",
+    "DEFAULT_MAX_INFLIGHT_MB",
+    "PIPELINE_STAGES",
+    "StagePipeline",
+    "StageStats",
+    "ExtractionExecutor",
+    "available_cpus",
+    "JobTimeouts",
+    "ScratchSpace",
+    "configure_scratch",
+    "get_scratch_space",
+    "sweep_orphans",
+    "DuplicatePlan",
+    "find_duplicates",
+    "MediaWatcher",
+    "INOTIFY",
+    "POLLING",
+    "inotify_available",
+    "EventStream",
     # Constants
     "VIDEO_EXTENSIONS",
     "AUDIO_EXTENSIONS",
@@ -0,0 +1,146 @@
+"""Adaptive (AIMD) batch concurrency.
+
+- Additive increase while latency, errors and rate-limiter pacing are healthy
+- Multiplicative decrease on 429s and upload timeouts
+- At most one decrease per window of in-flight files
+- Records the concurrency trajectory for the batch summary
+"""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
+
+from .ratelimit import RateLimiter, get_rate_limiter
+
+# Starting concurrency for --concurrency auto
+AUTO_INITIAL_CONCURRENCY = 2
+# Default ceiling for --concurrency auto; may exceed the fixed-mode limit
+DEFAULT_MAX_CONCURRENCY = 64
+# A file is slow when its seconds per MB exceed the best seen by this factor
+LATENCY_TOLERANCE = 2.0
+# Growth stops while the smoothed failure rate is above this
+MAX_ERROR_RATE = 0.1
+# Weight of the newest file in the smoothed failure rate
+ERROR_SMOOTHING = 0.2
+# Rate-limiter wait during one file that means the limiter, not
+# concurrency, is the bottleneck
+PACING_TOLERANCE_SECONDS = 0.5
+
+_MB = 1024 * 1024
+
+
+@dataclass
+class ConcurrencySlot:
+    """A granted slot, with the signals observed when it was taken."""
+
+    epoch: int
+    started: float
+    congestion_events: int
+    limiter_wait: float
+
+
+class AdaptiveConcurrency:
+    """AIMD limit on files in flight, for one event loop.
+
+    Each completed file is a feedback sample. A file that saw a new 429 or
+    timeout halves the limit, once per window: files that started before
+    the last decrease cannot trigger another. A healthy file (succeeded, no
+    more than LATENCY_TOLERANCE times the best seconds per MB, no
+    rate-limiter pacing) grows the limit by 1/limit, about one slot per
+    window of completions.
+    """
+
+    def __init__(
+        self,
+        initial: int = AUTO_INITIAL_CONCURRENCY,
+        ceiling: int = DEFAULT_MAX_CONCURRENCY,
+        floor: int = 1,
+        limiter: Optional[RateLimiter] = None,
+    ) -> None:
+        if floor < 1 or ceiling < floor:
+            raise ValueError("Concurrency bounds must satisfy 1 <= floor <= ceiling")
+
+        self.ceiling = ceiling
+        self.floor = floor
+        self._limit = float(min(ceiling, max(floor, initial)))
+        self._limiter = limiter
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self._epoch = 0
+        self._error_rate = 0.0
+        self._best_latency: Optional[float] = None
+        self._started = time.monotonic()
+        self.decreases = 0
+        self.trajectory: list[tuple[float, int]] = [(0.0, self.limit)]
+
+    @property
+    def limit(self) -> int:
+        """Current number of files allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Files currently holding a slot."""
+        return self._in_flight
+
+    def _signals(self) -> tuple[int, float]:
+        stats = (self._limiter or get_rate_limiter()).stats()
+        return stats.throttled + stats.timeouts, stats.total_wait_seconds
+
+    async def acquire(self) -> ConcurrencySlot:
+        """Wait for a slot under the current limit."""
+        while self._in_flight >= self.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                raise
+
+        self._in_flight += 1
+        congestion, wait = self._signals()
+        return ConcurrencySlot(self._epoch, time.monotonic(), congestion, wait)
+
+    def release(self, slot: ConcurrencySlot, success: bool, size_bytes: int = 0) -> None:
+        """Return a slot and adjust the limit from the file's outcome.
+
+        Args:
+            slot: Slot returned by acquire().
+            success: Whether the file was transcribed.
+            size_bytes: Source size, used to normalize latency.
+        """
+        self._in_flight -= 1
+        congestion, wait = self._signals()
+        congested = congestion > slot.congestion_events
+        paced = wait - slot.limiter_wait > PACING_TOLERANCE_SECONDS
+
+        failed = not success and not congested
+        self._error_rate += ERROR_SMOOTHING * (float(failed) - self._error_rate)
+
+        if congested:
+            if slot.epoch == self._epoch:
+                self._limit = max(float(self.floor), self._limit / 2)
+                self._epoch += 1
+                self.decreases += 1
+        elif success and not paced and self._error_rate < MAX_ERROR_RATE:
+            latency = (time.monotonic() - slot.started) / max(1.0, size_bytes / _MB)
+            if self._best_latency is None or latency < self._best_latency:
+                self._best_latency = latency
+            if latency <= self._best_latency * LATENCY_TOLERANCE:
+                self._limit = min(float(self.ceiling), self._limit + 1.0 / self._limit)
+
+        if self.limit != self.trajectory[-1][1]:
+            self.trajectory.append((time.monotonic() - self._started, self.limit))
+        self._wake()
+
+    def _wake(self) -> None:
+        free = self.limit - self._in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
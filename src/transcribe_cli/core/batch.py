@@ -1,21 +1,101 @@
 """Batch processing for multiple files.
 
 Implements Sprint 4: Batch Processing
-- Directory scanning for audio/video files
-- Concurrent transcription with semaphore control
+- Streaming directory scan (see scanner.py); workers start on the first
+  files found
+- Fixed worker pool fed through a bounded queue; results are emitted as
+  each file completes
+- One pooled async API client shared by every file in a run
+- Uploads paced by the shared rate limiter, reported in the summary
 - Progress tracking and error handling
+- Per-file journal in the output directory; resumed runs skip completed
+  files and retry failed ones last
+- Incremental runs skip files whose transcript is newer than the source
+  (optionally also when the source content is unchanged)
+- Scheduling policies (see schedule.py); per-worker idle time reported
+- Staged pipeline (probe, extract, upload, write) with per-stage limits
+  and bounded hand-offs (see pipeline.py)
+- Extraction on its own CPU-sized executor (see executor.py)
+- FFmpeg jobs killed on wall-clock and no-progress timeouts; timed-out files
+  are marked in their results (see watchdog.py)
+- Adaptive (AIMD) upload concurrency with concurrency="auto" (see adaptive.py)
+- Optional byte budget on extraction output and upload bodies in flight
+- Long-running inputs (see watcher.py) with a client kept warm between files
+- Optional duplicate pre-pass; byte-identical files are transcribed once and
+  the transcript is written for every copy (see dedup.py)
+- Optional JSONL event stream of stage transitions and finished files
+  (see events.py)
 """
 
 import asyncio
+import dataclasses
+import os
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, Literal, Optional
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    Literal,
+    Optional,
+    Union,
+)
+
+from openai import AsyncOpenAI
 
-from .extractor import SUPPORTED_EXTENSIONS, is_supported_file
+from .adaptive import DEFAULT_MAX_CONCURRENCY, AdaptiveConcurrency
+from .budget import ByteBudget
+from .cache import TranscriptCache, hash_file
+from .dedup import find_duplicates
+from .events import BATCH_EVENT, EventStream
+from .executor import ExtractionExecutor
+from .extractor import ExtractionTimeoutError
+from .journal import BatchJournal, JournalEntry
+from .pipeline import (
+    DEFAULT_PROBE_CONCURRENCY,
+    DEFAULT_WRITE_CONCURRENCY,
+    StagePipeline,
+    StageStats,
+    StageTicket,
+)
+from .ratelimit import RateLimitStats, get_rate_limiter
+from .scanner import ScannedFile, iter_media_files
+from .schedule import (
+    DURATION_POLICIES,
+    SCAN_ORDER,
+    SCHEDULE_POLICIES,
+    order_files,
+    probe_durations_async,
+)
 from .transcriber import (
+    DEFAULT_CHUNK_CONCURRENCY,
+    DEFAULT_CHUNK_SIZE_MINUTES,
+    DEFAULT_ENCODING_PROFILE,
+    KEEPALIVE_EXPIRY_SECONDS,
     TranscriptionResult,
-    transcribe_file,
+    UploadStats,
+    create_async_client,
+    estimate_in_flight_bytes,
+    track_uploads,
+    transcribe_file_async,
+    warm_async_client,
 )
+from .watchdog import JobTimeouts
+
+# Files for a batch: plain paths, or scanner entries carrying size and mtime
+BatchInput = Union[Path, ScannedFile]
+
+# Files queued ahead of each worker
+QUEUE_DEPTH_PER_WORKER = 2
+
+# Re-warm long-running clients before idle pooled connections expire
+DEFAULT_KEEP_WARM_SECONDS = KEEPALIVE_EXPIRY_SECONDS / 2
+
+# A fixed number of concurrent files, or "auto" for AIMD
+Concurrency = Union[int, Literal["auto"]]
 
 
 @dataclass
@@ -27,6 +107,18 @@ class BatchResult:
     success: bool
     error: Optional[str] = None
     result: Optional[TranscriptionResult] = None
+    # FFmpeg was killed by the extraction watchdog
+    timed_out: bool = False
+    # Byte-identical file whose transcript was reused for this one
+    duplicate_of: Optional[Path] = None
+    # Source size in bytes
+    size: int = 0
+    # Seconds spent holding, and queued for, each pipeline stage
+    stage_seconds: dict[str, float] = field(default_factory=dict)
+    wait_seconds: dict[str, float] = field(default_factory=dict)
+    # Transcription requests made for the file, and how many were retries
+    requests: int = 0
+    retries: int = 0
 
 
 @dataclass
@@ -38,13 +130,32 @@ class BatchSummary:
     failed: int
     skipped: int
     results: list[BatchResult] = field(default_factory=list)
+    rate_limit: Optional[RateLimitStats] = None
+    total_bytes: int = 0
+    elapsed_seconds: float = 0.0
+    worker_idle_seconds: list[float] = field(default_factory=list)
+    # (seconds into the run, limit) at each change, for concurrency="auto"
+    concurrency_trajectory: list[tuple[float, int]] = field(default_factory=list)
+    peak_in_flight_bytes: int = 0
+    byte_budget_wait_seconds: float = 0.0
+    stages: list[StageStats] = field(default_factory=list)
+    # Copies served from another file's transcript by the duplicate pre-pass
+    duplicates: int = 0
+    duplicate_bytes_saved: int = 0
+    api_calls_saved: int = 0
+
+    @property
+    def extraction_timeouts(self) -> int:
+        """Files whose FFmpeg job was killed for running too long or stalling."""
+        return sum(1 for r in self.results if r.timed_out)
 
     @property
     def success_rate(self) -> float:
-        """Calculate success rate as percentage."""
-        if self.total_files == 0:
+        """Calculate success rate of processed (not skipped) files as percentage."""
+        processed = self.total_files - self.skipped
+        if processed <= 0:
             return 0.0
-        return (self.successful / self.total_files) * 100
+        return (self.successful / processed) * 100
 
 
 def scan_directory(
@@ -58,30 +169,218 @@ def scan_directory(
         recursive: Whether to scan subdirectories.
 
     Returns:
-        List of paths to supported media files.
+        Sorted list of paths to supported media files.
 
     Raises:
         FileNotFoundError: If directory doesn't exist.
         ValueError: If path is not a directory.
     """
-    directory = Path(directory).resolve()
+    return sorted(entry.path for entry in iter_media_files(directory, recursive))
 
-    if not directory.exists():
-        raise FileNotFoundError(f"Directory not found: {directory}")
 
-    if not directory.is_dir():
-        raise ValueError(f"Path is not a directory: {directory}")
+def _output_path(
+    input_path: Path,
+    output_dir: Optional[Path],
+    output_format: str,
+) -> Path:
+    """Transcript path for an input file."""
+    if output_dir:
+        return output_dir / f"{input_path.stem}.{output_format}"
+    return input_path.with_suffix(f".{output_format}")
+
+
+def _resume_action(
+    path: Path,
+    entries: dict[Path, JournalEntry],
+    output_dir: Optional[Path],
+    output_format: str,
+) -> Literal["process", "retry", "skip"]:
+    """Decide what a resumed run does with a file."""
+    entry = entries.get(Path(path).resolve())
+    if entry is None or entry.state == "started":
+        return "process"
+    if entry.state == "failed":
+        return "retry"
+    expected = _output_path(path, output_dir, output_format)
+    if entry.output_path is not None and entry.output_path == expected and expected.exists():
+        return "skip"
+    return "process"
+
+
+def _is_up_to_date(
+    path: Path,
+    output_dir: Optional[Path],
+    output_format: str,
+    entries: dict[Path, JournalEntry],
+    check_hash: bool,
+    source_mtime_ns: Optional[int] = None,
+) -> bool:
+    """Whether a file's transcript is current (see plan_incremental)."""
+    output_path = _output_path(path, output_dir, output_format)
+    try:
+        if source_mtime_ns is None:
+            source_mtime_ns = path.stat().st_mtime_ns
+        output_mtime_ns = output_path.stat().st_mtime_ns
+    except OSError:
+        return False
 
-    files = []
-    pattern = "**/*" if recursive else "*"
+    if output_mtime_ns >= source_mtime_ns:
+        return True
+    if not check_hash:
+        return False
 
-    for path in directory.glob(pattern):
-        if path.is_file() and is_supported_file(path):
-            files.append(path)
+    entry = entries.get(Path(path).resolve())
+    if (
+        entry is None
+        or entry.state != "completed"
+        or entry.source_hash is None
+        or entry.output_path != output_path
+        or entry.source_hash != hash_file(path)
+    ):
+        return False
 
-    # Sort for consistent ordering
-    files.sort()
-    return files
+    # Refresh the transcript's mtime so the next run skips the hash
+    try:
+        os.utime(output_path)
+    except OSError:
+        pass
+    return True
+
+
+def plan_resume(
+    files: list[Path],
+    journal: BatchJournal,
+    output_dir: Optional[Path],
+    output_format: str,
+) -> tuple[list[Path], list[Path]]:
+    """Order a resumed run from the journal.
+
+    A file is done when its last journal entry is "completed" and the
+    transcript it recorded is the one this run would write and still
+    exists. Files that failed last time are moved to the end of the run.
+
+    Args:
+        files: Files found for this run.
+        journal: Journal of earlier runs.
+        output_dir: Output directory (None = same as input).
+        output_format: Output format of this run.
+
+    Returns:
+        Tuple of (files to process in order, files already done).
+    """
+    entries = journal.load()
+    pending: list[Path] = []
+    retry: list[Path] = []
+    done: list[Path] = []
+
+    for path in files:
+        action = _resume_action(path, entries, output_dir, output_format)
+        if action == "skip":
+            done.append(path)
+        elif action == "retry":
+            retry.append(path)
+        else:
+            pending.append(path)
+
+    return pending + retry, done
+
+
+def plan_incremental(
+    files: list[Path],
+    output_dir: Optional[Path],
+    output_format: str,
+    journal: Optional[BatchJournal] = None,
+    check_hash: bool = False,
+) -> tuple[list[Path], list[Path]]:
+    """Find files whose transcript is already up to date, make-style.
+
+    A transcript is up to date when it exists and is at least as new as its
+    source. With check_hash, a source that looks newer (touched, copied,
+    restored from backup) is still up to date if its SHA-256 matches the
+    hash the journal recorded when the transcript was written.
+
+    Args:
+        files: Files found for this run.
+        output_dir: Output directory (None = same as input).
+        output_format: Output format of this run.
+        journal: Journal holding source hashes of earlier runs.
+        check_hash: Compare content hashes when timestamps disagree.
+
+    Returns:
+        Tuple of (files to process, files already up to date).
+    """
+    entries = journal.load() if check_hash and journal is not None else {}
+    pending: list[Path] = []
+    current: list[Path] = []
+
+    for path in files:
+        if _is_up_to_date(path, output_dir, output_format, entries, check_hash):
+            current.append(path)
+        else:
+            pending.append(path)
+
+    return pending, current
+
+
+async def _iter_inputs(
+    files: Iterable[BatchInput],
+) -> AsyncIterator[tuple[Path, int, Optional[int]]]:
+    """Yield (path, size, mtime_ns) without blocking the event loop.
+
+    Lazy iterables (such as the directory scanner) are advanced on a worker
+    thread, so files are processed while the scan is still running. Plain
+    paths are stat'ed once; mtime_ns is None if that fails.
+    """
+    threaded = not isinstance(files, (list, tuple))
+    iterator: Iterator[BatchInput] = iter(files)
+
+    while True:
+        item = await asyncio.to_thread(next, iterator, None) if threaded else next(iterator, None)
+        if item is None:
+            return
+        if isinstance(item, ScannedFile):
+            yield item.path, item.size, item.mtime_ns
+            continue
+        path = Path(item)
+        try:
+            st = path.stat()
+        except OSError:
+            # Missing file: let the worker report it as a failure
+            yield path, 0, None
+            continue
+        yield path, st.st_size, st.st_mtime_ns
+
+
+def _accounting(
+    size: int, stages: Optional[StageTicket], uploads: UploadStats
+) -> dict[str, Any]:
+    """BatchResult fields describing what a file cost."""
+    return {
+        "size": size,
+        "stage_seconds": dict(stages.timings) if stages is not None else {},
+        "wait_seconds": dict(stages.waits) if stages is not None else {},
+        "requests": uploads.requests,
+        "retries": uploads.retries,
+    }
+
+
+def _emit_file(events: EventStream, result: BatchResult) -> None:
+    """Write the file record for a finished file."""
+    transcript = result.result
+    events.file(
+        result.input_path,
+        "completed" if result.success else "failed",
+        result.output_path,
+        result.size,
+        transcript.duration if transcript is not None else None,
+        result.stage_seconds,
+        result.wait_seconds,
+        result.requests,
+        result.retries,
+        error=result.error,
+        timed_out=result.timed_out,
+        duplicate_of=result.duplicate_of,
+    )
 
 
 async def _process_file_async(
@@ -89,9 +388,17 @@ async def _process_file_async(
     output_dir: Optional[Path],
     output_format: Literal["txt", "srt"],
     language: str,
-    api_key: Optional[str],
-    semaphore: asyncio.Semaphore,
+    client: AsyncOpenAI,
     progress_callback: Optional[Callable[[Path, str], None]] = None,
+    chunk_size_minutes: int = DEFAULT_CHUNK_SIZE_MINUTES,
+    cache: Optional[TranscriptCache] = None,
+    encoding_profile: str = DEFAULT_ENCODING_PROFILE,
+    stream_copy: bool = True,
+    journal: Optional[BatchJournal] = None,
+    record_hash: bool = False,
+    stages: Optional[StageTicket] = None,
+    extract_executor: Optional[ExtractionExecutor] = None,
+    size: int = 0,
 ) -> BatchResult:
     """Process a single file asynchronously.
 
@@ -100,155 +407,636 @@ async def _process_file_async(
         output_dir: Output directory (None = same as input).
         output_format: Output format.
         language: Language code or "auto".
-        api_key: OpenAI API key.
-        semaphore: Semaphore for concurrency control.
+        client: Shared async OpenAI client.
         progress_callback: Optional callback for progress updates.
+        chunk_size_minutes: Chunk length for files over the API size limit.
+        cache: Optional transcript cache shared by all files.
+        encoding_profile: Encoding profile for extracted audio.
+        stream_copy: Remux API-compatible audio instead of re-encoding.
+        journal: Optional journal recording the file's state changes.
+        record_hash: Store the source's SHA-256 with its completed entry.
+        stages: Optional pipeline ticket; the file passes through the
+            probe, extract and upload stages and then writes under the
+            write stage's limit.
+        extract_executor: Optional executor for FFmpeg work.
+        size: Source size in bytes, reported in the result.
 
     Returns:
         BatchResult with success/failure status.
     """
-    async with semaphore:
-        if progress_callback:
-            progress_callback(input_path, "started")
+    if progress_callback:
+        progress_callback(input_path, "started")
+    if journal is not None:
+        journal.record(input_path, "started")
 
-        try:
-            # Determine output path
-            if output_dir:
-                output_path = output_dir / f"{input_path.stem}.{output_format}"
-            else:
-                output_path = input_path.with_suffix(f".{output_format}")
-
-            # Run transcription in thread pool (blocking I/O)
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None,
-                lambda: transcribe_file(
-                    input_path=input_path,
-                    output_path=output_path,
-                    language=language,
-                    api_key=api_key,
-                ),
+    uploads = UploadStats()
+    try:
+        output_path = _output_path(input_path, output_dir, output_format)
+
+        # Upload on the event loop; only FFmpeg work leaves the loop
+        with track_uploads(uploads):
+            result = await transcribe_file_async(
+                input_path=input_path,
+                client=client,
+                output_path=output_path,
+                language=language,
+                chunk_size_minutes=chunk_size_minutes,
+                cache=cache,
+                encoding_profile=encoding_profile,
+                stream_copy=stream_copy,
+                stages=stages,
+                extract_executor=extract_executor,
             )
 
-            # Save with formatter
-            from transcribe_cli.output import save_formatted_transcript
+        if stages is not None:
+            await stages.enter("write")
 
-            saved_path = await loop.run_in_executor(
-                None,
-                lambda: save_formatted_transcript(result, output_path, output_format),
-            )
+        # Save with formatter
+        from transcribe_cli.output import save_formatted_transcript
 
-            if progress_callback:
-                progress_callback(input_path, "completed")
+        loop = asyncio.get_running_loop()
+        saved_path = await loop.run_in_executor(
+            None,
+            lambda: save_formatted_transcript(result, output_path, output_format),
+        )
 
-            return BatchResult(
-                input_path=input_path,
-                output_path=saved_path,
-                success=True,
-                result=result,
+        if journal is not None:
+            source_hash = (
+                await loop.run_in_executor(None, hash_file, input_path)
+                if record_hash
+                else None
             )
+            journal.record(
+                input_path, "completed", output_path=saved_path, source_hash=source_hash
+            )
+        if stages is not None:
+            stages.leave()
+        if progress_callback:
+            progress_callback(input_path, "completed")
+
+        return BatchResult(
+            input_path=input_path,
+            output_path=saved_path,
+            success=True,
+            result=result,
+            **_accounting(size, stages, uploads),
+        )
 
+    except Exception as e:
+        if stages is not None:
+            stages.leave(success=False)
+        if journal is not None:
+            journal.record(input_path, "failed", error=str(e))
+        if progress_callback:
+            progress_callback(input_path, "failed")
+
+        return BatchResult(
+            input_path=input_path,
+            output_path=None,
+            success=False,
+            error=str(e),
+            timed_out=isinstance(e, ExtractionTimeoutError),
+            **_accounting(size, stages, uploads),
+        )
+
+
+async def keep_warm(client: AsyncOpenAI, interval_seconds: float) -> None:
+    """Re-warm a client's connection pool until cancelled.
+
+    Keeps a connection open through idle stretches longer than the pool's
+    keep-alive expiry, so the next upload does not pay for a new TLS
+    handshake.
+
+    Args:
+        client: Async client to keep warm.
+        interval_seconds: Time between warm-up requests.
+    """
+    while True:
+        await warm_async_client(client)
+        await asyncio.sleep(interval_seconds)
+
+
+async def _write_copies(
+    original: BatchResult,
+    copies: list[ScannedFile],
+    output_dir: Optional[Path],
+    output_format: Literal["txt", "srt"],
+    progress_callback: Optional[Callable[[Path, str], None]] = None,
+    journal: Optional[BatchJournal] = None,
+    record_hash: bool = False,
+) -> list[BatchResult]:
+    """Give each byte-identical copy the original's transcript.
+
+    A copy fails with the original's error if the original failed.
+
+    Args:
+        original: Result of the file the copies duplicate.
+        copies: Files with the same content as the original.
+        output_dir: Output directory (None = same as input).
+        output_format: Output format.
+        progress_callback: Optional callback for progress updates.
+        journal: Optional journal recording each copy's state.
+        record_hash: Store the source's SHA-256 with completed entries.
+
+    Returns:
+        One BatchResult per copy.
+    """
+    from transcribe_cli.output import save_formatted_transcript
+
+    loop = asyncio.get_running_loop()
+    # Copies share the original's content, so they share its hash
+    source_hash = (
+        await loop.run_in_executor(None, hash_file, original.input_path)
+        if original.success and journal is not None and record_hash
+        else None
+    )
+    results: list[BatchResult] = []
+    for copy in copies:
+        if progress_callback:
+            progress_callback(copy.path, "started")
+        try:
+            if original.result is None:
+                raise RuntimeError(
+                    f"Duplicate of {original.input_path.name}: {original.error}"
+                )
+            output_path = _output_path(copy.path, output_dir, output_format)
+            transcript = dataclasses.replace(
+                original.result, input_path=copy.path, output_path=output_path
+            )
+            saved_path = await loop.run_in_executor(
+                None, save_formatted_transcript, transcript, output_path, output_format
+            )
         except Exception as e:
+            if journal is not None:
+                journal.record(copy.path, "failed", error=str(e))
             if progress_callback:
-                progress_callback(input_path, "failed")
+                progress_callback(copy.path, "failed")
+            results.append(
+                BatchResult(
+                    input_path=copy.path,
+                    output_path=None,
+                    success=False,
+                    error=str(e),
+                    duplicate_of=original.input_path,
+                    size=copy.size,
+                )
+            )
+            continue
 
-            return BatchResult(
-                input_path=input_path,
-                output_path=None,
-                success=False,
-                error=str(e),
+        if journal is not None:
+            journal.record(
+                copy.path, "completed", output_path=saved_path, source_hash=source_hash
             )
+        if progress_callback:
+            progress_callback(copy.path, "completed")
+        results.append(
+            BatchResult(
+                input_path=copy.path,
+                output_path=saved_path,
+                success=True,
+                result=transcript,
+                duplicate_of=original.input_path,
+                size=copy.size,
+            )
+        )
+    return results
 
 
 async def process_batch_async(
-    files: list[Path],
+    files: Iterable[BatchInput],
     output_dir: Optional[Path] = None,
     output_format: Literal["txt", "srt"] = "txt",
     language: str = "auto",
-    concurrency: int = 5,
+    concurrency: Concurrency = 5,
     api_key: Optional[str] = None,
     progress_callback: Optional[Callable[[Path, str], None]] = None,
+    chunk_size_minutes: int = DEFAULT_CHUNK_SIZE_MINUTES,
+    warm_up: bool = False,
+    cache: Optional[TranscriptCache] = None,
+    encoding_profile: str = DEFAULT_ENCODING_PROFILE,
+    stream_copy: bool = True,
+    journal: Optional[BatchJournal] = None,
+    resume: bool = False,
+    incremental: bool = False,
+    check_hash: bool = False,
+    result_callback: Optional[Callable[[BatchResult], None]] = None,
+    keep_results: bool = True,
+    schedule: str = SCAN_ORDER,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    max_in_flight_bytes: Optional[int] = None,
+    stage_limits: Optional[dict[str, int]] = None,
+    extract_jobs: Optional[int] = None,
+    extract_timeouts: Optional[JobTimeouts] = None,
+    dedup: bool = False,
+    keep_warm_seconds: Optional[float] = None,
+    events: Optional[EventStream] = None,
 ) -> BatchSummary:
     """Process multiple files concurrently.
 
+    Files are pulled from a bounded queue fed by `files`, which may be a
+    lazy iterable such as iter_media_files(), so work starts before the
+    scan finishes and memory does not grow with the number of files. Each
+    file then moves through a StagePipeline: probe (cache lookup and
+    ffprobe), extract, upload and write, each with its own limit and a
+    bounded queue in front of it, so extraction and uploads overlap and a
+    stalled stage holds back the ones before it. `concurrency` limits the
+    upload stage; with concurrency="auto" an AIMD controller sets it
+    between 1 and max_concurrency. Extraction runs on its own executor,
+    sized from the CPUs actually available (affinity mask and cgroup
+    quota) with the CPUs split between jobs as FFmpeg -threads, so it
+    neither oversubscribes nor idles the machine. With dedup, files are
+    grouped by size and content hash once the scan ends, and only the
+    first of each group of identical files is processed; its transcript is
+    written for the others. A byte budget additionally holds back
+    extraction of files whose estimated in-flight bytes (see
+    estimate_in_flight_bytes) would not fit. A single pooled AsyncOpenAI
+    client is shared by every upload.
+
     Args:
-        files: List of files to process.
+        files: Files to process (paths or ScannedFile entries).
         output_dir: Output directory (None = same as input).
         output_format: Output format for all files.
         language: Language code or "auto".
-        concurrency: Maximum concurrent transcriptions.
+        concurrency: Maximum concurrent transcriptions, or "auto" to adapt
+            between 1 and max_concurrency (see AdaptiveConcurrency).
         api_key: OpenAI API key.
         progress_callback: Optional callback(path, status) for progress.
+        chunk_size_minutes: Chunk length for files over the API size limit.
+        warm_up: Open an API connection in the background before the first
+            upload is ready.
+        cache: Optional transcript cache shared by all files.
+        encoding_profile: Encoding profile for extracted audio.
+        stream_copy: Remux API-compatible audio instead of re-encoding.
+        journal: Optional journal recording each file's state.
+        resume: Skip files the journal shows as completed and process
+            previously failed files last.
+        incremental: Skip files whose transcript is newer than the source.
+        check_hash: With incremental, also skip sources whose content hash
+            matches the one journaled with their transcript.
+        result_callback: Optional callback receiving each BatchResult as
+            its file completes.
+        keep_results: Keep every result in the summary; when False only
+            failures are kept, so memory does not grow with the corpus.
+        schedule: Dispatch order, one of SCHEDULE_POLICIES. Any policy but
+            "scan" waits for the whole scan before the first file starts.
+        max_concurrency: Ceiling for concurrency="auto".
+        max_in_flight_bytes: Budget for the estimated extraction output and
+            upload bodies held at once (None = file count only).
+        stage_limits: Overrides for the probe and write stage limits (the
+            upload limit is `concurrency`, the extract limit extract_jobs).
+        extract_jobs: Concurrent FFmpeg extractions (default: one per
+            available CPU, see ExtractionExecutor).
+        extract_timeouts: Wall-clock and no-progress limits for each FFmpeg
+            job (default: JobTimeouts()).
+        dedup: Transcribe byte-identical files once and write the transcript
+            for every copy. Waits for the whole scan, like a schedule policy.
+        keep_warm_seconds: Create the API client up front and re-warm its
+            connection pool at this interval, for long-running inputs such
+            as MediaWatcher (None = create it with the first file).
+        events: Optional JSONL stream receiving a record for every stage
+            transition, every finished or skipped file and the whole batch.
 
     Returns:
         BatchSummary with results for all files.
+
+    Raises:
+        APIKeyMissingError: If API key not configured.
+        ValueError: If the schedule policy is unknown.
     """
-    if not files:
-        return BatchSummary(
-            total_files=0,
-            successful=0,
-            failed=0,
-            skipped=0,
-            results=[],
-        )
+    if schedule not in SCHEDULE_POLICIES:
+        choices = ", ".join(SCHEDULE_POLICIES)
+        raise ValueError(f"Unknown schedule '{schedule}'. Choose from: {choices}")
 
     # Create output directory if specified
     if output_dir:
         output_dir = Path(output_dir).resolve()
         output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Create semaphore for concurrency control
-    semaphore = asyncio.Semaphore(concurrency)
+    entries = journal.load() if journal is not None and (resume or check_hash) else {}
 
-    # Create tasks for all files
-    tasks = [
-        _process_file_async(
-            input_path=f,
-            output_dir=output_dir,
-            output_format=output_format,
-            language=language,
-            api_key=api_key,
-            semaphore=semaphore,
-            progress_callback=progress_callback,
+    adaptive: Optional[AdaptiveConcurrency] = None
+    if concurrency == "auto":
+        adaptive = AdaptiveConcurrency(ceiling=max_concurrency)
+        uploads = max_concurrency
+    else:
+        uploads = concurrency
+
+    budget = ByteBudget(max_in_flight_bytes) if max_in_flight_bytes else None
+    extract_executor = ExtractionExecutor(extract_jobs, timeouts=extract_timeouts)
+    limits = {
+        "probe": DEFAULT_PROBE_CONCURRENCY,
+        "write": DEFAULT_WRITE_CONCURRENCY,
+        **(stage_limits or {}),
+        "extract": extract_executor.jobs,
+        "upload": uploads,
+    }
+
+    def on_stage(ticket: StageTicket, previous: Optional[str]) -> None:
+        assert events is not None and ticket.stage is not None
+        events.stage(
+            ticket.path,
+            ticket.stage,
+            previous,
+            ticket.size,
+            ticket.timings,
+            ticket.waits,
         )
-        for f in files
-    ]
 
-    # Run all tasks
-    results = await asyncio.gather(*tasks)
+    pipeline = StagePipeline(
+        limits,
+        upload_controller=adaptive,
+        byte_budget=budget,
+        listener=on_stage if events is not None else None,
+    )
+    # One worker per file the pipeline can hold; stage limits do the gating
+    workers = pipeline.capacity
+
+    # Bounded hand-off between the scan and the workers; memory stays flat
+    # however many files the scan produces
+    queue: "asyncio.Queue[Optional[tuple[Path, int]]]" = asyncio.Queue(
+        maxsize=workers * QUEUE_DEPTH_PER_WORKER
+    )
+    # Created with the first file to process (validates API key up front)
+    client: Optional[AsyncOpenAI] = None
+    warm_task: Optional[asyncio.Future] = None
+    results: list[BatchResult] = []
+    found = 0
+    skipped = 0
+    successful = 0
+    failed = 0
+    total_bytes = 0
+    busy_seconds = [0.0] * workers
+    # Original path -> byte-identical copies waiting for its transcript
+    copies: dict[Path, list[ScannedFile]] = {}
+    duplicate_files = 0
+    duplicate_bytes = 0
+    api_calls_saved = 0
+
+    def skip(path: Path, size: int) -> None:
+        nonlocal skipped
+        skipped += 1
+        if progress_callback:
+            progress_callback(path, "skipped")
+        if events is not None:
+            events.file(path, "skipped", None, size, None, {}, {}, 0, 0)
+
+    def ensure_client() -> None:
+        nonlocal client, warm_task
+        if client is None:
+            # One pooled client for the whole run
+            client = create_async_client(
+                api_key, max_connections=uploads * DEFAULT_CHUNK_CONCURRENCY
+            )
+            if keep_warm_seconds:
+                warm_task = asyncio.ensure_future(keep_warm(client, keep_warm_seconds))
+            elif warm_up:
+                warm_task = asyncio.ensure_future(warm_async_client(client))
+
+    async def enqueue(path: Path, size: int) -> None:
+        ensure_client()
+        await queue.put((path, size))
+
+    async def produce() -> None:
+        nonlocal found, total_bytes, duplicate_files, duplicate_bytes
+        retry: list[tuple[Path, int]] = []
+        # Held back until the scan ends when the policy needs every file
+        held: list[ScannedFile] = []
+        if keep_warm_seconds:
+            # Long-running input: be ready before the first file arrives
+            ensure_client()
+
+        # Queue each file as it arrives; the scan may still be running
+        async for path, size, mtime_ns in _iter_inputs(files):
+            found += 1
+            total_bytes += size
+            if progress_callback:
+                progress_callback(path, "found")
+
+            if incremental and _is_up_to_date(
+                path, output_dir, output_format, entries, check_hash, mtime_ns
+            ):
+                skip(path, size)
+                continue
+
+            if resume and journal is not None:
+                action = _resume_action(path, entries, output_dir, output_format)
+                if action == "skip":
+                    skip(path, size)
+                    continue
+                if action == "retry":
+                    retry.append((path, size))
+                    continue
+
+            if schedule != SCAN_ORDER or dedup:
+                held.append(ScannedFile(path, size, mtime_ns or 0))
+                continue
+            await enqueue(path, size)
+
+        if held and dedup:
+            plan = await asyncio.to_thread(find_duplicates, held)
+            copies.update(plan.copies)
+            duplicate_files = plan.duplicate_count
+            duplicate_bytes = plan.duplicate_bytes
+            held = plan.unique
 
-    # Calculate summary
-    successful = sum(1 for r in results if r.success)
-    failed = sum(1 for r in results if not r.success)
+        if held:
+            durations = None
+            if schedule in DURATION_POLICIES:
+                durations = await probe_durations_async(held)
+            ordered = order_files(held, schedule, durations)
+            for entry in ordered:
+                await enqueue(entry.path, entry.size)
 
-    return BatchSummary(
-        total_files=len(files),
+        # Files that failed in an earlier run go last
+        for path, size in retry:
+            await enqueue(path, size)
+
+        for _ in range(workers):
+            await queue.put(None)
+
+    def record(result: BatchResult) -> None:
+        nonlocal successful, failed
+        if result.success:
+            successful += 1
+        else:
+            failed += 1
+        if keep_results or not result.success:
+            results.append(result)
+        if events is not None:
+            _emit_file(events, result)
+        if result_callback:
+            result_callback(result)
+
+    async def work(worker: int) -> None:
+        nonlocal api_calls_saved
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            path, size = item
+            assert client is not None
+            started = time.monotonic()
+            result = await _process_file_async(
+                input_path=path,
+                output_dir=output_dir,
+                output_format=output_format,
+                language=language,
+                client=client,
+                progress_callback=progress_callback,
+                chunk_size_minutes=chunk_size_minutes,
+                cache=cache,
+                encoding_profile=encoding_profile,
+                stream_copy=stream_copy,
+                journal=journal,
+                record_hash=check_hash,
+                stages=pipeline.ticket(
+                    size, estimate_in_flight_bytes(path, size), path
+                ),
+                extract_executor=extract_executor,
+                size=size,
+            )
+            record(result)
+            duplicates = copies.pop(path, None)
+            if duplicates:
+                for copy_result in await _write_copies(
+                    result,
+                    duplicates,
+                    output_dir,
+                    output_format,
+                    progress_callback,
+                    journal,
+                    check_hash,
+                ):
+                    if copy_result.success:
+                        # The requests the copy would have made on its own
+                        api_calls_saved += result.requests - result.retries
+                    record(copy_result)
+            busy_seconds[worker] += time.monotonic() - started
+
+    tasks = [asyncio.ensure_future(produce())]
+    tasks += [asyncio.ensure_future(work(i)) for i in range(workers)]
+    run_started = time.monotonic()
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        elapsed = time.monotonic() - run_started
+        # Only left running if the scan or client setup failed
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        extract_executor.shutdown()
+        if warm_task is not None:
+            warm_task.cancel()
+        if client is not None:
+            await client.close()
+
+    summary = BatchSummary(
+        total_files=found,
         successful=successful,
         failed=failed,
-        skipped=0,
-        results=list(results),
+        skipped=skipped,
+        results=results,
+        rate_limit=get_rate_limiter().stats() if client is not None else None,
+        total_bytes=total_bytes,
+        elapsed_seconds=elapsed,
+        # Time each worker spent waiting for work, including the tail after
+        # its last file while others were still busy
+        worker_idle_seconds=[max(0.0, elapsed - busy) for busy in busy_seconds],
+        concurrency_trajectory=list(adaptive.trajectory) if adaptive is not None else [],
+        peak_in_flight_bytes=budget.peak if budget is not None else 0,
+        byte_budget_wait_seconds=budget.wait_seconds if budget is not None else 0.0,
+        stages=pipeline.stats(),
+        duplicates=duplicate_files,
+        duplicate_bytes_saved=duplicate_bytes,
+        api_calls_saved=api_calls_saved,
     )
+    if events is not None:
+        events.emit(
+            BATCH_EVENT,
+            total_files=summary.total_files,
+            successful=summary.successful,
+            failed=summary.failed,
+            skipped=summary.skipped,
+            bytes=summary.total_bytes,
+            elapsed_seconds=round(summary.elapsed_seconds, 6),
+            duplicates=summary.duplicates,
+        )
+    return summary
 
 
 def process_batch(
-    files: list[Path],
+    files: Iterable[BatchInput],
     output_dir: Optional[Path] = None,
     output_format: Literal["txt", "srt"] = "txt",
     language: str = "auto",
-    concurrency: int = 5,
+    concurrency: Concurrency = 5,
     api_key: Optional[str] = None,
     progress_callback: Optional[Callable[[Path, str], None]] = None,
+    chunk_size_minutes: int = DEFAULT_CHUNK_SIZE_MINUTES,
+    warm_up: bool = False,
+    cache: Optional[TranscriptCache] = None,
+    encoding_profile: str = DEFAULT_ENCODING_PROFILE,
+    stream_copy: bool = True,
+    journal: Optional[BatchJournal] = None,
+    resume: bool = False,
+    incremental: bool = False,
+    check_hash: bool = False,
+    result_callback: Optional[Callable[[BatchResult], None]] = None,
+    keep_results: bool = True,
+    schedule: str = SCAN_ORDER,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    max_in_flight_bytes: Optional[int] = None,
+    stage_limits: Optional[dict[str, int]] = None,
+    extract_jobs: Optional[int] = None,
+    extract_timeouts: Optional[JobTimeouts] = None,
+    dedup: bool = False,
+    keep_warm_seconds: Optional[float] = None,
+    events: Optional[EventStream] = None,
 ) -> BatchSummary:
     """Process multiple files (synchronous wrapper).
 
     Args:
-        files: List of files to process.
+        files: Files to process (paths or ScannedFile entries).
         output_dir: Output directory (None = same as input).
         output_format: Output format for all files.
         language: Language code or "auto".
-        concurrency: Maximum concurrent transcriptions.
+        concurrency: Maximum concurrent transcriptions, or "auto" to adapt
+            between 1 and max_concurrency (see AdaptiveConcurrency).
         api_key: OpenAI API key.
         progress_callback: Optional callback(path, status) for progress.
+        chunk_size_minutes: Chunk length for files over the API size limit.
+        warm_up: Open an API connection before the first upload is ready.
+        cache: Optional transcript cache shared by all files.
+        encoding_profile: Encoding profile for extracted audio.
+        stream_copy: Remux API-compatible audio instead of re-encoding.
+        journal: Optional journal recording each file's state.
+        resume: Skip files the journal shows as completed and process
+            previously failed files last.
+        incremental: Skip files whose transcript is newer than the source.
+        check_hash: With incremental, also skip sources whose content hash
+            matches the one journaled with their transcript.
+        result_callback: Optional callback receiving each BatchResult as
+            its file completes.
+        keep_results: Keep every result in the summary; when False only
+            failures are kept, so memory does not grow with the corpus.
+        schedule: Dispatch order, one of SCHEDULE_POLICIES. Any policy but
+            "scan" waits for the whole scan before the first file starts.
+        max_concurrency: Ceiling for concurrency="auto".
+        max_in_flight_bytes: Budget for the estimated extraction output and
+            upload bodies held at once (None = file count only).
+        stage_limits: Overrides for the probe and write stage limits (the
+            upload limit is `concurrency`, the extract limit extract_jobs).
+        extract_jobs: Concurrent FFmpeg extractions (default: one per
+            available CPU, see ExtractionExecutor).
+        extract_timeouts: Wall-clock and no-progress limits for each FFmpeg
+            job (default: JobTimeouts()).
+        dedup: Transcribe byte-identical files once and write the transcript
+            for every copy. Waits for the whole scan, like a schedule policy.
+        keep_warm_seconds: Create the API client up front and re-warm its
+            connection pool at this interval (None = create it with the
+            first file).
+        events: Optional JSONL stream receiving a record for every stage
+            transition, every finished or skipped file and the whole batch.
 
     Returns:
         BatchSummary with results for all files.
@@ -262,6 +1050,26 @@ def process_batch(
             concurrency=concurrency,
             api_key=api_key,
             progress_callback=progress_callback,
+            chunk_size_minutes=chunk_size_minutes,
+            warm_up=warm_up,
+            cache=cache,
+            encoding_profile=encoding_profile,
+            stream_copy=stream_copy,
+            journal=journal,
+            resume=resume,
+            incremental=incremental,
+            check_hash=check_hash,
+            result_callback=result_callback,
+            keep_results=keep_results,
+            schedule=schedule,
+            max_concurrency=max_concurrency,
+            max_in_flight_bytes=max_in_flight_bytes,
+            stage_limits=stage_limits,
+            extract_jobs=extract_jobs,
+            extract_timeouts=extract_timeouts,
+            dedup=dedup,
+            keep_warm_seconds=keep_warm_seconds,
+            events=events,
         )
     )
 
@@ -271,10 +1079,29 @@ def process_directory(
     output_dir: Optional[Path] = None,
     output_format: Literal["txt", "srt"] = "txt",
     language: str = "auto",
-    concurrency: int = 5,
+    concurrency: Concurrency = 5,
     recursive: bool = False,
     api_key: Optional[str] = None,
     progress_callback: Optional[Callable[[Path, str], None]] = None,
+    chunk_size_minutes: int = DEFAULT_CHUNK_SIZE_MINUTES,
+    warm_up: bool = False,
+    cache: Optional[TranscriptCache] = None,
+    encoding_profile: str = DEFAULT_ENCODING_PROFILE,
+    stream_copy: bool = True,
+    journal: Optional[BatchJournal] = None,
+    resume: bool = False,
+    incremental: bool = False,
+    check_hash: bool = False,
+    result_callback: Optional[Callable[[BatchResult], None]] = None,
+    keep_results: bool = True,
+    schedule: str = SCAN_ORDER,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    max_in_flight_bytes: Optional[int] = None,
+    stage_limits: Optional[dict[str, int]] = None,
+    extract_jobs: Optional[int] = None,
+    extract_timeouts: Optional[JobTimeouts] = None,
+    dedup: bool = False,
+    events: Optional[EventStream] = None,
 ) -> BatchSummary:
     """Scan directory and process all supported files.
 
@@ -283,15 +1110,46 @@ def process_directory(
         output_dir: Output directory (None = same as input).
         output_format: Output format for all files.
         language: Language code or "auto".
-        concurrency: Maximum concurrent transcriptions.
+        concurrency: Maximum concurrent transcriptions, or "auto".
         recursive: Whether to scan subdirectories.
         api_key: OpenAI API key.
         progress_callback: Optional callback(path, status) for progress.
+        chunk_size_minutes: Chunk length for files over the API size limit.
+        warm_up: Open an API connection before the first upload is ready.
+        cache: Optional transcript cache shared by all files.
+        encoding_profile: Encoding profile for extracted audio.
+        stream_copy: Remux API-compatible audio instead of re-encoding.
+        journal: Optional journal recording each file's state.
+        resume: Skip files the journal shows as completed and process
+            previously failed files last.
+        incremental: Skip files whose transcript is newer than the source.
+        check_hash: With incremental, also skip sources whose content hash
+            matches the one journaled with their transcript.
+        result_callback: Optional callback receiving each BatchResult as
+            its file completes.
+        keep_results: Keep every result in the summary; when False only
+            failures are kept, so memory does not grow with the corpus.
+        schedule: Dispatch order, one of SCHEDULE_POLICIES. Any policy but
+            "scan" waits for the whole scan before the first file starts.
+        max_concurrency: Ceiling for concurrency="auto".
+        max_in_flight_bytes: Budget for the estimated extraction output and
+            upload bodies held at once (None = file count only).
+        stage_limits: Overrides for the probe and write stage limits (the
+            upload limit is `concurrency`, the extract limit extract_jobs).
+        extract_jobs: Concurrent FFmpeg extractions (default: one per
+            available CPU, see ExtractionExecutor).
+        extract_timeouts: Wall-clock and no-progress limits for each FFmpeg
+            job (default: JobTimeouts()).
+        dedup: Transcribe byte-identical files once and write the transcript
+            for every copy. Waits for the whole scan, like a schedule policy.
+        events: Optional JSONL stream receiving a record for every stage
+            transition, every finished or skipped file and the whole batch.
 
     Returns:
         BatchSummary with results for all files.
     """
-    files = scan_directory(directory, recursive=recursive)
+    # Stream the scan into the workers instead of listing it first
+    files = iter_media_files(directory, recursive=recursive)
 
     return process_batch(
         files=files,
@@ -301,4 +1159,23 @@ def process_directory(
         concurrency=concurrency,
         api_key=api_key,
         progress_callback=progress_callback,
+        chunk_size_minutes=chunk_size_minutes,
+        warm_up=warm_up,
+        cache=cache,
+        encoding_profile=encoding_profile,
+        stream_copy=stream_copy,
+        journal=journal,
+        resume=resume,
+        incremental=incremental,
+        check_hash=check_hash,
+        result_callback=result_callback,
+        keep_results=keep_results,
+        schedule=schedule,
+        max_concurrency=max_concurrency,
+        max_in_flight_bytes=max_in_flight_bytes,
+        stage_limits=stage_limits,
+        extract_jobs=extract_jobs,
+        extract_timeouts=extract_timeouts,
+        dedup=dedup,
+        events=events,
     )
@@ -0,0 +1,97 @@
+"""Byte budget for batch work in flight.
+
+- Caps the extraction output and upload bodies held at once
+- FIFO, so a large file waiting for room is not starved by small ones
+- A file larger than the whole budget runs alone
+"""
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+# Default in-flight byte budget for batch runs
+DEFAULT_MAX_INFLIGHT_MB = 256
+
+
+class ByteBudget:
+    """Async limit on bytes held by files in flight, for one event loop.
+
+    Works alongside the file-count limit: with a generous file count,
+    small files run in large numbers while large ones wait for room.
+    """
+
+    def __init__(self, limit_bytes: int) -> None:
+        if limit_bytes <= 0:
+            raise ValueError("Byte budget must be positive")
+        self.limit = limit_bytes
+        self._in_use = 0
+        self._waiters: deque[tuple[int, asyncio.Future]] = deque()
+        self.peak = 0
+        self.wait_seconds = 0.0
+
+    @property
+    def in_use(self) -> int:
+        """Bytes currently reserved."""
+        return self._in_use
+
+    def _fits(self, size: int) -> bool:
+        return self._in_use == 0 or self._in_use + size <= self.limit
+
+    def _grant(self, size: int) -> None:
+        self._in_use += size
+        self.peak = max(self.peak, self._in_use)
+
+    async def acquire(self, size: int) -> int:
+        """Wait until `size` bytes fit in the budget and reserve them.
+
+        Args:
+            size: Bytes the caller will hold.
+
+        Returns:
+            Bytes reserved (capped at the budget); pass to release().
+        """
+        size = max(0, min(size, self.limit))
+        if not self._waiters and self._fits(size):
+            self._grant(size)
+            return size
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append((size, waiter))
+        started = time.monotonic()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Granted just before the cancellation landed
+                self.release(size)
+            else:
+                self._waiters.remove((size, waiter))
+                self._wake()
+            raise
+        finally:
+            self.wait_seconds += time.monotonic() - started
+        return size
+
+    def release(self, size: int) -> None:
+        """Return bytes reserved by acquire()."""
+        self._in_use -= size
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self._fits(self._waiters[0][0]):
+            size, waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._grant(size)
+            waiter.set_result(None)
+
+    @asynccontextmanager
+    async def reserve(self, size: int) -> AsyncIterator[int]:
+        """Hold `size` bytes of the budget for the duration of the block."""
+        granted = await self.acquire(size)
+        try:
+            yield granted
+        finally:
+            self.release(granted)
@@ -0,0 +1,266 @@
+"""Content-addressed cache of transcription responses.
+
+- Keys: SHA-256 of the source media bytes plus language, model and
+  preprocessing parameters
+- Stat aliases: a (path, size, mtime) key pointing at the content key, so
+  a repeat lookup of an unchanged file never reads the file
+- Values: the parsed verbose_json response, stored as JSON
+- Size limit with least-recently-used eviction
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from transcribe_cli.utils import get_cache_dir
+
+# Bump when the stored response layout changes
+CACHE_VERSION = 1
+DEFAULT_CACHE_MAX_MB = 500
+HASH_BLOCK_SIZE = 1024 * 1024
+# Field of an alias entry naming the entry it points at
+ALIAS_FIELD = "_alias"
+
+
+@dataclass
+class CacheStats:
+    """Summary of the transcript cache contents."""
+
+    directory: Path
+    entries: int
+    total_bytes: int
+    max_bytes: int
+
+    @property
+    def total_mb(self) -> float:
+        """Total size of cached entries in MB."""
+        return self.total_bytes / (1024 * 1024)
+
+    @property
+    def max_mb(self) -> float:
+        """Size limit in MB."""
+        return self.max_bytes / (1024 * 1024)
+
+
+def hash_file(path: Path) -> str:
+    """Compute the SHA-256 of a file's contents.
+
+    Args:
+        path: File to hash.
+
+    Returns:
+        Hex digest.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def stat_signature(path: Path) -> str:
+    """Identify a file by resolved path, size and mtime without reading it.
+
+    Args:
+        path: File to identify.
+
+    Returns:
+        Signature usable in place of a content hash in make_cache_key.
+    """
+    st = path.stat()
+    return f"stat:{path.resolve()}:{st.st_size}:{st.st_mtime_ns}"
+
+
+def make_cache_key(
+    content_hash: str,
+    language: str,
+    model: str = "whisper-1",
+    params: Optional[dict[str, Any]] = None,
+) -> str:
+    """Derive a cache key from content and request parameters.
+
+    Args:
+        content_hash: SHA-256 of the source media, or its stat_signature.
+        language: Requested language code or "auto".
+        model: Transcription model name.
+        params: Preprocessing parameters that affect the uploaded audio.
+
+    Returns:
+        Hex digest identifying the cached response.
+    """
+    material = json.dumps(
+        {
+            "version": CACHE_VERSION,
+            "content": content_hash,
+            "language": language,
+            "model": model,
+            "params": params or {},
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class TranscriptCache:
+    """On-disk cache of API responses keyed by content hash.
+
+    Entries are individual JSON files sharded by key prefix. Reads touch
+    the entry's mtime, and eviction removes the least recently used
+    entries until the cache fits within max_bytes. Writes are atomic, so
+    concurrent workers and processes can share one cache directory.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        max_bytes: int = DEFAULT_CACHE_MAX_MB * 1024 * 1024,
+    ) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._approx_bytes: Optional[int] = None
+
+    @classmethod
+    def default(cls, max_mb: int = DEFAULT_CACHE_MAX_MB) -> "TranscriptCache":
+        """Create a cache in the user cache directory.
+
+        Args:
+            max_mb: Size limit in MB.
+
+        Returns:
+            TranscriptCache rooted at <cache dir>/transcripts.
+        """
+        return cls(get_cache_dir() / "transcripts", max_bytes=max_mb * 1024 * 1024)
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _entries(self) -> list[tuple[Path, os.stat_result]]:
+        entries: list[tuple[Path, os.stat_result]] = []
+        if not self.directory.exists():
+            return entries
+        for path in self.directory.glob("*/*.json"):
+            try:
+                entries.append((path, path.stat()))
+            except FileNotFoundError:
+                continue
+        return entries
+
+    def get(self, key: str) -> Optional[dict]:
+        """Look up a cached response, following an alias entry.
+
+        Args:
+            key: Cache key from make_cache_key.
+
+        Returns:
+            Cached response dictionary, or None on a miss.
+        """
+        response = self._read(key)
+        if response is not None and set(response) == {ALIAS_FIELD}:
+            # An alias whose target was evicted is a miss
+            return self._read(response[ALIAS_FIELD])
+        return response
+
+    def _read(self, key: str) -> Optional[dict]:
+        path = self._entry_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                response: dict = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError):
+            # Corrupt entry - drop it and treat as a miss
+            path.unlink(missing_ok=True)
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return response
+
+    def put(self, key: str, response: dict) -> None:
+        """Store a response, evicting old entries if over the size limit.
+
+        Args:
+            key: Cache key from make_cache_key.
+            response: Parsed API response to store.
+        """
+        path = self._entry_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(response, f)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        with self._lock:
+            if self._approx_bytes is None:
+                self._approx_bytes = sum(st.st_size for _, st in self._entries())
+            else:
+                self._approx_bytes += path.stat().st_size
+            over_limit = self._approx_bytes > self.max_bytes
+
+        if over_limit:
+            self.prune()
+
+    def link(self, alias: str, key: str) -> None:
+        """Make lookups of alias return the entry stored under key.
+
+        Args:
+            alias: Cache key to add.
+            key: Cache key of an existing (or soon stored) entry.
+        """
+        self.put(alias, {ALIAS_FIELD: key})
+
+    def prune(self, max_bytes: Optional[int] = None) -> int:
+        """Evict least recently used entries until under the size limit.
+
+        Args:
+            max_bytes: Target size. Defaults to the cache's max_bytes.
+
+        Returns:
+            Number of entries removed.
+        """
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        entries = sorted(self._entries(), key=lambda e: e[1].st_mtime)
+        total = sum(st.st_size for _, st in entries)
+
+        removed = 0
+        for path, st in entries:
+            if total <= limit:
+                break
+            path.unlink(missing_ok=True)
+            total -= st.st_size
+            removed += 1
+
+        with self._lock:
+            self._approx_bytes = total
+        return removed
+
+    def clear(self) -> int:
+        """Remove every entry.
+
+        Returns:
+            Number of entries removed.
+        """
+        return self.prune(max_bytes=0)
+
+    def stats(self) -> CacheStats:
+        """Report the number and total size of cached entries."""
+        entries = self._entries()
+        return CacheStats(
+            directory=self.directory,
+            entries=len(entries),
+            total_bytes=sum(st.st_size for _, st in entries),
+            max_bytes=self.max_bytes,
+        )
@@ -0,0 +1,204 @@
+"""Chunked processing for recordings over the Whisper API size limit.
+
+Implements UC-004: Handle Large File
+- Splits audio into fixed time windows sized by chunk_size_minutes
+- Re-encodes each window (MP3 or an encoding profile) so every chunk fits
+  the upload limit
+- Merges per-chunk API responses back onto a single timeline
+- Each chunk is its own FFmpeg job under the extraction watchdog
+"""
+
+import math
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Optional
+
+import ffmpeg
+
+from .extractor import ExtractionError, ExtractionTimeoutError, get_media_info
+from .ffmpeg import validate_ffmpeg
+from .profiles import ENCODING_PROFILES, EncodingProfile
+from .watchdog import JobTimeouts, run_watched
+
+# Chunks shorter than this are folded into the previous window
+MIN_CHUNK_SECONDS = 1.0
+
+
+@dataclass
+class AudioChunk:
+    """A time window of a larger recording, encoded as its own file."""
+
+    index: int
+    path: Path
+    start: float
+    duration: float
+
+    @property
+    def end(self) -> float:
+        """End offset of the chunk in the source recording (seconds)."""
+        return self.start + self.duration
+
+
+def plan_chunks(
+    total_duration: float, chunk_seconds: float
+) -> list[tuple[float, float]]:
+    """Compute (start, duration) windows covering a recording.
+
+    Windows are contiguous with no gaps or overlaps. A trailing window
+    shorter than MIN_CHUNK_SECONDS is merged into the one before it.
+
+    Args:
+        total_duration: Length of the recording in seconds.
+        chunk_seconds: Target length of each window in seconds.
+
+    Returns:
+        List of (start, duration) tuples in seconds.
+
+    Raises:
+        ValueError: If either argument is not positive.
+    """
+    if total_duration <= 0:
+        raise ValueError(f"Duration must be positive, got {total_duration}")
+    if chunk_seconds <= 0:
+        raise ValueError(f"Chunk size must be positive, got {chunk_seconds}")
+
+    count = max(1, math.ceil(total_duration / chunk_seconds))
+    windows = []
+    for i in range(count):
+        start = i * chunk_seconds
+        duration = min(chunk_seconds, total_duration - start)
+        windows.append((start, duration))
+
+    if len(windows) > 1 and windows[-1][1] < MIN_CHUNK_SECONDS:
+        tail = windows.pop()
+        prev_start, prev_duration = windows[-1]
+        windows[-1] = (prev_start, prev_duration + tail[1])
+
+    return windows
+
+
+def split_audio(
+    input_path: Path,
+    output_dir: Path,
+    chunk_seconds: float,
+    duration: Optional[float] = None,
+    audio_bitrate: str = "192k",
+    profile: Optional[EncodingProfile] = None,
+    threads: Optional[int] = None,
+    timeouts: Optional[JobTimeouts] = None,
+) -> list[AudioChunk]:
+    """Split a media file into encoded chunks of a fixed duration.
+
+    Args:
+        input_path: Path to the audio (or video) file to split.
+        output_dir: Directory to write chunk files into.
+        chunk_seconds: Target length of each chunk in seconds.
+        duration: Known duration of the input. Probed with ffprobe if None.
+        audio_bitrate: MP3 bitrate for the encoded chunks.
+        profile: Encoding profile for the chunks. Overrides audio_bitrate
+            (MP3) when given.
+        threads: FFmpeg threads per chunk (default: FFmpeg's choice).
+        timeouts: Wall-clock and no-progress limits for each chunk
+            (default: JobTimeouts()).
+
+    Returns:
+        List of AudioChunk in timeline order.
+
+    Raises:
+        FFmpegNotFoundError: If FFmpeg is not installed.
+        ExtractionTimeoutError: If FFmpeg ran too long or stalled on a
+            chunk; the partial chunk is removed.
+        ExtractionError: If the duration is unknown or splitting fails.
+    """
+    validate_ffmpeg()
+
+    if duration is None:
+        duration = get_media_info(input_path).duration
+    if not duration:
+        raise ExtractionError(
+            f"Cannot split {input_path}: duration could not be determined"
+        )
+
+    if profile is None:
+        profile = replace(ENCODING_PROFILES["mp3"], bitrate=audio_bitrate)
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    chunks = []
+    for index, (start, length) in enumerate(plan_chunks(duration, chunk_seconds)):
+        chunk_path = (
+            output_dir / f"{input_path.stem}.chunk{index:04d}.{profile.extension}"
+        )
+        stream = ffmpeg.input(str(input_path), ss=start, t=length)
+        stream = ffmpeg.output(
+            stream,
+            str(chunk_path),
+            format=profile.container,
+            **profile.output_options(),
+            **({"threads": str(threads)} if threads is not None else {}),
+        )
+        stream = ffmpeg.overwrite_output(stream)
+        outcome = run_watched(stream, timeouts=timeouts)
+
+        if outcome.timeout is not None:
+            chunk_path.unlink(missing_ok=True)
+            limit = (timeouts or JobTimeouts()).limit(outcome.timeout)
+            raise ExtractionTimeoutError(input_path, outcome.timeout, limit)
+        if outcome.returncode != 0:
+            raise ExtractionError(
+                f"FFmpeg failed to write chunk {index + 1}: "
+                f"{outcome.stderr or 'Unknown error'}"
+            )
+
+        if not chunk_path.exists():
+            raise ExtractionError(f"Chunk file was not created: {chunk_path}")
+
+        chunks.append(
+            AudioChunk(index=index, path=chunk_path, start=start, duration=length)
+        )
+
+    return chunks
+
+
+def merge_chunk_responses(responses: list[dict], chunks: list[AudioChunk]) -> dict:
+    """Merge per-chunk verbose_json responses into one response.
+
+    Segment timestamps are shifted by each chunk's start offset and
+    renumbered so the result reads like a single-pass transcription.
+
+    Args:
+        responses: API responses, one per chunk, in the same order as chunks.
+        chunks: The chunks the responses belong to.
+
+    Returns:
+        Response dictionary with merged text, segments, language and duration.
+    """
+    texts = []
+    segments: list[dict[str, Any]] = []
+    language = None
+
+    for response, chunk in zip(responses, chunks):
+        text = (response.get("text") or "").strip()
+        if text:
+            texts.append(text)
+        if language is None and response.get("language"):
+            language = response["language"]
+
+        for seg in response.get("segments") or []:
+            segments.append(
+                {
+                    "id": len(segments),
+                    "start": chunk.start + seg.get("start", 0.0),
+                    "end": chunk.start + seg.get("end", 0.0),
+                    "text": seg.get("text", ""),
+                }
+            )
+
+    duration = chunks[-1].end if chunks else None
+
+    return {
+        "text": " ".join(texts),
+        "segments": segments,
+        "language": language or "unknown",
+        "duration": duration,
+    }
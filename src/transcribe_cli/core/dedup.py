@@ -0,0 +1,135 @@
+"""Duplicate detection for batch runs.
+
+- Candidates grouped by size first; files with a unique size are never read
+- Same-size files compared by a partial hash of their head and tail, then
+  confirmed by a full SHA-256
+- Files small enough for the partial hash to cover them skip the full pass
+- Hashing runs on a thread pool, like the directory scan
+"""
+
+import hashlib
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
+
+from .cache import hash_file
+from .scanner import DEFAULT_SCAN_WORKERS, ScannedFile
+
+# Bytes read from each end of a file for the partial hash
+PARTIAL_HASH_BYTES = 64 * 1024
+
+# Group of files that are (so far) indistinguishable
+_Group = list[ScannedFile]
+
+
+@dataclass
+class DuplicatePlan:
+    """Files to process, and the byte-identical copies each one stands for."""
+
+    unique: list[ScannedFile]
+    # Original path -> copies that reuse its transcript
+    copies: dict[Path, list[ScannedFile]] = field(default_factory=dict)
+
+    @property
+    def duplicate_count(self) -> int:
+        """Files that will not be processed on their own."""
+        return sum(len(copies) for copies in self.copies.values())
+
+    @property
+    def duplicate_bytes(self) -> int:
+        """Bytes of the files that will not be processed on their own."""
+        return sum(c.size for copies in self.copies.values() for c in copies)
+
+
+def partial_hash(path: Path, size: int) -> Optional[str]:
+    """Hash the first and last PARTIAL_HASH_BYTES of a file.
+
+    Args:
+        path: File to hash.
+        size: File size in bytes.
+
+    Returns:
+        Hex digest, or None if the file cannot be read.
+    """
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            digest.update(f.read(PARTIAL_HASH_BYTES))
+            if size > PARTIAL_HASH_BYTES:
+                # Tail window; starts after the head in files under two windows
+                f.seek(max(PARTIAL_HASH_BYTES, size - PARTIAL_HASH_BYTES))
+                digest.update(f.read(PARTIAL_HASH_BYTES))
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def _full_hash(entry: ScannedFile) -> Optional[str]:
+    try:
+        return hash_file(entry.path)
+    except OSError:
+        return None
+
+
+def _refine(
+    groups: list[_Group],
+    key: Callable[[ScannedFile], Optional[str]],
+    pool: ThreadPoolExecutor,
+) -> list[_Group]:
+    """Split groups by key, keeping only buckets with more than one file.
+
+    Files whose key is None (unreadable) drop out and are processed alone.
+    """
+    members = [entry for group in groups for entry in group]
+    keys = dict(zip((entry.path for entry in members), pool.map(key, members)))
+
+    refined: list[_Group] = []
+    for group in groups:
+        buckets: dict[str, _Group] = defaultdict(list)
+        for entry in group:
+            digest = keys[entry.path]
+            if digest is not None:
+                buckets[digest].append(entry)
+        refined += [bucket for bucket in buckets.values() if len(bucket) > 1]
+    return refined
+
+
+def find_duplicates(
+    entries: list[ScannedFile],
+    max_workers: int = DEFAULT_SCAN_WORKERS,
+) -> DuplicatePlan:
+    """Group byte-identical files.
+
+    The first file of each group (in input order) is the original; the
+    rest are its copies. Empty files are never treated as duplicates.
+
+    Args:
+        entries: Files found for this run.
+        max_workers: Files hashed at once.
+
+    Returns:
+        DuplicatePlan with the files to process in their original order.
+    """
+    by_size: dict[int, _Group] = defaultdict(list)
+    seen: set[Path] = set()
+    for entry in entries:
+        if entry.size > 0 and entry.path not in seen:
+            seen.add(entry.path)
+            by_size[entry.size].append(entry)
+    groups = [group for group in by_size.values() if len(group) > 1]
+    if not groups:
+        return DuplicatePlan(unique=list(entries))
+
+    with ThreadPoolExecutor(max_workers, thread_name_prefix="dedup") as pool:
+        groups = _refine(groups, lambda e: partial_hash(e.path, e.size), pool)
+        # The partial hash already covered every byte of small files
+        covered = [g for g in groups if g[0].size <= 2 * PARTIAL_HASH_BYTES]
+        large = [g for g in groups if g[0].size > 2 * PARTIAL_HASH_BYTES]
+        groups = covered + _refine(large, _full_hash, pool)
+
+    copies = {group[0].path: group[1:] for group in groups}
+    skipped = {entry.path for group in groups for entry in group[1:]}
+    unique = [entry for entry in entries if entry.path not in skipped]
+    return DuplicatePlan(unique=unique, copies=copies)
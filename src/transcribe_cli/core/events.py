@@ -0,0 +1,154 @@
+"""Structured JSONL event stream for batch runs.
+
+- One JSON line per stage transition, per finished file and per batch
+- Written to a file (appended) or stdout ("-"), flushed after every line so
+  consumers can act on each transcript as soon as it is written
+- Safe for concurrent workers (one locked write per line)
+"""
+
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import IO, Any, Optional, Union
+
+# Target meaning standard output
+STDOUT = "-"
+
+# Record types
+STAGE_EVENT = "stage"
+FILE_EVENT = "file"
+BATCH_EVENT = "batch"
+
+
+def _rounded(timings: dict[str, float]) -> dict[str, float]:
+    return {name: round(seconds, 6) for name, seconds in timings.items()}
+
+
+class EventStream:
+    """JSONL sink for batch events.
+
+    Every record has "event" (STAGE_EVENT, FILE_EVENT or BATCH_EVENT) and
+    "time" (Unix seconds); the rest depends on the event type.
+    """
+
+    def __init__(self, stream: IO[str], owned: bool = False) -> None:
+        """Wrap an open text stream.
+
+        Args:
+            stream: Stream to write lines to.
+            owned: Close the stream in close().
+        """
+        self._stream = stream
+        self._owned = owned
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(cls, target: Union[str, Path]) -> "EventStream":
+        """Open an event stream on a file path, or stdout for "-".
+
+        Files are opened for appending, so successive runs accumulate.
+        """
+        if str(target) == STDOUT:
+            return cls(sys.stdout)
+        path = Path(target).expanduser()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return cls(open(path, "a", encoding="utf-8"), owned=True)
+
+    def emit(self, event: str, **fields: Any) -> None:
+        """Write one record.
+
+        Args:
+            event: Record type.
+            **fields: JSON-serializable fields; Paths are written as strings.
+        """
+        record = {"event": event, "time": time.time(), **fields}
+        line = json.dumps(record, default=str)
+        with self._lock:
+            self._stream.write(line + "\n")
+            self._stream.flush()
+
+    def stage(
+        self,
+        input_path: Optional[Path],
+        stage: str,
+        previous: Optional[str],
+        size: int,
+        timings: dict[str, float],
+        waits: dict[str, float],
+    ) -> None:
+        """Record a file entering a pipeline stage.
+
+        Args:
+            input_path: Source file.
+            stage: Stage entered.
+            previous: Stage left (None for the first stage).
+            size: Source size in bytes.
+            timings: Seconds the file held each stage so far.
+            waits: Seconds the file queued for each stage so far.
+        """
+        self.emit(
+            STAGE_EVENT,
+            input=input_path,
+            stage=stage,
+            previous=previous,
+            bytes=size,
+            stage_seconds=_rounded(timings),
+            wait_seconds=_rounded(waits),
+        )
+
+    def file(
+        self,
+        input_path: Path,
+        status: str,
+        output_path: Optional[Path],
+        size: int,
+        audio_seconds: Optional[float],
+        timings: dict[str, float],
+        waits: dict[str, float],
+        requests: int,
+        retries: int,
+        **extra: Any,
+    ) -> None:
+        """Record a file leaving the batch.
+
+        Args:
+            input_path: Source file.
+            status: "completed", "failed" or "skipped".
+            output_path: Transcript written, if any.
+            size: Source size in bytes.
+            audio_seconds: Duration of the transcribed audio, if known.
+            timings: Seconds the file held each pipeline stage.
+            waits: Seconds the file queued for each pipeline stage.
+            requests: Transcription requests made, including retries.
+            retries: Requests that were retries.
+            **extra: Further fields (error, timed_out, duplicate_of).
+        """
+        self.emit(
+            FILE_EVENT,
+            input=input_path,
+            status=status,
+            output=output_path,
+            bytes=size,
+            audio_seconds=audio_seconds,
+            stage_seconds=_rounded(timings),
+            wait_seconds=_rounded(waits),
+            requests=requests,
+            retries=retries,
+            **extra,
+        )
+
+    def close(self) -> None:
+        """Flush, and close the stream if this object opened it."""
+        with self._lock:
+            if self._owned:
+                self._stream.close()
+            else:
+                self._stream.flush()
+
+    def __enter__(self) -> "EventStream":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
@@ -0,0 +1,139 @@
+"""CPU-aware executor for FFmpeg extraction.
+
+- CPU count from the scheduler affinity mask and the cgroup CPU quota, so
+  containers and taskset'd processes are not oversubscribed
+- Dedicated thread pool, separate from the default executor used for
+  uploads and file I/O
+- Splits the CPUs between concurrent jobs and gives each ffmpeg a matching
+  -threads value
+- Carries the wall-clock and no-progress limits for the batch's jobs
+"""
+
+import asyncio
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Optional, TypeVar
+
+from .watchdog import JobTimeouts
+
+# cgroup filesystem root (v2 unified hierarchy, or v1 controllers below it)
+CGROUP_ROOT = Path("/sys/fs/cgroup")
+
+T = TypeVar("T")
+
+
+def _read(path: Path) -> Optional[str]:
+    try:
+        return path.read_text().strip()
+    except OSError:
+        return None
+
+
+def cgroup_cpu_limit(root: Path = CGROUP_ROOT) -> Optional[float]:
+    """Read the CPU quota of the current cgroup.
+
+    Checks cgroup v2 (cpu.max) first, then v1 (cpu.cfs_quota_us and
+    cpu.cfs_period_us). Inside a container the process's own cgroup is
+    mounted at the root.
+
+    Args:
+        root: cgroup filesystem mount point.
+
+    Returns:
+        CPUs allowed by the quota, or None if there is no quota.
+    """
+    cpu_max = _read(root / "cpu.max")
+    if cpu_max is not None:
+        parts = cpu_max.split()
+        if len(parts) == 2 and parts[0] != "max":
+            try:
+                quota, period = int(parts[0]), int(parts[1])
+            except ValueError:
+                return None
+            if quota > 0 and period > 0:
+                return quota / period
+        return None
+
+    for controller in ("cpu", "cpu,cpuacct"):
+        quota_text = _read(root / controller / "cpu.cfs_quota_us")
+        period_text = _read(root / controller / "cpu.cfs_period_us")
+        if quota_text is None or period_text is None:
+            continue
+        try:
+            quota, period = int(quota_text), int(period_text)
+        except ValueError:
+            return None
+        if quota > 0 and period > 0:
+            return quota / period
+        return None
+    return None
+
+
+def available_cpus(cgroup_root: Path = CGROUP_ROOT) -> int:
+    """Count the CPUs this process may actually use.
+
+    Args:
+        cgroup_root: cgroup filesystem mount point.
+
+    Returns:
+        The smaller of the affinity mask size and the cgroup quota
+        (rounded up), at least 1.
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except (AttributeError, OSError):
+        # Not available on macOS or Windows
+        cpus = os.cpu_count() or 1
+
+    quota = cgroup_cpu_limit(cgroup_root)
+    if quota is not None:
+        cpus = min(cpus, math.ceil(quota))
+    return max(1, cpus)
+
+
+class ExtractionExecutor:
+    """Thread pool for FFmpeg extraction jobs.
+
+    The encoding itself runs in the ffmpeg child process; the pool thread
+    only waits on it and moves bytes through the pipe, so threads (not
+    processes) are enough. Batch runs await buffered extractions as
+    asyncio subprocesses and only use the pool for chunk splitting. What
+    matters is the number of concurrent jobs times the threads each ffmpeg
+    uses, which this keeps at the CPU count.
+    """
+
+    def __init__(
+        self,
+        jobs: Optional[int] = None,
+        cpus: Optional[int] = None,
+        timeouts: Optional[JobTimeouts] = None,
+    ) -> None:
+        """Size the pool.
+
+        Args:
+            jobs: Concurrent extractions (default: one per CPU).
+            cpus: CPUs to divide between jobs (default: available_cpus()).
+            timeouts: Limits for each FFmpeg job (default: JobTimeouts()).
+
+        Raises:
+            ValueError: If jobs is less than 1.
+        """
+        if jobs is not None and jobs < 1:
+            raise ValueError("Extraction jobs must be at least 1")
+        self.cpus = cpus if cpus is not None else available_cpus()
+        self.jobs = jobs if jobs is not None else self.cpus
+        self.threads_per_job = max(1, self.cpus // self.jobs)
+        self.timeouts = timeouts or JobTimeouts()
+        self._pool = ThreadPoolExecutor(max_workers=self.jobs, thread_name_prefix="extract")
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking extraction function on the pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, partial(func, *args, **kwargs))
+
+    def shutdown(self) -> None:
+        """Stop the pool once running jobs finish."""
+        self._pool.shutdown(wait=False)
@@ -4,24 +4,54 @@ Implements ADR-001: FFmpeg Integration Approach
 - Uses ffmpeg-python library for audio extraction
 - Supports MKV, MP4, AVI, MOV containers
 - Extracts to MP3 format (optimal for Whisper API)
+- Streams extracted audio through a pipe into a spooled in-memory buffer
+- Encodes with selectable profiles (see profiles.py)
+- Remuxes with stream copy when the source audio codec is API-compatible
+- Caches ffprobe results by path, size and mtime (see probe_cache.py)
+- Async probe and buffered extraction on asyncio subprocesses, killing the
+  child when the awaiting task is cancelled
+- Wall-clock and no-progress timeouts on every extraction (see watchdog.py)
 """
 
+import asyncio
 import json
+import os
 import subprocess
 import tempfile
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Literal, Optional
+from typing import IO, Literal, Optional
 
 import ffmpeg
 
 from .ffmpeg import FFmpegNotFoundError, find_ffprobe, validate_ffmpeg
+from .probe_cache import ProbeCache
+from .profiles import ENCODING_PROFILES, EncodingProfile, copy_profile
+from .watchdog import (
+    NO_PROGRESS,
+    JobOutcome,
+    JobTimeouts,
+    run_watched,
+    run_watched_async,
+)
 
 # Supported input formats
 VIDEO_EXTENSIONS = {".mkv", ".mp4", ".avi", ".mov", ".webm", ".wmv", ".flv"}
 AUDIO_EXTENSIONS = {".mp3", ".wav", ".flac", ".aac", ".m4a", ".ogg", ".wma"}
 SUPPORTED_EXTENSIONS = VIDEO_EXTENSIONS | AUDIO_EXTENSIONS
 
+# Piped audio stays in memory up to this size, then spills to a temp file
+DEFAULT_SPOOL_THRESHOLD_BYTES = 16 * 1024 * 1024
+
+# Seconds to wait for ffprobe before giving up on a file
+FFPROBE_TIMEOUT_SECONDS = 30
+
+# Only the ffprobe fields MediaInfo uses (cheaper than -show_format -show_streams)
+PROBE_ENTRIES = (
+    "format=format_name,duration:"
+    "stream=codec_type,codec_name,channels,sample_rate,bit_rate"
+)
+
 
 class ExtractionError(Exception):
     """Raised when audio extraction fails."""
@@ -29,6 +59,20 @@ class ExtractionError(Exception):
     pass
 
 
+class ExtractionTimeoutError(ExtractionError):
+    """Raised when FFmpeg is killed for running too long or stalling."""
+
+    def __init__(self, path: Path, reason: str, seconds: float) -> None:
+        if reason == NO_PROGRESS:
+            message = f"FFmpeg made no progress for {seconds:.0f}s on {path}; killed"
+        else:
+            message = f"FFmpeg exceeded the {seconds:.0f}s time limit on {path}; killed"
+        super().__init__(message)
+        self.path = path
+        self.reason = reason
+        self.seconds = seconds
+
+
 class UnsupportedFormatError(Exception):
     """Raised when file format is not supported."""
 
@@ -65,6 +109,7 @@ class MediaInfo:
     audio_codec: Optional[str]
     audio_channels: Optional[int]
     audio_sample_rate: Optional[int]
+    audio_bitrate: Optional[int] = None
 
     @property
     def is_video(self) -> bool:
@@ -97,6 +142,8 @@ class ExtractionResult:
     duration: Optional[float]
     audio_codec: str
     file_size: int
+    profile: Optional[str] = None
+    method: Literal["remux", "transcode"] = "transcode"
 
     @property
     def file_size_display(self) -> str:
@@ -110,49 +157,203 @@ class ExtractionResult:
         return f"{self.file_size / (1024 * 1024 * 1024):.2f} GB"
 
 
-def get_media_info(path: Path) -> MediaInfo:
-    """Get information about a media file using ffprobe.
+@dataclass
+class AudioBuffer:
+    """Extracted audio held in a spooled buffer rather than a named file.
 
-    Args:
-        path: Path to media file.
+    The buffer lives in memory until it grows past the spool threshold,
+    after which it is backed by an anonymous temporary file.
+    """
 
-    Returns:
-        MediaInfo with file details.
+    input_path: Path
+    name: str
+    file: IO[bytes]
+    size: int
+    duration: Optional[float]
+    audio_codec: str
+    method: Literal["remux", "transcode"] = "transcode"
 
-    Raises:
-        FFmpegNotFoundError: If ffprobe is not available.
-        ExtractionError: If file cannot be probed.
-    """
+    @property
+    def spilled(self) -> bool:
+        """Whether the buffer outgrew memory and was moved to disk."""
+        return bool(getattr(self.file, "_rolled", False))
+
+    def open(self) -> IO[bytes]:
+        """Rewind the buffer and return it for reading."""
+        self.file.seek(0)
+        return self.file
+
+    def read_bytes(self) -> bytes:
+        """Return the full contents of the buffer."""
+        return self.open().read()
+
+    def close(self) -> None:
+        """Release the buffer (and its spill file, if any)."""
+        self.file.close()
+
+
+def _ffprobe_args(path: Path) -> list[str]:
+    """Build the ffprobe command line for one file."""
     ffprobe_path = find_ffprobe()
     if ffprobe_path is None:
         raise FFmpegNotFoundError()  # Uses default message with installation instructions
 
+    return [
+        ffprobe_path,
+        "-v",
+        "quiet",
+        "-print_format",
+        "json",
+        "-show_entries",
+        PROBE_ENTRIES,
+        str(path),
+    ]
+
+
+def _parse_probe_output(stdout: str) -> dict:
+    try:
+        return json.loads(stdout)
+    except json.JSONDecodeError as e:
+        raise ExtractionError(f"Failed to parse ffprobe output: {e}") from e
+
+
+def _run_ffprobe(path: Path) -> dict:
+    """Run ffprobe on a file and return its parsed JSON output."""
+    args = _ffprobe_args(path)
     try:
         result = subprocess.run(
-            [
-                ffprobe_path,
-                "-v",
-                "quiet",
-                "-print_format",
-                "json",
-                "-show_format",
-                "-show_streams",
-                str(path),
-            ],
+            args,
             capture_output=True,
             text=True,
-            timeout=30,
+            timeout=FFPROBE_TIMEOUT_SECONDS,
         )
+    except subprocess.TimeoutExpired as e:
+        raise ExtractionError(f"ffprobe timed out for {path}") from e
 
-        if result.returncode != 0:
-            raise ExtractionError(f"ffprobe failed: {result.stderr}")
+    if result.returncode != 0:
+        raise ExtractionError(f"ffprobe failed: {result.stderr}")
 
-        data = json.loads(result.stdout)
-    except json.JSONDecodeError as e:
-        raise ExtractionError(f"Failed to parse ffprobe output: {e}") from e
-    except subprocess.TimeoutExpired as e:
+    return _parse_probe_output(result.stdout)
+
+
+async def _kill(process: "asyncio.subprocess.Process") -> None:
+    """Kill a child process if it is still running, and reap it."""
+    if process.returncode is None:
+        try:
+            process.kill()
+        except ProcessLookupError:
+            pass
+    await process.wait()
+
+
+async def _run_ffprobe_async(path: Path) -> dict:
+    """Run ffprobe as an asyncio subprocess and return its parsed output."""
+    process = await asyncio.create_subprocess_exec(
+        *_ffprobe_args(path),
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(
+            process.communicate(), timeout=FFPROBE_TIMEOUT_SECONDS
+        )
+    except asyncio.TimeoutError as e:
+        await _kill(process)
         raise ExtractionError(f"ffprobe timed out for {path}") from e
+    except BaseException:
+        await _kill(process)
+        raise
+
+    if process.returncode != 0:
+        raise ExtractionError(f"ffprobe failed: {stderr.decode(errors='replace')}")
+
+    return _parse_probe_output(stdout.decode())
+
+
+@dataclass
+class _ProbeEntry:
+    """Probe cache slot for one file at its current size and mtime."""
+
+    cache: ProbeCache
+    path: Path
+    st: os.stat_result
+
+    @classmethod
+    def lookup(cls, path: Path) -> Optional["_ProbeEntry"]:
+        try:
+            resolved = Path(path).resolve()
+            st = resolved.stat()
+            cache = ProbeCache.default()
+        except OSError:
+            # Missing or unreadable files are left for ffprobe to report
+            return None
+        return cls(cache, resolved, st)
+
+    def get(self) -> Optional[dict]:
+        return self.cache.get(self.path, self.st)
+
+    def put(self, data: dict) -> None:
+        self.cache.put(self.path, self.st, data)
+
 
+def get_media_info(path: Path, use_cache: bool = True) -> MediaInfo:
+    """Get information about a media file using ffprobe.
+
+    Results are cached by resolved path, size and mtime, so repeated
+    lookups of an unchanged file (verbose output, fit profiles, batch
+    runs) spawn ffprobe only once.
+
+    Args:
+        path: Path to media file.
+        use_cache: Read and update the persistent probe cache.
+
+    Returns:
+        MediaInfo with file details.
+
+    Raises:
+        FFmpegNotFoundError: If ffprobe is not available.
+        ExtractionError: If file cannot be probed.
+    """
+    entry = _ProbeEntry.lookup(path) if use_cache else None
+    data = entry.get() if entry is not None else None
+    if data is None:
+        data = _run_ffprobe(path)
+        if entry is not None:
+            entry.put(data)
+    return _parse_media_info(path, data)
+
+
+async def get_media_info_async(path: Path, use_cache: bool = True) -> MediaInfo:
+    """Get information about a media file without blocking the event loop.
+
+    Async counterpart of get_media_info. ffprobe runs as an asyncio
+    subprocess, so many concurrent probes need no threads; only the probe
+    cache lookups are handed to the default executor. If the awaiting task
+    is cancelled, ffprobe is killed.
+
+    Args:
+        path: Path to media file.
+        use_cache: Read and update the persistent probe cache.
+
+    Returns:
+        MediaInfo with file details.
+
+    Raises:
+        FFmpegNotFoundError: If ffprobe is not available.
+        ExtractionError: If file cannot be probed.
+    """
+    entry = await asyncio.to_thread(_ProbeEntry.lookup, path) if use_cache else None
+    data = await asyncio.to_thread(entry.get) if entry is not None else None
+    if data is None:
+        data = await _run_ffprobe_async(path)
+        if entry is not None:
+            await asyncio.to_thread(entry.put, data)
+    return _parse_media_info(path, data)
+
+
+def _parse_media_info(path: Path, data: dict) -> MediaInfo:
+    """Build MediaInfo from ffprobe JSON output."""
     # Parse streams
     streams = data.get("streams", [])
     format_info = data.get("format", {})
@@ -165,6 +366,7 @@ def get_media_info(path: Path) -> MediaInfo:
     audio_codec = None
     audio_channels = None
     audio_sample_rate = None
+    audio_bitrate = None
     if audio_streams:
         first_audio = audio_streams[0]
         audio_codec = first_audio.get("codec_name")
@@ -172,6 +374,12 @@ def get_media_info(path: Path) -> MediaInfo:
         sample_rate = first_audio.get("sample_rate")
         if sample_rate:
             audio_sample_rate = int(sample_rate)
+        bit_rate = first_audio.get("bit_rate")
+        if bit_rate:
+            try:
+                audio_bitrate = int(bit_rate)
+            except ValueError:
+                pass
 
     # Parse duration
     duration = None
@@ -191,6 +399,7 @@ def get_media_info(path: Path) -> MediaInfo:
         audio_codec=audio_codec,
         audio_channels=audio_channels,
         audio_sample_rate=audio_sample_rate,
+        audio_bitrate=audio_bitrate,
     )
 
 
@@ -215,12 +424,52 @@ def validate_input_file(path: Path) -> None:
         raise UnsupportedFormatError(path, extension)
 
 
+def _format_profile(
+    output_format: Literal["mp3", "wav"],
+    audio_bitrate: str,
+) -> EncodingProfile:
+    """Profile for the plain mp3/wav formats, honoring audio_bitrate."""
+    profile = ENCODING_PROFILES[output_format]
+    if profile.bitrate is not None:
+        profile = replace(profile, bitrate=audio_bitrate)
+    return profile
+
+
+def _output_stream(
+    input_path: Path,
+    target: str,
+    profile: EncodingProfile,
+    threads: Optional[int] = None,
+    **extra: str,
+) -> "ffmpeg.nodes.OutputStream":
+    """Build the FFmpeg graph for one extraction.
+
+    Stream copies map only the first audio stream (-map 0:a:0 -c:a copy);
+    transcodes drop video and encode with the profile's options. threads
+    caps FFmpeg's worker threads (-threads) for the job.
+    """
+    if threads is not None:
+        extra["threads"] = str(threads)
+    stream = ffmpeg.input(str(input_path))
+    if profile.is_copy:
+        return ffmpeg.output(
+            stream["a:0"], target, format=profile.container, acodec="copy", **extra
+        )
+    return ffmpeg.output(
+        stream, target, format=profile.container, **profile.output_options(), **extra
+    )
+
+
 def extract_audio(
     input_path: Path,
     output_path: Optional[Path] = None,
     output_format: Literal["mp3", "wav"] = "mp3",
     audio_bitrate: str = "192k",
     overwrite: bool = True,
+    profile: Optional[EncodingProfile] = None,
+    stream_copy: bool = False,
+    threads: Optional[int] = None,
+    timeouts: Optional[JobTimeouts] = None,
 ) -> ExtractionResult:
     """Extract audio from a video or audio file.
 
@@ -230,15 +479,25 @@ def extract_audio(
         output_format: Output audio format (mp3 or wav).
         audio_bitrate: Audio bitrate for MP3 (e.g., "192k", "320k").
         overwrite: Whether to overwrite existing output file.
+        profile: Encoding profile. Overrides output_format and
+            audio_bitrate when given.
+        stream_copy: Remux the source audio without re-encoding when its
+            codec is API-compatible and no profile was given. The output
+            then uses the remux container (e.g. .m4a for AAC).
+        threads: FFmpeg threads for this job (default: FFmpeg's choice).
+        timeouts: Wall-clock and no-progress limits (default: JobTimeouts()).
 
     Returns:
-        ExtractionResult with details about the extracted audio.
+        ExtractionResult with details about the extracted audio, including
+        whether it was remuxed or transcoded.
 
     Raises:
         FFmpegNotFoundError: If FFmpeg is not installed.
         FileNotFoundError: If input file does not exist.
         UnsupportedFormatError: If input format is not supported.
         NoAudioStreamError: If input has no audio stream.
+        ExtractionTimeoutError: If FFmpeg ran too long or stalled; the
+            partial output is removed.
         ExtractionError: If extraction fails.
     """
     # Validate FFmpeg first
@@ -253,9 +512,19 @@ def extract_audio(
     if not media_info.has_audio:
         raise NoAudioStreamError(input_path)
 
+    if profile is None and stream_copy:
+        copy = copy_profile(media_info.audio_codec)
+        # A stream copy cannot honor an output path in another format
+        if copy is not None and (
+            output_path is None or Path(output_path).suffix.lower() == f".{copy.extension}"
+        ):
+            profile = copy
+    if profile is None:
+        profile = _format_profile(output_format, audio_bitrate)
+
     # Determine output path
     if output_path is None:
-        output_path = input_path.with_suffix(f".{output_format}")
+        output_path = input_path.with_suffix(f".{profile.extension}")
     else:
         output_path = Path(output_path).resolve()
 
@@ -263,37 +532,15 @@ def extract_audio(
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     # Build ffmpeg command
-    try:
-        stream = ffmpeg.input(str(input_path))
-
-        # Configure output based on format
-        if output_format == "mp3":
-            stream = ffmpeg.output(
-                stream,
-                str(output_path),
-                acodec="libmp3lame",
-                audio_bitrate=audio_bitrate,
-                vn=None,  # No video
-            )
-        else:  # wav
-            stream = ffmpeg.output(
-                stream,
-                str(output_path),
-                acodec="pcm_s16le",
-                ar=16000,  # 16kHz sample rate (good for speech)
-                ac=1,  # Mono
-                vn=None,
-            )
-
-        if overwrite:
-            stream = ffmpeg.overwrite_output(stream)
-
-        # Run extraction
-        ffmpeg.run(stream, quiet=True, capture_stderr=True)
-
-    except ffmpeg.Error as e:
-        stderr = e.stderr.decode() if e.stderr else "Unknown error"
-        raise ExtractionError(f"FFmpeg extraction failed: {stderr}") from e
+    stream = _output_stream(input_path, str(output_path), profile, threads)
+    if overwrite:
+        stream = ffmpeg.overwrite_output(stream)
+
+    # Run extraction
+    outcome = run_watched(stream, timeouts=timeouts)
+    if outcome.timeout is not None:
+        output_path.unlink(missing_ok=True)
+    _check_outcome(input_path, outcome, timeouts)
 
     # Verify output was created
     if not output_path.exists():
@@ -303,8 +550,216 @@ def extract_audio(
         input_path=input_path,
         output_path=output_path,
         duration=media_info.duration,
-        audio_codec=output_format,
+        audio_codec=profile.extension,
         file_size=output_path.stat().st_size,
+        profile=profile.name,
+        method="remux" if profile.is_copy else "transcode",
+    )
+
+
+def extract_audio_to_buffer(
+    input_path: Path,
+    output_format: Literal["mp3", "wav"] = "mp3",
+    audio_bitrate: str = "192k",
+    spool_threshold: int = DEFAULT_SPOOL_THRESHOLD_BYTES,
+    media_info: Optional[MediaInfo] = None,
+    profile: Optional[EncodingProfile] = None,
+    stream_copy: bool = False,
+    threads: Optional[int] = None,
+    timeouts: Optional[JobTimeouts] = None,
+    spill_dir: Optional[Path] = None,
+) -> AudioBuffer:
+    """Extract audio by streaming FFmpeg's stdout into a spooled buffer.
+
+    Avoids the write/read/delete cycle of a scratch file: the encoded audio
+    is kept in memory and only spills to an anonymous temporary file if it
+    grows past spool_threshold.
+
+    Args:
+        input_path: Path to input media file.
+        output_format: Output audio format (mp3 or wav).
+        audio_bitrate: Audio bitrate for MP3 (e.g., "192k", "320k").
+        spool_threshold: Bytes to hold in memory before spilling to disk.
+        media_info: Already-probed info for input_path, if available.
+        profile: Encoding profile. Overrides output_format and
+            audio_bitrate when given.
+        stream_copy: Remux the source audio without re-encoding when its
+            codec is API-compatible and no profile was given.
+        threads: FFmpeg threads for this job (default: FFmpeg's choice).
+        timeouts: Wall-clock and no-progress limits (default: JobTimeouts()).
+        spill_dir: Directory for the spill file (default: the system temp
+            directory).
+
+    Returns:
+        AudioBuffer holding the extracted audio. The caller must close it.
+
+    Raises:
+        FFmpegNotFoundError: If FFmpeg is not installed.
+        FileNotFoundError: If input file does not exist.
+        UnsupportedFormatError: If input format is not supported.
+        NoAudioStreamError: If input has no audio stream.
+        ExtractionTimeoutError: If FFmpeg ran too long or stalled.
+        ExtractionError: If extraction fails.
+    """
+    validate_ffmpeg()
+
+    input_path = Path(input_path).resolve()
+    validate_input_file(input_path)
+
+    if media_info is None:
+        media_info = get_media_info(input_path)
+    if not media_info.has_audio:
+        raise NoAudioStreamError(input_path)
+
+    profile = _buffer_profile(media_info, output_format, audio_bitrate, profile, stream_copy)
+    stream = _pipe_stream(input_path, profile, threads)
+
+    buffer = tempfile.SpooledTemporaryFile(max_size=spool_threshold, dir=spill_dir)
+    try:
+        outcome = run_watched(stream, output=buffer, timeouts=timeouts)
+    except BaseException:
+        buffer.close()
+        raise
+
+    return _buffer_result(input_path, media_info, profile, buffer, outcome, timeouts)
+
+
+async def extract_audio_to_buffer_async(
+    input_path: Path,
+    output_format: Literal["mp3", "wav"] = "mp3",
+    audio_bitrate: str = "192k",
+    spool_threshold: int = DEFAULT_SPOOL_THRESHOLD_BYTES,
+    media_info: Optional[MediaInfo] = None,
+    profile: Optional[EncodingProfile] = None,
+    stream_copy: bool = False,
+    threads: Optional[int] = None,
+    timeouts: Optional[JobTimeouts] = None,
+    spill_dir: Optional[Path] = None,
+) -> AudioBuffer:
+    """Extract audio into a spooled buffer without blocking the event loop.
+
+    Async counterpart of extract_audio_to_buffer. FFmpeg runs as an
+    asyncio subprocess and its stdout is read on the loop, so concurrent
+    extractions need no threads. If the awaiting task is cancelled, or
+    the watchdog fires, FFmpeg is killed and the partial buffer is
+    discarded.
+
+    Args:
+        input_path: Path to input media file.
+        output_format: Output audio format (mp3 or wav).
+        audio_bitrate: Audio bitrate for MP3 (e.g., "192k", "320k").
+        spool_threshold: Bytes to hold in memory before spilling to disk.
+        media_info: Already-probed info for input_path, if available.
+        profile: Encoding profile. Overrides output_format and
+            audio_bitrate when given.
+        stream_copy: Remux the source audio without re-encoding when its
+            codec is API-compatible and no profile was given.
+        threads: FFmpeg threads for this job (default: FFmpeg's choice).
+        timeouts: Wall-clock and no-progress limits (default: JobTimeouts()).
+        spill_dir: Directory for the spill file (default: the system temp
+            directory).
+
+    Returns:
+        AudioBuffer holding the extracted audio. The caller must close it.
+
+    Raises:
+        FFmpegNotFoundError: If FFmpeg is not installed.
+        FileNotFoundError: If input file does not exist.
+        UnsupportedFormatError: If input format is not supported.
+        NoAudioStreamError: If input has no audio stream.
+        ExtractionTimeoutError: If FFmpeg ran too long or stalled.
+        ExtractionError: If extraction fails.
+    """
+    validate_ffmpeg()
+
+    input_path = Path(input_path).resolve()
+    validate_input_file(input_path)
+
+    if media_info is None:
+        media_info = await get_media_info_async(input_path)
+    if not media_info.has_audio:
+        raise NoAudioStreamError(input_path)
+
+    profile = _buffer_profile(media_info, output_format, audio_bitrate, profile, stream_copy)
+    stream = _pipe_stream(input_path, profile, threads)
+
+    buffer = tempfile.SpooledTemporaryFile(max_size=spool_threshold, dir=spill_dir)
+    try:
+        outcome = await run_watched_async(stream, output=buffer, timeouts=timeouts)
+    except BaseException:
+        buffer.close()
+        raise
+
+    return _buffer_result(input_path, media_info, profile, buffer, outcome, timeouts)
+
+
+def _buffer_profile(
+    media_info: MediaInfo,
+    output_format: Literal["mp3", "wav"],
+    audio_bitrate: str,
+    profile: Optional[EncodingProfile],
+    stream_copy: bool,
+) -> EncodingProfile:
+    """Pick the profile for a buffered extraction."""
+    if profile is None and stream_copy:
+        profile = copy_profile(media_info.audio_codec)
+    if profile is None:
+        profile = _format_profile(output_format, audio_bitrate)
+    return profile
+
+
+def _pipe_stream(
+    input_path: Path,
+    profile: EncodingProfile,
+    threads: Optional[int],
+) -> "ffmpeg.nodes.OutputStream":
+    """Build the FFmpeg graph for an extraction written to stdout."""
+    # MP4 cannot seek back to write its index on a pipe; fragment it instead
+    extra = {"movflags": "frag_keyframe+empty_moov"} if profile.container == "mp4" else {}
+    stream = _output_stream(input_path, "pipe:1", profile, threads, **extra)
+    return stream.global_args("-loglevel", "error")
+
+
+def _check_outcome(
+    input_path: Path,
+    outcome: JobOutcome,
+    timeouts: Optional[JobTimeouts],
+) -> None:
+    """Raise if an FFmpeg job timed out or failed."""
+    if outcome.timeout is not None:
+        limit = (timeouts or JobTimeouts()).limit(outcome.timeout)
+        raise ExtractionTimeoutError(input_path, outcome.timeout, limit)
+    if outcome.returncode != 0:
+        raise ExtractionError(f"FFmpeg extraction failed: {outcome.stderr or 'Unknown error'}")
+
+
+def _buffer_result(
+    input_path: Path,
+    media_info: MediaInfo,
+    profile: EncodingProfile,
+    buffer: IO[bytes],
+    outcome: JobOutcome,
+    timeouts: Optional[JobTimeouts],
+) -> AudioBuffer:
+    """Wrap a finished extraction, closing the buffer if it failed."""
+    try:
+        _check_outcome(input_path, outcome, timeouts)
+    except ExtractionError:
+        buffer.close()
+        raise
+
+    if outcome.output_bytes == 0:
+        buffer.close()
+        raise ExtractionError(f"FFmpeg produced no audio for {input_path}")
+
+    return AudioBuffer(
+        input_path=input_path,
+        name=f"{input_path.stem}.{profile.extension}",
+        file=buffer,
+        size=outcome.output_bytes,
+        duration=media_info.duration,
+        audio_codec=profile.extension,
+        method="remux" if profile.is_copy else "transcode",
     )
 
 
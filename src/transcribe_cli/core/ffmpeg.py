@@ -4,17 +4,29 @@ Implements ADR-001: FFmpeg Integration Approach
 - FFmpeg binary detection
 - Version validation (4.0+)
 - Platform-specific installation guidance
+- Toolchain registry that resolves ffmpeg/ffprobe once per process and
+  persists version, encoders and muxers keyed by binary path and mtime
 """
 
+import json
+import os
 import re
 import shutil
 import subprocess
 import sys
-from dataclasses import dataclass
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
 from typing import Optional
 
+from transcribe_cli.utils import get_cache_dir
+
 MINIMUM_FFMPEG_VERSION = (4, 0)
 
+TOOLCHAIN_FILENAME = "toolchain.json"
+# Bump when the persisted FFmpegInfo layout changes
+TOOLCHAIN_VERSION = 1
+
 
 class FFmpegNotFoundError(Exception):
     """Raised when FFmpeg is not installed or not in PATH."""
@@ -80,29 +92,43 @@ class FFmpegInfo:
     path: str
     version: tuple[int, int]
     version_string: str
+    encoders: tuple[str, ...] = ()
+    muxers: tuple[str, ...] = ()
 
     @property
     def version_display(self) -> str:
         """Return version as display string."""
         return f"{self.version[0]}.{self.version[1]}"
 
+    def has_encoder(self, name: str) -> bool:
+        """Check if FFmpeg was built with an encoder (e.g. "libopus")."""
+        return name in self.encoders
+
+    def has_muxer(self, name: str) -> bool:
+        """Check if FFmpeg was built with a muxer (e.g. "webm")."""
+        return name in self.muxers
+
 
 def find_ffmpeg() -> Optional[str]:
     """Find FFmpeg binary in PATH.
 
+    The lookup is done once per process (see ToolchainRegistry).
+
     Returns:
         Path to FFmpeg binary, or None if not found.
     """
-    return shutil.which("ffmpeg")
+    return get_toolchain().find("ffmpeg")
 
 
 def find_ffprobe() -> Optional[str]:
     """Find ffprobe binary in PATH.
 
+    The lookup is done once per process (see ToolchainRegistry).
+
     Returns:
         Path to ffprobe binary, or None if not found.
     """
-    return shutil.which("ffprobe")
+    return get_toolchain().find("ffprobe")
 
 
 def parse_version(version_output: str) -> tuple[int, int]:
@@ -162,11 +188,191 @@ def get_ffmpeg_version(ffmpeg_path: str) -> tuple[tuple[int, int], str]:
         raise RuntimeError(f"Failed to get FFmpeg version: {e}") from e
 
 
+def _list_capabilities(ffmpeg_path: str, flag: str) -> tuple[str, ...]:
+    """List encoder or muxer names from `ffmpeg -encoders` / `-muxers`.
+
+    Args:
+        ffmpeg_path: Path to FFmpeg binary.
+        flag: "-encoders" or "-muxers".
+
+    Returns:
+        Sorted names, or an empty tuple if the listing fails.
+    """
+    try:
+        result = subprocess.run(
+            [ffmpeg_path, "-hide_banner", flag],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return ()
+    if result.returncode != 0:
+        return ()
+
+    names: set[str] = set()
+    in_table = False
+    for line in result.stdout.splitlines():
+        stripped = line.strip()
+        if not in_table:
+            # The table starts after a " ------" / " --" separator line
+            in_table = stripped.startswith("--")
+            continue
+        parts = stripped.split()
+        if len(parts) >= 2:
+            names.update(parts[1].split(","))
+    return tuple(sorted(names))
+
+
+class ToolchainRegistry:
+    """Resolves the FFmpeg toolchain once and remembers it.
+
+    Binary lookups are memoized for the life of the process. Version,
+    encoders and muxers are also persisted to disk keyed by the binary's
+    resolved path and mtime, so later processes skip `ffmpeg -version`
+    until FFmpeg is upgraded.
+    """
+
+    def __init__(self, store_path: Optional[Path] = None) -> None:
+        self.store_path = store_path
+        self._lock = threading.Lock()
+        self._paths: dict[str, Optional[str]] = {}
+        self._infos: dict[str, FFmpegInfo] = {}
+
+    def find(self, name: str) -> Optional[str]:
+        """Locate a binary in PATH, once per process.
+
+        Args:
+            name: Binary name ("ffmpeg" or "ffprobe").
+
+        Returns:
+            Path to the binary, or None if not found.
+        """
+        with self._lock:
+            if name not in self._paths:
+                self._paths[name] = shutil.which(name)
+            return self._paths[name]
+
+    def describe(self, ffmpeg_path: str) -> FFmpegInfo:
+        """Get version, encoders and muxers of an FFmpeg binary.
+
+        Args:
+            ffmpeg_path: Path to FFmpeg binary.
+
+        Returns:
+            FFmpegInfo for the binary.
+
+        Raises:
+            RuntimeError: If the version cannot be determined.
+        """
+        with self._lock:
+            cached = self._infos.get(ffmpeg_path)
+        if cached is not None:
+            return cached
+
+        key = self._store_key(ffmpeg_path)
+        info = self._load(key) if key is not None else None
+        if info is None:
+            version, version_string = get_ffmpeg_version(ffmpeg_path)
+            info = FFmpegInfo(
+                path=ffmpeg_path,
+                version=version,
+                version_string=version_string,
+                encoders=_list_capabilities(ffmpeg_path, "-encoders"),
+                muxers=_list_capabilities(ffmpeg_path, "-muxers"),
+            )
+            if key is not None:
+                self._save(key, info)
+
+        with self._lock:
+            self._infos[ffmpeg_path] = info
+        return info
+
+    def clear(self) -> None:
+        """Forget memoized lookups and the persisted toolchain."""
+        with self._lock:
+            self._paths.clear()
+            self._infos.clear()
+        if self.store_path is not None:
+            try:
+                self.store_path.unlink()
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def _store_key(ffmpeg_path: str) -> Optional[str]:
+        try:
+            resolved = os.path.realpath(ffmpeg_path)
+            mtime_ns = os.stat(resolved).st_mtime_ns
+        except OSError:
+            return None
+        return f"{resolved}:{mtime_ns}"
+
+    def _read_store(self) -> dict:
+        if self.store_path is None:
+            return {}
+        try:
+            data = json.loads(self.store_path.read_text())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != TOOLCHAIN_VERSION:
+            return {}
+        return data
+
+    def _load(self, key: str) -> Optional[FFmpegInfo]:
+        entry = self._read_store().get("binaries", {}).get(key)
+        if entry is None:
+            return None
+        try:
+            return FFmpegInfo(
+                path=entry["path"],
+                version=tuple(entry["version"]),  # type: ignore[arg-type]
+                version_string=entry["version_string"],
+                encoders=tuple(entry.get("encoders", ())),
+                muxers=tuple(entry.get("muxers", ())),
+            )
+        except (KeyError, TypeError):
+            return None
+
+    def _save(self, key: str, info: FFmpegInfo) -> None:
+        if self.store_path is None:
+            return
+        data = self._read_store()
+        binaries = data.get("binaries", {})
+        binaries[key] = asdict(info)
+        try:
+            self.store_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.store_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(
+                json.dumps({"version": TOOLCHAIN_VERSION, "binaries": binaries})
+            )
+            os.replace(tmp_path, self.store_path)
+        except OSError:
+            # Persisting is an optimization; the in-process memo still applies
+            pass
+
+
+_default_toolchain: Optional[ToolchainRegistry] = None
+_toolchain_lock = threading.Lock()
+
+
+def get_toolchain() -> ToolchainRegistry:
+    """Return the process-wide toolchain registry."""
+    global _default_toolchain
+    with _toolchain_lock:
+        if _default_toolchain is None:
+            _default_toolchain = ToolchainRegistry(get_cache_dir() / TOOLCHAIN_FILENAME)
+        return _default_toolchain
+
+
 def validate_ffmpeg(
     min_version: tuple[int, int] = MINIMUM_FFMPEG_VERSION,
 ) -> FFmpegInfo:
     """Validate FFmpeg installation.
 
+    Version, encoders and muxers come from the toolchain registry, so only
+    the first call in a process (or after an FFmpeg upgrade) runs FFmpeg.
+
     Args:
         min_version: Minimum required version (major, minor).
 
@@ -181,12 +387,12 @@ def validate_ffmpeg(
     if path is None:
         raise FFmpegNotFoundError()
 
-    version, version_string = get_ffmpeg_version(path)
+    info = get_toolchain().describe(path)
 
-    if version < min_version:
-        raise FFmpegVersionError(version, min_version)
+    if info.version < min_version:
+        raise FFmpegVersionError(info.version, min_version)
 
-    return FFmpegInfo(path=path, version=version, version_string=version_string)
+    return info
 
 
 def check_ffmpeg_available() -> bool:
@@ -0,0 +1,121 @@
+"""Append-only journal of batch progress.
+
+- One JSON line per state change (started, completed, failed)
+- Lives in the batch output directory so an interrupted run can resume
+- Safe for concurrent workers and processes (single O_APPEND writes)
+- Tolerates a torn final line left by a crash
+"""
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Literal, Optional
+
+JOURNAL_FILENAME = ".transcribe-journal.jsonl"
+
+JournalState = Literal["started", "completed", "failed"]
+
+
+@dataclass
+class JournalEntry:
+    """Latest recorded state of one input file."""
+
+    input_path: Path
+    state: JournalState
+    output_path: Optional[Path] = None
+    error: Optional[str] = None
+    timestamp: float = 0.0
+    source_hash: Optional[str] = None
+
+
+class BatchJournal:
+    """Append-only JSONL record of each file's batch state.
+
+    Every state change is one line written with a single ``write`` on a
+    file opened with O_APPEND, so lines from concurrent workers (or two
+    processes sharing an output directory) never interleave. Reading keeps
+    the last entry per input path.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_directory(cls, directory: Path) -> "BatchJournal":
+        """Create the journal kept in a batch output directory."""
+        return cls(Path(directory).resolve() / JOURNAL_FILENAME)
+
+    def record(
+        self,
+        input_path: Path,
+        state: JournalState,
+        output_path: Optional[Path] = None,
+        error: Optional[str] = None,
+        source_hash: Optional[str] = None,
+    ) -> None:
+        """Append a state change for a file.
+
+        Args:
+            input_path: Source media file.
+            state: New state of the file.
+            output_path: Transcript written, for completed files.
+            error: Error message, for failed files.
+            source_hash: SHA-256 of the source the transcript was made from.
+        """
+        record: dict[str, Any] = {
+            "input": str(Path(input_path).resolve()),
+            "state": state,
+            "output": str(output_path) if output_path is not None else None,
+            "error": error,
+            "time": time.time(),
+        }
+        if source_hash is not None:
+            record["hash"] = source_hash
+        line = json.dumps(record)
+        data = (line + "\n").encode("utf-8")
+
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
+
+    def load(self) -> dict[Path, JournalEntry]:
+        """Read the latest entry for every file in the journal.
+
+        Returns:
+            Mapping of resolved input path to its last recorded entry.
+        """
+        entries: dict[Path, JournalEntry] = {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return entries
+
+        for line in lines:
+            try:
+                record = json.loads(line)
+                input_path = Path(record["input"])
+                state = record["state"]
+            except (ValueError, KeyError, TypeError):
+                # Torn write from a crash; the file is simply redone
+                continue
+            if state not in ("started", "completed", "failed"):
+                continue
+            output = record.get("output")
+            entries[input_path] = JournalEntry(
+                input_path=input_path,
+                state=state,
+                output_path=Path(output) if output else None,
+                error=record.get("error"),
+                timestamp=record.get("time", 0.0),
+                source_hash=record.get("hash"),
+            )
+        return entries
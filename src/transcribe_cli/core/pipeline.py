@@ -0,0 +1,227 @@
+"""Staged batch pipeline: probe, extract, upload, write.
+
+- Each stage has its own concurrency limit
+- Bounded hand-off queue in front of every stage; a file keeps its slot in
+  the previous stage until there is room, so a stalled stage backs up the
+  stages before it
+- Upload slots can be governed by AdaptiveConcurrency
+- Optional ByteBudget held from extraction until the upload finishes
+- Per-stage busy, wait and blocked time for the batch summary
+- Per-file stage timings and an optional listener called on every stage
+  transition (see events.py)
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Mapping, Optional
+
+from .adaptive import AdaptiveConcurrency, ConcurrencySlot
+from .budget import ByteBudget
+
+PIPELINE_STAGES = ("probe", "extract", "upload", "write")
+
+# ffprobe runs and cache lookups are I/O bound
+DEFAULT_PROBE_CONCURRENCY = 8
+# Transcript writes and journal appends
+DEFAULT_WRITE_CONCURRENCY = 4
+
+
+@dataclass
+class StageStats:
+    """Work done by one pipeline stage."""
+
+    name: str
+    limit: int
+    completed: int = 0
+    busy_seconds: float = 0.0
+    # Waiting for a slot in this stage after being queued for it
+    wait_seconds: float = 0.0
+    # Holding a slot while the next stage's queue was full
+    blocked_seconds: float = 0.0
+    peak_active: int = 0
+
+
+class _Stage:
+    def __init__(
+        self,
+        name: str,
+        limit: int,
+        queue_depth: int,
+        controller: Optional[AdaptiveConcurrency] = None,
+    ) -> None:
+        self.stats = StageStats(name, controller.ceiling if controller else limit)
+        self.controller = controller
+        self.slots = asyncio.Semaphore(limit)
+        self.room = asyncio.Semaphore(queue_depth)
+        self.queue_depth = queue_depth
+        self.active = 0
+
+    async def acquire(self) -> Optional[ConcurrencySlot]:
+        if self.controller is not None:
+            slot = await self.controller.acquire()
+        else:
+            await self.slots.acquire()
+            slot = None
+        self.active += 1
+        self.stats.peak_active = max(self.stats.peak_active, self.active)
+        return slot
+
+    def release(
+        self, slot: Optional[ConcurrencySlot], busy: float, success: bool, size: int
+    ) -> None:
+        self.active -= 1
+        self.stats.busy_seconds += busy
+        if success:
+            self.stats.completed += 1
+        if self.controller is not None and slot is not None:
+            self.controller.release(slot, success, size)
+        else:
+            self.slots.release()
+
+
+class StagePipeline:
+    """Per-stage limits and bounded queues shared by a batch's files.
+
+    Files pass through the stages in order (skipping any they do not
+    need) by calling StageTicket.enter() for each. Entering a stage first
+    takes room in its queue while still holding the current stage's slot,
+    exactly like a worker blocked on a full queue.put().
+    """
+
+    def __init__(
+        self,
+        limits: Mapping[str, int],
+        queue_depths: Optional[Mapping[str, int]] = None,
+        upload_controller: Optional[AdaptiveConcurrency] = None,
+        byte_budget: Optional[ByteBudget] = None,
+        listener: Optional[Callable[["StageTicket", Optional[str]], None]] = None,
+    ) -> None:
+        unknown = set(limits) - set(PIPELINE_STAGES)
+        if unknown:
+            raise ValueError(f"Unknown pipeline stage(s): {', '.join(sorted(unknown))}")
+        if any(limit < 1 for limit in limits.values()):
+            raise ValueError("Stage limits must be at least 1")
+
+        self.byte_budget = byte_budget
+        # Called with (ticket, previous stage) after a file enters a stage
+        self.listener = listener
+        depths = dict(queue_depths or {})
+        self._stages: dict[str, _Stage] = {}
+        for name in PIPELINE_STAGES:
+            controller = upload_controller if name == "upload" else None
+            if controller is not None:
+                limit = controller.ceiling
+            elif name in limits:
+                limit = limits[name]
+            else:
+                raise ValueError(f"Missing limit for pipeline stage '{name}'")
+            self._stages[name] = _Stage(name, limit, depths.get(name, limit), controller)
+
+    @property
+    def capacity(self) -> int:
+        """Files the pipeline can hold at once (slots plus queue room)."""
+        return sum(stage.stats.limit + stage.queue_depth for stage in self._stages.values())
+
+    def ticket(
+        self, size: int = 0, in_flight_bytes: int = 0, path: Optional[Path] = None
+    ) -> "StageTicket":
+        """Start one file's passage through the pipeline.
+
+        Args:
+            size: Source size in bytes.
+            in_flight_bytes: Bytes to reserve from the byte budget while
+                the file is extracted and uploaded.
+            path: Source file, for listeners.
+        """
+        return StageTicket(self, size, in_flight_bytes, path)
+
+    def stats(self) -> list[StageStats]:
+        """Per-stage counters, in pipeline order."""
+        return [self._stages[name].stats for name in PIPELINE_STAGES]
+
+
+class StageTicket:
+    """One file's position in a StagePipeline."""
+
+    def __init__(
+        self,
+        pipeline: StagePipeline,
+        size: int = 0,
+        in_flight_bytes: int = 0,
+        path: Optional[Path] = None,
+    ) -> None:
+        self._pipeline = pipeline
+        self.size = size
+        self.in_flight_bytes = in_flight_bytes
+        self.path = path
+        # Seconds this file held each stage's slot, and waited for it
+        self.timings: dict[str, float] = {}
+        self.waits: dict[str, float] = {}
+        self._reserved = 0
+        self._stage: Optional[_Stage] = None
+        self._slot: Optional[ConcurrencySlot] = None
+        self._entered = 0.0
+
+    @property
+    def stage(self) -> Optional[str]:
+        """Stage the file currently holds a slot in."""
+        return self._stage.stats.name if self._stage is not None else None
+
+    async def enter(self, name: str) -> None:
+        """Move to a stage, waiting for queue room and then a slot.
+
+        Args:
+            name: Stage to enter (one of PIPELINE_STAGES).
+        """
+        stage = self._pipeline._stages[name]
+        budget = self._pipeline.byte_budget
+        if name == "extract" and budget is not None and self.in_flight_bytes:
+            # Reserved before queueing, so waiting for room holds the file
+            # in the probe stage rather than the extractor
+            self._reserved = await budget.acquire(self.in_flight_bytes)
+
+        previous = self.stage
+        started = time.monotonic()
+        await stage.room.acquire()
+        try:
+            now = time.monotonic()
+            if self._stage is not None:
+                self._stage.stats.blocked_seconds += now - started
+            self._leave(success=True)
+            queued = time.monotonic()
+            self._slot = await stage.acquire()
+        finally:
+            stage.room.release()
+        self._stage = stage
+        self._entered = time.monotonic()
+        waited = self._entered - queued
+        stage.stats.wait_seconds += waited
+        self.waits[name] = self.waits.get(name, 0.0) + waited
+        if self._pipeline.listener is not None:
+            self._pipeline.listener(self, previous)
+
+    def leave(self, success: bool = True) -> None:
+        """Release the current stage (end of the pipeline or on failure)."""
+        self._leave(success)
+        self._release_bytes()
+
+    def _leave(self, success: bool) -> None:
+        if self._stage is None:
+            return
+        stage = self._stage
+        held = time.monotonic() - self._entered
+        stage.release(self._slot, held, success, self.size)
+        name = stage.stats.name
+        self.timings[name] = self.timings.get(name, 0.0) + held
+        self._stage = None
+        self._slot = None
+        if name == "upload":
+            self._release_bytes()
+
+    def _release_bytes(self) -> None:
+        budget = self._pipeline.byte_budget
+        if self._reserved and budget is not None:
+            budget.release(self._reserved)
+            self._reserved = 0
@@ -0,0 +1,140 @@
+"""Persistent cache of ffprobe results.
+
+- SQLite database in the user cache directory
+- Keyed by (resolved path, size, mtime_ns) so edited files are re-probed
+- Safe to share between threads and concurrent processes
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from contextlib import closing
+from pathlib import Path
+from typing import Optional
+
+from transcribe_cli.utils import get_cache_dir
+
+PROBE_CACHE_FILENAME = "probes.sqlite3"
+# Bump when the cached probe layout (or -show_entries list) changes
+PROBE_CACHE_VERSION = 1
+# Seconds to wait for another process holding the database lock
+SQLITE_TIMEOUT = 10.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS probes (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    version INTEGER NOT NULL,
+    data TEXT NOT NULL
+)
+"""
+
+
+class ProbeCache:
+    """SQLite-backed store of ffprobe output per file.
+
+    A lookup only hits when the file's size and mtime_ns both match the
+    probed values. Each operation opens its own short-lived connection, so
+    the cache can be used from worker threads and concurrent processes.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    @classmethod
+    def default(cls) -> "ProbeCache":
+        """Create a cache in the user cache directory."""
+        return cls(get_cache_dir() / PROBE_CACHE_FILENAME)
+
+    def _connect(self) -> sqlite3.Connection:
+        with self._lock:
+            if not self._initialized:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with closing(sqlite3.connect(self.path, timeout=SQLITE_TIMEOUT)) as conn:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.execute(_SCHEMA)
+                    conn.commit()
+                self._initialized = True
+        return sqlite3.connect(self.path, timeout=SQLITE_TIMEOUT)
+
+    def get(self, path: Path, st: os.stat_result) -> Optional[dict]:
+        """Look up cached ffprobe output.
+
+        Args:
+            path: Resolved path of the probed file.
+            st: Current stat of the file.
+
+        Returns:
+            Parsed ffprobe JSON, or None on a miss or stale entry.
+        """
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT size, mtime_ns, version, data FROM probes WHERE path = ?",
+                    (str(path),),
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+
+        if row is None:
+            return None
+        size, mtime_ns, version, data = row
+        if size != st.st_size or mtime_ns != st.st_mtime_ns or version != PROBE_CACHE_VERSION:
+            return None
+        try:
+            return json.loads(data)
+        except json.JSONDecodeError:
+            return None
+
+    def put(self, path: Path, st: os.stat_result, data: dict) -> None:
+        """Store ffprobe output for a file, replacing any older entry.
+
+        Args:
+            path: Resolved path of the probed file.
+            st: Stat of the file taken before probing.
+            data: Parsed ffprobe JSON.
+        """
+        try:
+            with closing(self._connect()) as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO probes (path, size, mtime_ns, version, data) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (
+                        str(path),
+                        st.st_size,
+                        st.st_mtime_ns,
+                        PROBE_CACHE_VERSION,
+                        json.dumps(data),
+                    ),
+                )
+                conn.commit()
+        except sqlite3.Error:
+            # The cache is an optimization; never fail a probe over it
+            pass
+
+    def count(self) -> int:
+        """Number of cached probes."""
+        if not self.path.exists():
+            return 0
+        try:
+            with closing(self._connect()) as conn:
+                return conn.execute("SELECT COUNT(*) FROM probes").fetchone()[0]
+        except sqlite3.Error:
+            return 0
+
+    def clear(self) -> int:
+        """Remove every cached probe.
+
+        Returns:
+            Number of entries removed.
+        """
+        if not self.path.exists():
+            return 0
+        with closing(self._connect()) as conn:
+            removed = conn.execute("DELETE FROM probes").rowcount
+            conn.commit()
+        return removed
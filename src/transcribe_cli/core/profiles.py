@@ -0,0 +1,210 @@
+"""Audio encoding profiles for extraction and upload.
+
+- Named profiles pairing a codec, container, bitrate and channel layout
+- Speech profiles (16kHz mono Opus and MP3) that shrink uploads several-fold
+- "fit" mode picks the highest bitrate that keeps a duration under a size limit
+- Stream-copy profiles that remux API-compatible source audio without
+  re-encoding
+"""
+
+from dataclasses import dataclass, replace
+from typing import Any, Optional
+
+# Special profile name resolved per file from its duration
+FIT_PROFILE = "fit"
+DEFAULT_PROFILE = "speech-mp3"
+
+# Bitrates tried by "fit", highest first (mono MP3 at 16kHz)
+FIT_BITRATES = ("128k", "96k", "64k", "48k", "32k", "24k", "16k", "8k")
+# Share of the size limit "fit" may use, leaving room for container overhead
+FIT_HEADROOM = 0.95
+
+
+@dataclass(frozen=True)
+class EncodingProfile:
+    """How extracted audio is encoded."""
+
+    name: str
+    codec: str
+    container: str
+    extension: str
+    bitrate: Optional[str] = None
+    sample_rate: Optional[int] = None
+    channels: Optional[int] = None
+
+    @property
+    def is_copy(self) -> bool:
+        """Whether this profile remuxes the source audio without re-encoding."""
+        return self.codec == "copy"
+
+    @property
+    def bitrate_bps(self) -> Optional[int]:
+        """Target bitrate in bits per second, None for uncompressed audio."""
+        if self.bitrate is None:
+            return None
+        return parse_bitrate(self.bitrate)
+
+    def output_options(self) -> dict[str, Any]:
+        """FFmpeg output options for this profile (without the muxer)."""
+        options: dict[str, Any] = {"acodec": self.codec, "vn": None}
+        if self.bitrate is not None:
+            options["audio_bitrate"] = self.bitrate
+        if self.sample_rate is not None:
+            options["ar"] = self.sample_rate
+        if self.channels is not None:
+            options["ac"] = self.channels
+        return options
+
+    def estimated_size(self, duration: float) -> Optional[int]:
+        """Estimate the encoded size in bytes of a recording.
+
+        Args:
+            duration: Length of the recording in seconds.
+
+        Returns:
+            Estimated bytes, or None for uncompressed audio.
+        """
+        if self.bitrate_bps is None:
+            if self.codec == "pcm_s16le" and self.sample_rate and self.channels:
+                return int(duration * self.sample_rate * self.channels * 2)
+            return None
+        return int(duration * self.bitrate_bps / 8)
+
+
+ENCODING_PROFILES: dict[str, EncodingProfile] = {
+    # Original stereo MP3, kept for compatibility
+    "mp3": EncodingProfile("mp3", "libmp3lame", "mp3", "mp3", bitrate="192k"),
+    "wav": EncodingProfile(
+        "wav", "pcm_s16le", "wav", "wav", sample_rate=16000, channels=1
+    ),
+    "speech-mp3": EncodingProfile(
+        "speech-mp3",
+        "libmp3lame",
+        "mp3",
+        "mp3",
+        bitrate="32k",
+        sample_rate=16000,
+        channels=1,
+    ),
+    "speech-opus": EncodingProfile(
+        "speech-opus",
+        "libopus",
+        "ogg",
+        "ogg",
+        bitrate="24k",
+        sample_rate=16000,
+        channels=1,
+    ),
+    "speech-webm": EncodingProfile(
+        "speech-webm",
+        "libopus",
+        "webm",
+        "webm",
+        bitrate="24k",
+        sample_rate=16000,
+        channels=1,
+    ),
+}
+
+PROFILE_NAMES = tuple(ENCODING_PROFILES) + (FIT_PROFILE,)
+
+# Source codecs the API accepts as-is, remuxed into a container it accepts
+COPY_PROFILES: dict[str, EncodingProfile] = {
+    "aac": EncodingProfile("copy", "copy", "mp4", "m4a"),
+    "mp3": EncodingProfile("copy", "copy", "mp3", "mp3"),
+    "opus": EncodingProfile("copy", "copy", "webm", "webm"),
+    "vorbis": EncodingProfile("copy", "copy", "webm", "webm"),
+    "flac": EncodingProfile("copy", "copy", "flac", "flac"),
+}
+
+
+def parse_bitrate(bitrate: str) -> int:
+    """Convert an FFmpeg bitrate string such as "192k" to bits per second.
+
+    Args:
+        bitrate: Bitrate string, e.g. "32k", "1.5M" or "64000".
+
+    Returns:
+        Bits per second.
+
+    Raises:
+        ValueError: If the bitrate cannot be parsed.
+    """
+    value = bitrate.strip().lower()
+    if value.endswith("k"):
+        return int(float(value[:-1]) * 1000)
+    if value.endswith("m"):
+        return int(float(value[:-1]) * 1000 * 1000)
+    return int(value)
+
+
+def fit_profile(duration: Optional[float], max_bytes: int) -> EncodingProfile:
+    """Pick the highest bitrate that keeps a recording under a size limit.
+
+    Args:
+        duration: Length of the recording in seconds, if known.
+        max_bytes: Size limit for the encoded audio.
+
+    Returns:
+        Mono 16kHz MP3 profile. When the duration is unknown the speech
+        default is used; when nothing fits, the lowest bitrate is used and
+        the caller is expected to chunk.
+    """
+    base = ENCODING_PROFILES["speech-mp3"]
+    if not duration:
+        return replace(base, name=FIT_PROFILE)
+
+    budget = max_bytes * FIT_HEADROOM
+    for bitrate in FIT_BITRATES:
+        candidate = replace(base, name=FIT_PROFILE, bitrate=bitrate)
+        if (candidate.estimated_size(duration) or 0) <= budget:
+            return candidate
+
+    return replace(base, name=FIT_PROFILE, bitrate=FIT_BITRATES[-1])
+
+
+def resolve_profile(
+    name: str,
+    duration: Optional[float] = None,
+    max_bytes: Optional[int] = None,
+) -> EncodingProfile:
+    """Look up a profile by name, resolving "fit" for a given duration.
+
+    Args:
+        name: Profile name (see PROFILE_NAMES).
+        duration: Length of the recording in seconds, used by "fit".
+        max_bytes: Size limit used by "fit".
+
+    Returns:
+        The EncodingProfile to encode with.
+
+    Raises:
+        ValueError: If the name is unknown, or "fit" has no size limit.
+    """
+    if name == FIT_PROFILE:
+        if max_bytes is None:
+            raise ValueError("The 'fit' profile needs a size limit")
+        return fit_profile(duration, max_bytes)
+
+    try:
+        return ENCODING_PROFILES[name]
+    except KeyError:
+        choices = ", ".join(PROFILE_NAMES)
+        raise ValueError(
+            f"Unknown encoding profile '{name}'. Choose from: {choices}"
+        ) from None
+
+
+def copy_profile(audio_codec: Optional[str]) -> Optional[EncodingProfile]:
+    """Find the stream-copy profile for a source audio codec.
+
+    Args:
+        audio_codec: Codec name reported by ffprobe (e.g. "aac").
+
+    Returns:
+        Profile that remuxes the audio into an API-compatible container,
+        or None if the codec has to be transcoded.
+    """
+    if audio_codec is None:
+        return None
+    return COPY_PROFILES.get(audio_codec.lower())
@@ -0,0 +1,323 @@
+"""Process-wide rate limiting for Whisper API uploads.
+
+- Token buckets for requests per minute and audio seconds per minute
+- Backs off on 429 responses and honors Retry-After
+- Follows x-ratelimit-* response headers
+- Counts upload timeouts alongside 429s (congestion signals for auto
+  concurrency)
+- Thread-safe, with sync and async acquire for both upload paths
+"""
+
+import asyncio
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Mapping, Optional
+
+# Default pacing (Whisper tier 1 request limit); audio rate unlimited
+DEFAULT_REQUESTS_PER_MINUTE = 500
+# Bucket capacity, in seconds of refill, that may be spent in a burst
+BURST_SECONDS = 10.0
+# Pacing never drops below this fraction of the configured rate
+MIN_RATE_FRACTION = 0.05
+# Fraction of the configured rate recovered per successful request
+RECOVERY_FRACTION = 0.05
+# Pause applied on a 429 that carries no Retry-After header
+DEFAULT_THROTTLE_PAUSE = 5.0
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+
+
+def parse_reset_duration(value: str) -> Optional[float]:
+    """Parse an x-ratelimit-reset-* value such as "6m0s", "1s" or "20ms".
+
+    Args:
+        value: Header value.
+
+    Returns:
+        Duration in seconds, or None if the value cannot be parsed.
+    """
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+
+    scale = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+    return sum(float(number) * scale[unit] for number, unit in parts)
+
+
+class TokenBucket:
+    """Token bucket supporting reservations (tokens may go negative).
+
+    Not thread-safe on its own; RateLimiter serializes access.
+    """
+
+    def __init__(self, rate_per_minute: float) -> None:
+        self.configured_rate = float(rate_per_minute)
+        self.rate = float(rate_per_minute)
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+
+    @property
+    def capacity(self) -> float:
+        """Maximum burst size at the current rate."""
+        return max(1.0, self.rate / 60.0 * BURST_SECONDS)
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate / 60.0)
+        self._updated = now
+
+    def reserve(self, cost: float, now: float) -> float:
+        """Take tokens and return how long the caller must wait for them."""
+        self._refill(now)
+        self.tokens -= cost
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / (self.rate / 60.0)
+
+    def set_rate(self, rate_per_minute: float, now: float) -> None:
+        """Change the refill rate, keeping accrued tokens."""
+        self._refill(now)
+        self.rate = rate_per_minute
+        self.tokens = min(self.tokens, self.capacity)
+
+
+@dataclass
+class RateLimitStats:
+    """Snapshot of limiter pacing, reported in batch summaries."""
+
+    requests_per_minute: float
+    configured_requests_per_minute: float
+    audio_seconds_per_minute: Optional[float]
+    requests: int
+    throttled: int
+    total_wait_seconds: float
+    timeouts: int = 0
+
+    @property
+    def pacing_fraction(self) -> float:
+        """Current request pacing as a fraction of the configured rate."""
+        if self.configured_requests_per_minute <= 0:
+            return 0.0
+        return self.requests_per_minute / self.configured_requests_per_minute
+
+
+class RateLimiter:
+    """Shared upload pacing for every worker in the process.
+
+    Each upload reserves one request and its audio duration before it is
+    sent. A 429 halves the request rate and pauses all workers until the
+    Retry-After time, and successful requests recover the rate gradually,
+    so concurrent workers back off together instead of retrying in
+    lockstep.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE,
+        audio_seconds_per_minute: Optional[float] = None,
+    ) -> None:
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+        if audio_seconds_per_minute is not None and audio_seconds_per_minute <= 0:
+            raise ValueError("audio_seconds_per_minute must be positive")
+
+        self._lock = threading.Lock()
+        self._requests = TokenBucket(requests_per_minute)
+        self._audio = (
+            TokenBucket(audio_seconds_per_minute)
+            if audio_seconds_per_minute is not None
+            else None
+        )
+        self._paused_until = 0.0
+        self._request_count = 0
+        self._throttled = 0
+        self._timeouts = 0
+        self._total_wait = 0.0
+
+    @property
+    def limits_audio(self) -> bool:
+        """Whether uploads are metered by audio seconds."""
+        return self._audio is not None
+
+    def reserve(self, audio_seconds: float = 0.0) -> float:
+        """Reserve capacity for one upload.
+
+        Args:
+            audio_seconds: Duration of the audio being uploaded.
+
+        Returns:
+            Seconds the caller must wait before sending.
+        """
+        with self._lock:
+            now = time.monotonic()
+            delay = self._requests.reserve(1.0, now)
+            if self._audio is not None and audio_seconds > 0:
+                delay = max(delay, self._audio.reserve(audio_seconds, now))
+            delay = max(delay, self._paused_until - now)
+            self._request_count += 1
+            self._total_wait += delay
+            return delay
+
+    def acquire(self, audio_seconds: float = 0.0) -> None:
+        """Block the calling thread until an upload may be sent."""
+        delay = self.reserve(audio_seconds)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, audio_seconds: float = 0.0) -> None:
+        """Wait on the event loop until an upload may be sent."""
+        delay = self.reserve(audio_seconds)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def record_success(self) -> None:
+        """Recover request pacing after a successful upload."""
+        with self._lock:
+            bucket = self._requests
+            if bucket.rate < bucket.configured_rate:
+                recovered = bucket.rate + bucket.configured_rate * RECOVERY_FRACTION
+                bucket.set_rate(
+                    min(bucket.configured_rate, recovered), time.monotonic()
+                )
+
+    def record_throttle(self, retry_after: Optional[float] = None) -> None:
+        """Slow down after a 429 response.
+
+        Args:
+            retry_after: Server-provided wait in seconds, if any.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._throttled += 1
+            # Workers throttled by the same burst slow down only once
+            already_paused = self._paused_until > now
+            pause = retry_after if retry_after is not None else DEFAULT_THROTTLE_PAUSE
+            self._paused_until = max(self._paused_until, now + pause)
+            if not already_paused:
+                bucket = self._requests
+                floor = bucket.configured_rate * MIN_RATE_FRACTION
+                bucket.set_rate(max(floor, bucket.rate / 2), now)
+
+    def record_timeout(self) -> None:
+        """Count an upload that timed out (a congestion signal)."""
+        with self._lock:
+            self._timeouts += 1
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """Adjust pacing from Retry-After and x-ratelimit-* headers.
+
+        Args:
+            headers: Response headers (case-insensitive mapping).
+        """
+        lowered = {k.lower(): v for k, v in headers.items()}
+
+        limit = lowered.get("x-ratelimit-limit-requests")
+        remaining = lowered.get("x-ratelimit-remaining-requests")
+        reset = lowered.get("x-ratelimit-reset-requests")
+
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._requests
+
+            if limit:
+                try:
+                    server_limit = float(limit)
+                except ValueError:
+                    server_limit = 0.0
+                if 0 < server_limit < bucket.configured_rate:
+                    bucket.configured_rate = server_limit
+                    if bucket.rate > server_limit:
+                        bucket.set_rate(server_limit, now)
+
+            if remaining is not None and reset:
+                try:
+                    exhausted = int(remaining) <= 0
+                except ValueError:
+                    exhausted = False
+                reset_seconds = parse_reset_duration(reset)
+                if exhausted and reset_seconds is not None:
+                    self._paused_until = max(self._paused_until, now + reset_seconds)
+
+            retry_after = retry_after_seconds(lowered)
+            if retry_after is not None:
+                self._paused_until = max(self._paused_until, now + retry_after)
+
+    def stats(self) -> RateLimitStats:
+        """Snapshot current pacing and counters."""
+        with self._lock:
+            return RateLimitStats(
+                requests_per_minute=self._requests.rate,
+                configured_requests_per_minute=self._requests.configured_rate,
+                audio_seconds_per_minute=(
+                    self._audio.rate if self._audio is not None else None
+                ),
+                requests=self._request_count,
+                throttled=self._throttled,
+                total_wait_seconds=self._total_wait,
+                timeouts=self._timeouts,
+            )
+
+
+def retry_after_seconds(headers: Mapping[str, str]) -> Optional[float]:
+    """Read Retry-After (or retry-after-ms) from response headers.
+
+    Args:
+        headers: Response headers.
+
+    Returns:
+        Wait in seconds, or None if absent or not numeric.
+    """
+    lowered = {k.lower(): v for k, v in headers.items()}
+    if "retry-after-ms" in lowered:
+        try:
+            return float(lowered["retry-after-ms"]) / 1000.0
+        except ValueError:
+            pass
+    if "retry-after" in lowered:
+        try:
+            return float(lowered["retry-after"])
+        except ValueError:
+            return None
+    return None
+
+
+_default_limiter: Optional[RateLimiter] = None
+_default_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Return the process-wide limiter, creating it with defaults."""
+    global _default_limiter
+    with _default_lock:
+        if _default_limiter is None:
+            _default_limiter = RateLimiter()
+        return _default_limiter
+
+
+def configure_rate_limiter(
+    requests_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE,
+    audio_seconds_per_minute: Optional[float] = None,
+) -> RateLimiter:
+    """Replace the process-wide limiter with new limits.
+
+    Args:
+        requests_per_minute: Maximum upload requests per minute.
+        audio_seconds_per_minute: Maximum seconds of audio uploaded per
+            minute, or None for no audio limit.
+
+    Returns:
+        The new process-wide limiter.
+    """
+    global _default_limiter
+    limiter = RateLimiter(requests_per_minute, audio_seconds_per_minute)
+    with _default_lock:
+        _default_limiter = limiter
+    return limiter
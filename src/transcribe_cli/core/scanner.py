@@ -0,0 +1,124 @@
+"""Streaming directory scanner for batch runs.
+
+- os.scandir walk that checks the extension before touching the file
+- Subdirectories scanned in parallel on a thread pool
+- Yields files as they are found, with the size and mtime from one stat
+"""
+
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Union
+
+from .extractor import SUPPORTED_EXTENSIONS
+
+# Directories scanned at once; scandir is I/O bound, so this can exceed
+# the CPU count (network mounts benefit most)
+DEFAULT_SCAN_WORKERS = 8
+
+
+@dataclass(frozen=True)
+class ScannedFile:
+    """A supported media file found by the scanner."""
+
+    path: Path
+    size: int
+    mtime_ns: int
+
+
+def _validate_directory(directory: Path) -> Path:
+    directory = Path(directory).resolve()
+
+    if not directory.exists():
+        raise FileNotFoundError(f"Directory not found: {directory}")
+
+    if not directory.is_dir():
+        raise ValueError(f"Path is not a directory: {directory}")
+
+    return directory
+
+
+# Messages posted by scan workers to the consuming generator
+_Message = Union[ScannedFile, Path, None]
+
+
+def _scan_one(
+    directory: Path,
+    recursive: bool,
+    out: "queue.Queue[_Message]",
+    stop: threading.Event,
+) -> None:
+    """Post files (ScannedFile), subdirectories (Path) and then None."""
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if stop.is_set():
+                    break
+                try:
+                    if recursive and entry.is_dir(follow_symlinks=False):
+                        out.put(Path(entry.path))
+                        continue
+                    # Extension first: no stat for files we would skip
+                    if os.path.splitext(entry.name)[1].lower() not in SUPPORTED_EXTENSIONS:
+                        continue
+                    if not entry.is_file():
+                        continue
+                    st = entry.stat()
+                except OSError:
+                    # Vanished or unreadable entry; skip like Path.glob does
+                    continue
+                out.put(ScannedFile(Path(entry.path), st.st_size, st.st_mtime_ns))
+    except OSError:
+        pass
+    finally:
+        out.put(None)
+
+
+def iter_media_files(
+    directory: Path,
+    recursive: bool = False,
+    max_workers: int = DEFAULT_SCAN_WORKERS,
+) -> Iterator[ScannedFile]:
+    """Stream supported media files from a directory tree.
+
+    Files are yielded as soon as a worker finds them, in no particular
+    order, so processing can start before the walk finishes. Symlinked
+    directories are not followed.
+
+    Args:
+        directory: Directory to scan.
+        recursive: Whether to scan subdirectories.
+        max_workers: Directories scanned concurrently.
+
+    Yields:
+        ScannedFile for each supported file.
+
+    Raises:
+        FileNotFoundError: If directory doesn't exist.
+        ValueError: If path is not a directory.
+    """
+    directory = _validate_directory(directory)
+
+    out: "queue.Queue[_Message]" = queue.Queue()
+    stop = threading.Event()
+    pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scan")
+    pending = 1
+    pool.submit(_scan_one, directory, recursive, out, stop)
+
+    try:
+        while pending:
+            message = out.get()
+            if message is None:
+                pending -= 1
+            elif isinstance(message, ScannedFile):
+                yield message
+            else:
+                pending += 1
+                pool.submit(_scan_one, message, recursive, out, stop)
+    finally:
+        # Consumer stopped early (or finished): let workers wind down
+        stop.set()
+        pool.shutdown(wait=False)
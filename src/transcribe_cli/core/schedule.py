@@ -0,0 +1,152 @@
+"""Batch scheduling policies.
+
+- "scan" (default) dispatches files in the order the scanner finds them
+- Longest/shortest first by probed duration, largest first by size
+- Newest modification time first
+- Round-robin across subdirectories for a fair share per folder
+- Async duration probes on asyncio subprocesses for batch runs
+"""
+
+import asyncio
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from .extractor import get_media_info, get_media_info_async
+from .scanner import DEFAULT_SCAN_WORKERS, ScannedFile
+
+SCAN_ORDER = "scan"
+SCHEDULE_POLICIES = (
+    SCAN_ORDER,
+    "path",
+    "longest",
+    "shortest",
+    "largest",
+    "newest",
+    "round-robin",
+)
+# Policies that need every file's duration before dispatching
+DURATION_POLICIES = ("longest", "shortest")
+
+# Stands in for a duration ffprobe could not report (128 kbps)
+ASSUMED_BYTES_PER_SECOND = 16_000
+
+
+def _duration_or_estimate(entry: ScannedFile, duration: Optional[float]) -> float:
+    if duration is None:
+        return entry.size / ASSUMED_BYTES_PER_SECOND
+    return duration
+
+
+def _probe_duration(entry: ScannedFile) -> float:
+    try:
+        duration = get_media_info(entry.path).duration
+    except Exception:
+        duration = None
+    return _duration_or_estimate(entry, duration)
+
+
+def probe_durations(
+    entries: list[ScannedFile],
+    max_workers: int = DEFAULT_SCAN_WORKERS,
+) -> dict[Path, float]:
+    """Probe durations of many files in parallel.
+
+    Probes go through the shared probe cache, so later stages reuse them.
+    Files ffprobe cannot read get a duration estimated from their size.
+
+    Args:
+        entries: Files to probe.
+        max_workers: Concurrent ffprobe processes.
+
+    Returns:
+        Mapping of path to duration in seconds.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="probe") as pool:
+        durations = list(pool.map(_probe_duration, entries))
+    return {entry.path: duration for entry, duration in zip(entries, durations)}
+
+
+async def probe_durations_async(
+    entries: list[ScannedFile],
+    max_concurrency: int = DEFAULT_SCAN_WORKERS,
+) -> dict[Path, float]:
+    """Async counterpart of probe_durations.
+
+    Each ffprobe is an asyncio subprocess, so a large batch is probed
+    without a thread per probe in flight.
+
+    Args:
+        entries: Files to probe.
+        max_concurrency: Concurrent ffprobe processes.
+
+    Returns:
+        Mapping of path to duration in seconds.
+    """
+    slots = asyncio.Semaphore(max_concurrency)
+
+    async def probe(entry: ScannedFile) -> float:
+        async with slots:
+            try:
+                duration = (await get_media_info_async(entry.path)).duration
+            except Exception:
+                duration = None
+        return _duration_or_estimate(entry, duration)
+
+    durations = await asyncio.gather(*(probe(entry) for entry in entries))
+    return {entry.path: duration for entry, duration in zip(entries, durations)}
+
+
+def _round_robin(entries: list[ScannedFile]) -> list[ScannedFile]:
+    groups: dict[Path, deque[ScannedFile]] = defaultdict(deque)
+    for entry in sorted(entries, key=lambda e: e.path):
+        groups[entry.path.parent].append(entry)
+
+    ordered: list[ScannedFile] = []
+    queues = [groups[parent] for parent in sorted(groups)]
+    while queues:
+        for q in queues:
+            ordered.append(q.popleft())
+        queues = [q for q in queues if q]
+    return ordered
+
+
+def order_files(
+    entries: list[ScannedFile],
+    policy: str,
+    durations: Optional[dict[Path, float]] = None,
+) -> list[ScannedFile]:
+    """Order files for dispatch under a scheduling policy.
+
+    Args:
+        entries: Files to schedule.
+        policy: One of SCHEDULE_POLICIES.
+        durations: Durations for "longest"/"shortest" (probed if omitted).
+
+    Returns:
+        Files in dispatch order. Ties keep path order.
+
+    Raises:
+        ValueError: If the policy is unknown.
+    """
+    if policy not in SCHEDULE_POLICIES:
+        choices = ", ".join(SCHEDULE_POLICIES)
+        raise ValueError(f"Unknown schedule '{policy}'. Choose from: {choices}")
+
+    if policy == SCAN_ORDER:
+        return list(entries)
+    if policy == "round-robin":
+        return _round_robin(entries)
+
+    by_path = sorted(entries, key=lambda e: e.path)
+    if policy == "path":
+        return by_path
+    if policy == "largest":
+        return sorted(by_path, key=lambda e: e.size, reverse=True)
+    if policy == "newest":
+        return sorted(by_path, key=lambda e: e.mtime_ns, reverse=True)
+
+    if durations is None:
+        durations = probe_durations(entries)
+    return sorted(by_path, key=lambda e: durations[e.path], reverse=policy == "longest")
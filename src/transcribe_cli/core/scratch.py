@@ -0,0 +1,242 @@
+"""Managed scratch space for intermediate audio.
+
+- Configurable location (TRANSCRIBE_SCRATCH_DIR or --scratch-dir); prefers
+  tmpfs (/dev/shm) when it has room for the whole budget
+- Per-process directories named transcribe_<pid>_*, so directories left by
+  killed runs can be told apart from live ones
+- Startup sweep of orphaned directories whose process is gone
+- Optional byte budget; chunked extractions in batch runs wait for space,
+  as do buffered extractions for the part that may spill to disk
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, Optional
+
+from .budget import ByteBudget
+
+SCRATCH_PREFIX = "transcribe_"
+SCRATCH_DIR_ENV = "TRANSCRIBE_SCRATCH_DIR"
+# tmpfs mounts tried before the system temp directory
+TMPFS_CANDIDATES = (Path("/dev/shm"),)
+# Default cap on chunk files held in scratch at once
+DEFAULT_SCRATCH_BUDGET_MB = 2048
+# Directories from older releases carry no PID; sweep them only once stale
+LEGACY_ORPHAN_AGE_SECONDS = 24 * 60 * 60
+
+_MB = 1024 * 1024
+
+
+def _pid_alive(pid: int) -> bool:
+    if os.name != "posix":
+        # os.kill would terminate the process on Windows
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        # Exists but belongs to someone else
+        return True
+    return True
+
+
+def _owner_pid(name: str) -> Optional[int]:
+    """PID embedded in a scratch directory name, if any."""
+    pid, sep, _ = name[len(SCRATCH_PREFIX) :].partition("_")
+    if not sep or not pid.isdigit():
+        return None
+    return int(pid)
+
+
+def choose_root(required_bytes: int) -> Path:
+    """Pick the scratch root: tmpfs if it has room, else the temp directory.
+
+    Args:
+        required_bytes: Free space tmpfs must have to be chosen.
+
+    Returns:
+        Directory to create scratch directories in.
+    """
+    for candidate in TMPFS_CANDIDATES:
+        try:
+            if (
+                candidate.is_dir()
+                and os.access(candidate, os.W_OK)
+                and shutil.disk_usage(candidate).free >= required_bytes
+            ):
+                return candidate
+        except OSError:
+            continue
+    return Path(tempfile.gettempdir())
+
+
+class ScratchSpace:
+    """Location and byte budget for scratch files.
+
+    The budget is an asyncio ByteBudget, so it applies to the batch run's
+    event loop; blocking single-file runs create their directory without
+    waiting.
+    """
+
+    def __init__(
+        self,
+        root: Optional[Path] = None,
+        budget_bytes: Optional[int] = DEFAULT_SCRATCH_BUDGET_MB * _MB,
+    ) -> None:
+        """Set up scratch space.
+
+        Args:
+            root: Directory for scratch directories (default: tmpfs if it
+                has room for the budget, else the system temp directory).
+            budget_bytes: Bytes of scratch files allowed at once (None or
+                0 for no limit).
+        """
+        self.budget = ByteBudget(budget_bytes) if budget_bytes else None
+        if root is None:
+            root = choose_root(budget_bytes or DEFAULT_SCRATCH_BUDGET_MB * _MB)
+        self.root = Path(root).expanduser()
+
+    def directory(self) -> "ScratchDir":
+        """A new per-file scratch directory, created on first use."""
+        return ScratchDir(self)
+
+
+class ScratchDir:
+    """Temporary directory for one file's intermediate audio."""
+
+    def __init__(self, space: ScratchSpace) -> None:
+        self._space = space
+        self._path: Optional[Path] = None
+        self._reserved = 0
+
+    @property
+    def path(self) -> Path:
+        """Return the directory, creating it if needed."""
+        if self._path is None:
+            self._space.root.mkdir(parents=True, exist_ok=True)
+            self._path = Path(
+                tempfile.mkdtemp(
+                    prefix=f"{SCRATCH_PREFIX}{os.getpid()}_", dir=self._space.root
+                )
+            )
+        return self._path
+
+    async def reserve(self, size: int) -> None:
+        """Wait until `size` bytes fit in the scratch budget and hold them.
+
+        The bytes are returned by cleanup().
+        """
+        if self._space.budget is not None:
+            self._reserved += await self._space.budget.acquire(size)
+
+    def release(self) -> None:
+        """Return the bytes held by reserve() before cleanup()."""
+        if self._reserved and self._space.budget is not None:
+            self._space.budget.release(self._reserved)
+        self._reserved = 0
+
+    def cleanup(self) -> None:
+        """Remove the directory and release its reserved bytes."""
+        if self._path is not None:
+            shutil.rmtree(self._path, ignore_errors=True)
+            self._path = None
+        self.release()
+
+
+def sweep_orphans(roots: Optional[Iterable[Path]] = None) -> int:
+    """Remove scratch directories left behind by processes that died.
+
+    Only directories owned by the current user are touched. Directories
+    whose name carries no PID (from older releases) are removed once they
+    are older than LEGACY_ORPHAN_AGE_SECONDS.
+
+    Args:
+        roots: Directories to sweep (default: the current scratch root,
+            the tmpfs candidates and the system temp directory).
+
+    Returns:
+        Number of directories removed.
+    """
+    if roots is None:
+        roots = [
+            get_scratch_space().root,
+            *TMPFS_CANDIDATES,
+            Path(tempfile.gettempdir()),
+        ]
+
+    removed = 0
+    now = time.time()
+    uid = os.getuid() if hasattr(os, "getuid") else None
+    for root in dict.fromkeys(Path(r) for r in roots):
+        try:
+            entries = list(os.scandir(root))
+        except OSError:
+            continue
+        for entry in entries:
+            if not entry.name.startswith(SCRATCH_PREFIX):
+                continue
+            try:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                st = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            if uid is not None and st.st_uid != uid:
+                continue
+
+            pid = _owner_pid(entry.name)
+            if pid is None:
+                if now - st.st_mtime < LEGACY_ORPHAN_AGE_SECONDS:
+                    continue
+            elif pid == os.getpid() or _pid_alive(pid):
+                continue
+
+            shutil.rmtree(entry.path, ignore_errors=True)
+            removed += 1
+    return removed
+
+
+_default_space: Optional[ScratchSpace] = None
+_default_lock = threading.Lock()
+
+
+def get_scratch_space() -> ScratchSpace:
+    """Return the process-wide scratch space, creating it with defaults.
+
+    TRANSCRIBE_SCRATCH_DIR, if set, overrides the automatic location.
+    """
+    global _default_space
+    with _default_lock:
+        if _default_space is None:
+            override = os.environ.get(SCRATCH_DIR_ENV)
+            _default_space = ScratchSpace(Path(override) if override else None)
+        return _default_space
+
+
+def configure_scratch(
+    root: Optional[Path] = None,
+    budget_bytes: Optional[int] = DEFAULT_SCRATCH_BUDGET_MB * _MB,
+) -> ScratchSpace:
+    """Replace the process-wide scratch space.
+
+    Args:
+        root: Directory for scratch directories (default:
+            TRANSCRIBE_SCRATCH_DIR, else tmpfs or the temp directory).
+        budget_bytes: Bytes of scratch files allowed at once (None or 0
+            for no limit).
+
+    Returns:
+        The new process-wide scratch space.
+    """
+    global _default_space
+    if root is None and os.environ.get(SCRATCH_DIR_ENV):
+        root = Path(os.environ[SCRATCH_DIR_ENV])
+    space = ScratchSpace(root, budget_bytes)
+    with _default_lock:
+        _default_space = space
+    return space
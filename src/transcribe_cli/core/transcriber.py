@@ -4,23 +4,77 @@ Implements Sprint 3: Transcription Client
 - OpenAI Whisper API integration
 - Retry logic with exponential backoff
 - Response parsing with timestamps
+- Chunked transcription for files over the 25MB API limit
+- Shared keep-alive client for batch runs
+- Async-native transcription on AsyncOpenAI for batch concurrency
+- Content-addressed response cache to skip repeat uploads
+- Shared adaptive rate limiter paced by 429s and x-ratelimit-* headers
+- Video audio piped into spooled memory buffers instead of scratch files
+- Speech encoding profiles, including "fit" to avoid chunking
+- Stream-copy remux of API-compatible audio from video containers
+- In-flight byte estimates for the batch byte budget
+- Stage hand-offs (probe, extract, upload) for the batch pipeline
+- Extraction on a CPU-sized executor with per-job FFmpeg threads
+- Async probes and buffered extractions on asyncio subprocesses in batch runs
+- Batch extractions killed on wall-clock and no-progress timeouts
+- Chunk files in managed scratch space; batch splits wait for scratch budget
+- Per-file request and retry counts for batch events
 """
 
-import tempfile
+import asyncio
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Literal, Optional
-
-from openai import APIConnectionError, APIStatusError, OpenAI, RateLimitError
+from typing import IO, Any, Iterator, Literal, Mapping, Optional, Union, cast
+
+from openai import (
+    APIConnectionError,
+    APITimeoutError,
+    APIStatusError,
+    AsyncOpenAI,
+    DefaultAsyncHttpxClient,
+    DefaultHttpxClient,
+    OpenAI,
+    RateLimitError,
+)
 from tenacity import (
+    RetryCallState,
     retry,
     retry_if_exception_type,
     stop_after_attempt,
     wait_exponential,
 )
 
-from .extractor import extract_audio, is_video_file
+from .cache import TranscriptCache, hash_file, make_cache_key, stat_signature
+from .chunker import AudioChunk, merge_chunk_responses, split_audio
+from .extractor import (
+    DEFAULT_SPOOL_THRESHOLD_BYTES,
+    AudioBuffer,
+    MediaInfo,
+    NoAudioStreamError,
+    extract_audio_to_buffer,
+    extract_audio_to_buffer_async,
+    get_media_info,
+    get_media_info_async,
+    is_video_file,
+)
+from .executor import ExtractionExecutor
 from .ffmpeg import FFmpegNotFoundError
+from .pipeline import StageTicket
+from .profiles import DEFAULT_PROFILE, EncodingProfile, copy_profile, resolve_profile
+from .ratelimit import RateLimiter, get_rate_limiter, retry_after_seconds
+from .scratch import ScratchDir, get_scratch_space
+from .watchdog import JobTimeouts
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - openai releases built on httpx2
+    import httpx2 as httpx
 
 
 class TranscriptionError(Exception):
@@ -52,7 +106,7 @@ class FileTooLargeError(Exception):
             f"File is too large for Whisper API: {size_mb:.1f}MB\n"
             f"Maximum allowed size: {max_mb}MB\n"
             f"File: {path}\n\n"
-            "For large files, use chunking (available in future release)."
+            "Try a smaller chunk size (chunk_size_minutes) so each chunk fits."
         )
         super().__init__(message)
         self.path = path
@@ -96,6 +150,18 @@ class TranscriptionResult:
 MAX_FILE_SIZE_MB = 25.0
 MAX_FILE_SIZE_BYTES = int(MAX_FILE_SIZE_MB * 1024 * 1024)
 
+# Whisper model and the encoding applied to extracted audio before upload
+WHISPER_MODEL = "whisper-1"
+DEFAULT_ENCODING_PROFILE = DEFAULT_PROFILE
+
+# Chunking defaults (see Settings.chunk_size_minutes)
+DEFAULT_CHUNK_SIZE_MINUTES = 10
+DEFAULT_CHUNK_CONCURRENCY = 4
+
+# Connection pool defaults for shared clients
+DEFAULT_MAX_CONNECTIONS = 20
+KEEPALIVE_EXPIRY_SECONDS = 60.0
+
 
 def _check_file_size(path: Path) -> None:
     """Check if file is within Whisper API limits.
@@ -112,11 +178,15 @@ def _check_file_size(path: Path) -> None:
         raise FileTooLargeError(path, size_mb, MAX_FILE_SIZE_MB)
 
 
-def _create_client(api_key: Optional[str] = None) -> OpenAI:
+def _create_client(
+    api_key: Optional[str] = None,
+    http_client: Optional[httpx.Client] = None,
+) -> OpenAI:
     """Create OpenAI client.
 
     Args:
         api_key: Optional API key. If not provided, uses OPENAI_API_KEY env var.
+        http_client: Optional HTTP client with a custom connection pool.
 
     Returns:
         Configured OpenAI client.
@@ -125,7 +195,10 @@ def _create_client(api_key: Optional[str] = None) -> OpenAI:
         APIKeyMissingError: If no API key is available.
     """
     try:
-        client = OpenAI(api_key=api_key)
+        if http_client is None:
+            client = OpenAI(api_key=api_key)
+        else:
+            client = OpenAI(api_key=api_key, http_client=http_client)
         # Validate key is present (OpenAI client doesn't validate until first call)
         if not client.api_key:
             raise APIKeyMissingError()
@@ -136,25 +209,261 @@ def _create_client(api_key: Optional[str] = None) -> OpenAI:
         raise
 
 
-@retry(
+def create_client(
+    api_key: Optional[str] = None,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+) -> OpenAI:
+    """Create a long-lived OpenAI client with a sized keep-alive pool.
+
+    Intended to be created once and shared by every transcription in a
+    run, so uploads reuse warm TLS connections instead of opening a new
+    pool per file. The client is thread-safe.
+
+    Args:
+        api_key: Optional API key. If not provided, uses OPENAI_API_KEY env var.
+        max_connections: Maximum number of pooled connections.
+
+    Returns:
+        Configured OpenAI client.
+
+    Raises:
+        APIKeyMissingError: If no API key is available.
+    """
+    http_client = DefaultHttpxClient(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+        ),
+    )
+    try:
+        return _create_client(api_key, http_client=http_client)
+    except Exception:
+        http_client.close()
+        raise
+
+
+def warm_client(client: OpenAI) -> threading.Thread:
+    """Open a pooled connection in the background.
+
+    Issues a cheap authenticated request on a daemon thread so the TLS
+    handshake overlaps with local work such as audio extraction. Errors
+    are ignored; the first real upload reports any problem.
+
+    Args:
+        client: Client to warm up.
+
+    Returns:
+        The started background thread.
+    """
+
+    def _warm() -> None:
+        try:
+            client.with_options(max_retries=0, timeout=10.0).models.retrieve(
+                "whisper-1"
+            )
+        except Exception:
+            pass
+
+    thread = threading.Thread(target=_warm, name="transcribe-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+def create_async_client(
+    api_key: Optional[str] = None,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+) -> AsyncOpenAI:
+    """Create a long-lived AsyncOpenAI client with a sized keep-alive pool.
+
+    Async counterpart of create_client, used by batch processing.
+
+    Args:
+        api_key: Optional API key. If not provided, uses OPENAI_API_KEY env var.
+        max_connections: Maximum number of pooled connections.
+
+    Returns:
+        Configured AsyncOpenAI client.
+
+    Raises:
+        APIKeyMissingError: If no API key is available.
+    """
+    http_client = DefaultAsyncHttpxClient(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+        ),
+    )
+    try:
+        client = AsyncOpenAI(api_key=api_key, http_client=http_client)
+    except Exception as e:
+        if "api_key" in str(e).lower():
+            raise APIKeyMissingError() from e
+        raise
+    if not client.api_key:
+        raise APIKeyMissingError()
+    return client
+
+
+async def warm_async_client(client: AsyncOpenAI) -> None:
+    """Open a pooled connection ahead of the first upload.
+
+    Meant to be scheduled as a task. Errors are ignored; the first real
+    upload reports any problem.
+
+    Args:
+        client: Async client to warm up.
+    """
+    try:
+        await client.with_options(max_retries=0, timeout=10.0).models.retrieve(
+            "whisper-1"
+        )
+    except Exception:
+        pass
+
+
+_connection_backoff = wait_exponential(multiplier=1, min=1, max=10)
+
+
+def _retry_wait(retry_state: RetryCallState) -> float:
+    """Wait between attempts.
+
+    Rate-limit pauses are enforced by the shared RateLimiter when the next
+    attempt acquires, so 429s only add jitter here to de-synchronize
+    workers. Connection errors use exponential backoff.
+    """
+    outcome = retry_state.outcome
+    if outcome is not None and isinstance(outcome.exception(), RateLimitError):
+        return random.uniform(0.0, 1.0)
+    return _connection_backoff(retry_state)
+
+
+# Uploadable audio: a file on disk or an in-memory extraction buffer
+AudioSource = Union[Path, AudioBuffer]
+
+
+@contextmanager
+def _open_upload(
+    audio: AudioSource,
+) -> Iterator[Union[IO[bytes], tuple[str, IO[bytes]]]]:
+    """Open audio for a (possibly retried) upload attempt."""
+    if isinstance(audio, AudioBuffer):
+        yield (audio.name, audio.open())
+    else:
+        with open(audio, "rb") as audio_file:
+            yield audio_file
+
+
+@dataclass
+class UploadStats:
+    """Transcription requests made for one input file."""
+
+    requests: int = 0
+    retries: int = 0
+
+
+# Counters for the file being transcribed; chunk tasks inherit them
+_upload_stats: ContextVar[Optional[UploadStats]] = ContextVar(
+    "upload_stats", default=None
+)
+
+
+@contextmanager
+def track_uploads(stats: Optional[UploadStats] = None) -> Iterator[UploadStats]:
+    """Count the transcription requests made inside the block.
+
+    The counters follow the context into tasks and to_thread calls started
+    inside the block, so concurrent chunk uploads are included.
+
+    Args:
+        stats: Counters to add to (default: new ones).
+    """
+    if stats is None:
+        stats = UploadStats()
+    token = _upload_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _upload_stats.reset(token)
+
+
+def _count_request() -> None:
+    stats = _upload_stats.get()
+    if stats is not None:
+        stats.requests += 1
+
+
+def _count_retry(retry_state: RetryCallState) -> None:
+    stats = _upload_stats.get()
+    if stats is not None:
+        stats.retries += 1
+
+
+# Retry policy shared by the sync and async upload paths
+_retry_api_call = retry(
     retry=retry_if_exception_type((RateLimitError, APIConnectionError)),
     stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=1, max=10),
+    wait=_retry_wait,
+    before_sleep=_count_retry,
     reraise=True,
 )
+
+
+def _record_throttle(limiter: RateLimiter, error: RateLimitError) -> None:
+    """Report a 429 to the shared limiter, honoring its headers."""
+    headers = getattr(error.response, "headers", None) or {}
+    limiter.update_from_headers(headers)
+    limiter.record_throttle(retry_after_seconds(headers))
+
+
+def _request_kwargs(
+    language: Optional[str],
+    response_format: Literal["json", "text", "verbose_json"],
+) -> dict:
+    """Build keyword arguments for a transcription request (minus file)."""
+    kwargs: dict = {
+        "model": WHISPER_MODEL,
+        "response_format": response_format,
+    }
+    if language and language != "auto":
+        kwargs["language"] = language
+    return kwargs
+
+
+def _response_to_dict(
+    response: object,
+    response_format: Literal["json", "text", "verbose_json"],
+) -> dict:
+    """Normalize an API response object to a dictionary."""
+    data: dict
+    if response_format == "text":
+        data = {"text": response}
+    elif hasattr(response, "model_dump"):
+        data = response.model_dump()
+    else:
+        data = dict(cast(Mapping[str, Any], response))
+    return data
+
+
+@_retry_api_call
 def _transcribe_audio_file(
     client: OpenAI,
-    audio_path: Path,
+    audio: AudioSource,
     language: Optional[str] = None,
     response_format: Literal["json", "text", "verbose_json"] = "verbose_json",
+    audio_seconds: float = 0.0,
 ) -> dict:
     """Call Whisper API to transcribe audio file.
 
+    Every attempt first acquires from the process-wide RateLimiter.
+
     Args:
         client: OpenAI client.
-        audio_path: Path to audio file.
+        audio: Path to audio file, or an extraction buffer.
         language: Optional language code (e.g., "en", "es").
         response_format: API response format.
+        audio_seconds: Duration of the audio, charged to the audio bucket.
 
     Returns:
         API response as dictionary.
@@ -164,24 +473,77 @@ def _transcribe_audio_file(
         APIConnectionError: On connection issues (will be retried).
         APIStatusError: On other API errors.
     """
-    with open(audio_path, "rb") as audio_file:
-        kwargs = {
-            "model": "whisper-1",
-            "file": audio_file,
-            "response_format": response_format,
-        }
-        if language and language != "auto":
-            kwargs["language"] = language
-
-        response = client.audio.transcriptions.create(**kwargs)
-
-    # Handle different response formats
-    if response_format == "text":
-        return {"text": response}
-    elif hasattr(response, "model_dump"):
-        return response.model_dump()
-    else:
-        return dict(response)
+    kwargs = _request_kwargs(language, response_format)
+    limiter = get_rate_limiter()
+    limiter.acquire(audio_seconds)
+    _count_request()
+
+    with _open_upload(audio) as upload:
+        try:
+            raw = client.audio.transcriptions.with_raw_response.create(
+                file=upload, **kwargs
+            )
+        except RateLimitError as e:
+            _record_throttle(limiter, e)
+            raise
+        except APITimeoutError:
+            limiter.record_timeout()
+            raise
+
+    limiter.update_from_headers(raw.headers)
+    limiter.record_success()
+    return _response_to_dict(raw.parse(), response_format)
+
+
+@_retry_api_call
+async def _transcribe_audio_file_async(
+    client: AsyncOpenAI,
+    audio: AudioSource,
+    language: Optional[str] = None,
+    response_format: Literal["json", "text", "verbose_json"] = "verbose_json",
+    audio_seconds: float = 0.0,
+) -> dict:
+    """Call Whisper API to transcribe audio file without blocking the loop.
+
+    The audio is read off the event loop and uploaded from memory, so an
+    in-flight upload costs a coroutine rather than a worker thread. Every
+    attempt first acquires from the process-wide RateLimiter.
+
+    Args:
+        client: Async OpenAI client.
+        audio: Path to audio file, or an extraction buffer.
+        language: Optional language code (e.g., "en", "es").
+        response_format: API response format.
+        audio_seconds: Duration of the audio, charged to the audio bucket.
+
+    Returns:
+        API response as dictionary.
+
+    Raises:
+        RateLimitError: On rate limit (will be retried).
+        APIConnectionError: On connection issues (will be retried).
+        APIStatusError: On other API errors.
+    """
+    kwargs = _request_kwargs(language, response_format)
+    data = await asyncio.to_thread(audio.read_bytes)
+    limiter = get_rate_limiter()
+    await limiter.acquire_async(audio_seconds)
+    _count_request()
+
+    try:
+        raw = await client.audio.transcriptions.with_raw_response.create(
+            file=(audio.name, data), **kwargs
+        )
+    except RateLimitError as e:
+        _record_throttle(limiter, e)
+        raise
+    except APITimeoutError:
+        limiter.record_timeout()
+        raise
+
+    limiter.update_from_headers(raw.headers)
+    limiter.record_success()
+    return _response_to_dict(raw.parse(), response_format)
 
 
 def _parse_segments(response: dict) -> list[TranscriptionSegment]:
@@ -209,103 +571,738 @@ def _parse_segments(response: dict) -> list[TranscriptionSegment]:
     return segments
 
 
+def _translate_api_error(e: Exception) -> TranscriptionError:
+    """Convert an OpenAI API exception into a user-facing TranscriptionError."""
+    if isinstance(e, RateLimitError):
+        return TranscriptionError(
+            f"Rate limit exceeded after retries. Please wait and try again.\n{e}"
+        )
+    if isinstance(e, APIStatusError):
+        return TranscriptionError(f"API error: {e.message}")
+    return TranscriptionError(
+        f"Connection error after retries. Check your internet connection.\n{e}"
+    )
+
+
+def _transcribe_or_raise(
+    client: OpenAI,
+    audio: AudioSource,
+    language: Optional[str],
+    audio_seconds: float = 0.0,
+) -> dict:
+    """Call the Whisper API, converting API failures to TranscriptionError.
+
+    Args:
+        client: OpenAI client.
+        audio: Audio file or extraction buffer (within the size limit).
+        language: Optional language code, None for auto-detection.
+        audio_seconds: Duration of the audio, for rate limiting.
+
+    Returns:
+        API response as dictionary.
+
+    Raises:
+        TranscriptionError: If the API call fails after retries.
+    """
+    try:
+        return _transcribe_audio_file(
+            client=client,
+            audio=audio,
+            language=language,
+            audio_seconds=audio_seconds,
+        )
+    except (APIStatusError, APIConnectionError) as e:
+        raise _translate_api_error(e) from e
+
+
+async def _transcribe_or_raise_async(
+    client: AsyncOpenAI,
+    audio: AudioSource,
+    language: Optional[str],
+    audio_seconds: float = 0.0,
+) -> dict:
+    """Async counterpart of _transcribe_or_raise."""
+    try:
+        return await _transcribe_audio_file_async(
+            client=client,
+            audio=audio,
+            language=language,
+            audio_seconds=audio_seconds,
+        )
+    except (APIStatusError, APIConnectionError) as e:
+        raise _translate_api_error(e) from e
+
+
+def _chunk_error(chunk: AudioChunk, total: int, e: Exception) -> TranscriptionError:
+    """Wrap a chunk failure with the chunk's position in the recording."""
+    return TranscriptionError(
+        f"Chunk {chunk.index + 1}/{total} "
+        f"({chunk.start:.0f}s-{chunk.end:.0f}s) failed: {e}"
+    )
+
+
+def _transcribe_chunks(
+    client: OpenAI,
+    chunks: list[AudioChunk],
+    language: Optional[str],
+    max_workers: int = DEFAULT_CHUNK_CONCURRENCY,
+) -> dict:
+    """Transcribe chunks concurrently and merge them onto one timeline.
+
+    Args:
+        client: OpenAI client (thread-safe, shared by all uploads).
+        chunks: Chunks to upload, in timeline order.
+        language: Optional language code, None for auto-detection.
+        max_workers: Maximum concurrent chunk uploads.
+
+    Returns:
+        Merged API response dictionary.
+
+    Raises:
+        FileTooLargeError: If a single chunk still exceeds the API limit.
+        TranscriptionError: If any chunk fails, naming the failed chunk.
+    """
+    for chunk in chunks:
+        _check_file_size(chunk.path)
+
+    def _run(chunk: AudioChunk) -> dict:
+        try:
+            return _transcribe_or_raise(
+                client, chunk.path, language, audio_seconds=chunk.duration
+            )
+        except TranscriptionError as e:
+            raise _chunk_error(chunk, len(chunks), e) from e
+
+    workers = max(1, min(max_workers, len(chunks)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        responses = list(pool.map(_run, chunks))
+
+    return merge_chunk_responses(responses, chunks)
+
+
+async def _transcribe_chunks_async(
+    client: AsyncOpenAI,
+    chunks: list[AudioChunk],
+    language: Optional[str],
+    max_concurrency: int = DEFAULT_CHUNK_CONCURRENCY,
+) -> dict:
+    """Async counterpart of _transcribe_chunks."""
+    for chunk in chunks:
+        _check_file_size(chunk.path)
+
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _run(chunk: AudioChunk) -> dict:
+        async with semaphore:
+            try:
+                return await _transcribe_or_raise_async(
+                    client, chunk.path, language, audio_seconds=chunk.duration
+                )
+            except TranscriptionError as e:
+                raise _chunk_error(chunk, len(chunks), e) from e
+
+    responses = await asyncio.gather(*(_run(chunk) for chunk in chunks))
+    return merge_chunk_responses(list(responses), chunks)
+
+
+@dataclass
+class _PreparedAudio:
+    """Uploadable audio for one input file."""
+
+    source: AudioSource
+    chunks: Optional[list[AudioChunk]] = None
+    duration: float = 0.0
+
+    def close(self) -> None:
+        """Release an in-memory extraction buffer, if any."""
+        if isinstance(self.source, AudioBuffer):
+            self.source.close()
+
+
+def _split_source(
+    source_path: Path,
+    scratch: ScratchDir,
+    chunk_size_minutes: int,
+    encoding_profile: str,
+    duration: Optional[float] = None,
+    threads: Optional[int] = None,
+    timeouts: Optional[JobTimeouts] = None,
+) -> _PreparedAudio:
+    """Split a recording that is too large for one upload into chunks."""
+    chunk_seconds = chunk_size_minutes * 60
+    chunks = split_audio(
+        input_path=source_path,
+        output_dir=scratch.path / "chunks",
+        chunk_seconds=chunk_seconds,
+        duration=duration,
+        profile=resolve_profile(encoding_profile, chunk_seconds, MAX_FILE_SIZE_BYTES),
+        threads=threads,
+        timeouts=timeouts,
+    )
+    return _PreparedAudio(
+        source=source_path,
+        chunks=chunks,
+        duration=chunks[-1].end if chunks else 0.0,
+    )
+
+
+def _remux_if_fits(
+    input_path: Path,
+    media_info: MediaInfo,
+    threads: Optional[int] = None,
+    spill_dir: Optional[Path] = None,
+) -> Optional[_PreparedAudio]:
+    """Stream-copy compatible audio out of a container into a buffer.
+
+    Returns None when the codec needs transcoding or the copied audio
+    would not fit in one upload.
+    """
+    profile = _remux_profile(media_info)
+    if profile is None:
+        return None
+
+    buffer = extract_audio_to_buffer(
+        input_path,
+        media_info=media_info,
+        profile=profile,
+        threads=threads,
+        spill_dir=spill_dir,
+    )
+    if buffer.size > MAX_FILE_SIZE_BYTES:
+        buffer.close()
+        return None
+    return _PreparedAudio(source=buffer, duration=media_info.duration or 0.0)
+
+
+def _remux_profile(media_info: MediaInfo) -> Optional[EncodingProfile]:
+    """Stream-copy profile for the source audio, if its copy would fit."""
+    profile = copy_profile(media_info.audio_codec)
+    if profile is None:
+        return None
+
+    duration = media_info.duration
+    if duration and media_info.audio_bitrate:
+        if duration * media_info.audio_bitrate / 8 > MAX_FILE_SIZE_BYTES:
+            return None
+    return profile
+
+
+def _spill_bytes(estimated_size: Optional[float]) -> int:
+    """Scratch bytes a buffered extraction may spill past the spool threshold.
+
+    Unknown sizes assume the largest audio that is uploaded in one request.
+    """
+    if estimated_size is None:
+        estimated_size = MAX_FILE_SIZE_BYTES
+    expected = min(int(estimated_size), MAX_FILE_SIZE_BYTES)
+    return max(0, expected - DEFAULT_SPOOL_THRESHOLD_BYTES)
+
+
+def _prepare_audio(
+    input_path: Path,
+    scratch: ScratchDir,
+    chunk_size_minutes: int,
+    encoding_profile: str = DEFAULT_ENCODING_PROFILE,
+    stream_copy: bool = True,
+    threads: Optional[int] = None,
+) -> _PreparedAudio:
+    """Produce uploadable audio for an input file.
+
+    Audio files within the API size limit are uploaded as they are. Video
+    files whose audio codec the API accepts are remuxed without
+    re-encoding when the copy fits in one upload. Other video files, and
+    audio over the limit, are re-encoded with the encoding profile. Either
+    way the audio is piped from FFmpeg into a spooled in-memory buffer,
+    which only spills into the scratch directory past the spool threshold. Recordings whose encoded audio would still exceed the limit
+    are split directly from the source. The duration of plain audio is
+    only probed when the rate limiter meters audio seconds.
+
+    Args:
+        input_path: Resolved path to the audio or video file.
+        scratch: Scratch directory for chunk files and buffer spills.
+        chunk_size_minutes: Length of each chunk for files over the limit.
+        encoding_profile: Profile name for re-encoded audio (see profiles).
+        stream_copy: Remux compatible audio from video instead of
+            re-encoding it.
+        threads: FFmpeg threads per job (default: FFmpeg's choice).
+
+    Returns:
+        _PreparedAudio. chunks is None when the audio can be uploaded in
+        one request. The caller must close it.
+
+    Raises:
+        NoAudioStreamError: If the file has no audio stream.
+    """
+    if (
+        not is_video_file(input_path)
+        and input_path.stat().st_size <= MAX_FILE_SIZE_BYTES
+    ):
+        duration = None
+        if get_rate_limiter().limits_audio:
+            try:
+                duration = get_media_info(input_path).duration
+            except Exception:
+                duration = None
+        return _PreparedAudio(source=input_path, duration=duration or 0.0)
+
+    media_info = get_media_info(input_path)
+    if not media_info.has_audio:
+        raise NoAudioStreamError(input_path)
+
+    duration = media_info.duration
+    if stream_copy and is_video_file(input_path):
+        copied = _remux_if_fits(input_path, media_info, threads, scratch.path)
+        if copied is not None:
+            return copied
+
+    profile = resolve_profile(encoding_profile, duration, MAX_FILE_SIZE_BYTES)
+    estimated_size = profile.estimated_size(duration) if duration else None
+    if estimated_size is not None and estimated_size > MAX_FILE_SIZE_BYTES:
+        return _split_source(
+            input_path, scratch, chunk_size_minutes, encoding_profile, duration, threads
+        )
+
+    buffer = extract_audio_to_buffer(
+        input_path,
+        media_info=media_info,
+        profile=profile,
+        threads=threads,
+        spill_dir=scratch.path,
+    )
+    if buffer.size <= MAX_FILE_SIZE_BYTES:
+        return _PreparedAudio(source=buffer, duration=duration or 0.0)
+
+    buffer.close()
+    return _split_source(
+        input_path, scratch, chunk_size_minutes, encoding_profile, duration, threads
+    )
+
+
+async def _prepare_audio_async(
+    input_path: Path,
+    scratch: ScratchDir,
+    chunk_size_minutes: int,
+    encoding_profile: str = DEFAULT_ENCODING_PROFILE,
+    stream_copy: bool = True,
+    extract_executor: Optional[ExtractionExecutor] = None,
+) -> _PreparedAudio:
+    """Async counterpart of _prepare_audio (see there for the decisions).
+
+    Probes and buffered extractions are awaited as asyncio subprocesses,
+    so they hold no thread and are killed if the file is cancelled. Only
+    chunk splitting runs on extract_executor (or the loop's executor).
+    Buffered extractions first reserve the bytes they may spill, and chunk
+    splitting the bytes of its chunks, in the scratch budget.
+
+    Args:
+        input_path: Resolved path to the audio or video file.
+        scratch: Scratch directory for chunk files and buffer spills.
+        chunk_size_minutes: Length of each chunk for files over the limit.
+        encoding_profile: Profile name for re-encoded audio (see profiles).
+        stream_copy: Remux compatible audio from video instead of
+            re-encoding it.
+        extract_executor: Executor for chunk splitting, which also sets
+            each job's FFmpeg thread count and timeouts.
+
+    Returns:
+        _PreparedAudio. The caller must close it.
+
+    Raises:
+        NoAudioStreamError: If the file has no audio stream.
+    """
+    threads = None
+    timeouts = None
+    if extract_executor is not None:
+        threads = extract_executor.threads_per_job
+        timeouts = extract_executor.timeouts
+    st = await asyncio.to_thread(input_path.stat)
+    if not is_video_file(input_path) and st.st_size <= MAX_FILE_SIZE_BYTES:
+        duration = None
+        if get_rate_limiter().limits_audio:
+            try:
+                duration = (await get_media_info_async(input_path)).duration
+            except Exception:
+                duration = None
+        return _PreparedAudio(source=input_path, duration=duration or 0.0)
+
+    media_info = await get_media_info_async(input_path)
+    if not media_info.has_audio:
+        raise NoAudioStreamError(input_path)
+
+    duration = media_info.duration
+    if stream_copy and is_video_file(input_path):
+        copy = _remux_profile(media_info)
+        if copy is not None:
+            copy_size = None
+            if duration and media_info.audio_bitrate:
+                copy_size = duration * media_info.audio_bitrate / 8
+            await scratch.reserve(_spill_bytes(copy_size))
+            buffer = await extract_audio_to_buffer_async(
+                input_path,
+                media_info=media_info,
+                profile=copy,
+                threads=threads,
+                timeouts=timeouts,
+                spill_dir=scratch.path,
+            )
+            if buffer.size <= MAX_FILE_SIZE_BYTES:
+                return _PreparedAudio(source=buffer, duration=duration or 0.0)
+            buffer.close()
+            scratch.release()
+
+    profile = resolve_profile(encoding_profile, duration, MAX_FILE_SIZE_BYTES)
+    estimated_size = profile.estimated_size(duration) if duration else None
+    if estimated_size is None or estimated_size <= MAX_FILE_SIZE_BYTES:
+        await scratch.reserve(_spill_bytes(estimated_size))
+        buffer = await extract_audio_to_buffer_async(
+            input_path,
+            media_info=media_info,
+            profile=profile,
+            threads=threads,
+            timeouts=timeouts,
+            spill_dir=scratch.path,
+        )
+        if buffer.size <= MAX_FILE_SIZE_BYTES:
+            return _PreparedAudio(source=buffer, duration=duration or 0.0)
+        buffer.close()
+        scratch.release()
+
+    # Chunks are written to scratch; wait for room for all of them
+    chunk_profile = resolve_profile(
+        encoding_profile, chunk_size_minutes * 60, MAX_FILE_SIZE_BYTES
+    )
+    estimate = chunk_profile.estimated_size(duration) if duration else None
+    await scratch.reserve(estimate or st.st_size)
+    split = partial(
+        _split_source,
+        input_path,
+        scratch,
+        chunk_size_minutes,
+        encoding_profile,
+        duration,
+        threads,
+        timeouts,
+    )
+    if extract_executor is not None:
+        return await extract_executor.run(split)
+    return await asyncio.to_thread(split)
+
+
+def _needs_probe(input_path: Path) -> bool:
+    """Whether _prepare_audio will probe the file (see there)."""
+    try:
+        size = input_path.stat().st_size
+    except OSError:
+        return False
+    return (
+        is_video_file(input_path)
+        or size > MAX_FILE_SIZE_BYTES
+        or get_rate_limiter().limits_audio
+    )
+
+
+def estimate_in_flight_bytes(input_path: Path, size: int) -> int:
+    """Estimate the memory a file holds while being transcribed.
+
+    Audio within the API limit is uploaded as it is, so its upload body is
+    the file. Anything else is extracted into a buffer of at most one
+    upload and read again for the upload body, or split into chunks that
+    are uploaded DEFAULT_CHUNK_CONCURRENCY at a time.
+
+    Args:
+        input_path: Audio or video file.
+        size: Size of the file in bytes.
+
+    Returns:
+        Estimated peak bytes of extraction output plus upload body.
+    """
+    if not is_video_file(input_path) and size <= MAX_FILE_SIZE_BYTES:
+        return size
+    return min(2 * size, MAX_FILE_SIZE_BYTES * DEFAULT_CHUNK_CONCURRENCY)
+
+
+def _cache_lookup(
+    cache: TranscriptCache,
+    input_path: Path,
+    language: str,
+    chunk_size_minutes: int,
+    encoding_profile: str = DEFAULT_ENCODING_PROFILE,
+    stream_copy: bool = True,
+) -> tuple[Optional[dict], tuple[str, str]]:
+    """Look up a source file's transcript in the cache.
+
+    The first lookup is keyed on the file's path, size and mtime, so an
+    unchanged file is found without reading it. Only on a miss is the
+    source hashed, to find the same media cached under another name. The
+    source media is keyed (rather than the extracted audio) so that cache
+    hits skip extraction as well as the upload; the preprocessing
+    parameters that shape the uploaded audio are part of both keys.
+
+    Returns:
+        (cached response or None, (stat key, content key)); the content
+        key is empty when the stat key hit.
+    """
+    params = {
+        "profile": encoding_profile,
+        "stream_copy": stream_copy,
+        "chunk_size_minutes": chunk_size_minutes,
+    }
+    stat_key = make_cache_key(
+        stat_signature(input_path), language, WHISPER_MODEL, params
+    )
+    cached = cache.get(stat_key)
+    if cached is not None:
+        return cached, (stat_key, "")
+
+    content_key = make_cache_key(hash_file(input_path), language, WHISPER_MODEL, params)
+    cached = cache.get(content_key)
+    if cached is not None:
+        cache.link(stat_key, content_key)
+    return cached, (stat_key, content_key)
+
+
+def _cache_store(cache: TranscriptCache, keys: tuple[str, str], response: dict) -> None:
+    """Store a response under its content key, aliased by its stat key."""
+    stat_key, content_key = keys
+    cache.put(content_key, response)
+    cache.link(stat_key, content_key)
+
+
+def _build_result(
+    input_path: Path,
+    output_path: Optional[Path],
+    response: dict,
+) -> TranscriptionResult:
+    """Build a TranscriptionResult from a (possibly merged) API response."""
+    if output_path is None:
+        output_path = input_path.with_suffix(".txt")
+
+    return TranscriptionResult(
+        input_path=input_path,
+        output_path=output_path,
+        text=response.get("text", ""),
+        segments=_parse_segments(response),
+        language=response.get("language", "unknown"),
+        duration=response.get("duration"),
+    )
+
+
 def transcribe_file(
     input_path: Path,
     output_path: Optional[Path] = None,
     language: str = "auto",
     api_key: Optional[str] = None,
+    chunk_size_minutes: int = DEFAULT_CHUNK_SIZE_MINUTES,
+    client: Optional[OpenAI] = None,
+    cache: Optional[TranscriptCache] = None,
+    encoding_profile: str = DEFAULT_ENCODING_PROFILE,
+    stream_copy: bool = True,
 ) -> TranscriptionResult:
     """Transcribe an audio or video file.
 
-    For video files, audio is automatically extracted first.
+    For video files, audio is automatically extracted first, encoded with
+    encoding_profile. Audio over the 25MB API limit is re-encoded the same
+    way, and only split into chunk_size_minutes windows (transcribed
+    concurrently and merged into a single result) if it still does not fit.
 
     Args:
         input_path: Path to audio or video file.
         output_path: Optional path for output text file.
         language: Language code or "auto" for detection.
         api_key: Optional OpenAI API key.
+        chunk_size_minutes: Length of each chunk for files over the limit.
+        client: Optional shared client (see create_client). A new client
+            is created from api_key if not provided.
+        cache: Optional transcript cache. Hits return without extraction
+            or an API call.
+        encoding_profile: Encoding profile for extracted or re-encoded
+            audio ("fit" picks a bitrate that avoids chunking).
+        stream_copy: Remux API-compatible audio out of video containers
+            instead of re-encoding it.
 
     Returns:
         TranscriptionResult with transcribed text and metadata.
 
     Raises:
         APIKeyMissingError: If API key not configured.
-        FileTooLargeError: If file exceeds 25MB.
+        FileTooLargeError: If a chunk still exceeds 25MB.
         FFmpegNotFoundError: If FFmpeg needed but not installed.
         TranscriptionError: If transcription fails.
+        ValueError: If encoding_profile is unknown.
     """
     input_path = Path(input_path).resolve()
 
     if not input_path.exists():
         raise FileNotFoundError(f"File not found: {input_path}")
 
-    # Create client (validates API key)
-    client = _create_client(api_key)
+    resolve_profile(encoding_profile, max_bytes=MAX_FILE_SIZE_BYTES)
+
+    cache_keys = None
+    if cache is not None:
+        cached, cache_keys = _cache_lookup(
+            cache,
+            input_path,
+            language,
+            chunk_size_minutes,
+            encoding_profile,
+            stream_copy,
+        )
+        if cached is not None:
+            return _build_result(input_path, output_path, cached)
 
-    # Handle video files - extract audio first
-    audio_path = input_path
-    temp_audio = None
+    # Create client (validates API key) unless a shared one was injected
+    if client is None:
+        client = _create_client(api_key)
+
+    api_language = language if language != "auto" else None
+    scratch = get_scratch_space().directory()
+    audio: Optional[_PreparedAudio] = None
 
     try:
-        if is_video_file(input_path):
-            # Extract audio to temporary file
-            temp_dir = tempfile.mkdtemp(prefix="transcribe_")
-            temp_audio = Path(temp_dir) / f"{input_path.stem}.mp3"
-            extraction_result = extract_audio(
-                input_path=input_path,
-                output_path=temp_audio,
-                output_format="mp3",
+        audio = _prepare_audio(
+            input_path, scratch, chunk_size_minutes, encoding_profile, stream_copy
+        )
+
+        # Call Whisper API, chunking if the audio exceeds the upload limit
+        if audio.chunks:
+            response = _transcribe_chunks(client, audio.chunks, api_language)
+        else:
+            response = _transcribe_or_raise(
+                client, audio.source, api_language, audio_seconds=audio.duration
             )
-            audio_path = extraction_result.output_path
 
-        # Check file size
-        _check_file_size(audio_path)
+        if cache is not None and cache_keys is not None:
+            _cache_store(cache, cache_keys, response)
 
-        # Call Whisper API
-        try:
-            response = _transcribe_audio_file(
-                client=client,
-                audio_path=audio_path,
-                language=language if language != "auto" else None,
-            )
-        except RateLimitError as e:
-            raise TranscriptionError(
-                f"Rate limit exceeded after retries. Please wait and try again.\n{e}"
-            ) from e
-        except APIStatusError as e:
-            raise TranscriptionError(f"API error: {e.message}") from e
-        except APIConnectionError as e:
-            raise TranscriptionError(
-                f"Connection error after retries. Check your internet connection.\n{e}"
-            ) from e
-
-        # Parse response
-        text = response.get("text", "")
-        segments = _parse_segments(response)
-        detected_language = response.get("language", "unknown")
-        duration = response.get("duration")
-
-        # Determine output path
-        if output_path is None:
-            output_path = input_path.with_suffix(".txt")
-
-        return TranscriptionResult(
-            input_path=input_path,
-            output_path=output_path,
-            text=text,
-            segments=segments,
-            language=detected_language,
-            duration=duration,
+        return _build_result(input_path, output_path, response)
+
+    finally:
+        # Release buffered audio and clean up chunk files
+        if audio is not None:
+            audio.close()
+        scratch.cleanup()
+
+
+async def transcribe_file_async(
+    input_path: Path,
+    client: AsyncOpenAI,
+    output_path: Optional[Path] = None,
+    language: str = "auto",
+    chunk_size_minutes: int = DEFAULT_CHUNK_SIZE_MINUTES,
+    cache: Optional[TranscriptCache] = None,
+    encoding_profile: str = DEFAULT_ENCODING_PROFILE,
+    stream_copy: bool = True,
+    stages: Optional[StageTicket] = None,
+    extract_executor: Optional[ExtractionExecutor] = None,
+) -> TranscriptionResult:
+    """Transcribe an audio or video file on the running event loop.
+
+    Async counterpart of transcribe_file. Uploads are awaited on the
+    shared AsyncOpenAI client, and ffprobe and buffered FFmpeg runs are
+    awaited as subprocesses; only chunk splitting and file reads run off
+    the loop. With a pipeline ticket, the cache lookup and probe, the
+    extraction and the upload each run under their stage's limit.
+
+    Args:
+        input_path: Path to audio or video file.
+        client: Shared async client (see create_async_client).
+        output_path: Optional path for output text file.
+        language: Language code or "auto" for detection.
+        chunk_size_minutes: Length of each chunk for files over the limit.
+        cache: Optional transcript cache. Hits return without extraction
+            or an API call.
+        encoding_profile: Encoding profile for extracted or re-encoded
+            audio ("fit" picks a bitrate that avoids chunking).
+        stream_copy: Remux API-compatible audio out of video containers
+            instead of re-encoding it.
+        stages: Optional StagePipeline ticket; the file is left holding
+            its upload (or, on a cache hit, probe) slot.
+        extract_executor: Executor for chunk splitting, which also sets
+            each job's FFmpeg thread count (default: the loop's executor).
+
+    Returns:
+        TranscriptionResult with transcribed text and metadata.
+
+    Raises:
+        FileTooLargeError: If a chunk still exceeds 25MB.
+        FFmpegNotFoundError: If FFmpeg needed but not installed.
+        TranscriptionError: If transcription fails.
+        ValueError: If encoding_profile is unknown.
+    """
+    input_path = Path(input_path).resolve()
+
+    if not input_path.exists():
+        raise FileNotFoundError(f"File not found: {input_path}")
+
+    resolve_profile(encoding_profile, max_bytes=MAX_FILE_SIZE_BYTES)
+
+    if stages is not None:
+        await stages.enter("probe")
+
+    cache_keys = None
+    if cache is not None:
+        cached, cache_keys = await asyncio.to_thread(
+            _cache_lookup,
+            cache,
+            input_path,
+            language,
+            chunk_size_minutes,
+            encoding_profile,
+            stream_copy,
         )
+        if cached is not None:
+            return _build_result(input_path, output_path, cached)
+
+    if stages is not None:
+        # Probe here so extraction reads the result from the probe cache;
+        # a failed probe is reported by the extract stage instead
+        if await asyncio.to_thread(_needs_probe, input_path):
+            try:
+                await get_media_info_async(input_path)
+            except Exception:
+                pass
+        await stages.enter("extract")
+
+    api_language = language if language != "auto" else None
+    scratch = get_scratch_space().directory()
+    audio: Optional[_PreparedAudio] = None
+
+    try:
+        audio = await _prepare_audio_async(
+            input_path,
+            scratch,
+            chunk_size_minutes,
+            encoding_profile,
+            stream_copy,
+            extract_executor,
+        )
+
+        if stages is not None:
+            await stages.enter("upload")
+
+        if audio.chunks:
+            response = await _transcribe_chunks_async(
+                client, audio.chunks, api_language
+            )
+        else:
+            response = await _transcribe_or_raise_async(
+                client, audio.source, api_language, audio_seconds=audio.duration
+            )
+
+        if cache is not None and cache_keys is not None:
+            await asyncio.to_thread(_cache_store, cache, cache_keys, response)
+
+        return _build_result(input_path, output_path, response)
 
     finally:
-        # Clean up temporary audio file
-        if temp_audio and temp_audio.exists():
-            temp_audio.unlink()
-            temp_audio.parent.rmdir()
+        if audio is not None:
+            audio.close()
+        scratch.cleanup()
 
 
-def save_transcript(result: TranscriptionResult, output_path: Optional[Path] = None) -> Path:
+def save_transcript(
+    result: TranscriptionResult, output_path: Optional[Path] = None
+) -> Path:
     """Save transcription result to a text file.
 
     Args:
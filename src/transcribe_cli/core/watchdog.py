@@ -0,0 +1,281 @@
+"""Watchdog for FFmpeg jobs.
+
+- Per-job wall-clock limit
+- No-progress limit fed by FFmpeg's -progress output and its piped output
+- Each job runs in its own process group, killed as a whole on timeout or
+  cancellation
+- Blocking and asyncio runners with the same outcome
+"""
+
+import asyncio
+import os
+import re
+import signal
+import subprocess
+import threading
+import time
+from dataclasses import dataclass
+from typing import IO, Optional, Union
+
+import ffmpeg
+
+from .ffmpeg import find_ffmpeg
+
+# Per-job wall-clock limit; generous, since a healthy job keeps advancing
+DEFAULT_JOB_TIMEOUT_SECONDS = 3600.0
+# Kill a job whose output position has not moved for this long
+DEFAULT_STALL_TIMEOUT_SECONDS = 60.0
+# How often the watchdog checks a running job
+WATCHDOG_INTERVAL_SECONDS = 1.0
+# Machine-readable progress on stderr instead of the interactive stats line
+PROGRESS_ARGS = ("-progress", "pipe:2", "-nostats")
+PIPE_READ_SIZE = 64 * 1024
+
+WALL_CLOCK = "wall-clock"
+NO_PROGRESS = "no progress"
+
+# Progress counters that only grow while FFmpeg is producing output
+_ADVANCING_KEYS = ("out_time_us", "out_time_ms", "total_size")
+_PROGRESS_LINE = re.compile(r"(\w+)=(\S*)")
+
+Process = Union["subprocess.Popen[bytes]", "asyncio.subprocess.Process"]
+
+
+@dataclass
+class JobTimeouts:
+    """Limits for one FFmpeg job. None or 0 disables a limit."""
+
+    wall_seconds: Optional[float] = DEFAULT_JOB_TIMEOUT_SECONDS
+    stall_seconds: Optional[float] = DEFAULT_STALL_TIMEOUT_SECONDS
+
+    def limit(self, reason: str) -> float:
+        """Seconds allowed by the limit named by reason."""
+        seconds = self.wall_seconds if reason == WALL_CLOCK else self.stall_seconds
+        return seconds or 0.0
+
+
+@dataclass
+class JobOutcome:
+    """How an FFmpeg job ended."""
+
+    returncode: int = 0
+    # stderr without the -progress lines
+    stderr: str = ""
+    # WALL_CLOCK or NO_PROGRESS when the watchdog killed the job
+    timeout: Optional[str] = None
+    output_bytes: int = 0
+
+
+class ProgressWatch:
+    """Tracks whether an FFmpeg job is still advancing."""
+
+    def __init__(self, timeouts: Optional[JobTimeouts] = None) -> None:
+        self.timeouts = timeouts or JobTimeouts()
+        self.started = time.monotonic()
+        self.last_progress = self.started
+        self._counters: dict[str, int] = {}
+
+    def touch(self) -> None:
+        """Record progress (e.g. output bytes arriving on a pipe)."""
+        self.last_progress = time.monotonic()
+
+    def feed(self, line: str) -> bool:
+        """Consume one stderr line.
+
+        Returns:
+            True if the line was -progress output rather than a message.
+        """
+        match = _PROGRESS_LINE.fullmatch(line.strip())
+        if match is None:
+            return False
+
+        key, value = match.groups()
+        if key == "progress" and value == "end":
+            self.touch()
+        elif key in _ADVANCING_KEYS:
+            try:
+                count = int(value)
+            except ValueError:
+                # N/A before the first packet is written
+                return True
+            if count > self._counters.get(key, -1):
+                self._counters[key] = count
+                self.touch()
+        return True
+
+    def expired(self) -> Optional[str]:
+        """WALL_CLOCK or NO_PROGRESS if a limit has passed, else None."""
+        now = time.monotonic()
+        wall = self.timeouts.wall_seconds
+        if wall and now - self.started > wall:
+            return WALL_CLOCK
+        stall = self.timeouts.stall_seconds
+        if stall and now - self.last_progress > stall:
+            return NO_PROGRESS
+        return None
+
+
+def ffmpeg_command(stream: "ffmpeg.nodes.OutputStream") -> list[str]:
+    """Compile an FFmpeg graph into a command line that reports progress."""
+    args = stream.compile(cmd=find_ffmpeg() or "ffmpeg")
+    return [args[0], *PROGRESS_ARGS, *args[1:]]
+
+
+def _new_group() -> dict:
+    """Popen arguments that start the job in its own process group."""
+    if os.name == "posix":
+        return {"start_new_session": True}
+    return {"creationflags": getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0)}
+
+
+def kill_process_group(process: Process) -> None:
+    """Kill a job's process and anything it started."""
+    if process.returncode is not None:
+        return
+    try:
+        if os.name == "posix":
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except ProcessLookupError:
+        pass
+
+
+def run_watched(
+    stream: "ffmpeg.nodes.OutputStream",
+    output: Optional[IO[bytes]] = None,
+    timeouts: Optional[JobTimeouts] = None,
+) -> JobOutcome:
+    """Run an FFmpeg job under the watchdog, blocking until it ends.
+
+    Args:
+        stream: FFmpeg graph to run.
+        output: File to copy FFmpeg's stdout into, for pipe:1 outputs.
+        timeouts: Job limits (default: JobTimeouts()).
+
+    Returns:
+        JobOutcome. A job killed by the watchdog has timeout set.
+    """
+    watch = ProgressWatch(timeouts)
+    process = subprocess.Popen(
+        ffmpeg_command(stream),
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE if output is not None else subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        **_new_group(),
+    )
+    messages: list[str] = []
+    killed: list[str] = []
+    finished = threading.Event()
+
+    def drain() -> None:
+        for raw in process.stderr:  # type: ignore[union-attr]
+            line = raw.decode(errors="replace").rstrip()
+            if not watch.feed(line):
+                messages.append(line)
+
+    def guard() -> None:
+        while not finished.wait(WATCHDOG_INTERVAL_SECONDS):
+            reason = watch.expired()
+            if reason is not None:
+                killed.append(reason)
+                kill_process_group(process)
+                return
+
+    threads = [
+        threading.Thread(target=drain, daemon=True),
+        threading.Thread(target=guard, daemon=True),
+    ]
+    for thread in threads:
+        thread.start()
+
+    size = 0
+    try:
+        if output is not None:
+            read = process.stdout.read  # type: ignore[union-attr]
+            for block in iter(lambda: read(PIPE_READ_SIZE), b""):
+                output.write(block)
+                size += len(block)
+                watch.touch()
+        returncode = process.wait()
+    except BaseException:
+        kill_process_group(process)
+        process.wait()
+        raise
+    finally:
+        finished.set()
+        for thread in threads:
+            thread.join()
+
+    return JobOutcome(returncode, "\n".join(messages), killed[0] if killed else None, size)
+
+
+async def run_watched_async(
+    stream: "ffmpeg.nodes.OutputStream",
+    output: Optional[IO[bytes]] = None,
+    timeouts: Optional[JobTimeouts] = None,
+) -> JobOutcome:
+    """Run an FFmpeg job under the watchdog as an asyncio subprocess.
+
+    If the awaiting task is cancelled, the job's process group is killed
+    before the cancellation propagates.
+
+    Args:
+        stream: FFmpeg graph to run.
+        output: File to copy FFmpeg's stdout into, for pipe:1 outputs.
+        timeouts: Job limits (default: JobTimeouts()).
+
+    Returns:
+        JobOutcome. A job killed by the watchdog has timeout set.
+    """
+    watch = ProgressWatch(timeouts)
+    process = await asyncio.create_subprocess_exec(
+        *ffmpeg_command(stream),
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE if output is not None else asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+        **_new_group(),
+    )
+    messages: list[str] = []
+    killed: list[str] = []
+
+    async def drain() -> None:
+        async for raw in process.stderr:  # type: ignore[union-attr]
+            line = raw.decode(errors="replace").rstrip()
+            if not watch.feed(line):
+                messages.append(line)
+
+    async def guard() -> None:
+        while True:
+            await asyncio.sleep(WATCHDOG_INTERVAL_SECONDS)
+            reason = watch.expired()
+            if reason is not None:
+                killed.append(reason)
+                kill_process_group(process)
+                return
+
+    draining = asyncio.ensure_future(drain())
+    guarding = asyncio.ensure_future(guard())
+
+    size = 0
+    try:
+        if output is not None:
+            while True:
+                block = await process.stdout.read(PIPE_READ_SIZE)  # type: ignore[union-attr]
+                if not block:
+                    break
+                output.write(block)
+                size += len(block)
+                watch.touch()
+        await draining
+        returncode = await process.wait()
+    except BaseException:
+        kill_process_group(process)
+        await process.wait()
+        raise
+    finally:
+        draining.cancel()
+        guarding.cancel()
+        await asyncio.gather(draining, guarding, return_exceptions=True)
+
+    return JobOutcome(returncode, "\n".join(messages), killed[0] if killed else None, size)
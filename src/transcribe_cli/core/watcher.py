@@ -0,0 +1,279 @@
+"""Directory watcher for long-running batch runs.
+
+- inotify through ctypes on Linux, with a polling fallback elsewhere
+- Files already in the directory are picked up at startup
+- New subdirectories are watched as they appear when recursive
+- Debounce: a file is only yielded once its size and mtime have stayed
+  the same for the settle period, so partly written files are not read
+- Yields ScannedFile entries, so the watcher can feed process_batch_async
+  like the directory scanner
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Iterator, Optional
+
+from .extractor import SUPPORTED_EXTENSIONS
+from .scanner import ScannedFile, _validate_directory, iter_media_files
+
+# A file must keep its size and mtime this long before it is processed
+DEFAULT_SETTLE_SECONDS = 2.0
+# Full rescans for the polling backend
+DEFAULT_POLL_SECONDS = 5.0
+# Upper bound on how long the watcher blocks, so stop() is noticed quickly
+TICK_SECONDS = 0.5
+
+INOTIFY = "inotify"
+POLLING = "polling"
+WATCH_BACKENDS = (INOTIFY, POLLING)
+
+# inotify(7) event bits
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+# struct inotify_event header: wd, mask, cookie, len
+_EVENT = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+
+def _load_libc() -> Optional[ctypes.CDLL]:
+    """The C library, if it provides inotify."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    except OSError:
+        return None
+    if not all(hasattr(libc, name) for name in ("inotify_init1", "inotify_add_watch")):
+        return None
+    return libc
+
+
+class _Inotify:
+    """Minimal inotify wrapper: watch directories, read (directory, name, mask)."""
+
+    def __init__(self, libc: ctypes.CDLL) -> None:
+        self._libc = libc
+        self.fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"inotify_init1 failed: {os.strerror(errno)}")
+        self._dirs: dict[int, Path] = {}
+
+    def add(self, directory: Path) -> bool:
+        """Watch a directory. Returns False if it cannot be watched."""
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            return False
+        self._dirs[wd] = directory
+        return True
+
+    def read(self, timeout: float) -> Optional[list[tuple[Path, str, int]]]:
+        """Wait up to timeout for events.
+
+        Returns:
+            (directory, name, mask) per event, or None if the kernel queue
+            overflowed and events were lost.
+        """
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            data = os.read(self.fd, _READ_SIZE)
+        except BlockingIOError:
+            return []
+
+        events: list[tuple[Path, str, int]] = []
+        offset = 0
+        while offset + _EVENT.size <= len(data):
+            wd, mask, _, length = _EVENT.unpack_from(data, offset)
+            offset += _EVENT.size
+            raw = data[offset : offset + length].split(b"\0", 1)[0]
+            offset += length
+            if mask & _IN_Q_OVERFLOW:
+                return None
+            if mask & _IN_IGNORED:
+                # Directory removed or unmounted
+                self._dirs.pop(wd, None)
+                continue
+            directory = self._dirs.get(wd)
+            if directory is not None and raw:
+                events.append((directory, os.fsdecode(raw), mask))
+        return events
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def inotify_available() -> bool:
+    """Whether the inotify backend can be used on this system."""
+    return _load_libc() is not None
+
+
+class MediaWatcher:
+    """Watch a directory and yield media files once they are fully written.
+
+    Iterating blocks until stop() is called, yielding each file that
+    settles; a file that later changes is yielded again. Meant to be
+    passed as `files` to process_batch_async with the "scan" schedule and
+    without dedup, which would otherwise wait for the iteration to end.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        recursive: bool = False,
+        settle_seconds: float = DEFAULT_SETTLE_SECONDS,
+        poll_seconds: float = DEFAULT_POLL_SECONDS,
+        backend: Optional[str] = None,
+    ) -> None:
+        """Set up the watcher.
+
+        Args:
+            directory: Directory to watch.
+            recursive: Also watch subdirectories, including new ones.
+            settle_seconds: How long size and mtime must stay unchanged.
+            poll_seconds: Rescan interval for the polling backend.
+            backend: INOTIFY or POLLING (default: inotify when available).
+
+        Raises:
+            FileNotFoundError: If directory doesn't exist.
+            ValueError: If the path is not a directory or the backend is
+                unknown or unavailable.
+        """
+        self.directory = _validate_directory(directory)
+        self.recursive = recursive
+        self.settle_seconds = settle_seconds
+        self.poll_seconds = poll_seconds
+        libc = _load_libc()
+        if backend is None:
+            backend = INOTIFY if libc is not None else POLLING
+        if backend not in WATCH_BACKENDS:
+            choices = ", ".join(WATCH_BACKENDS)
+            raise ValueError(
+                f"Unknown watch backend '{backend}'. Choose from: {choices}"
+            )
+        if backend == INOTIFY and libc is None:
+            raise ValueError("inotify is not available on this system")
+        self.backend = backend
+        self._libc = libc
+        self._stop = threading.Event()
+        # path -> ((size, mtime_ns), when that signature was first seen)
+        self._pending: dict[Path, tuple[tuple[int, int], float]] = {}
+        # Signature each file had when it was last yielded
+        self._yielded: dict[Path, tuple[int, int]] = {}
+
+    def stop(self) -> None:
+        """Make iteration end at the next tick."""
+        self._stop.set()
+
+    @property
+    def stopped(self) -> bool:
+        """Whether stop() has been called."""
+        return self._stop.is_set()
+
+    def _observe(self, path: Path) -> None:
+        """Start (or restart) the settle clock for a candidate file."""
+        if os.path.splitext(path.name)[1].lower() not in SUPPORTED_EXTENSIONS:
+            return
+        try:
+            st = path.stat()
+        except OSError:
+            self._pending.pop(path, None)
+            return
+        signature = (st.st_size, st.st_mtime_ns)
+        if self._yielded.get(path) == signature:
+            return
+        current = self._pending.get(path)
+        if current is None or current[0] != signature:
+            self._pending[path] = (signature, time.monotonic())
+
+    def _rescan(self) -> None:
+        for entry in iter_media_files(self.directory, self.recursive):
+            if self._yielded.get(entry.path) != (entry.size, entry.mtime_ns):
+                self._observe(entry.path)
+
+    def _settled(self) -> Iterator[ScannedFile]:
+        now = time.monotonic()
+        for path, (signature, since) in list(self._pending.items()):
+            if now - since < self.settle_seconds:
+                continue
+            try:
+                st = path.stat()
+            except OSError:
+                # Removed or renamed before it settled
+                del self._pending[path]
+                continue
+            current = (st.st_size, st.st_mtime_ns)
+            if current != signature:
+                self._pending[path] = (current, now)
+                continue
+            del self._pending[path]
+            if st.st_size == 0:
+                # Placeholder; the write that fills it restarts the clock
+                continue
+            self._yielded[path] = current
+            yield ScannedFile(path, *current)
+
+    def _watch_tree(self, notify: _Inotify, directory: Path) -> None:
+        """Watch a directory (and, if recursive, everything below it)."""
+        notify.add(directory)
+        if not self.recursive:
+            return
+        for root, dirs, _ in os.walk(directory):
+            for name in dirs:
+                notify.add(Path(root) / name)
+
+    def __iter__(self) -> Iterator[ScannedFile]:
+        notify = None
+        if self.backend == INOTIFY and self._libc is not None:
+            notify = _Inotify(self._libc)
+        try:
+            # Watch before the initial scan so nothing lands unseen between them
+            if notify is not None:
+                self._watch_tree(notify, self.directory)
+            self._rescan()
+            next_poll = time.monotonic() + self.poll_seconds
+
+            while not self._stop.is_set():
+                yield from self._settled()
+                tick = min(TICK_SECONDS, self.settle_seconds or TICK_SECONDS)
+                if notify is None:
+                    self._stop.wait(tick)
+                    if time.monotonic() >= next_poll:
+                        self._rescan()
+                        next_poll = time.monotonic() + self.poll_seconds
+                    continue
+
+                events = notify.read(tick)
+                if events is None:
+                    # Kernel queue overflowed; find what was missed
+                    self._rescan()
+                    continue
+                for directory, name, mask in events:
+                    path = directory / name
+                    if mask & _IN_ISDIR:
+                        if self.recursive and mask & (_IN_CREATE | _IN_MOVED_TO):
+                            # Files may have landed before the watch existed
+                            self._watch_tree(notify, path)
+                            for entry in iter_media_files(path, recursive=True):
+                                self._observe(entry.path)
+                        continue
+                    self._observe(path)
+        finally:
+            if notify is not None:
+                notify.close()
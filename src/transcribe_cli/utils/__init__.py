@@ -1 +1,8 @@
 """Utility functions for transcribe-cli."""
+
+from .paths import CACHE_DIR_ENV, get_cache_dir
+
+__all__ = [
+    "CACHE_DIR_ENV",
+    "get_cache_dir",
+]
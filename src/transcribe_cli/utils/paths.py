@@ -0,0 +1,36 @@
+"""Filesystem locations used by transcribe-cli."""
+
+import os
+import sys
+from pathlib import Path
+
+# Environment variable overriding the cache root
+CACHE_DIR_ENV = "TRANSCRIBE_CACHE_DIR"
+
+
+def get_cache_dir() -> Path:
+    """Get the root directory for persistent caches.
+
+    Resolution order:
+    1. TRANSCRIBE_CACHE_DIR environment variable
+    2. %LOCALAPPDATA%/transcribe on Windows
+    3. $XDG_CACHE_HOME/transcribe
+    4. ~/.cache/transcribe
+
+    The directory is not created.
+
+    Returns:
+        Path to the cache root.
+    """
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return Path(override).expanduser()
+
+    if sys.platform == "win32" and os.environ.get("LOCALAPPDATA"):
+        return Path(os.environ["LOCALAPPDATA"]) / "transcribe"
+
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    if xdg:
+        return Path(xdg) / "transcribe"
+
+    return Path.home() / ".cache" / "transcribe"
@@ -0,0 +1,55 @@
+"""Shared pytest fixtures."""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+) -> Path:
+    """Point persistent caches at a per-test directory."""
+    cache_dir = tmp_path_factory.mktemp("cache")
+    monkeypatch.setenv("TRANSCRIBE_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
+
+@pytest.fixture(autouse=True)
+def fresh_rate_limiter(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give each test its own process-wide rate limiter."""
+    from transcribe_cli.core import ratelimit
+
+    monkeypatch.setattr(ratelimit, "_default_limiter", None)
+
+
+@pytest.fixture(autouse=True)
+def fresh_toolchain(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give each test its own FFmpeg toolchain registry."""
+    from transcribe_cli.core import ffmpeg
+
+    monkeypatch.setattr(ffmpeg, "_default_toolchain", None)
+
+
+@pytest.fixture(autouse=True)
+def isolated_scratch(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+) -> Path:
+    """Keep scratch directories and the orphan sweep in a per-test directory."""
+    from transcribe_cli.core import scratch
+
+    scratch_dir = tmp_path_factory.mktemp("scratch")
+    monkeypatch.setattr(scratch, "TMPFS_CANDIDATES", ())
+    monkeypatch.setattr(scratch, "_default_space", None)
+    monkeypatch.setattr(tempfile, "tempdir", str(scratch_dir))
+    monkeypatch.delenv("TRANSCRIBE_SCRATCH_DIR", raising=False)
+    return scratch_dir
+
+
+@pytest.fixture(autouse=True)
+def isolated_config(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Ignore config files on the machine running the tests."""
+    from transcribe_cli.config import settings
+
+    monkeypatch.setattr(settings, "CONFIG_LOCATIONS", [])
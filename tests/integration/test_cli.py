@@ -64,6 +64,149 @@ class TestCLI:
         result = runner.invoke(app, ["batch", ".", "--concurrency", "25"])
         assert result.exit_code != 0
 
+    def test_batch_concurrency_auto(self, tmp_path: Path) -> None:
+        """--concurrency auto is passed through with its ceiling."""
+        (tmp_path / "audio.mp3").write_bytes(b"fake")
+
+        from transcribe_cli.core.batch import BatchSummary
+
+        mock_summary = BatchSummary(
+            total_files=1,
+            successful=1,
+            failed=0,
+            skipped=0,
+            concurrency_trajectory=[(0.0, 2), (3.0, 3)],
+        )
+
+        with patch("transcribe_cli.core.process_directory", return_value=mock_summary) as mock:
+            result = runner.invoke(
+                app,
+                ["batch", str(tmp_path), "--concurrency", "auto", "--max-concurrency", "40"],
+            )
+
+        assert result.exit_code == 0
+        assert mock.call_args.kwargs["concurrency"] == "auto"
+        assert mock.call_args.kwargs["max_concurrency"] == 40
+        assert "2 → 3" in result.stdout
+
+    def test_batch_extraction_timeouts(self, tmp_path: Path) -> None:
+        """Timeout options reach the batch and timed-out files are flagged."""
+        (tmp_path / "hung.mkv").write_bytes(b"fake")
+
+        from transcribe_cli.core.batch import BatchResult, BatchSummary
+
+        hung = BatchResult(
+            input_path=tmp_path / "hung.mkv",
+            output_path=None,
+            success=False,
+            error="FFmpeg made no progress for 30s",
+            timed_out=True,
+        )
+        mock_summary = BatchSummary(
+            total_files=1, successful=0, failed=1, skipped=0, results=[hung]
+        )
+
+        with patch("transcribe_cli.core.process_directory", return_value=mock_summary) as mock:
+            result = runner.invoke(
+                app,
+                ["batch", str(tmp_path), "--extract-timeout", "600", "--stall-timeout", "30"],
+            )
+
+        assert result.exit_code == 1
+        timeouts = mock.call_args.kwargs["extract_timeouts"]
+        assert (timeouts.wall_seconds, timeouts.stall_seconds) == (600, 30)
+        assert "Extraction timeouts: 1" in result.stdout
+        assert "hung.mkv (timed out)" in result.stdout
+
+    def test_batch_dedup_reports_savings(self, tmp_path: Path) -> None:
+        """--dedup reaches the batch and the savings are summarized."""
+        (tmp_path / "a.mp3").write_bytes(b"fake")
+
+        from transcribe_cli.core.batch import BatchSummary
+
+        mock_summary = BatchSummary(
+            total_files=3,
+            successful=3,
+            failed=0,
+            skipped=0,
+            duplicates=2,
+            duplicate_bytes_saved=3 * 1024 * 1024,
+            api_calls_saved=2,
+        )
+
+        with patch("transcribe_cli.core.process_directory", return_value=mock_summary) as mock:
+            result = runner.invoke(app, ["batch", str(tmp_path), "--dedup"])
+
+        assert result.exit_code == 0
+        assert mock.call_args.kwargs["dedup"] is True
+        assert "Duplicates: 2 file(s) reused a transcript" in result.stdout
+        assert "3.0 MB and 2 API call(s) saved" in result.stdout
+
+    def test_batch_events_jsonl(self, tmp_path: Path) -> None:
+        """--events-jsonl opens a stream for the batch and closes it afterwards."""
+        (tmp_path / "a.mp3").write_bytes(b"fake")
+        target = tmp_path / "logs" / "events.jsonl"
+
+        from transcribe_cli.core import EventStream
+        from transcribe_cli.core.batch import BatchSummary
+
+        mock_summary = BatchSummary(total_files=1, successful=1, failed=0, skipped=0)
+
+        def run(**kwargs: object) -> BatchSummary:
+            events = kwargs["events"]
+            assert isinstance(events, EventStream)
+            events.emit("batch", total_files=1)
+            return mock_summary
+
+        with patch("transcribe_cli.core.process_directory", side_effect=run):
+            result = runner.invoke(
+                app, ["batch", str(tmp_path), "--events-jsonl", str(target)]
+            )
+
+        assert result.exit_code == 0
+        assert '"event": "batch"' in target.read_text()
+
+
+class TestWatchCommand:
+    """Tests for watch command."""
+
+    def test_watch_feeds_batch_with_watcher(self, tmp_path: Path) -> None:
+        """watch runs an incremental batch over a MediaWatcher."""
+        from transcribe_cli.core import MediaWatcher
+        from transcribe_cli.core.batch import BatchSummary
+
+        mock_summary = BatchSummary(total_files=2, successful=1, failed=0, skipped=1)
+
+        with patch("transcribe_cli.core.validate_ffmpeg"):
+            with patch("transcribe_cli.core.process_batch", return_value=mock_summary) as mock:
+                result = runner.invoke(
+                    app, ["watch", str(tmp_path), "--polling", "--settle-seconds", "1"]
+                )
+
+        assert result.exit_code == 0
+        kwargs = mock.call_args.kwargs
+        watcher = kwargs["files"]
+        assert isinstance(watcher, MediaWatcher)
+        assert (watcher.backend, watcher.settle_seconds) == ("polling", 1.0)
+        assert kwargs["incremental"] is True
+        assert kwargs["keep_warm_seconds"] > 0
+        assert "Watching:" in result.stdout
+        assert "Skipped (up to date): 1" in result.stdout
+
+    def test_watch_missing_ffmpeg_warns(self, tmp_path: Path) -> None:
+        """Without FFmpeg the watch still starts, for audio-only inboxes."""
+        from transcribe_cli.core import FFmpegNotFoundError
+        from transcribe_cli.core.batch import BatchSummary
+
+        mock_summary = BatchSummary(total_files=0, successful=0, failed=0, skipped=0)
+
+        with patch("transcribe_cli.core.validate_ffmpeg", side_effect=FFmpegNotFoundError()):
+            with patch("transcribe_cli.core.process_batch", return_value=mock_summary):
+                result = runner.invoke(app, ["watch", str(tmp_path)])
+
+        assert result.exit_code == 0
+        assert "Warning:" in result.stdout
+
 
 class TestExtractCommand:
     """Tests for extract command."""
@@ -124,6 +267,45 @@ class TestExtractCommand:
             assert result.exit_code == 0
             assert "Success" in result.stdout
 
+    def test_extract_remuxes_unless_format_given(self, tmp_path: Path) -> None:
+        """extract should stream-copy by default and encode when --format is set."""
+        fake_video = tmp_path / "video.mp4"
+        fake_video.write_bytes(b"fake video content")
+
+        mock_result = MagicMock()
+        mock_result.output_path = tmp_path / "video.m4a"
+        mock_result.duration = 60.0
+
+        with patch("transcribe_cli.core.extract_audio", return_value=mock_result) as mock_extract:
+            result = runner.invoke(app, ["extract", str(fake_video)])
+            assert result.exit_code == 0
+            assert mock_extract.call_args.kwargs["stream_copy"] is True
+
+            result = runner.invoke(app, ["extract", str(fake_video), "--format", "wav"])
+            assert result.exit_code == 0
+            assert mock_extract.call_args.kwargs["stream_copy"] is False
+            assert mock_extract.call_args.kwargs["output_format"] == "wav"
+
+    def test_extract_fit_profile_uses_duration(self, tmp_path: Path) -> None:
+        """extract --profile fit should pick a bitrate from the duration."""
+        fake_video = tmp_path / "video.mp4"
+        fake_video.write_bytes(b"fake video content")
+
+        mock_info = MagicMock()
+        mock_info.duration = 3600.0
+        mock_result = MagicMock()
+        mock_result.output_path = tmp_path / "video.mp3"
+        mock_result.duration = 3600.0
+
+        with patch("transcribe_cli.core.get_media_info", return_value=mock_info):
+            with patch("transcribe_cli.core.extract_audio", return_value=mock_result) as mock_extract:
+                result = runner.invoke(app, ["extract", str(fake_video), "--profile", "fit"])
+
+        assert result.exit_code == 0
+        profile = mock_extract.call_args.kwargs["profile"]
+        assert profile.name == "fit"
+        assert profile.bitrate == "48k"
+
     def test_extract_ffmpeg_not_found(self, tmp_path: Path) -> None:
         """extract should show helpful error when FFmpeg not found."""
         fake_video = tmp_path / "video.mp4"
@@ -172,6 +354,31 @@ class TestTranscribeCommand:
         assert result.exit_code == 1
         assert "Unsupported format" in result.stdout
 
+    def test_transcribe_invalid_profile(self, tmp_path: Path) -> None:
+        """transcribe should reject unknown encoding profiles."""
+        fake_audio = tmp_path / "audio.mp3"
+        fake_audio.write_bytes(b"fake audio content")
+
+        result = runner.invoke(app, ["transcribe", str(fake_audio), "--profile", "flac"])
+        assert result.exit_code == 1
+        assert "Unknown profile" in result.stdout
+
+    def test_transcribe_passes_profile(self, tmp_path: Path) -> None:
+        """transcribe should pass the encoding profile through."""
+        fake_audio = tmp_path / "audio.mp3"
+        fake_audio.write_bytes(b"fake audio content")
+
+        mock_result = MagicMock()
+        mock_result.text = "Test"
+        mock_result.word_count = 1
+
+        with patch("transcribe_cli.core.transcribe_file", return_value=mock_result) as mock_transcribe:
+            with patch("transcribe_cli.output.save_formatted_transcript", return_value=tmp_path / "audio.txt"):
+                result = runner.invoke(app, ["transcribe", str(fake_audio), "--profile", "speech-opus"])
+
+        assert result.exit_code == 0
+        assert mock_transcribe.call_args.kwargs["encoding_profile"] == "speech-opus"
+
     def test_transcribe_srt_shows_warning(self, tmp_path: Path) -> None:
         """transcribe with --format srt should show warning."""
         fake_audio = tmp_path / "audio.mp3"
@@ -337,6 +544,26 @@ class TestBatchCommand:
             assert "Successful" in result.stdout
             assert "2" in result.stdout
 
+    def test_batch_chunk_minutes_from_config(self, tmp_path: Path) -> None:
+        """chunk_size_minutes in the config file is the --chunk-minutes default."""
+        (tmp_path / "audio1.mp3").write_bytes(b"fake1")
+        config = tmp_path / "transcribe.toml"
+        config.write_text("[processing]\nchunk_size_minutes = 4\n")
+
+        from transcribe_cli.core.batch import BatchSummary
+
+        mock_summary = BatchSummary(total_files=1, successful=1, failed=0, skipped=0)
+
+        with patch("transcribe_cli.config.settings.CONFIG_LOCATIONS", [config]):
+            with patch(
+                "transcribe_cli.core.process_directory", return_value=mock_summary
+            ) as mock:
+                runner.invoke(app, ["batch", str(tmp_path)])
+                assert mock.call_args.kwargs["chunk_size_minutes"] == 4
+
+                runner.invoke(app, ["batch", str(tmp_path), "--chunk-minutes", "2"])
+                assert mock.call_args.kwargs["chunk_size_minutes"] == 2
+
     def test_batch_with_failures(self, tmp_path: Path) -> None:
         """batch should report failures correctly."""
         (tmp_path / "audio.mp3").write_bytes(b"fake")
@@ -358,6 +585,75 @@ class TestBatchCommand:
             assert result.exit_code == 1
             assert "Failed" in result.stdout
 
+    def test_batch_resume_uses_output_journal(self, tmp_path: Path) -> None:
+        """batch --resume passes the output directory journal and reports skips."""
+        (tmp_path / "audio.mp3").write_bytes(b"fake")
+        out_dir = tmp_path / "out"
+
+        from transcribe_cli.core.batch import BatchSummary
+
+        mock_summary = BatchSummary(
+            total_files=1, successful=0, failed=0, skipped=1, results=[]
+        )
+
+        with patch("transcribe_cli.core.process_directory", return_value=mock_summary) as mock_process:
+            result = runner.invoke(
+                app, ["batch", str(tmp_path), "--output-dir", str(out_dir), "--resume"]
+            )
+
+        assert result.exit_code == 0
+        assert "Skipped" in result.stdout
+        kwargs = mock_process.call_args.kwargs
+        assert kwargs["resume"] is True
+        assert kwargs["journal"].path.parent == out_dir.resolve()
+
+    def test_batch_check_hash_requires_incremental(self, tmp_path: Path) -> None:
+        """--check-hash without --incremental is rejected."""
+        (tmp_path / "audio.mp3").write_bytes(b"fake")
+
+        result = runner.invoke(app, ["batch", str(tmp_path), "--check-hash"])
+
+        assert result.exit_code == 1
+        assert "--incremental" in result.stdout
+
+    def test_batch_rejects_unknown_schedule(self, tmp_path: Path) -> None:
+        """An unknown --schedule policy is rejected."""
+        (tmp_path / "audio.mp3").write_bytes(b"fake")
+
+        result = runner.invoke(app, ["batch", str(tmp_path), "--schedule", "random"])
+
+        assert result.exit_code == 1
+        assert "Unknown schedule" in result.stdout
+
+    def test_batch_schedule_dry_run_order(self, tmp_path: Path) -> None:
+        """Dry runs list files in the scheduled order."""
+        (tmp_path / "a_small.mp3").write_bytes(b"x")
+        (tmp_path / "b_large.mp3").write_bytes(b"x" * 100)
+
+        result = runner.invoke(
+            app, ["batch", str(tmp_path), "--schedule", "largest", "--dry-run"]
+        )
+
+        assert result.exit_code == 0
+        assert result.stdout.index("b_large.mp3") < result.stdout.index("a_small.mp3")
+
+    def test_batch_incremental_dry_run(self, tmp_path: Path) -> None:
+        """Dry runs report how many files --incremental would skip."""
+        import os
+
+        audio = tmp_path / "audio.mp3"
+        audio.write_bytes(b"fake")
+        st = audio.stat()
+        os.utime(audio, ns=(st.st_atime_ns, st.st_mtime_ns - 10**10))
+        (tmp_path / "audio.txt").write_text("done")
+        (tmp_path / "new.mp3").write_bytes(b"fake")
+
+        result = runner.invoke(app, ["batch", str(tmp_path), "--incremental", "--dry-run"])
+
+        assert result.exit_code == 0
+        assert "1 file(s) would be skipped" in result.stdout
+        assert "Would process 1 files" in result.stdout
+
     def test_batch_shows_file_count(self, tmp_path: Path) -> None:
         """batch should show number of files found."""
         (tmp_path / "audio1.mp3").write_bytes(b"fake1")
@@ -412,3 +708,67 @@ class TestConfigCommand:
         assert result.exit_code == 0
         assert "--show" in result.stdout
         assert "--init" in result.stdout
+
+
+class TestCacheCommand:
+    """Tests for cache subcommands."""
+
+    def test_cache_stats_empty(self) -> None:
+        """cache stats should report an empty cache."""
+        result = runner.invoke(app, ["cache", "stats"])
+        assert result.exit_code == 0
+        assert "Entries: 0" in result.stdout
+
+    def test_cache_clear_removes_entries(self) -> None:
+        """cache clear --yes should remove cached transcripts."""
+        from transcribe_cli.core.cache import TranscriptCache
+
+        TranscriptCache.default().put("ab" * 32, {"text": "cached"})
+
+        result = runner.invoke(app, ["cache", "clear", "--yes"])
+        assert result.exit_code == 0
+        assert "Cleared 1" in result.stdout
+        assert TranscriptCache.default().stats().entries == 0
+
+    def test_cache_prune_to_zero(self) -> None:
+        """cache prune --max-mb 0 should evict everything."""
+        from transcribe_cli.core.cache import TranscriptCache
+
+        TranscriptCache.default().put("ab" * 32, {"text": "cached"})
+
+        result = runner.invoke(app, ["cache", "prune", "--max-mb", "0"])
+        assert result.exit_code == 0
+        assert "Pruned 1 entry" in result.stdout
+
+
+class TestSetupCommand:
+    """Tests for setup command."""
+
+    def test_setup_check_reports_missing_encoders(self) -> None:
+        """setup --check reads the toolchain registry and flags missing encoders."""
+        from transcribe_cli.core.ffmpeg import FFmpegInfo
+
+        info = FFmpegInfo(
+            "/usr/bin/ffmpeg",
+            (6, 1),
+            "ffmpeg version 6.1",
+            encoders=("libmp3lame", "pcm_s16le"),
+            muxers=("mp3", "ogg", "wav", "webm"),
+        )
+        with patch("transcribe_cli.core.find_ffmpeg", return_value="/usr/bin/ffmpeg"):
+            with patch("transcribe_cli.core.find_ffprobe", return_value="/usr/bin/ffprobe"):
+                with patch("transcribe_cli.core.validate_ffmpeg", return_value=info):
+                    result = runner.invoke(app, ["setup", "--check"])
+
+        assert result.exit_code == 0
+        assert "FFmpeg 6.1" in result.stdout
+        assert "lacks encoders: libopus" in result.stdout
+
+    def test_setup_check_ffmpeg_missing(self) -> None:
+        """setup --check exits non-zero when FFmpeg is not found."""
+        with patch("transcribe_cli.core.find_ffmpeg", return_value=None):
+            with patch("transcribe_cli.core.find_ffprobe", return_value=None):
+                result = runner.invoke(app, ["setup", "--check"])
+
+        assert result.exit_code == 1
+        assert "FFmpeg not found" in result.stdout
@@ -0,0 +1,161 @@
+"""Unit tests for adaptive (AIMD) batch concurrency."""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from transcribe_cli.core.adaptive import AdaptiveConcurrency
+from transcribe_cli.core.pipeline import StageTicket
+from transcribe_cli.core.ratelimit import RateLimiter
+
+
+def _complete(controller: AdaptiveConcurrency, success: bool = True) -> None:
+    """Acquire and immediately release one slot."""
+    slot = asyncio.run(controller.acquire())
+    controller.release(slot, success)
+
+
+class TestAdaptiveConcurrency:
+    """Tests for AdaptiveConcurrency."""
+
+    def test_grows_additively_while_healthy(self) -> None:
+        """Healthy completions raise the limit by about one per window."""
+        controller = AdaptiveConcurrency(initial=2, ceiling=10, limiter=RateLimiter())
+
+        for _ in range(3):
+            _complete(controller)
+        assert controller.limit == 3
+
+        for _ in range(4):
+            _complete(controller)
+        assert controller.limit == 4
+
+    def test_never_exceeds_ceiling(self) -> None:
+        """Growth stops at the ceiling."""
+        controller = AdaptiveConcurrency(initial=2, ceiling=3, limiter=RateLimiter())
+
+        for _ in range(50):
+            _complete(controller)
+
+        assert controller.limit == 3
+
+    def test_throttle_halves_once_per_window(self) -> None:
+        """Files in flight during one 429 burst halve the limit only once."""
+        limiter = RateLimiter()
+        controller = AdaptiveConcurrency(initial=8, ceiling=16, limiter=limiter)
+
+        async def run() -> None:
+            slots = [await controller.acquire() for _ in range(4)]
+            limiter.record_throttle(retry_after=0)
+            limiter.record_throttle(retry_after=0)
+            for slot in slots:
+                controller.release(slot, success=False)
+
+        asyncio.run(run())
+
+        assert controller.limit == 4
+        assert controller.decreases == 1
+        assert [limit for _, limit in controller.trajectory] == [8, 4]
+
+    def test_timeout_counts_as_congestion(self) -> None:
+        """An upload timeout halves the limit like a 429."""
+        limiter = RateLimiter()
+        controller = AdaptiveConcurrency(initial=6, ceiling=16, limiter=limiter)
+
+        async def run() -> None:
+            slot = await controller.acquire()
+            limiter.record_timeout()
+            controller.release(slot, success=True)
+
+        asyncio.run(run())
+
+        assert controller.limit == 3
+
+    def test_failures_stop_growth(self) -> None:
+        """Plain failures do not shrink the limit but stop it growing."""
+        controller = AdaptiveConcurrency(initial=2, ceiling=10, limiter=RateLimiter())
+
+        for _ in range(5):
+            _complete(controller, success=False)
+        _complete(controller)
+
+        assert controller.limit == 2
+
+    def test_rate_limiter_pacing_stops_growth(self) -> None:
+        """Growth holds while the rate limiter is making uploads wait."""
+        limiter = MagicMock()
+        limiter.stats.side_effect = [
+            MagicMock(throttled=0, timeouts=0, total_wait_seconds=0.0),
+            MagicMock(throttled=0, timeouts=0, total_wait_seconds=5.0),
+        ]
+        controller = AdaptiveConcurrency(initial=1, ceiling=10, limiter=limiter)
+
+        _complete(controller)
+
+        assert controller.limit == 1
+
+    def test_acquire_waits_at_limit(self) -> None:
+        """No more than `limit` slots are held at once."""
+        controller = AdaptiveConcurrency(initial=1, ceiling=1, limiter=RateLimiter())
+
+        async def run() -> list[str]:
+            order: list[str] = []
+
+            async def job(name: str) -> None:
+                slot = await controller.acquire()
+                order.append(f"{name}+")
+                await asyncio.sleep(0.01)
+                order.append(f"{name}-")
+                controller.release(slot, True)
+
+            await asyncio.gather(job("a"), job("b"))
+            return order
+
+        assert asyncio.run(run()) == ["a+", "a-", "b+", "b-"]
+
+    def test_invalid_bounds(self) -> None:
+        """A ceiling below the floor is rejected."""
+        with pytest.raises(ValueError):
+            AdaptiveConcurrency(ceiling=0)
+
+
+class TestAutoConcurrencyBatch:
+    """Tests for process_batch with concurrency="auto"."""
+
+    def test_auto_reports_trajectory(self, tmp_path: Path) -> None:
+        """An auto run grows past its start and reports the trajectory."""
+        from transcribe_cli.core.batch import process_batch
+        from transcribe_cli.core.transcriber import TranscriptionResult
+
+        files = []
+        for i in range(20):
+            f = tmp_path / f"audio{i}.mp3"
+            f.write_bytes(b"fake")
+            files.append(f)
+        in_flight = 0
+        peak = 0
+
+        async def transcribe(input_path: Path, stages: StageTicket, **kwargs: object) -> MagicMock:
+            nonlocal in_flight, peak
+            await stages.enter("upload")
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.005)
+            in_flight -= 1
+            return MagicMock(spec=TranscriptionResult)
+
+        with patch("transcribe_cli.core.batch.create_async_client", return_value=AsyncMock()):
+            with patch("transcribe_cli.core.batch.transcribe_file_async", side_effect=transcribe):
+                with patch("transcribe_cli.output.save_formatted_transcript"):
+                    summary = process_batch(
+                        files=files, concurrency="auto", max_concurrency=5, api_key="sk-test"
+                    )
+
+        assert summary.successful == 20
+        assert summary.concurrency_trajectory[0][1] == 2
+        assert summary.concurrency_trajectory[-1][1] > 2
+        assert peak <= 5
+        upload = next(stage for stage in summary.stages if stage.name == "upload")
+        assert upload.limit == 5
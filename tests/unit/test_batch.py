@@ -1,7 +1,8 @@
 """Unit tests for batch processing module."""
 
+import os
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -10,6 +11,7 @@ from transcribe_cli.core.batch import (
     BatchSummary,
     scan_directory,
 )
+from transcribe_cli.core.pipeline import StageTicket
 
 
 class TestBatchResult:
@@ -209,7 +211,7 @@ class TestProcessBatch:
         mock_result.language = "en"
         mock_result.duration = 1.0
 
-        with patch("transcribe_cli.core.batch.transcribe_file", return_value=mock_result):
+        with patch("transcribe_cli.core.batch.transcribe_file_async", AsyncMock(return_value=mock_result)):
             with patch("transcribe_cli.output.formatters.save_formatted_transcript") as mock_save:
                 mock_save.return_value = tmp_path / "output.txt"
                 summary = process_batch(
@@ -223,6 +225,30 @@ class TestProcessBatch:
         assert summary.successful == 2
         assert summary.failed == 0
 
+    def test_process_batch_shares_one_client(self, tmp_path: Path) -> None:
+        """A single pooled client is created and injected into every file."""
+        from transcribe_cli.core.batch import process_batch
+        from transcribe_cli.core.transcriber import TranscriptionResult
+
+        for i in range(3):
+            (tmp_path / f"audio{i}.mp3").write_bytes(b"fake")
+        files = sorted(tmp_path.glob("*.mp3"))
+
+        mock_result = MagicMock(spec=TranscriptionResult)
+        mock_client = AsyncMock()
+        mock_transcribe = AsyncMock(return_value=mock_result)
+
+        with patch("transcribe_cli.core.batch.create_async_client", return_value=mock_client) as mock_create:
+            with patch("transcribe_cli.core.batch.transcribe_file_async", mock_transcribe):
+                with patch("transcribe_cli.output.formatters.save_formatted_transcript"):
+                    process_batch(files=files, concurrency=2, api_key="sk-test")
+
+        mock_create.assert_called_once()
+        assert mock_create.call_args.kwargs["max_connections"] >= 2
+        clients = {id(c.kwargs["client"]) for c in mock_transcribe.call_args_list}
+        assert clients == {id(mock_client)}
+        mock_client.close.assert_awaited_once()
+
 
 class TestProcessDirectory:
     """Tests for directory processing."""
@@ -248,10 +274,392 @@ class TestProcessDirectory:
         mock_result.language = "en"
         mock_result.duration = 1.0
 
-        with patch("transcribe_cli.core.batch.transcribe_file", return_value=mock_result):
+        with patch("transcribe_cli.core.batch.transcribe_file_async", AsyncMock(return_value=mock_result)):
             with patch("transcribe_cli.output.formatters.save_formatted_transcript") as mock_save:
                 mock_save.return_value = tmp_path / "audio.txt"
                 summary = process_directory(tmp_path, api_key="sk-test")
 
         assert summary.total_files == 1
         assert summary.successful == 1
+
+
+class TestResume:
+    """Tests for journal-backed resume."""
+
+    def test_plan_resume_orders_files(self, tmp_path: Path) -> None:
+        """Completed files are skipped and failed files go last."""
+        from transcribe_cli.core.batch import plan_resume
+        from transcribe_cli.core.journal import BatchJournal
+
+        files = [tmp_path / f"{name}.mp3" for name in ("a", "b", "c", "d")]
+        for f in files:
+            f.write_bytes(b"fake")
+        (tmp_path / "a.txt").write_text("done")
+
+        journal = BatchJournal.for_directory(tmp_path)
+        journal.record(files[0], "completed", output_path=tmp_path / "a.txt")
+        journal.record(files[1], "failed", error="API error")
+        journal.record(files[2], "started")
+
+        pending, done = plan_resume(files, journal, None, "txt")
+
+        assert done == [files[0]]
+        assert pending == [files[2], files[3], files[1]]
+
+    def test_plan_resume_redoes_missing_or_other_format(self, tmp_path: Path) -> None:
+        """A completed entry only counts if its transcript is still there."""
+        from transcribe_cli.core.batch import plan_resume
+        from transcribe_cli.core.journal import BatchJournal
+
+        media = tmp_path / "a.mp3"
+        media.write_bytes(b"fake")
+        (tmp_path / "a.txt").write_text("done")
+
+        journal = BatchJournal.for_directory(tmp_path)
+        journal.record(media, "completed", output_path=tmp_path / "a.txt")
+
+        assert plan_resume([media], journal, None, "srt") == ([media], [])
+        (tmp_path / "a.txt").unlink()
+        assert plan_resume([media], journal, None, "txt") == ([media], [])
+
+    def test_process_batch_records_and_resumes(self, tmp_path: Path) -> None:
+        """A resumed run only transcribes what the first run did not finish."""
+        from transcribe_cli.core.batch import process_batch
+        from transcribe_cli.core.journal import BatchJournal
+        from transcribe_cli.core.transcriber import TranscriptionResult
+
+        files = [tmp_path / "a.mp3", tmp_path / "b.mp3"]
+        for f in files:
+            f.write_bytes(b"fake")
+        journal = BatchJournal.for_directory(tmp_path)
+
+        async def transcribe(input_path: Path, **kwargs: object) -> MagicMock:
+            if input_path.name == "b.mp3":
+                raise RuntimeError("API error")
+            return MagicMock(spec=TranscriptionResult)
+
+        def save(result: object, output_path: Path, output_format: str) -> Path:
+            output_path.write_text("transcript")
+            return output_path
+
+        with patch("transcribe_cli.core.batch.create_async_client", return_value=AsyncMock()):
+            with patch("transcribe_cli.core.batch.transcribe_file_async", side_effect=transcribe):
+                with patch("transcribe_cli.output.save_formatted_transcript", side_effect=save):
+                    first = process_batch(files=files, api_key="sk-test", journal=journal)
+
+        assert (first.successful, first.failed) == (1, 1)
+        assert journal.load()[files[1].resolve()].state == "failed"
+
+        mock_transcribe = AsyncMock(return_value=MagicMock(spec=TranscriptionResult))
+        with patch("transcribe_cli.core.batch.create_async_client", return_value=AsyncMock()):
+            with patch("transcribe_cli.core.batch.transcribe_file_async", mock_transcribe):
+                with patch("transcribe_cli.output.save_formatted_transcript", side_effect=save):
+                    second = process_batch(
+                        files=files, api_key="sk-test", journal=journal, resume=True
+                    )
+
+        assert [c.kwargs["input_path"] for c in mock_transcribe.call_args_list] == [files[1]]
+        assert second.skipped == 1
+        assert second.successful == 1
+        assert second.total_files == 2
+        assert second.success_rate == 100.0
+
+
+def _age(path: Path, seconds: int) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 1_000_000_000))
+
+
+class TestIncremental:
+    """Tests for make-style incremental runs."""
+
+    def test_plan_incremental_by_mtime(self, tmp_path: Path) -> None:
+        """Files with a newer transcript are up to date; others are redone."""
+        from transcribe_cli.core.batch import plan_incremental
+
+        fresh, stale, new = (tmp_path / f"{n}.mp3" for n in ("fresh", "stale", "new"))
+        for f in (fresh, stale, new):
+            f.write_bytes(b"fake")
+            _age(f, 100)
+        (tmp_path / "fresh.txt").write_text("done")
+        (tmp_path / "stale.txt").write_text("done")
+        _age(tmp_path / "stale.txt", 200)
+
+        pending, current = plan_incremental([fresh, stale, new], None, "txt")
+
+        assert current == [fresh]
+        assert pending == [stale, new]
+
+    def test_plan_incremental_uses_output_dir(self, tmp_path: Path) -> None:
+        """Transcripts are looked up in the output directory."""
+        from transcribe_cli.core.batch import plan_incremental
+
+        media = tmp_path / "talk.mp3"
+        media.write_bytes(b"fake")
+        _age(media, 100)
+        out_dir = tmp_path / "out"
+        out_dir.mkdir()
+        (out_dir / "talk.srt").write_text("1")
+
+        assert plan_incremental([media], out_dir, "srt") == ([], [media])
+        assert plan_incremental([media], out_dir, "txt") == ([media], [])
+
+    def test_check_hash_skips_touched_source(self, tmp_path: Path) -> None:
+        """A touched but unchanged source is up to date with check_hash."""
+        from transcribe_cli.core.batch import plan_incremental
+        from transcribe_cli.core.cache import hash_file
+        from transcribe_cli.core.journal import BatchJournal
+
+        media = tmp_path / "talk.mp3"
+        media.write_bytes(b"fake")
+        transcript = tmp_path / "talk.txt"
+        transcript.write_text("done")
+        _age(transcript, 100)
+
+        journal = BatchJournal.for_directory(tmp_path)
+        journal.record(media, "completed", output_path=transcript, source_hash=hash_file(media))
+
+        assert plan_incremental([media], None, "txt", journal) == ([media], [])
+        assert plan_incremental([media], None, "txt", journal, check_hash=True) == ([], [media])
+        # The transcript was touched, so the next run needs no hash
+        assert transcript.stat().st_mtime_ns >= media.stat().st_mtime_ns
+
+        media.write_bytes(b"edited")
+        _age(transcript, 100)
+        assert plan_incremental([media], None, "txt", journal, check_hash=True) == ([media], [])
+
+    def test_process_batch_incremental_counts_skips(self, tmp_path: Path) -> None:
+        """Up-to-date files are not transcribed and count as skipped."""
+        from transcribe_cli.core.batch import process_batch
+        from transcribe_cli.core.transcriber import TranscriptionResult
+
+        done, todo = tmp_path / "done.mp3", tmp_path / "todo.mp3"
+        for f in (done, todo):
+            f.write_bytes(b"fake")
+            _age(f, 100)
+        (tmp_path / "done.txt").write_text("done")
+
+        mock_transcribe = AsyncMock(return_value=MagicMock(spec=TranscriptionResult))
+        with patch("transcribe_cli.core.batch.create_async_client", return_value=AsyncMock()):
+            with patch("transcribe_cli.core.batch.transcribe_file_async", mock_transcribe):
+                with patch("transcribe_cli.output.save_formatted_transcript"):
+                    summary = process_batch(
+                        files=[done, todo], api_key="sk-test", incremental=True
+                    )
+
+        assert [c.kwargs["input_path"] for c in mock_transcribe.call_args_list] == [todo]
+        assert summary.skipped == 1
+        assert summary.successful == 1
+
+
+class TestWorkerPool:
+    """Tests for the bounded worker pool."""
+
+    def test_concurrency_bounds_in_flight_files(self, tmp_path: Path) -> None:
+        """No more than `concurrency` files are transcribed at once."""
+        import asyncio
+
+        from transcribe_cli.core.batch import process_batch
+        from transcribe_cli.core.transcriber import TranscriptionResult
+
+        files = []
+        for i in range(10):
+            f = tmp_path / f"audio{i}.mp3"
+            f.write_bytes(b"fake")
+            files.append(f)
+
+        in_flight = 0
+        peak = 0
+
+        async def transcribe(input_path: Path, stages: StageTicket, **kwargs: object) -> MagicMock:
+            nonlocal in_flight, peak
+            await stages.enter("upload")
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return MagicMock(spec=TranscriptionResult)
+
+        with patch("transcribe_cli.core.batch.create_async_client", return_value=AsyncMock()):
+            with patch("transcribe_cli.core.batch.transcribe_file_async", side_effect=transcribe):
+                with patch("transcribe_cli.output.save_formatted_transcript"):
+                    summary = process_batch(files=files, concurrency=3, api_key="sk-test")
+
+        assert summary.successful == 10
+        assert peak == 3
+
+    def test_scan_is_consumed_with_bounded_lookahead(self, tmp_path: Path) -> None:
+        """The producer stays a bounded distance ahead of the workers."""
+        from transcribe_cli.core.batch import QUEUE_DEPTH_PER_WORKER, process_batch
+        from transcribe_cli.core.transcriber import TranscriptionResult
+
+        media = tmp_path / "audio.mp3"
+        media.write_bytes(b"fake")
+        produced = 0
+        max_lead = 0
+        transcribed = 0
+
+        def scan():
+            nonlocal produced, max_lead
+            for _ in range(50):
+                produced += 1
+                max_lead = max(max_lead, produced - transcribed)
+                yield media
+
+        async def transcribe(input_path: Path, **kwargs: object) -> MagicMock:
+            nonlocal transcribed
+            transcribed += 1
+            return MagicMock(spec=TranscriptionResult)
+
+        with patch("transcribe_cli.core.batch.create_async_client", return_value=AsyncMock()):
+            with patch("transcribe_cli.core.batch.transcribe_file_async", side_effect=transcribe):
+                with patch("transcribe_cli.output.save_formatted_transcript"):
+                    summary = process_batch(files=scan(), concurrency=2, api_key="sk-test")
+
+        assert summary.successful == 50
+        # Queue depth plus one file per worker plus the item being queued
+        assert max_lead <= 2 * QUEUE_DEPTH_PER_WORKER + 2 + 1
+
+    def test_results_emitted_as_completed(self, tmp_path: Path) -> None:
+        """result_callback sees every file; keep_results=False keeps failures only."""
+        from transcribe_cli.core.batch import BatchResult, process_batch
+        from transcribe_cli.core.transcriber import TranscriptionResult
+
+        good, bad = tmp_path / "good.mp3", tmp_path / "bad.mp3"
+        for f in (good, bad):
+            f.write_bytes(b"fake")
+
+        async def transcribe(input_path: Path, **kwargs: object) -> MagicMock:
+            if input_path == bad:
+                raise RuntimeError("API error")
+            return MagicMock(spec=TranscriptionResult)
+
+        emitted: list[BatchResult] = []
+        with patch("transcribe_cli.core.batch.create_async_client", return_value=AsyncMock()):
+            with patch("transcribe_cli.core.batch.transcribe_file_async", side_effect=transcribe):
+                with patch("transcribe_cli.output.save_formatted_transcript"):
+                    summary = process_batch(
+                        files=[good, bad],
+                        api_key="sk-test",
+                        result_callback=emitted.append,
+                        keep_results=False,
+                    )
+
+        assert {r.input_path for r in emitted} == {good, bad}
+        assert [r.input_path for r in summary.results] == [bad]
+        assert (summary.successful, summary.failed) == (1, 1)
+
+
+class TestDedup:
+    """Tests for the duplicate pre-pass."""
+
+    @staticmethod
+    def _media(tmp_path: Path) -> list[Path]:
+        files = []
+        for folder, content in (("a", b"same"), ("b", b"same"), ("c", b"diff")):
+            (tmp_path / folder).mkdir()
+            path = tmp_path / folder / "talk.mp3"
+            path.write_bytes(content)
+            files.append(path)
+        return files
+
+    def test_copies_reuse_the_transcript(self, tmp_path: Path) -> None:
+        """Identical files are transcribed once; every copy gets a transcript."""
+        from transcribe_cli.core.batch import process_batch
+        from transcribe_cli.core.journal import BatchJournal
+        from transcribe_cli.core.transcriber import TranscriptionResult, _count_request
+
+        files = self._media(tmp_path)
+        journal = BatchJournal.for_directory(tmp_path)
+
+        async def transcribe(input_path: Path, **kwargs: object) -> TranscriptionResult:
+            # One upload, counted like a real request
+            _count_request()
+            return TranscriptionResult(input_path, None, "hello", [], "en", 1.0)
+
+        mock_transcribe = AsyncMock(side_effect=transcribe)
+        with patch("transcribe_cli.core.batch.create_async_client", return_value=AsyncMock()):
+            with patch("transcribe_cli.core.batch.transcribe_file_async", mock_transcribe):
+                summary = process_batch(
+                    files=files, api_key="sk-test", journal=journal, dedup=True
+                )
+
+        transcribed = [c.kwargs["input_path"] for c in mock_transcribe.call_args_list]
+        assert sorted(transcribed) == [files[0], files[2]]
+        assert (summary.successful, summary.failed) == (3, 0)
+        assert (summary.duplicates, summary.duplicate_bytes_saved) == (1, 4)
+        assert summary.api_calls_saved == 1
+        assert (tmp_path / "b" / "talk.txt").read_text().strip() == "hello"
+        copy = next(r for r in summary.results if r.duplicate_of is not None)
+        assert copy.input_path == files[1]
+        assert copy.duplicate_of == files[0]
+        assert journal.load()[files[1].resolve()].state == "completed"
+
+    def test_copies_fail_with_the_original(self, tmp_path: Path) -> None:
+        """If the original fails, its copies fail too and are not uploaded."""
+        from transcribe_cli.core.batch import process_batch
+
+        files = self._media(tmp_path)[:2]
+        mock_transcribe = AsyncMock(side_effect=RuntimeError("API error"))
+
+        with patch("transcribe_cli.core.batch.create_async_client", return_value=AsyncMock()):
+            with patch("transcribe_cli.core.batch.transcribe_file_async", mock_transcribe):
+                summary = process_batch(files=files, api_key="sk-test", dedup=True)
+
+        assert mock_transcribe.call_count == 1
+        assert summary.failed == 2
+        assert summary.api_calls_saved == 0
+        copy = next(r for r in summary.results if r.input_path == files[1])
+        assert copy.error == "Duplicate of talk.mp3: API error"
+
+
+class TestKeepWarm:
+    """Tests for long-running batch inputs."""
+
+    def test_client_created_and_warmed_before_files(self) -> None:
+        """With keep_warm_seconds the client is ready before any file arrives."""
+        from transcribe_cli.core.batch import process_batch
+
+        client = AsyncMock()
+        with patch("transcribe_cli.core.batch.create_async_client", return_value=client):
+            with patch("transcribe_cli.core.batch.warm_async_client") as mock_warm:
+                summary = process_batch(files=iter([]), api_key="sk-test", keep_warm_seconds=30)
+
+        assert summary.total_files == 0
+        assert summary.rate_limit is not None
+        mock_warm.assert_called_once_with(client)
+        client.close.assert_awaited_once()
+
+    def test_watcher_feeds_the_worker_pool(self, tmp_path: Path) -> None:
+        """Files yielded by a MediaWatcher are transcribed until it stops."""
+        from transcribe_cli.core.batch import process_batch
+        from transcribe_cli.core.watcher import POLLING, MediaWatcher
+
+        (tmp_path / "a.mp3").write_bytes(b"audio")
+        watcher = MediaWatcher(tmp_path, settle_seconds=0, poll_seconds=0.05, backend=POLLING)
+
+        def done(result: BatchResult) -> None:
+            watcher.stop()
+
+        def save(result: object, output_path: Path, output_format: str) -> Path:
+            output_path.write_text("transcript")
+            return output_path
+
+        with patch("transcribe_cli.core.batch.create_async_client", return_value=AsyncMock()):
+            with patch("transcribe_cli.core.batch.warm_async_client"):
+                with patch(
+                    "transcribe_cli.core.batch.transcribe_file_async",
+                    AsyncMock(return_value=MagicMock()),
+                ):
+                    with patch(
+                        "transcribe_cli.output.save_formatted_transcript", side_effect=save
+                    ):
+                        summary = process_batch(
+                            files=watcher,
+                            api_key="sk-test",
+                            result_callback=done,
+                            keep_warm_seconds=30,
+                        )
+
+        assert summary.successful == 1
+        assert (tmp_path / "a.txt").read_text() == "transcript"
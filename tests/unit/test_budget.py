@@ -0,0 +1,169 @@
+"""Unit tests for the in-flight byte budget."""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from transcribe_cli.core.budget import ByteBudget
+from transcribe_cli.core.pipeline import StageTicket
+from transcribe_cli.core.transcriber import (
+    DEFAULT_CHUNK_CONCURRENCY,
+    MAX_FILE_SIZE_BYTES,
+    estimate_in_flight_bytes,
+)
+
+
+class TestByteBudget:
+    """Tests for ByteBudget."""
+
+    def test_small_reservations_share_the_budget(self) -> None:
+        """Reservations that fit together are granted at once."""
+
+        async def run() -> int:
+            budget = ByteBudget(100)
+            for _ in range(4):
+                await budget.acquire(25)
+            return budget.in_use
+
+        assert asyncio.run(run()) == 100
+
+    def test_waits_for_room(self) -> None:
+        """A reservation that does not fit waits for a release."""
+
+        async def run() -> list[str]:
+            budget = ByteBudget(100)
+            order: list[str] = []
+
+            async def job(name: str, size: int, hold: float) -> None:
+                async with budget.reserve(size):
+                    order.append(f"{name}+")
+                    await asyncio.sleep(hold)
+                    order.append(f"{name}-")
+
+            await asyncio.gather(job("a", 80, 0.02), job("b", 40, 0.0))
+            return order
+
+        assert asyncio.run(run()) == ["a+", "a-", "b+", "b-"]
+
+    def test_oversized_reservation_runs_alone(self) -> None:
+        """A file larger than the budget is capped and runs by itself."""
+
+        async def run() -> tuple[int, int]:
+            budget = ByteBudget(100)
+            granted = await budget.acquire(500)
+            return granted, budget.in_use
+
+        assert asyncio.run(run()) == (100, 100)
+
+    def test_fifo_prevents_starvation(self) -> None:
+        """Small reservations queue behind a waiting large one."""
+
+        async def run() -> list[str]:
+            budget = ByteBudget(100)
+            order: list[str] = []
+            first = await budget.acquire(60)
+
+            async def job(name: str, size: int) -> None:
+                async with budget.reserve(size):
+                    order.append(name)
+
+            tasks = [asyncio.ensure_future(job("large", 90))]
+            await asyncio.sleep(0)
+            tasks.append(asyncio.ensure_future(job("small", 10)))
+            await asyncio.sleep(0)
+            assert order == []
+            budget.release(first)
+            await asyncio.gather(*tasks)
+            return order
+
+        assert asyncio.run(run()) == ["large", "small"]
+
+    def test_cancelled_waiter_does_not_leak(self) -> None:
+        """Cancelling a waiting reservation leaves the budget intact."""
+
+        async def run() -> int:
+            budget = ByteBudget(100)
+            held = await budget.acquire(100)
+            task = asyncio.ensure_future(budget.acquire(50))
+            await asyncio.sleep(0)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            budget.release(held)
+            return budget.in_use
+
+        assert asyncio.run(run()) == 0
+
+    def test_invalid_limit(self) -> None:
+        """A non-positive budget is rejected."""
+        with pytest.raises(ValueError):
+            ByteBudget(0)
+
+
+class TestEstimateInFlightBytes:
+    """Tests for estimate_in_flight_bytes."""
+
+    def test_small_audio_is_its_own_upload(self) -> None:
+        """Audio within the API limit costs its size."""
+        assert estimate_in_flight_bytes(Path("a.mp3"), 200_000) == 200_000
+
+    def test_video_counts_buffer_and_upload(self) -> None:
+        """Video costs the extraction buffer plus the upload body."""
+        assert estimate_in_flight_bytes(Path("v.mp4"), 1_000_000) == 2_000_000
+
+    def test_large_files_are_capped(self) -> None:
+        """Chunked uploads cap the estimate at the chunk upload concurrency."""
+        estimate = estimate_in_flight_bytes(Path("v.mkv"), 10 * 1024**3)
+
+        assert estimate == MAX_FILE_SIZE_BYTES * DEFAULT_CHUNK_CONCURRENCY
+
+
+class TestBudgetedBatch:
+    """Tests for process_batch with a byte budget."""
+
+    def test_large_files_throttle_small_files_flow(self, tmp_path: Path) -> None:
+        """Large files run one at a time while small files run together."""
+        from transcribe_cli.core.batch import process_batch
+        from transcribe_cli.core.transcriber import TranscriptionResult
+
+        files = []
+        for name, size in (("big1.mp3", 600), ("big2.mp3", 600)):
+            f = tmp_path / name
+            f.write_bytes(b"x" * size)
+            files.append(f)
+        for i in range(6):
+            f = tmp_path / f"small{i}.mp3"
+            f.write_bytes(b"x" * 100)
+            files.append(f)
+
+        in_flight: list[str] = []
+        peak_big = 0
+        peak_small = 0
+
+        async def transcribe(input_path: Path, stages: StageTicket, **kwargs: object) -> MagicMock:
+            nonlocal peak_big, peak_small
+            await stages.enter("extract")
+            await stages.enter("upload")
+            in_flight.append(input_path.name)
+            peak_big = max(peak_big, sum(n.startswith("big") for n in in_flight))
+            peak_small = max(peak_small, sum(n.startswith("small") for n in in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(input_path.name)
+            return MagicMock(spec=TranscriptionResult)
+
+        with patch("transcribe_cli.core.batch.create_async_client", return_value=AsyncMock()):
+            with patch("transcribe_cli.core.batch.transcribe_file_async", side_effect=transcribe):
+                with patch("transcribe_cli.output.save_formatted_transcript"):
+                    summary = process_batch(
+                        files=files,
+                        concurrency=8,
+                        api_key="sk-test",
+                        max_in_flight_bytes=1000,
+                    )
+
+        assert summary.successful == 8
+        assert peak_big == 1
+        assert peak_small >= 4
+        assert summary.peak_in_flight_bytes <= 1000
@@ -0,0 +1,127 @@
+"""Unit tests for transcript cache module."""
+
+import os
+import time
+from pathlib import Path
+
+from transcribe_cli.core.cache import (
+    TranscriptCache,
+    hash_file,
+    make_cache_key,
+    stat_signature,
+)
+
+
+class TestCacheKey:
+    """Tests for cache key derivation."""
+
+    def test_hash_file_matches_content(self, tmp_path: Path) -> None:
+        """Identical content hashes identically regardless of name."""
+        a = tmp_path / "a.mp3"
+        b = tmp_path / "b.mp3"
+        a.write_bytes(b"same audio")
+        b.write_bytes(b"same audio")
+        assert hash_file(a) == hash_file(b)
+
+    def test_key_depends_on_language_and_params(self) -> None:
+        """Language, model and preprocessing parameters change the key."""
+        base = make_cache_key("abc", "auto", "whisper-1", {"bitrate": "192k"})
+        assert base == make_cache_key("abc", "auto", "whisper-1", {"bitrate": "192k"})
+        assert base != make_cache_key("abc", "en", "whisper-1", {"bitrate": "192k"})
+        assert base != make_cache_key("abc", "auto", "other", {"bitrate": "192k"})
+        assert base != make_cache_key("abc", "auto", "whisper-1", {"bitrate": "64k"})
+
+    def test_stat_signature_tracks_size_and_mtime(self, tmp_path: Path) -> None:
+        """The signature changes when a file is rewritten or touched."""
+        path = tmp_path / "a.mp3"
+        path.write_bytes(b"audio")
+        before = stat_signature(path)
+
+        os.utime(path, ns=(0, 0))
+
+        assert stat_signature(path) != before
+
+
+class TestTranscriptCache:
+    """Tests for the on-disk cache."""
+
+    def test_miss_returns_none(self, tmp_path: Path) -> None:
+        """Unknown key is a miss."""
+        cache = TranscriptCache(tmp_path)
+        assert cache.get("0" * 64) is None
+
+    def test_put_then_get(self, tmp_path: Path) -> None:
+        """Stored response is returned on a hit."""
+        cache = TranscriptCache(tmp_path)
+        response = {"text": "Hello", "segments": [], "language": "en"}
+        cache.put("ab" * 32, response)
+        assert cache.get("ab" * 32) == response
+
+    def test_link_follows_alias(self, tmp_path: Path) -> None:
+        """An alias returns its target's entry, and misses once it is gone."""
+        cache = TranscriptCache(tmp_path)
+        cache.put("ab" * 32, {"text": "Hello"})
+        cache.link("ef" * 32, "ab" * 32)
+
+        assert cache.get("ef" * 32) == {"text": "Hello"}
+        cache.clear()
+        cache.link("ef" * 32, "ab" * 32)
+        assert cache.get("ef" * 32) is None
+
+    def test_corrupt_entry_is_dropped(self, tmp_path: Path) -> None:
+        """Unreadable entries are treated as misses and removed."""
+        cache = TranscriptCache(tmp_path)
+        key = "cd" * 32
+        cache.put(key, {"text": "x"})
+        entry = tmp_path / key[:2] / f"{key}.json"
+        entry.write_text("{not json")
+        assert cache.get(key) is None
+        assert not entry.exists()
+
+    def test_prune_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        """Oldest-accessed entries are evicted first."""
+        cache = TranscriptCache(tmp_path, max_bytes=10**9)
+        keys = [f"{i:02d}" * 32 for i in range(3)]
+        for i, key in enumerate(keys):
+            cache.put(key, {"text": "x" * 100})
+            entry = tmp_path / key[:2] / f"{key}.json"
+            past = time.time() - 1000 + i
+            os.utime(entry, (past, past))
+
+        # Touch the oldest entry so it becomes most recently used
+        cache.get(keys[0])
+
+        entry_size = (tmp_path / keys[0][:2] / f"{keys[0]}.json").stat().st_size
+        removed = cache.prune(max_bytes=entry_size * 2)
+
+        assert removed == 1
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) is not None
+        assert cache.get(keys[2]) is not None
+
+    def test_put_enforces_size_limit(self, tmp_path: Path) -> None:
+        """Writing past max_bytes triggers eviction."""
+        cache = TranscriptCache(tmp_path, max_bytes=300)
+        for i in range(5):
+            cache.put(f"{i:02d}" * 32, {"text": "x" * 100})
+        assert cache.stats().total_bytes <= 300
+
+    def test_stats_and_clear(self, tmp_path: Path) -> None:
+        """Stats count entries and clear removes them all."""
+        cache = TranscriptCache(tmp_path)
+        cache.put("ab" * 32, {"text": "a"})
+        cache.put("cd" * 32, {"text": "b"})
+
+        stats = cache.stats()
+        assert stats.entries == 2
+        assert stats.total_bytes > 0
+
+        assert cache.clear() == 2
+        assert cache.stats().entries == 0
+
+    def test_default_uses_cache_dir_env(self, tmp_path: Path, monkeypatch) -> None:
+        """Default cache honors TRANSCRIBE_CACHE_DIR."""
+        monkeypatch.setenv("TRANSCRIBE_CACHE_DIR", str(tmp_path))
+        cache = TranscriptCache.default(max_mb=1)
+        assert cache.directory == tmp_path / "transcripts"
+        assert cache.max_bytes == 1024 * 1024
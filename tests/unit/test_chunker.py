@@ -0,0 +1,127 @@
+"""Unit tests for chunking module."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from transcribe_cli.core.chunker import (
+    AudioChunk,
+    merge_chunk_responses,
+    plan_chunks,
+    split_audio,
+)
+from transcribe_cli.core.extractor import ExtractionError
+from transcribe_cli.core.watchdog import JobOutcome
+
+
+class TestPlanChunks:
+    """Tests for chunk window planning."""
+
+    def test_exact_multiple(self) -> None:
+        """Duration divisible by chunk size gives equal windows."""
+        assert plan_chunks(1200.0, 600.0) == [(0.0, 600.0), (600.0, 600.0)]
+
+    def test_partial_last_window(self) -> None:
+        """Last window covers the remainder."""
+        windows = plan_chunks(1500.0, 600.0)
+        assert windows == [(0.0, 600.0), (600.0, 600.0), (1200.0, 300.0)]
+
+    def test_short_recording_single_window(self) -> None:
+        """Recording shorter than a chunk gives one window."""
+        assert plan_chunks(90.0, 600.0) == [(0.0, 90.0)]
+
+    def test_tiny_tail_merged(self) -> None:
+        """A sub-second tail is folded into the previous window."""
+        windows = plan_chunks(600.5, 600.0)
+        assert windows == [(0.0, 600.5)]
+
+    def test_windows_are_contiguous(self) -> None:
+        """Windows have no gaps or overlaps."""
+        windows = plan_chunks(3723.0, 600.0)
+        for (start, length), (next_start, _) in zip(windows, windows[1:]):
+            assert start + length == next_start
+        assert sum(length for _, length in windows) == pytest.approx(3723.0)
+
+    def test_invalid_arguments_raise(self) -> None:
+        """Non-positive arguments raise ValueError."""
+        with pytest.raises(ValueError):
+            plan_chunks(0.0, 600.0)
+        with pytest.raises(ValueError):
+            plan_chunks(100.0, 0.0)
+
+
+class TestMergeChunkResponses:
+    """Tests for merging per-chunk responses."""
+
+    def test_segments_shifted_and_renumbered(self) -> None:
+        """Segment timestamps are offset by chunk start."""
+        chunks = [
+            AudioChunk(index=0, path=Path("c0.mp3"), start=0.0, duration=600.0),
+            AudioChunk(index=1, path=Path("c1.mp3"), start=600.0, duration=300.0),
+        ]
+        responses = [
+            {
+                "text": " Hello there.",
+                "language": "english",
+                "segments": [
+                    {"id": 0, "start": 1.0, "end": 2.5, "text": " Hello there."}
+                ],
+            },
+            {
+                "text": " Goodbye.",
+                "language": "english",
+                "segments": [{"id": 0, "start": 3.0, "end": 4.0, "text": " Goodbye."}],
+            },
+        ]
+
+        merged = merge_chunk_responses(responses, chunks)
+
+        assert merged["text"] == "Hello there. Goodbye."
+        assert merged["language"] == "english"
+        assert merged["duration"] == 900.0
+        assert [s["id"] for s in merged["segments"]] == [0, 1]
+        assert merged["segments"][1]["start"] == 603.0
+        assert merged["segments"][1]["end"] == 604.0
+
+    def test_missing_language_defaults_unknown(self) -> None:
+        """Language falls back to unknown when no chunk reports one."""
+        chunks = [AudioChunk(index=0, path=Path("c0.mp3"), start=0.0, duration=10.0)]
+        merged = merge_chunk_responses([{"text": "Hi"}], chunks)
+        assert merged["language"] == "unknown"
+        assert merged["segments"] == []
+
+
+class TestSplitAudio:
+    """Tests for splitting audio with mocked FFmpeg."""
+
+    def test_split_writes_one_file_per_window(self, tmp_path: Path) -> None:
+        """Each planned window is encoded to its own chunk file."""
+        source = tmp_path / "long.mp3"
+        source.write_bytes(b"fake")
+
+        def fake_run(stream, **kwargs):  # type: ignore[no-untyped-def]
+            output = [a for a in stream.get_args() if a.endswith(".mp3")][-1]
+            Path(output).write_bytes(b"chunk")
+            return JobOutcome()
+
+        with patch("transcribe_cli.core.chunker.validate_ffmpeg"):
+            with patch("transcribe_cli.core.chunker.run_watched", side_effect=fake_run):
+                chunks = split_audio(
+                    source, tmp_path / "chunks", 600.0, duration=1500.0
+                )
+
+        assert [c.start for c in chunks] == [0.0, 600.0, 1200.0]
+        assert chunks[-1].duration == 300.0
+        assert all(c.path.exists() for c in chunks)
+
+    def test_unknown_duration_raises(self, tmp_path: Path) -> None:
+        """Splitting without a known duration raises ExtractionError."""
+        source = tmp_path / "long.mp3"
+        source.write_bytes(b"fake")
+
+        with patch("transcribe_cli.core.chunker.validate_ffmpeg"):
+            with patch("transcribe_cli.core.chunker.get_media_info") as mock_info:
+                mock_info.return_value.duration = None
+                with pytest.raises(ExtractionError, match="duration"):
+                    split_audio(source, tmp_path / "chunks", 600.0)
@@ -11,7 +11,9 @@ from transcribe_cli.config.settings import (
     Settings,
     create_default_config,
     find_config_file,
+    flatten_config,
     get_config_locations,
+    get_settings,
     load_config_file,
 )
 
@@ -40,6 +42,17 @@ class TestSettings:
             assert settings.language == "auto"
             assert settings.verbose is False
             assert settings.quiet is False
+            assert settings.encoding_profile == "speech-mp3"
+
+    def test_settings_encoding_profile_validation(self) -> None:
+        """Unknown encoding profiles are rejected."""
+        with patch.dict(
+            os.environ,
+            {"OPENAI_API_KEY": "sk-test", "TRANSCRIBE_ENCODING_PROFILE": "flac"},
+            clear=True,
+        ):
+            with pytest.raises(ValidationError):
+                Settings(_env_file=None)
 
     def test_settings_concurrency_validation_min(self) -> None:
         """Concurrency should not be less than 1."""
@@ -63,6 +76,15 @@ class TestSettings:
                 Settings(_env_file=None)
             assert "cannot exceed 20" in str(exc_info.value)
 
+    def test_settings_concurrency_auto(self) -> None:
+        """Concurrency accepts "auto"."""
+        with patch.dict(
+            os.environ,
+            {"OPENAI_API_KEY": "sk-test", "TRANSCRIBE_CONCURRENCY": "auto"},
+            clear=True,
+        ):
+            assert Settings(_env_file=None).concurrency == "auto"
+
     def test_settings_output_dir_resolved(self) -> None:
         """Output directory should be resolved to absolute path."""
         with patch.dict(os.environ, {"OPENAI_API_KEY": "sk-test"}, clear=True):
@@ -155,6 +177,43 @@ language = "es"
             assert result == {}
 
 
+class TestGetSettings:
+    """Tests for settings built from a config file."""
+
+    def test_flatten_config_maps_tables(self) -> None:
+        """[output] keys gain a prefix; other tables map directly."""
+        config = {
+            "output": {"format": "srt", "dir": "out"},
+            "processing": {"chunk_size_minutes": 5},
+            "logging": {"verbose": True},
+        }
+
+        assert flatten_config(config) == {
+            "output_format": "srt",
+            "output_dir": "out",
+            "chunk_size_minutes": 5,
+            "verbose": True,
+        }
+
+    def test_config_file_values_reach_settings(self, tmp_path: Path) -> None:
+        """Values in the config file's tables are applied."""
+        config = tmp_path / "config.toml"
+        config.write_text("[processing]\nchunk_size_minutes = 5\n")
+
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "sk-test"}, clear=True):
+            assert get_settings(config).chunk_size_minutes == 5
+
+    def test_api_key_optional_for_defaults(self, tmp_path: Path) -> None:
+        """Without require_api_key, a missing key does not hide the config."""
+        config = tmp_path / "config.toml"
+        config.write_text("[processing]\nchunk_size_minutes = 5\n")
+
+        with patch.dict(os.environ, {}, clear=True):
+            with pytest.raises(ValidationError):
+                get_settings(config)
+            assert get_settings(config, require_api_key=False).chunk_size_minutes == 5
+
+
 class TestCreateDefaultConfig:
     """Tests for config file creation."""
 
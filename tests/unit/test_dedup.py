@@ -0,0 +1,77 @@
+"""Unit tests for batch duplicate detection."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from transcribe_cli.core.dedup import PARTIAL_HASH_BYTES, find_duplicates, partial_hash
+from transcribe_cli.core.scanner import ScannedFile
+
+
+def _entry(path: Path, content: bytes) -> ScannedFile:
+    path.write_bytes(content)
+    return ScannedFile(path, len(content), 0)
+
+
+class TestFindDuplicates:
+    """Tests for grouping byte-identical files."""
+
+    def test_groups_identical_files(self, tmp_path: Path) -> None:
+        """The first copy is kept; the others are attached to it."""
+        first = _entry(tmp_path / "a.mp3", b"audio")
+        other = _entry(tmp_path / "b.mp3", b"other")
+        copy = _entry(tmp_path / "c.mp3", b"audio")
+
+        plan = find_duplicates([first, other, copy])
+
+        assert plan.unique == [first, other]
+        assert plan.copies == {first.path: [copy]}
+        assert plan.duplicate_count == 1
+        assert plan.duplicate_bytes == 5
+
+    def test_unique_sizes_are_never_read(self, tmp_path: Path) -> None:
+        """Files with a size of their own skip hashing entirely."""
+        entries = [_entry(tmp_path / f"{n}.mp3", b"x" * n) for n in (1, 2, 3)]
+
+        with patch("transcribe_cli.core.dedup.partial_hash") as mock_hash:
+            plan = find_duplicates(entries)
+
+        mock_hash.assert_not_called()
+        assert plan.unique == entries
+        assert plan.copies == {}
+
+    def test_full_hash_separates_matching_ends(self, tmp_path: Path) -> None:
+        """Large files that differ only in the middle are not duplicates."""
+        head = b"h" * PARTIAL_HASH_BYTES
+        tail = b"t" * PARTIAL_HASH_BYTES
+        first = _entry(tmp_path / "a.mkv", head + b"1" * 10 + tail)
+        second = _entry(tmp_path / "b.mkv", head + b"2" * 10 + tail)
+        copy = _entry(tmp_path / "c.mkv", head + b"1" * 10 + tail)
+
+        assert partial_hash(first.path, first.size) == partial_hash(
+            second.path, second.size
+        )
+        plan = find_duplicates([first, second, copy])
+
+        assert plan.copies == {first.path: [copy]}
+        assert plan.unique == [first, second]
+
+    def test_empty_and_repeated_entries_are_kept(self, tmp_path: Path) -> None:
+        """Empty files and the same path listed twice are left alone."""
+        empty_a = _entry(tmp_path / "a.mp3", b"")
+        empty_b = _entry(tmp_path / "b.mp3", b"")
+        audio = _entry(tmp_path / "c.mp3", b"audio")
+
+        plan = find_duplicates([empty_a, empty_b, audio, audio])
+
+        assert plan.copies == {}
+        assert plan.unique == [empty_a, empty_b, audio, audio]
+
+    def test_unreadable_files_are_processed_alone(self, tmp_path: Path) -> None:
+        """A file that cannot be hashed is never treated as a copy."""
+        first = _entry(tmp_path / "a.mp3", b"audio")
+        missing = ScannedFile(tmp_path / "gone.mp3", 5, 0)
+
+        plan = find_duplicates([first, missing])
+
+        assert plan.unique == [first, missing]
+        assert plan.copies == {}
@@ -0,0 +1,131 @@
+"""Unit tests for the JSONL event stream."""
+
+import io
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from transcribe_cli.core.events import (
+    BATCH_EVENT,
+    FILE_EVENT,
+    STAGE_EVENT,
+    EventStream,
+)
+
+
+def _records(text: str) -> list[dict]:
+    return [json.loads(line) for line in text.splitlines()]
+
+
+class TestEventStream:
+    """Tests for writing records."""
+
+    def test_emit_writes_one_line_per_record(self) -> None:
+        """Each record is a JSON line with its type, a timestamp and Paths as text."""
+        buffer = io.StringIO()
+        stream = EventStream(buffer)
+
+        stream.emit("custom", input=Path("/media/a.mp3"), count=2)
+        stream.emit("custom", count=3)
+
+        records = _records(buffer.getvalue())
+        assert [r["count"] for r in records] == [2, 3]
+        assert records[0]["event"] == "custom"
+        assert records[0]["input"] == "/media/a.mp3"
+        assert isinstance(records[0]["time"], float)
+
+    def test_open_appends_to_file(self, tmp_path: Path) -> None:
+        """Files are created with their parents and appended to across runs."""
+        target = tmp_path / "logs" / "events.jsonl"
+
+        for run in range(2):
+            with EventStream.open(target) as stream:
+                stream.emit("custom", run=run)
+
+        assert [r["run"] for r in _records(target.read_text())] == [0, 1]
+
+    def test_dash_is_stdout(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """'-' writes to standard output and leaves it open."""
+        stream = EventStream.open("-")
+        stream.emit("custom")
+        stream.close()
+
+        assert _records(capsys.readouterr().out)[0]["event"] == "custom"
+
+
+class TestBatchEvents:
+    """Tests for the records written by batch runs."""
+
+    def test_stage_file_and_batch_records(self, tmp_path: Path) -> None:
+        """A transcribed file produces stage records, a file record and a total."""
+        from transcribe_cli.core.batch import process_batch
+        from transcribe_cli.core.transcriber import TranscriptionResult, _count_request
+
+        media = tmp_path / "talk.mp3"
+        media.write_bytes(b"audio")
+
+        async def transcribe(input_path: Path, stages, **kwargs: object) -> TranscriptionResult:
+            await stages.enter("probe")
+            await stages.enter("upload")
+            _count_request()
+            return TranscriptionResult(input_path, None, "hello", [], "en", 2.5)
+
+        buffer = io.StringIO()
+        with patch("transcribe_cli.core.batch.create_async_client", return_value=AsyncMock()):
+            with patch(
+                "transcribe_cli.core.batch.transcribe_file_async",
+                AsyncMock(side_effect=transcribe),
+            ):
+                process_batch(files=[media], api_key="sk-test", events=EventStream(buffer))
+
+        records = _records(buffer.getvalue())
+        stages = [r for r in records if r["event"] == STAGE_EVENT]
+        assert [(r["stage"], r["previous"]) for r in stages] == [
+            ("probe", None),
+            ("upload", "probe"),
+            ("write", "upload"),
+        ]
+        assert stages[0]["input"] == str(media)
+        assert stages[0]["bytes"] == 5
+
+        (record,) = [r for r in records if r["event"] == FILE_EVENT]
+        assert record["status"] == "completed"
+        assert record["output"] == str(tmp_path / "talk.txt")
+        assert record["audio_seconds"] == 2.5
+        assert (record["requests"], record["retries"]) == (1, 0)
+        assert set(record["stage_seconds"]) == {"probe", "upload", "write"}
+        assert records[-1]["event"] == BATCH_EVENT
+        assert (records[-1]["successful"], records[-1]["failed"]) == (1, 0)
+
+    def test_skipped_and_failed_files(self, tmp_path: Path) -> None:
+        """Up-to-date files and failures get file records too."""
+        from transcribe_cli.core.batch import process_batch
+
+        done, broken = tmp_path / "done.mp3", tmp_path / "broken.mp3"
+        for path in (done, broken):
+            path.write_bytes(b"audio")
+        (tmp_path / "done.txt").write_text("transcript")
+
+        buffer = io.StringIO()
+        with patch("transcribe_cli.core.batch.create_async_client", return_value=AsyncMock()):
+            with patch(
+                "transcribe_cli.core.batch.transcribe_file_async",
+                AsyncMock(side_effect=RuntimeError("API error")),
+            ):
+                process_batch(
+                    files=[done, broken],
+                    api_key="sk-test",
+                    incremental=True,
+                    events=EventStream(buffer),
+                )
+
+        files = {
+            Path(r["input"]).name: r
+            for r in _records(buffer.getvalue())
+            if r["event"] == FILE_EVENT
+        }
+        assert files["done.mp3"]["status"] == "skipped"
+        assert files["broken.mp3"]["status"] == "failed"
+        assert files["broken.mp3"]["error"] == "API error"
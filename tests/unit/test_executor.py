@@ -0,0 +1,176 @@
+"""Unit tests for the CPU-aware extraction executor."""
+
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from transcribe_cli.core.executor import (
+    ExtractionExecutor,
+    available_cpus,
+    cgroup_cpu_limit,
+)
+
+
+class TestCgroupCpuLimit:
+    """Tests for cgroup quota parsing."""
+
+    def test_v2_quota(self, tmp_path: Path) -> None:
+        """cpu.max "quota period" gives quota / period CPUs."""
+        (tmp_path / "cpu.max").write_text("250000 100000\n")
+
+        assert cgroup_cpu_limit(tmp_path) == 2.5
+
+    def test_v2_unlimited(self, tmp_path: Path) -> None:
+        """cpu.max "max" means no quota."""
+        (tmp_path / "cpu.max").write_text("max 100000\n")
+
+        assert cgroup_cpu_limit(tmp_path) is None
+
+    def test_v1_quota(self, tmp_path: Path) -> None:
+        """cgroup v1 cfs quota and period are read from the cpu controller."""
+        cpu = tmp_path / "cpu,cpuacct"
+        cpu.mkdir()
+        (cpu / "cpu.cfs_quota_us").write_text("400000")
+        (cpu / "cpu.cfs_period_us").write_text("100000")
+
+        assert cgroup_cpu_limit(tmp_path) == 4.0
+
+    def test_v1_unlimited(self, tmp_path: Path) -> None:
+        """A quota of -1 means no limit."""
+        cpu = tmp_path / "cpu"
+        cpu.mkdir()
+        (cpu / "cpu.cfs_quota_us").write_text("-1")
+        (cpu / "cpu.cfs_period_us").write_text("100000")
+
+        assert cgroup_cpu_limit(tmp_path) is None
+
+    def test_no_cgroup(self, tmp_path: Path) -> None:
+        """No cgroup files means no quota."""
+        assert cgroup_cpu_limit(tmp_path) is None
+
+
+class TestAvailableCpus:
+    """Tests for available_cpus."""
+
+    def test_quota_caps_affinity(self, tmp_path: Path) -> None:
+        """A fractional quota below the affinity mask is rounded up."""
+        (tmp_path / "cpu.max").write_text("150000 100000")
+
+        with patch("os.sched_getaffinity", return_value=set(range(64)), create=True):
+            assert available_cpus(tmp_path) == 2
+
+    def test_affinity_without_quota(self, tmp_path: Path) -> None:
+        """Without a quota the affinity mask decides."""
+        with patch("os.sched_getaffinity", return_value={0, 1, 2}, create=True):
+            assert available_cpus(tmp_path) == 3
+
+
+class TestExtractionExecutor:
+    """Tests for ExtractionExecutor sizing."""
+
+    def test_default_one_job_per_cpu(self) -> None:
+        """By default every CPU runs one single-threaded job."""
+        executor = ExtractionExecutor(cpus=8)
+
+        assert executor.jobs == 8
+        assert executor.threads_per_job == 1
+        executor.shutdown()
+
+    def test_fewer_jobs_get_more_threads(self) -> None:
+        """CPUs are split between the configured jobs."""
+        executor = ExtractionExecutor(jobs=4, cpus=64)
+
+        assert executor.threads_per_job == 16
+        executor.shutdown()
+
+    def test_invalid_jobs(self) -> None:
+        """Zero jobs is rejected."""
+        with pytest.raises(ValueError):
+            ExtractionExecutor(jobs=0, cpus=4)
+
+    async def test_runs_on_extraction_threads(self) -> None:
+        """Jobs run on the dedicated pool, not the default executor."""
+        executor = ExtractionExecutor(jobs=1, cpus=1)
+
+        name = await executor.run(lambda: threading.current_thread().name)
+
+        assert name.startswith("extract")
+        executor.shutdown()
+
+
+class TestBatchExtraction:
+    """Tests for the executor in batch runs."""
+
+    def test_batch_extraction_uses_job_threads(self, tmp_path: Path) -> None:
+        """Buffered batch extraction gets the per-job FFmpeg thread split."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        from transcribe_cli.core.batch import process_batch
+        from transcribe_cli.core.extractor import MediaInfo
+
+        video = tmp_path / "talk.mp4"
+        video.write_bytes(b"video")
+        info = MediaInfo(video, "mp4", 60.0, True, True, "opus", 2, 48000)
+        buffer = MagicMock(size=1024)
+
+        with patch("transcribe_cli.core.batch.create_async_client", return_value=AsyncMock()):
+            with patch("transcribe_cli.core.executor.available_cpus", return_value=8):
+                with patch(
+                    "transcribe_cli.core.transcriber.get_media_info_async",
+                    AsyncMock(return_value=info),
+                ):
+                    with patch(
+                        "transcribe_cli.core.transcriber.extract_audio_to_buffer_async",
+                        AsyncMock(return_value=buffer),
+                    ) as mock_extract:
+                        with patch(
+                            "transcribe_cli.core.transcriber._transcribe_or_raise_async",
+                            AsyncMock(return_value={"text": "hi"}),
+                        ):
+                            with patch("transcribe_cli.output.save_formatted_transcript"):
+                                summary = process_batch(
+                                    files=[video], api_key="sk-test", extract_jobs=2
+                                )
+
+        assert summary.successful == 1
+        assert mock_extract.call_args.kwargs["threads"] == 4
+        extract = next(stage for stage in summary.stages if stage.name == "extract")
+        assert extract.limit == 2
+
+    async def test_chunk_splitting_runs_on_executor(self, tmp_path: Path) -> None:
+        """Recordings that must be chunked are split on the executor's pool."""
+        from unittest.mock import AsyncMock
+
+        from transcribe_cli.core.extractor import MediaInfo
+        from transcribe_cli.core.scratch import ScratchSpace
+        from transcribe_cli.core.transcriber import _prepare_audio_async, _PreparedAudio
+
+        video = tmp_path / "lecture.mkv"
+        video.write_bytes(b"video")
+        # Ten hours of audio cannot fit in one upload at any profile
+        info = MediaInfo(video, "matroska", 36000.0, True, True, "pcm_s16le", 2, 48000)
+        executor = ExtractionExecutor(jobs=2, cpus=8)
+        calls: list[tuple[str, object]] = []
+
+        def split(*args: object) -> _PreparedAudio:
+            calls.append((threading.current_thread().name, args[5]))
+            return _PreparedAudio(source=video, chunks=[])
+
+        with patch(
+            "transcribe_cli.core.transcriber.get_media_info_async",
+            AsyncMock(return_value=info),
+        ):
+            with patch("transcribe_cli.core.transcriber._split_source", side_effect=split):
+                await _prepare_audio_async(
+                    video,
+                    ScratchSpace(tmp_path / "scratch").directory(),
+                    10,
+                    extract_executor=executor,
+                )
+        executor.shutdown()
+
+        thread_name, threads = calls[0]
+        assert thread_name.startswith("extract")
+        assert threads == 4
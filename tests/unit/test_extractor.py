@@ -1,6 +1,10 @@
 """Unit tests for audio extractor module."""
 
+import asyncio
+import io
 import json
+import signal
+import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -15,12 +19,16 @@ from transcribe_cli.core.extractor import (
     MediaInfo,
     NoAudioStreamError,
     UnsupportedFormatError,
+    extract_audio_to_buffer,
+    extract_audio_to_buffer_async,
     get_media_info,
+    get_media_info_async,
     is_audio_file,
     is_supported_file,
     is_video_file,
     validate_input_file,
 )
+from transcribe_cli.core.watchdog import JobOutcome
 
 
 class TestFileTypeChecks:
@@ -344,3 +352,316 @@ class TestGetMediaInfo:
                 assert info.has_video is False
                 assert info.has_audio is True
                 assert info.is_audio_only is True
+
+
+def _media_info(path: Path, has_audio: bool = True) -> MediaInfo:
+    return MediaInfo(
+        path=path,
+        format_name="matroska",
+        duration=60.0,
+        has_video=True,
+        has_audio=has_audio,
+        audio_codec="aac" if has_audio else None,
+        audio_channels=2 if has_audio else None,
+        audio_sample_rate=48000 if has_audio else None,
+    )
+
+
+def _fake_run(stdout: bytes, returncode: int = 0, stderr: str = ""):  # type: ignore[no-untyped-def]
+    """Stand-in for run_watched that writes stdout into the output buffer."""
+
+    def run(stream, output=None, timeouts=None):  # type: ignore[no-untyped-def]
+        if output is not None:
+            output.write(stdout)
+        return JobOutcome(returncode, stderr, output_bytes=len(stdout))
+
+    return run
+
+
+class TestExtractAudioToBuffer:
+    """Tests for piped extraction into a spooled buffer."""
+
+    def test_small_output_stays_in_memory(self, tmp_path: Path) -> None:
+        """Audio under the spool threshold is never written to disk."""
+        video = tmp_path / "clip.mkv"
+        video.write_bytes(b"fake video")
+
+        with patch("transcribe_cli.core.extractor.validate_ffmpeg"):
+            with patch(
+                "transcribe_cli.core.extractor.run_watched",
+                side_effect=_fake_run(b"x" * 1000),
+            ) as mock_run:
+                buffer = extract_audio_to_buffer(
+                    video, spool_threshold=4096, media_info=_media_info(video)
+                )
+
+        args = mock_run.call_args.args[0].get_args()
+        assert "pipe:1" in args
+        assert buffer.name == "clip.mp3"
+        assert buffer.size == 1000
+        assert buffer.duration == 60.0
+        assert buffer.spilled is False
+        assert buffer.read_bytes() == b"x" * 1000
+        buffer.close()
+
+    def test_large_output_spills(self, tmp_path: Path) -> None:
+        """Audio over the spool threshold spills to a temporary file."""
+        video = tmp_path / "clip.mkv"
+        video.write_bytes(b"fake video")
+
+        with patch("transcribe_cli.core.extractor.validate_ffmpeg"):
+            with patch(
+                "transcribe_cli.core.extractor.run_watched",
+                side_effect=_fake_run(b"x" * 10000),
+            ):
+                buffer = extract_audio_to_buffer(
+                    video, spool_threshold=4096, media_info=_media_info(video)
+                )
+
+        assert buffer.spilled is True
+        assert len(buffer.read_bytes()) == 10000
+        buffer.close()
+
+    def test_ffmpeg_failure_raises(self, tmp_path: Path) -> None:
+        """A non-zero exit raises ExtractionError with FFmpeg's stderr."""
+        video = tmp_path / "clip.mkv"
+        video.write_bytes(b"fake video")
+
+        with patch("transcribe_cli.core.extractor.validate_ffmpeg"):
+            with patch(
+                "transcribe_cli.core.extractor.run_watched",
+                side_effect=_fake_run(b"", returncode=1, stderr="bad input"),
+            ):
+                with pytest.raises(ExtractionError, match="bad input"):
+                    extract_audio_to_buffer(video, media_info=_media_info(video))
+
+    def test_no_audio_stream_raises(self, tmp_path: Path) -> None:
+        """Files without audio raise before FFmpeg is started."""
+        video = tmp_path / "clip.mkv"
+        video.write_bytes(b"fake video")
+
+        with patch("transcribe_cli.core.extractor.validate_ffmpeg"):
+            with patch("transcribe_cli.core.extractor.run_watched") as mock_run:
+                with pytest.raises(NoAudioStreamError):
+                    extract_audio_to_buffer(
+                        video, media_info=_media_info(video, has_audio=False)
+                    )
+
+        mock_run.assert_not_called()
+
+    def test_buffer_extraction_passes_threads(self, tmp_path: Path) -> None:
+        """threads becomes -threads on the FFmpeg command line."""
+        video = tmp_path / "clip.mkv"
+        video.write_bytes(b"fake video")
+
+        with patch("transcribe_cli.core.extractor.validate_ffmpeg"):
+            with patch(
+                "transcribe_cli.core.extractor.run_watched",
+                side_effect=_fake_run(b"x"),
+            ) as mock_run:
+                buffer = extract_audio_to_buffer(
+                    video, media_info=_media_info(video), threads=4
+                )
+
+        args = mock_run.call_args.args[0].get_args()
+        assert args[args.index("-threads") + 1] == "4"
+        buffer.close()
+
+
+def _script(tmp_path: Path, name: str, body: str) -> str:
+    """Write an executable shell script standing in for ffmpeg/ffprobe."""
+    path = tmp_path / name
+    path.write_text(f"#!/bin/sh\n{body}\n")
+    path.chmod(0o755)
+    return str(path)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses shell scripts as fake binaries")
+class TestAsyncSubprocesses:
+    """Tests for the asyncio subprocess probe and extraction."""
+
+    async def test_async_probe_parses_output(self, tmp_path: Path) -> None:
+        """ffprobe output is parsed the same way as the blocking probe."""
+        output = json.dumps(
+            {
+                "streams": [{"codec_type": "audio", "codec_name": "aac", "channels": 2}],
+                "format": {"format_name": "m4a", "duration": "12.5"},
+            }
+        )
+        ffprobe = _script(tmp_path, "ffprobe", f"echo '{output}'")
+
+        with patch("transcribe_cli.core.extractor.find_ffprobe", return_value=ffprobe):
+            info = await get_media_info_async(tmp_path / "a.m4a", use_cache=False)
+
+        assert info.duration == 12.5
+        assert info.audio_codec == "aac"
+        assert info.is_audio_only
+
+    async def test_async_probe_failure_raises(self, tmp_path: Path) -> None:
+        """A non-zero ffprobe exit is an ExtractionError."""
+        ffprobe = _script(tmp_path, "ffprobe", "echo 'bad file' >&2; exit 1")
+
+        with patch("transcribe_cli.core.extractor.find_ffprobe", return_value=ffprobe):
+            with pytest.raises(ExtractionError, match="bad file"):
+                await get_media_info_async(tmp_path / "a.m4a", use_cache=False)
+
+    async def test_async_probe_timeout_kills_ffprobe(self, tmp_path: Path) -> None:
+        """A hung ffprobe is killed and reported as a timeout."""
+        ffprobe = _script(tmp_path, "ffprobe", "exec sleep 30")
+
+        with patch("transcribe_cli.core.extractor.find_ffprobe", return_value=ffprobe):
+            with patch("transcribe_cli.core.extractor.FFPROBE_TIMEOUT_SECONDS", 0.1):
+                with pytest.raises(ExtractionError, match="timed out"):
+                    await get_media_info_async(tmp_path / "a.m4a", use_cache=False)
+
+    async def test_async_extraction_reads_stdout(self, tmp_path: Path) -> None:
+        """FFmpeg's stdout ends up in the buffer."""
+        video = tmp_path / "clip.mkv"
+        video.write_bytes(b"fake video")
+        ffmpeg_bin = _script(tmp_path, "ffmpeg", "printf 'encoded audio'")
+
+        with patch("transcribe_cli.core.extractor.validate_ffmpeg"):
+            with patch("transcribe_cli.core.watchdog.find_ffmpeg", return_value=ffmpeg_bin):
+                buffer = await extract_audio_to_buffer_async(
+                    video, media_info=_media_info(video), threads=2
+                )
+
+        assert buffer.name == "clip.mp3"
+        assert buffer.read_bytes() == b"encoded audio"
+        buffer.close()
+
+    async def test_async_extraction_failure_raises(self, tmp_path: Path) -> None:
+        """A non-zero FFmpeg exit is an ExtractionError with its stderr."""
+        video = tmp_path / "clip.mkv"
+        video.write_bytes(b"fake video")
+        ffmpeg_bin = _script(tmp_path, "ffmpeg", "echo 'Invalid data' >&2; exit 1")
+
+        with patch("transcribe_cli.core.extractor.validate_ffmpeg"):
+            with patch("transcribe_cli.core.watchdog.find_ffmpeg", return_value=ffmpeg_bin):
+                with pytest.raises(ExtractionError, match="Invalid data"):
+                    await extract_audio_to_buffer_async(video, media_info=_media_info(video))
+
+    async def test_cancel_kills_ffmpeg_and_discards_buffer(self, tmp_path: Path) -> None:
+        """Cancelling an extraction kills FFmpeg and closes the partial buffer."""
+        video = tmp_path / "clip.mkv"
+        video.write_bytes(b"fake video")
+        ffmpeg_bin = _script(tmp_path, "ffmpeg", "printf 'partial'; exec sleep 30")
+        processes: list[asyncio.subprocess.Process] = []
+        buffers: list[MagicMock] = []
+        spawn = asyncio.create_subprocess_exec
+
+        async def track(*args: object, **kwargs: object) -> asyncio.subprocess.Process:
+            process = await spawn(*args, **kwargs)
+            processes.append(process)
+            return process
+
+        def spool(max_size: int) -> MagicMock:
+            buffers.append(MagicMock())
+            return buffers[-1]
+
+        with patch("transcribe_cli.core.extractor.validate_ffmpeg"):
+            with patch("transcribe_cli.core.watchdog.find_ffmpeg", return_value=ffmpeg_bin):
+                with patch("asyncio.create_subprocess_exec", side_effect=track):
+                    with patch("tempfile.SpooledTemporaryFile", side_effect=spool):
+                        task = asyncio.ensure_future(
+                            extract_audio_to_buffer_async(video, media_info=_media_info(video))
+                        )
+                        while not buffers or not buffers[0].write.called:
+                            await asyncio.sleep(0.01)
+                        task.cancel()
+                        with pytest.raises(asyncio.CancelledError):
+                            await task
+
+        assert processes[0].returncode == -signal.SIGKILL
+        buffers[0].close.assert_called_once()
+
+
+class TestStreamCopy:
+    """Tests for remuxing compatible audio without re-encoding."""
+
+    def test_extract_audio_remuxes_aac(self, tmp_path: Path) -> None:
+        """AAC audio is copied into an m4a with -map 0:a:0 -c:a copy."""
+        from transcribe_cli.core.extractor import extract_audio
+
+        video = tmp_path / "clip.mp4"
+        video.write_bytes(b"fake video")
+
+        def fake_run(stream, **kwargs):  # type: ignore[no-untyped-def]
+            args = stream.get_args()
+            Path(args[-2] if args[-1] == "-y" else args[-1]).write_bytes(b"m4a")
+            fake_run.args = args
+            return JobOutcome()
+
+        with patch("transcribe_cli.core.extractor.validate_ffmpeg"):
+            with patch(
+                "transcribe_cli.core.extractor.get_media_info", return_value=_media_info(video)
+            ):
+                with patch("transcribe_cli.core.extractor.run_watched", side_effect=fake_run):
+                    result = extract_audio(video, stream_copy=True)
+
+        assert result.method == "remux"
+        assert result.output_path.suffix == ".m4a"
+        assert ["-map", "0:a:0"] == fake_run.args[2:4]
+        assert "copy" in fake_run.args
+
+    def test_extract_audio_transcodes_by_default(self, tmp_path: Path) -> None:
+        """Without stream_copy the requested format is encoded."""
+        from transcribe_cli.core.extractor import extract_audio
+
+        video = tmp_path / "clip.mp4"
+        video.write_bytes(b"fake video")
+
+        def fake_run(stream, **kwargs):  # type: ignore[no-untyped-def]
+            Path([a for a in stream.get_args() if a.endswith(".mp3")][-1]).write_bytes(b"mp3")
+            return JobOutcome()
+
+        with patch("transcribe_cli.core.extractor.validate_ffmpeg"):
+            with patch(
+                "transcribe_cli.core.extractor.get_media_info", return_value=_media_info(video)
+            ):
+                with patch("transcribe_cli.core.extractor.run_watched", side_effect=fake_run):
+                    result = extract_audio(video)
+
+        assert result.method == "transcode"
+        assert result.output_path.suffix == ".mp3"
+
+    def test_output_path_in_other_format_transcodes(self, tmp_path: Path) -> None:
+        """An explicit output path in another format disables the copy."""
+        from transcribe_cli.core.extractor import extract_audio
+
+        video = tmp_path / "clip.mp4"
+        video.write_bytes(b"fake video")
+        target = tmp_path / "out.mp3"
+
+        def fake_run(stream, **kwargs):  # type: ignore[no-untyped-def]
+            target.write_bytes(b"mp3")
+            return JobOutcome()
+
+        with patch("transcribe_cli.core.extractor.validate_ffmpeg"):
+            with patch(
+                "transcribe_cli.core.extractor.get_media_info", return_value=_media_info(video)
+            ):
+                with patch("transcribe_cli.core.extractor.run_watched", side_effect=fake_run):
+                    result = extract_audio(video, output_path=target, stream_copy=True)
+
+        assert result.method == "transcode"
+
+    def test_buffer_remux_fragments_mp4(self, tmp_path: Path) -> None:
+        """Piped m4a remuxes are fragmented so the pipe need not seek."""
+        video = tmp_path / "clip.mp4"
+        video.write_bytes(b"fake video")
+
+        with patch("transcribe_cli.core.extractor.validate_ffmpeg"):
+            with patch(
+                "transcribe_cli.core.extractor.run_watched",
+                side_effect=_fake_run(b"m4a"),
+            ) as mock_run:
+                buffer = extract_audio_to_buffer(
+                    video, media_info=_media_info(video), stream_copy=True
+                )
+
+        args = mock_run.call_args.args[0].get_args()
+        assert buffer.method == "remux"
+        assert buffer.name == "clip.m4a"
+        assert "frag_keyframe+empty_moov" in args
+        buffer.close()
@@ -1,6 +1,8 @@
 """Unit tests for FFmpeg detection module."""
 
+import os
 import subprocess
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -10,10 +12,12 @@ from transcribe_cli.core.ffmpeg import (
     FFmpegInfo,
     FFmpegNotFoundError,
     FFmpegVersionError,
+    ToolchainRegistry,
     check_ffmpeg_available,
     find_ffmpeg,
     find_ffprobe,
     get_ffmpeg_version,
+    get_toolchain,
     parse_version,
     validate_ffmpeg,
 )
@@ -127,6 +131,109 @@ class TestValidateFFmpeg:
                 assert exc_info.value.required_version == MINIMUM_FFMPEG_VERSION
 
 
+ENCODERS_OUTPUT = """Encoders:
+ V..... = Video
+ A..... = Audio
+ ------
+ A....D libmp3lame           libmp3lame MP3 (MPEG audio layer 3) (codec mp3)
+ A....D libopus              libopus Opus (codec opus)
+"""
+
+MUXERS_OUTPUT = """ File formats:
+ D. = Demuxing supported
+ .E = Muxing supported
+ --
+  E mp3             MP3 (MPEG audio layer 3)
+  E webm            WebM
+"""
+
+
+def _fake_ffmpeg_run(args: list[str], **kwargs: object) -> MagicMock:
+    result = MagicMock()
+    result.returncode = 0
+    result.stderr = ""
+    if "-encoders" in args:
+        result.stdout = ENCODERS_OUTPUT
+    elif "-muxers" in args:
+        result.stdout = MUXERS_OUTPUT
+    else:
+        result.stdout = "ffmpeg version 6.1.1 Copyright (c) 2000-2023"
+    return result
+
+
+class TestToolchainRegistry:
+    """Tests for cached toolchain discovery."""
+
+    def test_find_resolves_once(self) -> None:
+        """Binary lookups hit PATH once per process."""
+        with patch("shutil.which", return_value="/usr/bin/ffprobe") as mock_which:
+            assert find_ffprobe() == "/usr/bin/ffprobe"
+            assert find_ffprobe() == "/usr/bin/ffprobe"
+
+        assert mock_which.call_count == 1
+
+    def test_describe_records_capabilities(self, tmp_path: Path) -> None:
+        """describe records version, encoders and muxers."""
+        binary = tmp_path / "ffmpeg"
+        binary.write_text("")
+        registry = ToolchainRegistry(tmp_path / "toolchain.json")
+
+        with patch("subprocess.run", side_effect=_fake_ffmpeg_run):
+            info = registry.describe(str(binary))
+
+        assert info.version == (6, 1)
+        assert info.has_encoder("libopus")
+        assert info.has_muxer("webm")
+        assert not info.has_encoder("aac")
+
+    def test_validate_runs_ffmpeg_once(self) -> None:
+        """Repeated validation does not re-run ffmpeg -version."""
+        with patch("transcribe_cli.core.ffmpeg.find_ffmpeg", return_value="/usr/bin/ffmpeg"):
+            with patch("subprocess.run", side_effect=_fake_ffmpeg_run) as mock_run:
+                validate_ffmpeg()
+                validate_ffmpeg()
+
+        # -version, -encoders and -muxers, all on the first call
+        assert mock_run.call_count == 3
+
+    def test_persisted_across_processes(self, tmp_path: Path) -> None:
+        """A new registry reads the stored toolchain for an unchanged binary."""
+        binary = tmp_path / "ffmpeg"
+        binary.write_text("")
+        store = tmp_path / "toolchain.json"
+
+        with patch("subprocess.run", side_effect=_fake_ffmpeg_run):
+            ToolchainRegistry(store).describe(str(binary))
+
+        with patch("subprocess.run") as mock_run:
+            info = ToolchainRegistry(store).describe(str(binary))
+
+        mock_run.assert_not_called()
+        assert info.version == (6, 1)
+        assert info.encoders == ("libmp3lame", "libopus")
+
+    def test_binary_change_invalidates_store(self, tmp_path: Path) -> None:
+        """An upgraded binary (new mtime) is described again."""
+        binary = tmp_path / "ffmpeg"
+        binary.write_text("")
+        store = tmp_path / "toolchain.json"
+
+        with patch("subprocess.run", side_effect=_fake_ffmpeg_run):
+            ToolchainRegistry(store).describe(str(binary))
+
+        st = binary.stat()
+        os.utime(binary, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        with patch("subprocess.run", side_effect=_fake_ffmpeg_run) as mock_run:
+            ToolchainRegistry(store).describe(str(binary))
+
+        assert mock_run.call_count == 3
+
+    def test_default_registry_is_shared(self) -> None:
+        """get_toolchain returns the same registry."""
+        assert get_toolchain() is get_toolchain()
+
+
 class TestCheckFFmpegAvailable:
     """Tests for non-throwing FFmpeg check."""
 
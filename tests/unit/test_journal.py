@@ -0,0 +1,73 @@
+"""Unit tests for the batch journal."""
+
+import json
+import threading
+from pathlib import Path
+
+from transcribe_cli.core.journal import JOURNAL_FILENAME, BatchJournal
+
+
+class TestBatchJournal:
+    """Tests for journal writes and reads."""
+
+    def test_for_directory(self, tmp_path: Path) -> None:
+        """The journal lives in the given directory."""
+        journal = BatchJournal.for_directory(tmp_path)
+        assert journal.path == tmp_path.resolve() / JOURNAL_FILENAME
+
+    def test_load_missing_journal(self, tmp_path: Path) -> None:
+        """A journal that was never written is empty."""
+        assert BatchJournal(tmp_path / "journal.jsonl").load() == {}
+
+    def test_last_entry_wins(self, tmp_path: Path) -> None:
+        """load keeps the latest state of each file."""
+        journal = BatchJournal(tmp_path / "journal.jsonl")
+        media = tmp_path / "a.mp3"
+
+        journal.record(media, "started")
+        journal.record(media, "failed", error="API error")
+        journal.record(media, "started")
+        journal.record(media, "completed", output_path=tmp_path / "a.txt")
+
+        entry = journal.load()[media.resolve()]
+        assert entry.state == "completed"
+        assert entry.output_path == tmp_path / "a.txt"
+        assert entry.error is None
+
+    def test_records_error(self, tmp_path: Path) -> None:
+        """Failed entries keep the error message."""
+        journal = BatchJournal(tmp_path / "journal.jsonl")
+        media = tmp_path / "a.mp3"
+
+        journal.record(media, "failed", error="No audio stream")
+
+        assert journal.load()[media.resolve()].error == "No audio stream"
+
+    def test_torn_line_is_ignored(self, tmp_path: Path) -> None:
+        """A partial line from a crash does not break loading."""
+        journal = BatchJournal(tmp_path / "journal.jsonl")
+        journal.record(tmp_path / "a.mp3", "completed", output_path=tmp_path / "a.txt")
+        with open(journal.path, "a") as f:
+            f.write('{"input": "/x/b.mp3", "sta')
+
+        entries = journal.load()
+        assert list(entries) == [(tmp_path / "a.mp3").resolve()]
+
+    def test_concurrent_writers_do_not_interleave(self, tmp_path: Path) -> None:
+        """Records from many threads stay one JSON object per line."""
+        journal = BatchJournal(tmp_path / "journal.jsonl")
+
+        def worker(n: int) -> None:
+            for i in range(50):
+                journal.record(tmp_path / f"file{n}_{i}.mp3", "started")
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        lines = journal.path.read_text().splitlines()
+        assert len(lines) == 400
+        assert all(json.loads(line)["state"] == "started" for line in lines)
+        assert len(journal.load()) == 400
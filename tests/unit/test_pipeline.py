@@ -0,0 +1,166 @@
+"""Unit tests for the staged batch pipeline."""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from transcribe_cli.core.budget import ByteBudget
+from transcribe_cli.core.pipeline import StagePipeline
+
+LIMITS = {"probe": 2, "extract": 2, "upload": 2, "write": 2}
+
+
+class TestStagePipeline:
+    """Tests for StagePipeline and StageTicket."""
+
+    async def test_stage_limit_bounds_active_files(self) -> None:
+        """No more than a stage's limit of files hold it at once."""
+        pipeline = StagePipeline({**LIMITS, "extract": 1})
+        active = 0
+        peak = 0
+
+        async def run() -> None:
+            nonlocal active, peak
+            ticket = pipeline.ticket()
+            await ticket.enter("extract")
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            ticket.leave()
+
+        await asyncio.gather(*(run() for _ in range(4)))
+
+        assert peak == 1
+        extract = pipeline.stats()[1]
+        assert extract.completed == 4
+        assert extract.wait_seconds > 0
+
+    async def test_full_queue_holds_previous_stage(self) -> None:
+        """A file keeps its extract slot until the upload queue has room."""
+        pipeline = StagePipeline(
+            {**LIMITS, "extract": 1, "upload": 1},
+            queue_depths={"upload": 1},
+        )
+        uploading = pipeline.ticket()
+        await uploading.enter("upload")
+        queued = pipeline.ticket()
+        await queued.enter("extract")
+        waiting = asyncio.ensure_future(queued.enter("upload"))
+        await asyncio.sleep(0)
+
+        # The queue slot is taken, so a third file stays in extract
+        blocked = pipeline.ticket()
+        await blocked.enter("extract")
+        assert not waiting.done()
+        assert blocked.stage == "extract"
+        stuck = asyncio.ensure_future(blocked.enter("upload"))
+        await asyncio.sleep(0.01)
+        assert blocked.stage == "extract"
+
+        uploading.leave()
+        await waiting
+        assert queued.stage == "upload"
+        queued.leave()
+        await stuck
+        assert blocked.stage == "upload"
+        blocked.leave()
+        assert pipeline.stats()[1].blocked_seconds > 0
+
+    async def test_byte_budget_held_from_extract_to_upload_end(self) -> None:
+        """In-flight bytes are reserved for extraction and upload only."""
+        budget = ByteBudget(100)
+        pipeline = StagePipeline(LIMITS, byte_budget=budget)
+        ticket = pipeline.ticket(size=10, in_flight_bytes=60)
+
+        await ticket.enter("probe")
+        assert budget.in_use == 0
+        await ticket.enter("extract")
+        await ticket.enter("upload")
+        assert budget.in_use == 60
+        await ticket.enter("write")
+        assert budget.in_use == 0
+        ticket.leave()
+
+    async def test_failure_releases_slot_and_bytes(self) -> None:
+        """Leaving early frees the stage slot and the byte reservation."""
+        budget = ByteBudget(100)
+        pipeline = StagePipeline({**LIMITS, "extract": 1}, byte_budget=budget)
+        ticket = pipeline.ticket(in_flight_bytes=80)
+        await ticket.enter("extract")
+
+        ticket.leave(success=False)
+
+        assert budget.in_use == 0
+        assert pipeline.stats()[1].completed == 0
+        other = pipeline.ticket()
+        await asyncio.wait_for(other.enter("extract"), timeout=1)
+
+    async def test_listener_sees_transitions_and_timings(self) -> None:
+        """The listener runs on each stage entry; time held is kept per stage."""
+        seen: list[tuple[str, object]] = []
+        pipeline = StagePipeline(
+            LIMITS, listener=lambda ticket, previous: seen.append((ticket.stage, previous))
+        )
+        ticket = pipeline.ticket(path=Path("a.mp3"))
+
+        await ticket.enter("probe")
+        await asyncio.sleep(0.01)
+        await ticket.enter("upload")
+        ticket.leave()
+
+        assert seen == [("probe", None), ("upload", "probe")]
+        assert ticket.path == Path("a.mp3")
+        assert ticket.timings["probe"] > 0
+        assert set(ticket.waits) == {"probe", "upload"}
+
+    def test_invalid_limits(self) -> None:
+        """Unknown stages, missing stages and zero limits are rejected."""
+        with pytest.raises(ValueError, match="Unknown"):
+            StagePipeline({**LIMITS, "parse": 1})
+        with pytest.raises(ValueError, match="Missing"):
+            StagePipeline({"probe": 1, "extract": 1, "upload": 1})
+        with pytest.raises(ValueError, match="at least 1"):
+            StagePipeline({**LIMITS, "write": 0})
+
+
+class TestStagedTranscription:
+    """Tests for transcribe_file_async stage hand-offs."""
+
+    async def test_video_passes_probe_extract_upload(self, tmp_path: Path) -> None:
+        """A video is probed, extracted and uploaded in separate stages."""
+        from transcribe_cli.core.transcriber import _PreparedAudio, transcribe_file_async
+
+        video = tmp_path / "talk.mp4"
+        video.write_bytes(b"video")
+        pipeline = StagePipeline(LIMITS)
+        ticket = pipeline.ticket()
+        seen: list[str] = []
+
+        async def probe(path: Path) -> None:
+            seen.append(f"probe:{ticket.stage}")
+
+        async def prepare(*args: object) -> _PreparedAudio:
+            seen.append(f"prepare:{ticket.stage}")
+            return _PreparedAudio(source=video)
+
+        async def upload(*args: object, **kwargs: object) -> dict:
+            seen.append(f"upload:{ticket.stage}")
+            return {"text": "hi"}
+
+        with patch("transcribe_cli.core.transcriber.get_media_info_async", side_effect=probe):
+            with patch(
+                "transcribe_cli.core.transcriber._prepare_audio_async", side_effect=prepare
+            ):
+                with patch(
+                    "transcribe_cli.core.transcriber._transcribe_or_raise_async",
+                    AsyncMock(side_effect=upload),
+                ):
+                    result = await transcribe_file_async(video, client=MagicMock(), stages=ticket)
+
+        assert result.text == "hi"
+        assert seen == ["probe:probe", "prepare:extract", "upload:upload"]
+        assert ticket.stage == "upload"
+        ticket.leave()
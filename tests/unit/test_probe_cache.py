@@ -0,0 +1,129 @@
+"""Unit tests for the ffprobe result cache."""
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from transcribe_cli.core.extractor import PROBE_ENTRIES, get_media_info
+from transcribe_cli.core.probe_cache import ProbeCache
+
+FFPROBE_OUTPUT = {
+    "format": {"format_name": "matroska,webm", "duration": "120.500"},
+    "streams": [
+        {"codec_type": "video", "codec_name": "h264"},
+        {"codec_type": "audio", "codec_name": "aac", "channels": 2, "sample_rate": "44100"},
+    ],
+}
+
+
+def _ffprobe_result() -> MagicMock:
+    result = MagicMock()
+    result.returncode = 0
+    result.stdout = json.dumps(FFPROBE_OUTPUT)
+    return result
+
+
+class TestProbeCache:
+    """Tests for ProbeCache storage."""
+
+    def test_put_then_get(self, tmp_path: Path) -> None:
+        """Stored probes are returned for an unchanged file."""
+        media = tmp_path / "video.mkv"
+        media.write_bytes(b"video")
+        cache = ProbeCache(tmp_path / "probes.sqlite3")
+
+        cache.put(media, media.stat(), FFPROBE_OUTPUT)
+
+        assert cache.get(media, media.stat()) == FFPROBE_OUTPUT
+        assert cache.count() == 1
+
+    def test_size_or_mtime_change_misses(self, tmp_path: Path) -> None:
+        """A different size or mtime invalidates the entry."""
+        media = tmp_path / "video.mkv"
+        media.write_bytes(b"video")
+        cache = ProbeCache(tmp_path / "probes.sqlite3")
+        cache.put(media, media.stat(), FFPROBE_OUTPUT)
+
+        st = media.stat()
+        os.utime(media, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert cache.get(media, media.stat()) is None
+
+        cache.put(media, media.stat(), FFPROBE_OUTPUT)
+        media.write_bytes(b"longer video")
+        os.utime(media, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert cache.get(media, media.stat()) is None
+
+    def test_clear(self, tmp_path: Path) -> None:
+        """clear removes every entry."""
+        media = tmp_path / "video.mkv"
+        media.write_bytes(b"video")
+        cache = ProbeCache(tmp_path / "probes.sqlite3")
+        cache.put(media, media.stat(), FFPROBE_OUTPUT)
+
+        assert cache.clear() == 1
+        assert cache.count() == 0
+
+    def test_missing_database_is_empty(self, tmp_path: Path) -> None:
+        """A cache that was never written reports no entries."""
+        cache = ProbeCache(tmp_path / "probes.sqlite3")
+
+        assert cache.count() == 0
+        assert cache.clear() == 0
+
+
+class TestCachedGetMediaInfo:
+    """Tests for get_media_info cache use."""
+
+    def test_second_probe_hits_cache(self, tmp_path: Path) -> None:
+        """An unchanged file is probed by ffprobe only once."""
+        media = tmp_path / "video.mkv"
+        media.write_bytes(b"video")
+
+        with patch("transcribe_cli.core.extractor.find_ffprobe", return_value="/usr/bin/ffprobe"):
+            with patch("subprocess.run", return_value=_ffprobe_result()) as mock_run:
+                first = get_media_info(media)
+                second = get_media_info(media)
+
+        assert mock_run.call_count == 1
+        assert first == second
+        assert second.audio_codec == "aac"
+
+    def test_modified_file_is_reprobed(self, tmp_path: Path) -> None:
+        """Changing the file invalidates its cached probe."""
+        media = tmp_path / "video.mkv"
+        media.write_bytes(b"video")
+
+        with patch("transcribe_cli.core.extractor.find_ffprobe", return_value="/usr/bin/ffprobe"):
+            with patch("subprocess.run", return_value=_ffprobe_result()) as mock_run:
+                get_media_info(media)
+                media.write_bytes(b"re-encoded video")
+                get_media_info(media)
+
+        assert mock_run.call_count == 2
+
+    def test_use_cache_false_always_probes(self, tmp_path: Path) -> None:
+        """use_cache=False bypasses the cache."""
+        media = tmp_path / "video.mkv"
+        media.write_bytes(b"video")
+
+        with patch("transcribe_cli.core.extractor.find_ffprobe", return_value="/usr/bin/ffprobe"):
+            with patch("subprocess.run", return_value=_ffprobe_result()) as mock_run:
+                get_media_info(media, use_cache=False)
+                get_media_info(media, use_cache=False)
+
+        assert mock_run.call_count == 2
+        assert ProbeCache.default().count() == 0
+
+    def test_probe_requests_only_used_fields(self, tmp_path: Path) -> None:
+        """ffprobe is asked for the MediaInfo fields rather than everything."""
+        media = tmp_path / "video.mkv"
+        media.write_bytes(b"video")
+
+        with patch("transcribe_cli.core.extractor.find_ffprobe", return_value="/usr/bin/ffprobe"):
+            with patch("subprocess.run", return_value=_ffprobe_result()) as mock_run:
+                get_media_info(media)
+
+        args = mock_run.call_args.args[0]
+        assert args[args.index("-show_entries") + 1] == PROBE_ENTRIES
+        assert "-show_streams" not in args
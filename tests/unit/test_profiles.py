@@ -0,0 +1,126 @@
+"""Unit tests for encoding profiles module."""
+
+import pytest
+
+from transcribe_cli.core.profiles import (
+    DEFAULT_PROFILE,
+    ENCODING_PROFILES,
+    FIT_BITRATES,
+    EncodingProfile,
+    PROFILE_NAMES,
+    fit_profile,
+    parse_bitrate,
+    resolve_profile,
+)
+
+LIMIT = 25 * 1024 * 1024
+
+
+class TestParseBitrate:
+    """Tests for bitrate parsing."""
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [("192k", 192000), ("32K", 32000), ("1.5M", 1500000), ("64000", 64000)],
+    )
+    def test_values(self, value: str, expected: int) -> None:
+        """FFmpeg bitrate strings are converted to bits per second."""
+        assert parse_bitrate(value) == expected
+
+    def test_invalid(self) -> None:
+        """Garbage raises ValueError."""
+        with pytest.raises(ValueError):
+            parse_bitrate("fast")
+
+
+class TestEncodingProfile:
+    """Tests for profile definitions."""
+
+    def test_speech_profiles_are_mono_16khz(self) -> None:
+        """Speech profiles downmix to 16kHz mono."""
+        for name in ("speech-mp3", "speech-opus", "speech-webm"):
+            profile = ENCODING_PROFILES[name]
+            assert profile.sample_rate == 16000
+            assert profile.channels == 1
+
+    def test_opus_containers(self) -> None:
+        """Opus profiles use containers the API accepts."""
+        assert ENCODING_PROFILES["speech-opus"].container == "ogg"
+        assert ENCODING_PROFILES["speech-webm"].container == "webm"
+        assert ENCODING_PROFILES["speech-opus"].codec == "libopus"
+
+    def test_output_options(self) -> None:
+        """Profiles translate to FFmpeg output options."""
+        options = ENCODING_PROFILES["speech-mp3"].output_options()
+        assert options == {
+            "acodec": "libmp3lame",
+            "vn": None,
+            "audio_bitrate": "32k",
+            "ar": 16000,
+            "ac": 1,
+        }
+
+    def test_estimated_size(self) -> None:
+        """Size estimates follow bitrate, or PCM sample size for WAV."""
+        assert ENCODING_PROFILES["speech-mp3"].estimated_size(60.0) == 240000
+        assert ENCODING_PROFILES["wav"].estimated_size(1.0) == 32000
+
+    def test_speech_profile_is_much_smaller(self) -> None:
+        """The default speech profile is several times smaller than 192k MP3."""
+        legacy = ENCODING_PROFILES["mp3"].estimated_size(3600.0)
+        speech = ENCODING_PROFILES[DEFAULT_PROFILE].estimated_size(3600.0)
+        assert legacy is not None and speech is not None
+        assert legacy / speech >= 4
+
+
+class TestFitProfile:
+    """Tests for the "fit" bitrate selection."""
+
+    def test_short_recording_gets_highest_bitrate(self) -> None:
+        """Short recordings use the top of the ladder."""
+        assert fit_profile(600.0, LIMIT).bitrate == FIT_BITRATES[0]
+
+    def test_picks_highest_bitrate_that_fits(self) -> None:
+        """The chosen bitrate fits and the next one up does not."""
+        profile = fit_profile(3600.0, LIMIT)
+        assert profile.bitrate == "48k"
+        assert profile.estimated_size(3600.0) <= LIMIT
+
+        index = FIT_BITRATES.index(profile.bitrate)
+        higher = EncodingProfile(
+            "x", "libmp3lame", "mp3", "mp3", bitrate=FIT_BITRATES[index - 1]
+        )
+        assert higher.estimated_size(3600.0) > LIMIT * 0.95
+
+    def test_nothing_fits_uses_lowest(self) -> None:
+        """Very long recordings fall back to the lowest bitrate."""
+        assert fit_profile(10 * 24 * 3600.0, LIMIT).bitrate == FIT_BITRATES[-1]
+
+    def test_unknown_duration_uses_speech_default(self) -> None:
+        """Without a duration the speech MP3 bitrate is used."""
+        profile = fit_profile(None, LIMIT)
+        assert profile.name == "fit"
+        assert profile.bitrate == ENCODING_PROFILES["speech-mp3"].bitrate
+
+
+class TestResolveProfile:
+    """Tests for profile lookup."""
+
+    def test_named_profile(self) -> None:
+        """Named profiles are returned as defined."""
+        assert resolve_profile("speech-opus") is ENCODING_PROFILES["speech-opus"]
+
+    def test_fit_needs_limit(self) -> None:
+        """"fit" without a size limit raises ValueError."""
+        with pytest.raises(ValueError, match="size limit"):
+            resolve_profile("fit", 600.0)
+
+    def test_unknown_name(self) -> None:
+        """Unknown names list the valid choices."""
+        with pytest.raises(ValueError, match="speech-opus"):
+            resolve_profile("nope")
+
+    def test_profile_names_include_fit(self) -> None:
+        """PROFILE_NAMES lists every profile plus "fit"."""
+        assert "fit" in PROFILE_NAMES
+        assert set(ENCODING_PROFILES) <= set(PROFILE_NAMES)
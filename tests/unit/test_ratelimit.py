@@ -0,0 +1,283 @@
+"""Unit tests for rate limiting module."""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from transcribe_cli.core.ratelimit import (
+    DEFAULT_THROTTLE_PAUSE,
+    RateLimiter,
+    TokenBucket,
+    configure_rate_limiter,
+    get_rate_limiter,
+    parse_reset_duration,
+    retry_after_seconds,
+)
+
+
+class TestParseResetDuration:
+    """Tests for x-ratelimit-reset-* parsing."""
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            ("1s", 1.0),
+            ("6m0s", 360.0),
+            ("20ms", 0.02),
+            ("1h2m3s", 3723.0),
+            ("2.5", 2.5),
+        ],
+    )
+    def test_valid_values(self, value: str, expected: float) -> None:
+        """Durations in OpenAI header format are parsed to seconds."""
+        assert parse_reset_duration(value) == pytest.approx(expected)
+
+    def test_invalid_value(self) -> None:
+        """Unparseable values return None."""
+        assert parse_reset_duration("soon") is None
+
+
+class TestRetryAfterSeconds:
+    """Tests for Retry-After header parsing."""
+
+    def test_retry_after(self) -> None:
+        """Retry-After seconds are read case-insensitively."""
+        assert retry_after_seconds({"Retry-After": "3"}) == 3.0
+
+    def test_retry_after_ms_preferred(self) -> None:
+        """retry-after-ms takes precedence over retry-after."""
+        headers = {"retry-after-ms": "1500", "retry-after": "3"}
+        assert retry_after_seconds(headers) == 1.5
+
+    def test_missing_or_date(self) -> None:
+        """Missing or HTTP-date values return None."""
+        assert retry_after_seconds({}) is None
+        assert (
+            retry_after_seconds({"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"})
+            is None
+        )
+
+
+class TestTokenBucket:
+    """Tests for token bucket reservations."""
+
+    def test_burst_then_wait(self) -> None:
+        """Reservations beyond the burst capacity must wait."""
+        bucket = TokenBucket(rate_per_minute=60)
+        now = bucket._updated
+        capacity = int(bucket.capacity)
+
+        for _ in range(capacity):
+            assert bucket.reserve(1.0, now) == 0.0
+
+        # One token per second at 60/min
+        assert bucket.reserve(1.0, now) == pytest.approx(1.0)
+        assert bucket.reserve(1.0, now) == pytest.approx(2.0)
+
+    def test_refill_over_time(self) -> None:
+        """Tokens refill at the configured rate."""
+        bucket = TokenBucket(rate_per_minute=60)
+        now = bucket._updated
+        bucket.reserve(bucket.capacity, now)
+
+        assert bucket.reserve(1.0, now + 1.0) == 0.0
+
+
+class TestRateLimiter:
+    """Tests for the shared limiter."""
+
+    def test_invalid_limits_raise(self) -> None:
+        """Non-positive limits raise ValueError."""
+        with pytest.raises(ValueError):
+            RateLimiter(requests_per_minute=0)
+        with pytest.raises(ValueError):
+            RateLimiter(audio_seconds_per_minute=0)
+
+    def test_audio_bucket_limits_long_uploads(self) -> None:
+        """Audio seconds beyond the audio budget delay the upload."""
+        limiter = RateLimiter(requests_per_minute=1000, audio_seconds_per_minute=600)
+
+        assert limiter.limits_audio
+        # Capacity is 100 audio seconds (10s of refill at 10/s)
+        assert limiter.reserve(audio_seconds=100) == 0.0
+        assert limiter.reserve(audio_seconds=50) == pytest.approx(5.0, abs=0.1)
+
+    def test_throttle_halves_rate_once_per_burst(self) -> None:
+        """Workers hit by the same 429 burst slow down only once."""
+        limiter = RateLimiter(requests_per_minute=100)
+
+        limiter.record_throttle(retry_after=2.0)
+        limiter.record_throttle(retry_after=2.0)
+
+        stats = limiter.stats()
+        assert stats.requests_per_minute == 50
+        assert stats.throttled == 2
+        assert stats.pacing_fraction == 0.5
+
+    def test_throttle_pauses_all_workers(self) -> None:
+        """A 429 delays the next reservation by Retry-After."""
+        limiter = RateLimiter(requests_per_minute=1000)
+
+        limiter.record_throttle(retry_after=3.0)
+
+        assert limiter.reserve() == pytest.approx(3.0, abs=0.1)
+
+    def test_throttle_without_retry_after_uses_default(self) -> None:
+        """A 429 without Retry-After pauses for the default time."""
+        limiter = RateLimiter(requests_per_minute=1000)
+
+        limiter.record_throttle()
+
+        assert limiter.reserve() == pytest.approx(DEFAULT_THROTTLE_PAUSE, abs=0.1)
+
+    def test_success_recovers_rate(self) -> None:
+        """Successful requests recover pacing toward the configured rate."""
+        limiter = RateLimiter(requests_per_minute=100)
+        limiter.record_throttle(retry_after=0.0)
+
+        for _ in range(20):
+            limiter.record_success()
+
+        assert limiter.stats().requests_per_minute == 100
+
+    def test_headers_cap_configured_rate(self) -> None:
+        """x-ratelimit-limit-requests lowers the configured rate."""
+        limiter = RateLimiter(requests_per_minute=500)
+
+        limiter.update_from_headers({"x-ratelimit-limit-requests": "50"})
+
+        stats = limiter.stats()
+        assert stats.configured_requests_per_minute == 50
+        assert stats.requests_per_minute == 50
+
+    def test_exhausted_headers_pause_until_reset(self) -> None:
+        """Zero remaining requests pause until the reset time."""
+        limiter = RateLimiter(requests_per_minute=1000)
+
+        limiter.update_from_headers(
+            {
+                "x-ratelimit-remaining-requests": "0",
+                "x-ratelimit-reset-requests": "2s",
+            }
+        )
+
+        assert limiter.reserve() == pytest.approx(2.0, abs=0.1)
+
+    def test_remaining_headers_do_not_pause(self) -> None:
+        """Requests left in the window do not pause."""
+        limiter = RateLimiter(requests_per_minute=1000)
+
+        limiter.update_from_headers(
+            {
+                "x-ratelimit-remaining-requests": "10",
+                "x-ratelimit-reset-requests": "2s",
+            }
+        )
+
+        assert limiter.reserve() == 0.0
+
+    def test_stats_count_requests_and_wait(self) -> None:
+        """Stats report requests made and time spent waiting."""
+        limiter = RateLimiter(requests_per_minute=1000)
+        limiter.record_throttle(retry_after=1.0)
+
+        limiter.reserve()
+        limiter.reserve()
+
+        stats = limiter.stats()
+        assert stats.requests == 2
+        assert stats.total_wait_seconds == pytest.approx(2.0, abs=0.2)
+
+    async def test_acquire_async_sleeps_for_delay(self) -> None:
+        """acquire_async waits on the event loop for the reserved delay."""
+        limiter = RateLimiter(requests_per_minute=1000)
+        limiter.record_throttle(retry_after=1.0)
+
+        with patch("transcribe_cli.core.ratelimit.asyncio.sleep") as mock_sleep:
+            await limiter.acquire_async()
+
+        assert mock_sleep.call_args.args[0] == pytest.approx(1.0, abs=0.1)
+
+
+class TestProcessLimiter:
+    """Tests for the process-wide limiter."""
+
+    def test_get_returns_singleton(self) -> None:
+        """get_rate_limiter returns the same instance."""
+        assert get_rate_limiter() is get_rate_limiter()
+
+    def test_configure_replaces_limiter(self) -> None:
+        """configure_rate_limiter installs a limiter with new limits."""
+        limiter = configure_rate_limiter(
+            requests_per_minute=60, audio_seconds_per_minute=120
+        )
+
+        assert get_rate_limiter() is limiter
+        assert limiter.stats().configured_requests_per_minute == 60
+        assert limiter.stats().audio_seconds_per_minute == 120
+
+
+class TestUploadPacing:
+    """Tests for limiter use on the upload path."""
+
+    def test_upload_reads_headers_and_records_throttle(self, tmp_path: Path) -> None:
+        """Uploads report headers on success and back off on 429."""
+        from openai import RateLimitError
+
+        from transcribe_cli.core.transcriber import _transcribe_audio_file
+
+        audio_file = tmp_path / "test.mp3"
+        audio_file.write_bytes(b"fake audio")
+
+        limited = MagicMock()
+        limited.status_code = 429
+        limited.headers = {"retry-after": "0"}
+        error = RateLimitError("Too many requests", response=limited, body=None)
+
+        raw = MagicMock()
+        raw.headers = {"x-ratelimit-limit-requests": "100"}
+        raw.parse.return_value = MagicMock(
+            model_dump=MagicMock(return_value={"text": "ok"})
+        )
+
+        client = MagicMock()
+        client.audio.transcriptions.with_raw_response.create.side_effect = [error, raw]
+
+        with patch("transcribe_cli.core.transcriber.random.uniform", return_value=0.0):
+            response = _transcribe_audio_file(client, audio_file)
+
+        assert response == {"text": "ok"}
+        stats = get_rate_limiter().stats()
+        assert stats.throttled == 1
+        assert stats.requests == 2
+        assert stats.configured_requests_per_minute == 100
+
+    def test_upload_timeout_is_counted(self, tmp_path: Path) -> None:
+        """A timed-out upload is recorded as a limiter timeout and retried."""
+        from openai import APITimeoutError
+
+        from transcribe_cli.core.transcriber import _transcribe_audio_file
+
+        audio_file = tmp_path / "test.mp3"
+        audio_file.write_bytes(b"fake audio")
+
+        raw = MagicMock()
+        raw.headers = {}
+        raw.parse.return_value = MagicMock(
+            model_dump=MagicMock(return_value={"text": "ok"})
+        )
+
+        client = MagicMock()
+        client.audio.transcriptions.with_raw_response.create.side_effect = [
+            APITimeoutError(request=MagicMock()),
+            raw,
+        ]
+
+        with patch(
+            "transcribe_cli.core.transcriber._connection_backoff", return_value=0.0
+        ):
+            response = _transcribe_audio_file(client, audio_file)
+
+        assert response == {"text": "ok"}
+        assert get_rate_limiter().stats().timeouts == 1
@@ -0,0 +1,115 @@
+"""Unit tests for the streaming directory scanner."""
+
+import os
+import threading
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from transcribe_cli.core.scanner import ScannedFile, iter_media_files
+
+
+class TestIterMediaFiles:
+    """Tests for iter_media_files."""
+
+    def test_yields_metadata(self, tmp_path: Path) -> None:
+        """Entries carry the size and mtime from the scan."""
+        media = tmp_path / "talk.mp3"
+        media.write_bytes(b"x" * 10)
+
+        (entry,) = list(iter_media_files(tmp_path))
+
+        assert entry == ScannedFile(media, 10, media.stat().st_mtime_ns)
+
+    def test_filters_extensions_case_insensitively(self, tmp_path: Path) -> None:
+        """Only supported extensions are yielded."""
+        (tmp_path / "a.MP3").write_bytes(b"a")
+        (tmp_path / "b.mkv").write_bytes(b"b")
+        (tmp_path / "notes.txt").write_text("c")
+        (tmp_path / "dir.mp3").mkdir()
+
+        names = sorted(e.path.name for e in iter_media_files(tmp_path))
+
+        assert names == ["a.MP3", "b.mkv"]
+
+    def test_recursive_walks_nested_directories(self, tmp_path: Path) -> None:
+        """Nested directories are scanned only when recursive."""
+        (tmp_path / "top.mp3").write_bytes(b"a")
+        deep = tmp_path / "a" / "b" / "c"
+        deep.mkdir(parents=True)
+        (deep / "deep.wav").write_bytes(b"b")
+        for i in range(20):
+            sub = tmp_path / f"sub{i}"
+            sub.mkdir()
+            (sub / f"f{i}.mp3").write_bytes(b"c")
+
+        flat = list(iter_media_files(tmp_path))
+        nested = list(iter_media_files(tmp_path, recursive=True, max_workers=4))
+
+        assert [e.path.name for e in flat] == ["top.mp3"]
+        assert len(nested) == 22
+        assert deep / "deep.wav" in {e.path for e in nested}
+
+    @pytest.mark.skipif(not hasattr(os, "symlink"), reason="needs symlinks")
+    def test_does_not_follow_directory_symlinks(self, tmp_path: Path) -> None:
+        """Symlinked directories are not followed (no loops)."""
+        (tmp_path / "a.mp3").write_bytes(b"a")
+        os.symlink(tmp_path, tmp_path / "loop")
+
+        assert len(list(iter_media_files(tmp_path, recursive=True))) == 1
+
+    def test_stops_early(self, tmp_path: Path) -> None:
+        """Closing the generator early does not hang."""
+        for i in range(50):
+            (tmp_path / f"f{i}.mp3").write_bytes(b"a")
+
+        scan = iter_media_files(tmp_path)
+        first = next(scan)
+        scan.close()
+
+        assert first.path.suffix == ".mp3"
+
+    def test_invalid_directory(self, tmp_path: Path) -> None:
+        """Missing directories and files raise like scan_directory."""
+        with pytest.raises(FileNotFoundError):
+            list(iter_media_files(tmp_path / "missing"))
+
+        file_path = tmp_path / "a.mp3"
+        file_path.write_bytes(b"a")
+        with pytest.raises(ValueError):
+            list(iter_media_files(file_path))
+
+
+class TestStreamingBatch:
+    """Tests for processing while the scan is still running."""
+
+    def test_first_file_starts_before_scan_finishes(self, tmp_path: Path) -> None:
+        """Workers pick up files before the producer is exhausted."""
+        from transcribe_cli.core.batch import process_batch
+        from transcribe_cli.core.transcriber import TranscriptionResult
+
+        first, second = tmp_path / "a.mp3", tmp_path / "b.mp3"
+        for f in (first, second):
+            f.write_bytes(b"fake")
+        first_started = threading.Event()
+
+        def slow_scan():
+            yield first
+            # The scan blocks until the first file is being transcribed
+            assert first_started.wait(timeout=5)
+            yield second
+
+        async def transcribe(input_path: Path, **kwargs: object) -> MagicMock:
+            if input_path == first:
+                first_started.set()
+            return MagicMock(spec=TranscriptionResult)
+
+        with patch("transcribe_cli.core.batch.create_async_client", return_value=AsyncMock()):
+            with patch("transcribe_cli.core.batch.transcribe_file_async", side_effect=transcribe):
+                with patch("transcribe_cli.output.save_formatted_transcript"):
+                    summary = process_batch(files=slow_scan(), api_key="sk-test")
+
+        assert summary.total_files == 2
+        assert summary.successful == 2
+        assert summary.total_bytes == 8
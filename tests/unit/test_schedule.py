@@ -0,0 +1,184 @@
+"""Unit tests for batch scheduling policies."""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from transcribe_cli.core.extractor import ExtractionError
+from transcribe_cli.core.schedule import (
+    ASSUMED_BYTES_PER_SECOND,
+    order_files,
+    probe_durations,
+    probe_durations_async,
+)
+from transcribe_cli.core.scanner import ScannedFile
+
+
+def _entry(path: str, size: int = 0, mtime_ns: int = 0) -> ScannedFile:
+    return ScannedFile(Path(path), size, mtime_ns)
+
+
+class TestOrderFiles:
+    """Tests for order_files."""
+
+    def test_scan_keeps_arrival_order(self) -> None:
+        """The default policy dispatches files as found."""
+        entries = [_entry("/m/b.mp3"), _entry("/m/a.mp3")]
+
+        assert order_files(entries, "scan") == entries
+
+    def test_largest_first(self) -> None:
+        """largest orders by size, descending."""
+        entries = [_entry("/m/a.mp3", 10), _entry("/m/b.mp3", 30), _entry("/m/c.mp3", 20)]
+
+        ordered = order_files(entries, "largest")
+
+        assert [e.size for e in ordered] == [30, 20, 10]
+
+    def test_newest_first(self) -> None:
+        """newest orders by modification time, descending."""
+        entries = [_entry("/m/old.mp3", mtime_ns=1), _entry("/m/new.mp3", mtime_ns=3)]
+
+        ordered = order_files(entries, "newest")
+
+        assert [e.path.name for e in ordered] == ["new.mp3", "old.mp3"]
+
+    def test_longest_and_shortest_use_durations(self) -> None:
+        """Duration policies sort by the probed duration, not size."""
+        short, long = _entry("/m/short.mp3", size=900), _entry("/m/long.mp3", size=100)
+        durations = {short.path: 60.0, long.path: 3600.0}
+
+        assert order_files([short, long], "longest", durations) == [long, short]
+        assert order_files([short, long], "shortest", durations) == [short, long]
+
+    def test_round_robin_interleaves_directories(self) -> None:
+        """round-robin takes one file from each directory in turn."""
+        entries = [
+            _entry("/m/a/1.mp3"),
+            _entry("/m/a/2.mp3"),
+            _entry("/m/a/3.mp3"),
+            _entry("/m/b/1.mp3"),
+            _entry("/m/c/1.mp3"),
+            _entry("/m/c/2.mp3"),
+        ]
+
+        ordered = order_files(entries, "round-robin")
+
+        assert [str(e.path) for e in ordered] == [
+            "/m/a/1.mp3",
+            "/m/b/1.mp3",
+            "/m/c/1.mp3",
+            "/m/a/2.mp3",
+            "/m/c/2.mp3",
+            "/m/a/3.mp3",
+        ]
+
+    def test_unknown_policy_raises(self) -> None:
+        """An unknown policy is rejected."""
+        with pytest.raises(ValueError, match="Unknown schedule"):
+            order_files([], "random")
+
+
+class TestProbeDurations:
+    """Tests for probe_durations."""
+
+    def test_unprobeable_file_estimated_from_size(self) -> None:
+        """A file ffprobe cannot read gets a size-based estimate."""
+        good = _entry("/m/good.mp3", size=1)
+        bad = _entry("/m/bad.mp3", size=ASSUMED_BYTES_PER_SECOND * 30)
+
+        def info(path: Path) -> MagicMock:
+            if path == bad.path:
+                raise ExtractionError("corrupt")
+            return MagicMock(duration=120.0)
+
+        with patch("transcribe_cli.core.schedule.get_media_info", side_effect=info):
+            durations = probe_durations([good, bad])
+
+        assert durations == {good.path: 120.0, bad.path: 30.0}
+
+    async def test_async_probes_are_bounded(self) -> None:
+        """Async probes run at most max_concurrency ffprobes at once."""
+        entries = [_entry(f"/m/{i}.mp3", size=ASSUMED_BYTES_PER_SECOND) for i in range(10)]
+        active = 0
+        peak = 0
+
+        async def info(path: Path) -> MagicMock:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            if path == entries[0].path:
+                raise ExtractionError("corrupt")
+            return MagicMock(duration=5.0)
+
+        with patch("transcribe_cli.core.schedule.get_media_info_async", side_effect=info):
+            durations = await probe_durations_async(entries, max_concurrency=3)
+
+        assert peak == 3
+        assert durations[entries[0].path] == 1.0
+        assert durations[entries[1].path] == 5.0
+
+
+class TestScheduledBatch:
+    """Tests for scheduling in process_batch."""
+
+    def test_dispatch_follows_policy(self, tmp_path: Path) -> None:
+        """Files are transcribed in the policy's order."""
+        from transcribe_cli.core.batch import process_batch
+        from transcribe_cli.core.transcriber import TranscriptionResult
+
+        files = []
+        for name, size in (("small.mp3", 1), ("large.mp3", 3), ("medium.mp3", 2)):
+            f = tmp_path / name
+            f.write_bytes(b"x" * size)
+            files.append(f)
+        order: list[str] = []
+
+        async def transcribe(input_path: Path, **kwargs: object) -> MagicMock:
+            order.append(input_path.name)
+            return MagicMock(spec=TranscriptionResult)
+
+        with patch("transcribe_cli.core.batch.create_async_client", return_value=AsyncMock()):
+            with patch("transcribe_cli.core.batch.transcribe_file_async", side_effect=transcribe):
+                with patch("transcribe_cli.output.save_formatted_transcript"):
+                    summary = process_batch(
+                        files=files, concurrency=1, api_key="sk-test", schedule="largest"
+                    )
+
+        assert order == ["large.mp3", "medium.mp3", "small.mp3"]
+        assert summary.successful == 3
+
+    def test_summary_reports_worker_idle_time(self, tmp_path: Path) -> None:
+        """Each worker's idle time is reported; a starved worker idles longest."""
+        import asyncio
+
+        from transcribe_cli.core.batch import process_batch
+        from transcribe_cli.core.transcriber import TranscriptionResult
+
+        media = tmp_path / "audio.mp3"
+        media.write_bytes(b"fake")
+
+        async def transcribe(input_path: Path, **kwargs: object) -> MagicMock:
+            await asyncio.sleep(0.05)
+            return MagicMock(spec=TranscriptionResult)
+
+        with patch("transcribe_cli.core.batch.create_async_client", return_value=AsyncMock()):
+            with patch("transcribe_cli.core.batch.transcribe_file_async", side_effect=transcribe):
+                with patch("transcribe_cli.output.save_formatted_transcript"):
+                    summary = process_batch(files=[media], concurrency=2, api_key="sk-test")
+
+        assert len(summary.worker_idle_seconds) >= 2
+        assert summary.elapsed_seconds >= 0.05
+        assert max(summary.worker_idle_seconds) >= 0.04
+        assert min(summary.worker_idle_seconds) < 0.04
+
+    def test_unknown_schedule_rejected(self) -> None:
+        """process_batch rejects an unknown policy before doing any work."""
+        from transcribe_cli.core.batch import process_batch
+
+        with pytest.raises(ValueError, match="Unknown schedule"):
+            process_batch(files=[], api_key="sk-test", schedule="random")
@@ -0,0 +1,149 @@
+"""Unit tests for managed scratch space."""
+
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from transcribe_cli.core import scratch
+from transcribe_cli.core.scratch import (
+    LEGACY_ORPHAN_AGE_SECONDS,
+    SCRATCH_PREFIX,
+    ScratchSpace,
+    choose_root,
+    configure_scratch,
+    get_scratch_space,
+    sweep_orphans,
+)
+
+
+def _dead_pid() -> int:
+    """PID of a process that has already exited."""
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+
+class TestChooseRoot:
+    """Tests for picking the scratch location."""
+
+    def test_prefers_tmpfs_with_room(self, tmp_path: Path) -> None:
+        """A writable tmpfs with enough free space is used."""
+        shm = tmp_path / "shm"
+        shm.mkdir()
+
+        with patch.object(scratch, "TMPFS_CANDIDATES", (shm,)):
+            assert choose_root(1024) == shm
+
+    def test_falls_back_when_tmpfs_is_small(self, tmp_path: Path) -> None:
+        """tmpfs without room for the budget is skipped."""
+        shm = tmp_path / "shm"
+        shm.mkdir()
+
+        with patch.object(scratch, "TMPFS_CANDIDATES", (shm, tmp_path / "missing")):
+            with patch("transcribe_cli.core.scratch.shutil.disk_usage") as mock_usage:
+                mock_usage.return_value.free = 10
+                root = choose_root(1024)
+
+        assert root == Path(scratch.tempfile.gettempdir())
+
+
+class TestScratchDir:
+    """Tests for per-file scratch directories."""
+
+    def test_directory_is_named_after_process(self, tmp_path: Path) -> None:
+        """Directories are created lazily and carry the owning PID."""
+        directory = ScratchSpace(tmp_path / "root").directory()
+        assert not (tmp_path / "root").exists()
+
+        path = directory.path
+
+        assert path.parent == tmp_path / "root"
+        assert path.name.startswith(f"{SCRATCH_PREFIX}{os.getpid()}_")
+        directory.cleanup()
+        assert not path.exists()
+
+    async def test_reserve_waits_for_budget(self, tmp_path: Path) -> None:
+        """A reservation waits until another directory is cleaned up."""
+        space = ScratchSpace(tmp_path, budget_bytes=100)
+        first, second = space.directory(), space.directory()
+        await first.reserve(80)
+
+        waiting = asyncio.ensure_future(second.reserve(80))
+        await asyncio.sleep(0.01)
+        assert not waiting.done()
+
+        first.cleanup()
+        await asyncio.wait_for(waiting, 1)
+        second.cleanup()
+        assert space.budget is not None
+        assert space.budget.in_use == 0
+
+    async def test_zero_budget_never_waits(self, tmp_path: Path) -> None:
+        """Without a budget, reservations return immediately."""
+        directory = ScratchSpace(tmp_path, budget_bytes=0).directory()
+
+        await directory.reserve(10**12)
+        directory.cleanup()
+
+
+@pytest.mark.skipif(os.name != "posix", reason="PID liveness is POSIX-only")
+class TestSweepOrphans:
+    """Tests for removing directories left by killed runs."""
+
+    def test_removes_only_dead_owners(self, tmp_path: Path) -> None:
+        """Directories of exited processes go; live and own ones stay."""
+        dead = tmp_path / f"{SCRATCH_PREFIX}{_dead_pid()}_abc"
+        live = tmp_path / f"{SCRATCH_PREFIX}{os.getppid()}_abc"
+        own = tmp_path / f"{SCRATCH_PREFIX}{os.getpid()}_abc"
+        unrelated = tmp_path / "other_123_abc"
+        for path in (dead, live, own, unrelated):
+            (path / "chunks").mkdir(parents=True)
+
+        assert sweep_orphans([tmp_path]) == 1
+
+        assert not dead.exists()
+        assert live.exists() and own.exists() and unrelated.exists()
+
+    def test_legacy_directories_removed_when_stale(self, tmp_path: Path) -> None:
+        """Directories without a PID are only removed once old."""
+        fresh = tmp_path / f"{SCRATCH_PREFIX}abc123"
+        stale = tmp_path / f"{SCRATCH_PREFIX}def456"
+        fresh.mkdir()
+        stale.mkdir()
+        old = time.time() - LEGACY_ORPHAN_AGE_SECONDS - 60
+        os.utime(stale, (old, old))
+
+        assert sweep_orphans([tmp_path]) == 1
+
+        assert fresh.exists()
+        assert not stale.exists()
+
+    def test_missing_root_is_ignored(self, tmp_path: Path) -> None:
+        """Roots that do not exist are skipped."""
+        assert sweep_orphans([tmp_path / "missing"]) == 0
+
+
+class TestDefaultSpace:
+    """Tests for the process-wide scratch space."""
+
+    def test_env_var_sets_root(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """TRANSCRIBE_SCRATCH_DIR overrides the automatic location."""
+        monkeypatch.setenv("TRANSCRIBE_SCRATCH_DIR", str(tmp_path / "env"))
+
+        assert get_scratch_space().root == tmp_path / "env"
+        assert configure_scratch(budget_bytes=None).root == tmp_path / "env"
+
+    def test_configure_replaces_space(self, tmp_path: Path) -> None:
+        """configure_scratch sets the root and budget used by later runs."""
+        space = configure_scratch(tmp_path, budget_bytes=None)
+
+        assert get_scratch_space() is space
+        assert space.budget is None
@@ -1,10 +1,11 @@
 """Unit tests for transcription module."""
 
+import os
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from openai import APIConnectionError, RateLimitError
+from openai import RateLimitError
 
 from transcribe_cli.core.transcriber import (
     APIKeyMissingError,
@@ -113,6 +114,29 @@ class TestCreateClient:
             with pytest.raises(APIKeyMissingError):
                 _create_client(None)
 
+    def test_shared_client_uses_sized_pool(self) -> None:
+        """create_client passes an HTTP client with the requested pool size."""
+        from transcribe_cli.core.transcriber import create_client
+
+        with patch("transcribe_cli.core.transcriber.OpenAI") as mock_openai:
+            with patch(
+                "transcribe_cli.core.transcriber.DefaultHttpxClient"
+            ) as mock_http:
+                mock_client = MagicMock()
+                mock_client.api_key = "sk-test"
+                mock_openai.return_value = mock_client
+
+                client = create_client("sk-test", max_connections=7)
+
+                assert client is mock_client
+                limits = mock_http.call_args.kwargs["limits"]
+                assert limits.max_connections == 7
+                assert limits.max_keepalive_connections == 7
+                assert (
+                    mock_openai.call_args.kwargs["http_client"]
+                    is mock_http.return_value
+                )
+
 
 class TestParseSegments:
     """Tests for segment parsing."""
@@ -263,7 +287,9 @@ class TestTranscribeFileWithMocks:
         }
 
         with patch("transcribe_cli.core.transcriber._create_client") as mock_create:
-            with patch("transcribe_cli.core.transcriber._transcribe_audio_file") as mock_transcribe:
+            with patch(
+                "transcribe_cli.core.transcriber._transcribe_audio_file"
+            ) as mock_transcribe:
                 mock_transcribe.return_value = mock_response
                 mock_create.return_value = MagicMock()
 
@@ -273,6 +299,102 @@ class TestTranscribeFileWithMocks:
                 assert result.language == "english"
                 assert len(result.segments) == 2
 
+    def test_transcribe_uses_injected_client(self, tmp_path: Path) -> None:
+        """A shared client is used instead of creating a new one."""
+        from transcribe_cli.core.transcriber import transcribe_file
+
+        audio_file = tmp_path / "test.mp3"
+        audio_file.write_bytes(b"fake audio content")
+        shared = MagicMock()
+
+        with patch("transcribe_cli.core.transcriber._create_client") as mock_create:
+            with patch(
+                "transcribe_cli.core.transcriber._transcribe_audio_file"
+            ) as mock_transcribe:
+                mock_transcribe.return_value = {"text": "Hi", "language": "en"}
+
+                transcribe_file(audio_file, client=shared)
+
+                mock_create.assert_not_called()
+                assert mock_transcribe.call_args.kwargs["client"] is shared
+
+    def test_cache_hit_skips_api(self, tmp_path: Path) -> None:
+        """Second transcription of identical content is served from cache."""
+        from transcribe_cli.core.cache import TranscriptCache
+        from transcribe_cli.core.transcriber import transcribe_file
+
+        first = tmp_path / "first.mp3"
+        copy = tmp_path / "copy.mp3"
+        first.write_bytes(b"identical audio")
+        copy.write_bytes(b"identical audio")
+        cache = TranscriptCache(tmp_path / "cache")
+
+        with patch("transcribe_cli.core.transcriber._create_client") as mock_create:
+            with patch(
+                "transcribe_cli.core.transcriber._transcribe_audio_file"
+            ) as mock_transcribe:
+                mock_create.return_value = MagicMock()
+                mock_transcribe.return_value = {
+                    "text": "Cached words.",
+                    "language": "en",
+                }
+
+                transcribe_file(first, api_key="sk-test", cache=cache)
+                result = transcribe_file(copy, api_key="sk-test", cache=cache)
+
+        assert mock_transcribe.call_count == 1
+        assert mock_create.call_count == 1
+        assert result.text == "Cached words."
+        assert result.input_path == copy.resolve()
+
+    def test_cache_hit_on_unchanged_file_skips_hashing(self, tmp_path: Path) -> None:
+        """A repeat lookup is keyed on path, size and mtime; a touch rehashes."""
+        from transcribe_cli.core.cache import TranscriptCache, hash_file
+        from transcribe_cli.core.transcriber import transcribe_file
+
+        audio_file = tmp_path / "talk.mp3"
+        audio_file.write_bytes(b"audio")
+        cache = TranscriptCache(tmp_path / "cache")
+
+        with patch("transcribe_cli.core.transcriber._create_client"):
+            with patch(
+                "transcribe_cli.core.transcriber._transcribe_audio_file"
+            ) as mock_transcribe:
+                mock_transcribe.return_value = {"text": "Hello", "language": "en"}
+                with patch(
+                    "transcribe_cli.core.transcriber.hash_file", side_effect=hash_file
+                ) as mock_hash:
+                    transcribe_file(audio_file, cache=cache)
+                    transcribe_file(audio_file, cache=cache)
+                    assert mock_hash.call_count == 1
+
+                    os.utime(audio_file, ns=(0, 0))
+                    result = transcribe_file(audio_file, cache=cache)
+                    assert mock_hash.call_count == 2
+
+        assert mock_transcribe.call_count == 1
+        assert result.text == "Hello"
+
+    def test_cache_key_includes_language(self, tmp_path: Path) -> None:
+        """A different language is a cache miss."""
+        from transcribe_cli.core.cache import TranscriptCache
+        from transcribe_cli.core.transcriber import transcribe_file
+
+        audio_file = tmp_path / "test.mp3"
+        audio_file.write_bytes(b"audio")
+        cache = TranscriptCache(tmp_path / "cache")
+
+        with patch("transcribe_cli.core.transcriber._create_client"):
+            with patch(
+                "transcribe_cli.core.transcriber._transcribe_audio_file"
+            ) as mock_transcribe:
+                mock_transcribe.return_value = {"text": "Hola", "language": "es"}
+
+                transcribe_file(audio_file, language="es", cache=cache)
+                transcribe_file(audio_file, language="en", cache=cache)
+
+        assert mock_transcribe.call_count == 2
+
     def test_transcribe_file_not_found(self, tmp_path: Path) -> None:
         """Non-existent file raises FileNotFoundError."""
         from transcribe_cli.core.transcriber import transcribe_file
@@ -288,7 +410,9 @@ class TestTranscribeFileWithMocks:
         audio_file.write_bytes(b"fake audio")
 
         with patch("transcribe_cli.core.transcriber._create_client") as mock_create:
-            with patch("transcribe_cli.core.transcriber._transcribe_audio_file") as mock_transcribe:
+            with patch(
+                "transcribe_cli.core.transcriber._transcribe_audio_file"
+            ) as mock_transcribe:
                 mock_create.return_value = MagicMock()
                 # Create a proper RateLimitError mock
                 mock_response = MagicMock()
@@ -303,3 +427,293 @@ class TestTranscribeFileWithMocks:
                     transcribe_file(audio_file, api_key="sk-test")
 
                 assert "rate limit" in str(exc_info.value).lower()
+
+    def test_transcribe_large_file_is_chunked(self, tmp_path: Path) -> None:
+        """Audio over the API limit is split and merged into one result."""
+        from transcribe_cli.core.chunker import AudioChunk
+        from transcribe_cli.core.extractor import MediaInfo
+        from transcribe_cli.core.transcriber import MAX_FILE_SIZE_BYTES, transcribe_file
+
+        audio_file = tmp_path / "long.mp3"
+        audio_file.write_bytes(b"x" * (MAX_FILE_SIZE_BYTES + 1))
+
+        chunk_paths = []
+        for i in range(2):
+            chunk_path = tmp_path / f"chunk{i}.mp3"
+            chunk_path.write_bytes(b"chunk")
+            chunk_paths.append(chunk_path)
+        chunks = [
+            AudioChunk(index=0, path=chunk_paths[0], start=0.0, duration=600.0),
+            AudioChunk(index=1, path=chunk_paths[1], start=600.0, duration=120.0),
+        ]
+        responses = {
+            chunk_paths[0]: {
+                "text": "First part.",
+                "language": "english",
+                "segments": [
+                    {"id": 0, "start": 0.0, "end": 5.0, "text": "First part."}
+                ],
+            },
+            chunk_paths[1]: {
+                "text": "Second part.",
+                "language": "english",
+                "segments": [
+                    {"id": 0, "start": 1.0, "end": 3.0, "text": "Second part."}
+                ],
+            },
+        }
+
+        # Too long to fit even when re-encoded for speech
+        info = MediaInfo(audio_file, "mp3", 20000.0, False, True, "mp3", 2, 44100)
+
+        with patch("transcribe_cli.core.transcriber._create_client") as mock_create:
+            with patch(
+                "transcribe_cli.core.transcriber.get_media_info", return_value=info
+            ):
+                with patch(
+                    "transcribe_cli.core.transcriber.split_audio", return_value=chunks
+                ) as mock_split:
+                    with patch(
+                        "transcribe_cli.core.transcriber._transcribe_audio_file"
+                    ) as mock_transcribe:
+                        mock_create.return_value = MagicMock()
+                        mock_transcribe.side_effect = (
+                            lambda client, audio, language, **kwargs: responses[audio]
+                        )
+
+                        result = transcribe_file(
+                            audio_file, api_key="sk-test", chunk_size_minutes=10
+                        )
+
+        assert mock_split.call_args.kwargs["chunk_seconds"] == 600
+        assert result.text == "First part. Second part."
+        assert [s.start for s in result.segments] == [0.0, 601.0]
+        assert result.duration == 720.0
+
+    def test_video_audio_uploaded_from_buffer(self, tmp_path: Path) -> None:
+        """Video audio is piped into a buffer and uploaded without a scratch file."""
+        import io
+
+        from transcribe_cli.core.extractor import AudioBuffer, MediaInfo
+        from transcribe_cli.core.transcriber import transcribe_file
+
+        video = tmp_path / "talk.mp4"
+        video.write_bytes(b"fake video")
+        info = MediaInfo(video, "mp4", 60.0, True, True, "aac", 2, 48000)
+        buffer = AudioBuffer(video, "talk.mp3", io.BytesIO(b"audio"), 5, 60.0, "mp3")
+
+        with patch("transcribe_cli.core.transcriber.get_media_info", return_value=info):
+            with patch(
+                "transcribe_cli.core.transcriber.extract_audio_to_buffer",
+                return_value=buffer,
+            ):
+                with patch(
+                    "transcribe_cli.core.scratch.tempfile.mkdtemp"
+                ) as mock_mkdtemp:
+                    with patch(
+                        "transcribe_cli.core.transcriber._transcribe_audio_file",
+                        return_value={"text": "Hi."},
+                    ) as mock_transcribe:
+                        result = transcribe_file(video, client=MagicMock())
+
+        assert result.text == "Hi."
+        assert mock_transcribe.call_args.kwargs["audio"] is buffer
+        assert mock_transcribe.call_args.kwargs["audio_seconds"] == 60.0
+        mock_mkdtemp.assert_not_called()
+        assert buffer.file.closed
+
+    def test_compatible_video_audio_is_remuxed(self, tmp_path: Path) -> None:
+        """AAC audio in a video is stream-copied instead of re-encoded."""
+        import io
+
+        from transcribe_cli.core.extractor import AudioBuffer, MediaInfo
+        from transcribe_cli.core.transcriber import transcribe_file
+
+        video = tmp_path / "talk.mp4"
+        video.write_bytes(b"fake video")
+        info = MediaInfo(
+            video, "mp4", 60.0, True, True, "aac", 2, 48000, audio_bitrate=128000
+        )
+        buffer = AudioBuffer(
+            video, "talk.m4a", io.BytesIO(b"aac"), 3, 60.0, "m4a", "remux"
+        )
+
+        with patch("transcribe_cli.core.transcriber.get_media_info", return_value=info):
+            with patch(
+                "transcribe_cli.core.transcriber.extract_audio_to_buffer",
+                return_value=buffer,
+            ) as mock_extract:
+                with patch(
+                    "transcribe_cli.core.transcriber._transcribe_audio_file",
+                    return_value={"text": "Hi."},
+                ) as mock_transcribe:
+                    transcribe_file(video, client=MagicMock())
+
+        assert mock_extract.call_count == 1
+        assert mock_extract.call_args.kwargs["profile"].is_copy
+        assert mock_transcribe.call_args.kwargs["audio"] is buffer
+
+    def test_incompatible_video_audio_is_transcoded(self, tmp_path: Path) -> None:
+        """Audio the API cannot take as-is is re-encoded with the profile."""
+        import io
+
+        from transcribe_cli.core.extractor import AudioBuffer, MediaInfo
+        from transcribe_cli.core.transcriber import transcribe_file
+
+        video = tmp_path / "old.avi"
+        video.write_bytes(b"fake video")
+        info = MediaInfo(video, "avi", 60.0, True, True, "pcm_s16le", 2, 48000)
+        buffer = AudioBuffer(video, "old.mp3", io.BytesIO(b"mp3"), 3, 60.0, "mp3")
+
+        with patch("transcribe_cli.core.transcriber.get_media_info", return_value=info):
+            with patch(
+                "transcribe_cli.core.transcriber.extract_audio_to_buffer",
+                return_value=buffer,
+            ) as mock_extract:
+                with patch(
+                    "transcribe_cli.core.transcriber._transcribe_audio_file",
+                    return_value={"text": "Hi."},
+                ):
+                    transcribe_file(video, client=MagicMock(), stream_copy=True)
+
+        assert mock_extract.call_args.kwargs["profile"].name == "speech-mp3"
+
+    def test_long_video_split_from_source(self, tmp_path: Path) -> None:
+        """Video too long for one upload is chunked without a full extraction."""
+        from transcribe_cli.core.chunker import AudioChunk
+        from transcribe_cli.core.extractor import MediaInfo
+        from transcribe_cli.core.transcriber import transcribe_file
+
+        video = tmp_path / "lecture.mkv"
+        video.write_bytes(b"fake video")
+        info = MediaInfo(
+            video, "matroska", 7200.0, True, True, "aac", 2, 48000, audio_bitrate=128000
+        )
+        chunk_path = tmp_path / "lecture.chunk0000.mp3"
+        chunk_path.write_bytes(b"chunk")
+        chunks = [AudioChunk(index=0, path=chunk_path, start=0.0, duration=7200.0)]
+
+        with patch("transcribe_cli.core.transcriber.get_media_info", return_value=info):
+            with patch(
+                "transcribe_cli.core.transcriber.extract_audio_to_buffer"
+            ) as mock_extract:
+                with patch(
+                    "transcribe_cli.core.transcriber.split_audio", return_value=chunks
+                ) as mock_split:
+                    with patch(
+                        "transcribe_cli.core.transcriber._transcribe_audio_file",
+                        return_value={"text": "Long."},
+                    ):
+                        result = transcribe_file(video, client=MagicMock())
+
+        mock_extract.assert_not_called()
+        assert mock_split.call_args.kwargs["input_path"] == video.resolve()
+        assert mock_split.call_args.kwargs["duration"] == 7200.0
+        assert result.text == "Long."
+
+    def test_oversized_audio_reencoded_to_fit(self, tmp_path: Path) -> None:
+        """Audio over the limit is re-encoded into one upload when it fits."""
+        import io
+
+        from transcribe_cli.core.extractor import AudioBuffer, MediaInfo
+        from transcribe_cli.core.transcriber import MAX_FILE_SIZE_BYTES, transcribe_file
+
+        audio_file = tmp_path / "interview.wav"
+        audio_file.write_bytes(b"x" * (MAX_FILE_SIZE_BYTES + 1))
+        info = MediaInfo(audio_file, "wav", 3600.0, False, True, "pcm_s16le", 2, 44100)
+        buffer = AudioBuffer(
+            audio_file, "interview.mp3", io.BytesIO(b"a"), 1, 3600.0, "mp3"
+        )
+
+        with patch("transcribe_cli.core.transcriber.get_media_info", return_value=info):
+            with patch(
+                "transcribe_cli.core.transcriber.extract_audio_to_buffer",
+                return_value=buffer,
+            ) as mock_extract:
+                with patch("transcribe_cli.core.transcriber.split_audio") as mock_split:
+                    with patch(
+                        "transcribe_cli.core.transcriber._transcribe_audio_file",
+                        return_value={"text": "One pass."},
+                    ):
+                        result = transcribe_file(
+                            audio_file, client=MagicMock(), encoding_profile="fit"
+                        )
+
+        profile = mock_extract.call_args.kwargs["profile"]
+        assert profile.name == "fit"
+        assert profile.bitrate == "48k"
+        mock_split.assert_not_called()
+        assert result.text == "One pass."
+
+    def test_unknown_profile_raises(self, tmp_path: Path) -> None:
+        """An unknown encoding profile is rejected up front."""
+        from transcribe_cli.core.transcriber import transcribe_file
+
+        audio_file = tmp_path / "test.mp3"
+        audio_file.write_bytes(b"fake audio")
+
+        with pytest.raises(ValueError, match="Unknown encoding profile"):
+            transcribe_file(audio_file, client=MagicMock(), encoding_profile="flac-hq")
+
+
+class TestTranscribeFileAsync:
+    """Tests for the AsyncOpenAI transcription path."""
+
+    async def test_transcribe_audio_file_async(self, tmp_path: Path) -> None:
+        """Audio file is uploaded from memory on the async client."""
+        from transcribe_cli.core.transcriber import transcribe_file_async
+
+        audio_file = tmp_path / "test.mp3"
+        audio_file.write_bytes(b"fake audio content")
+
+        response = MagicMock()
+        response.model_dump.return_value = {
+            "text": "Async text.",
+            "language": "english",
+            "duration": 2.0,
+            "segments": [{"id": 0, "start": 0.0, "end": 2.0, "text": " Async text."}],
+        }
+        raw = MagicMock()
+        raw.headers = {}
+        raw.parse.return_value = response
+        client = MagicMock()
+        client.audio.transcriptions.with_raw_response.create = AsyncMock(
+            return_value=raw
+        )
+
+        result = await transcribe_file_async(audio_file, client=client, language="en")
+
+        assert result.text == "Async text."
+        assert result.segments[0].text == "Async text."
+        kwargs = client.audio.transcriptions.with_raw_response.create.call_args.kwargs
+        assert kwargs["file"] == ("test.mp3", b"fake audio content")
+        assert kwargs["language"] == "en"
+
+    async def test_async_api_error_raises_transcription_error(
+        self, tmp_path: Path
+    ) -> None:
+        """API status errors are converted to TranscriptionError."""
+        from openai import APIStatusError
+
+        from transcribe_cli.core.transcriber import transcribe_file_async
+
+        audio_file = tmp_path / "test.mp3"
+        audio_file.write_bytes(b"fake audio")
+
+        mock_response = MagicMock()
+        mock_response.status_code = 400
+        error = APIStatusError("Bad request", response=mock_response, body=None)
+
+        with patch(
+            "transcribe_cli.core.transcriber._transcribe_audio_file_async",
+            AsyncMock(side_effect=error),
+        ):
+            with pytest.raises(TranscriptionError, match="API error"):
+                await transcribe_file_async(audio_file, client=MagicMock())
+
+    async def test_async_missing_file_raises(self, tmp_path: Path) -> None:
+        """Non-existent file raises FileNotFoundError."""
+        from transcribe_cli.core.transcriber import transcribe_file_async
+
+        with pytest.raises(FileNotFoundError):
+            await transcribe_file_async(tmp_path / "missing.mp3", client=MagicMock())
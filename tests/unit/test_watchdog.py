@@ -0,0 +1,237 @@
+"""Unit tests for the FFmpeg job watchdog."""
+
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import ffmpeg
+import pytest
+
+from transcribe_cli.core.watchdog import (
+    NO_PROGRESS,
+    PROGRESS_ARGS,
+    WALL_CLOCK,
+    JobTimeouts,
+    ProgressWatch,
+    ffmpeg_command,
+    run_watched,
+    run_watched_async,
+)
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="uses shell scripts as fake binaries"
+)
+
+
+def _fake_ffmpeg(tmp_path: Path, body: str) -> str:
+    path = tmp_path / "ffmpeg"
+    path.write_text(f"#!/bin/sh\n{body}\n")
+    path.chmod(0o755)
+    return str(path)
+
+
+def _stream() -> "ffmpeg.nodes.OutputStream":
+    return ffmpeg.input("in.mkv").output("pipe:1", format="mp3")
+
+
+def _alive(pid: int) -> bool:
+    """Whether a process exists and is not a zombie."""
+    try:
+        stat = Path(f"/proc/{pid}/stat").read_text()
+    except OSError:
+        return False
+    return stat.rsplit(")", 1)[1].split()[0] != "Z"
+
+
+# Emits progress once, then hangs without advancing
+STALLED = 'echo "out_time_us=1000" >&2; echo "progress=continue" >&2; exec sleep 30'
+
+
+class TestProgressWatch:
+    """Tests for progress parsing and limits."""
+
+    def test_progress_lines_are_not_messages(self) -> None:
+        """key=value progress lines are consumed; other stderr is kept."""
+        watch = ProgressWatch()
+
+        assert watch.feed("out_time_us=1500000") is True
+        assert watch.feed("speed=1.5x") is True
+        assert watch.feed("Invalid data found when processing input") is False
+
+    def test_only_advancing_counters_count_as_progress(self) -> None:
+        """Repeated or unknown positions do not reset the stall clock."""
+        watch = ProgressWatch()
+        watch.feed("out_time_us=100")
+        first = watch.last_progress
+
+        watch.feed("out_time_us=100")
+        watch.feed("out_time_us=N/A")
+        watch.feed("speed=2x")
+        assert watch.last_progress == first
+
+        watch.feed("total_size=4096")
+        assert watch.last_progress > first
+
+    def test_expiry_reasons(self) -> None:
+        """The wall-clock limit wins over the stall limit."""
+        watch = ProgressWatch(JobTimeouts(wall_seconds=10, stall_seconds=5))
+        assert watch.expired() is None
+
+        watch.last_progress -= 6
+        assert watch.expired() == NO_PROGRESS
+
+        watch.started -= 11
+        assert watch.expired() == WALL_CLOCK
+
+    def test_zero_disables_limits(self) -> None:
+        """0 (or None) turns a limit off."""
+        watch = ProgressWatch(JobTimeouts(wall_seconds=0, stall_seconds=None))
+        watch.started -= 10_000
+        watch.last_progress -= 10_000
+
+        assert watch.expired() is None
+
+    def test_command_reports_progress(self) -> None:
+        """The compiled command asks FFmpeg for -progress on stderr."""
+        with patch("transcribe_cli.core.watchdog.find_ffmpeg", return_value="/opt/ffmpeg"):
+            args = ffmpeg_command(_stream())
+
+        assert args[0] == "/opt/ffmpeg"
+        assert tuple(args[1:4]) == PROGRESS_ARGS
+        assert "pipe:1" in args
+
+
+@patch("transcribe_cli.core.watchdog.WATCHDOG_INTERVAL_SECONDS", 0.05)
+class TestRunWatched:
+    """Tests for running jobs under the watchdog."""
+
+    def test_stalled_job_is_killed(self, tmp_path: Path) -> None:
+        """A job whose progress stops is killed with a no-progress outcome."""
+        binary = _fake_ffmpeg(tmp_path, STALLED)
+
+        with patch("transcribe_cli.core.watchdog.find_ffmpeg", return_value=binary):
+            outcome = run_watched(_stream(), timeouts=JobTimeouts(stall_seconds=0.3))
+
+        assert outcome.timeout == NO_PROGRESS
+        assert outcome.returncode != 0
+
+    async def test_wall_clock_limit_applies_while_progressing(self, tmp_path: Path) -> None:
+        """A job that keeps advancing is still killed at the wall-clock limit."""
+        binary = _fake_ffmpeg(
+            tmp_path,
+            'i=0; while true; do i=$((i+1)); echo "out_time_us=$i" >&2; sleep 0.05; done',
+        )
+
+        with patch("transcribe_cli.core.watchdog.find_ffmpeg", return_value=binary):
+            outcome = await run_watched_async(
+                _stream(), timeouts=JobTimeouts(wall_seconds=0.3, stall_seconds=5)
+            )
+
+        assert outcome.timeout == WALL_CLOCK
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads /proc")
+    async def test_timeout_kills_process_group(self, tmp_path: Path) -> None:
+        """Children started by the job die with it."""
+        pid_file = tmp_path / "child.pid"
+        binary = _fake_ffmpeg(
+            tmp_path, f'sleep 30 & echo $! > {pid_file}; echo "out_time_us=1" >&2; wait'
+        )
+
+        with patch("transcribe_cli.core.watchdog.find_ffmpeg", return_value=binary):
+            outcome = await run_watched_async(
+                _stream(), timeouts=JobTimeouts(stall_seconds=0.3)
+            )
+
+        assert outcome.timeout == NO_PROGRESS
+        assert not _alive(int(pid_file.read_text()))
+
+    async def test_finished_job_keeps_messages_and_output(self, tmp_path: Path) -> None:
+        """A healthy job returns its stdout and non-progress stderr."""
+        import io
+
+        binary = _fake_ffmpeg(
+            tmp_path,
+            'echo "out_time_us=1" >&2; echo "Guessed channel layout" >&2; '
+            'printf audio; echo "progress=end" >&2',
+        )
+        output = io.BytesIO()
+
+        with patch("transcribe_cli.core.watchdog.find_ffmpeg", return_value=binary):
+            outcome = await run_watched_async(_stream(), output=output)
+
+        assert outcome.timeout is None
+        assert outcome.returncode == 0
+        assert outcome.stderr == "Guessed channel layout"
+        assert output.getvalue() == b"audio"
+        assert outcome.output_bytes == 5
+
+
+@patch("transcribe_cli.core.watchdog.WATCHDOG_INTERVAL_SECONDS", 0.05)
+class TestExtractionTimeouts:
+    """Tests for timeouts surfaced by extraction and batch runs."""
+
+    def test_extract_audio_removes_partial_output(self, tmp_path: Path) -> None:
+        """A timed-out extraction raises and leaves no partial file."""
+        from transcribe_cli.core.extractor import (
+            ExtractionTimeoutError,
+            MediaInfo,
+            extract_audio,
+        )
+
+        video = tmp_path / "clip.mkv"
+        video.write_bytes(b"fake video")
+        target = tmp_path / "clip.mp3"
+        binary = _fake_ffmpeg(tmp_path, f"printf partial > {target}; {STALLED}")
+        info = MediaInfo(video, "matroska", 60.0, True, True, "opus", 2, 48000)
+
+        with patch("transcribe_cli.core.extractor.validate_ffmpeg"):
+            with patch("transcribe_cli.core.extractor.get_media_info", return_value=info):
+                with patch("transcribe_cli.core.watchdog.find_ffmpeg", return_value=binary):
+                    with pytest.raises(ExtractionTimeoutError, match="no progress") as exc:
+                        extract_audio(
+                            video, output_path=target, timeouts=JobTimeouts(stall_seconds=0.3)
+                        )
+
+        assert exc.value.reason == NO_PROGRESS
+        assert not target.exists()
+
+    def test_batch_records_timeout_and_continues(self, tmp_path: Path) -> None:
+        """A hung file is marked timed out without holding up the others."""
+        from transcribe_cli.core.batch import process_batch
+        from transcribe_cli.core.extractor import MediaInfo
+
+        files = []
+        for name in ("hung.mkv", "ok.mp3"):
+            path = tmp_path / name
+            path.write_bytes(b"media")
+            files.append(path)
+        binary = _fake_ffmpeg(tmp_path, STALLED)
+        info = MediaInfo(files[0], "matroska", 60.0, True, True, "pcm_s16le", 2, 48000)
+
+        with patch("transcribe_cli.core.batch.create_async_client", return_value=AsyncMock()):
+            with patch(
+                "transcribe_cli.core.transcriber.get_media_info_async",
+                AsyncMock(return_value=info),
+            ):
+                with patch("transcribe_cli.core.extractor.validate_ffmpeg"):
+                    with patch("transcribe_cli.core.watchdog.find_ffmpeg", return_value=binary):
+                        with patch(
+                            "transcribe_cli.core.transcriber._transcribe_or_raise_async",
+                            AsyncMock(return_value={"text": "hi"}),
+                        ):
+                            with patch("transcribe_cli.output.save_formatted_transcript"):
+                                summary = process_batch(
+                                    files=files,
+                                    api_key="sk-test",
+                                    extract_jobs=1,
+                                    extract_timeouts=JobTimeouts(stall_seconds=0.3),
+                                )
+
+        assert summary.successful == 1
+        assert summary.failed == 1
+        assert summary.extraction_timeouts == 1
+        hung = next(r for r in summary.results if not r.success)
+        assert hung.input_path.name == "hung.mkv"
+        assert hung.timed_out is True
+        extract = next(stage for stage in summary.stages if stage.name == "extract")
+        assert extract.peak_active == 1
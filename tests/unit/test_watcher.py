@@ -0,0 +1,157 @@
+"""Unit tests for the directory watcher."""
+
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from transcribe_cli.core.scanner import ScannedFile
+from transcribe_cli.core.watcher import (
+    INOTIFY,
+    POLLING,
+    MediaWatcher,
+    inotify_available,
+)
+
+BACKENDS = [
+    POLLING,
+    pytest.param(
+        INOTIFY,
+        marks=pytest.mark.skipif(not inotify_available(), reason="needs inotify"),
+    ),
+]
+
+
+class _Collector:
+    """Iterates a watcher on a thread and records what it yields."""
+
+    def __init__(self, watcher: MediaWatcher) -> None:
+        self.watcher = watcher
+        self.found: list[ScannedFile] = []
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        for entry in self.watcher:
+            self.found.append(entry)
+
+    def wait_for(self, condition: Callable[[], bool], timeout: float = 5.0) -> bool:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if condition():
+                return True
+            time.sleep(0.02)
+        return False
+
+    def names(self) -> list[str]:
+        return [entry.path.name for entry in self.found]
+
+    def stop(self) -> None:
+        self.watcher.stop()
+        self._thread.join(timeout=5)
+        assert not self._thread.is_alive()
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+class TestMediaWatcher:
+    """Tests shared by the inotify and polling backends."""
+
+    def test_existing_files_are_picked_up(self, tmp_path: Path, backend: str) -> None:
+        """Media already in the directory is yielded at startup."""
+        (tmp_path / "old.mp3").write_bytes(b"audio")
+        (tmp_path / "notes.txt").write_text("not media")
+
+        collector = _Collector(
+            MediaWatcher(tmp_path, settle_seconds=0.1, poll_seconds=0.1, backend=backend)
+        )
+        try:
+            assert collector.wait_for(lambda: collector.found)
+        finally:
+            collector.stop()
+
+        assert collector.names() == ["old.mp3"]
+        assert collector.found[0].size == 5
+
+    def test_file_waits_until_writes_stop(self, tmp_path: Path, backend: str) -> None:
+        """A file still being written is only yielded once it is complete."""
+        collector = _Collector(
+            MediaWatcher(tmp_path, settle_seconds=0.3, poll_seconds=0.05, backend=backend)
+        )
+        try:
+            with open(tmp_path / "new.mp4", "wb") as f:
+                for _ in range(5):
+                    f.write(b"x" * 100)
+                    f.flush()
+                    time.sleep(0.1)
+                    assert collector.found == []
+            assert collector.wait_for(lambda: collector.found)
+        finally:
+            collector.stop()
+
+        assert [(e.path.name, e.size) for e in collector.found] == [("new.mp4", 500)]
+
+    def test_new_subdirectories_when_recursive(self, tmp_path: Path, backend: str) -> None:
+        """Files in directories created after startup are found."""
+        collector = _Collector(
+            MediaWatcher(
+                tmp_path,
+                recursive=True,
+                settle_seconds=0.1,
+                poll_seconds=0.05,
+                backend=backend,
+            )
+        )
+        try:
+            time.sleep(0.1)
+            (tmp_path / "day1" / "morning").mkdir(parents=True)
+            (tmp_path / "day1" / "morning" / "call.wav").write_bytes(b"audio")
+            assert collector.wait_for(lambda: collector.found)
+        finally:
+            collector.stop()
+
+        assert collector.names() == ["call.wav"]
+
+    def test_empty_and_unchanged_files_are_not_repeated(
+        self, tmp_path: Path, backend: str
+    ) -> None:
+        """Placeholders wait for content; settled files are yielded once."""
+        (tmp_path / "a.mp3").write_bytes(b"audio")
+        placeholder = tmp_path / "b.mp3"
+        placeholder.touch()
+
+        collector = _Collector(
+            MediaWatcher(tmp_path, settle_seconds=0.1, poll_seconds=0.05, backend=backend)
+        )
+        try:
+            assert collector.wait_for(lambda: collector.found)
+            time.sleep(0.3)
+            assert collector.names() == ["a.mp3"]
+
+            placeholder.write_bytes(b"filled")
+            assert collector.wait_for(lambda: len(collector.found) == 2)
+        finally:
+            collector.stop()
+
+        assert collector.names() == ["a.mp3", "b.mp3"]
+
+
+class TestBackendSelection:
+    """Tests for choosing the watch backend."""
+
+    def test_unknown_backend(self, tmp_path: Path) -> None:
+        """An unknown backend is rejected."""
+        with pytest.raises(ValueError, match="Unknown watch backend"):
+            MediaWatcher(tmp_path, backend="fanotify")
+
+    def test_default_prefers_inotify(self, tmp_path: Path) -> None:
+        """inotify is used where available, polling otherwise."""
+        expected = INOTIFY if inotify_available() else POLLING
+
+        assert MediaWatcher(tmp_path).backend == expected
+
+    def test_missing_directory(self, tmp_path: Path) -> None:
+        """Watching a directory that does not exist fails up front."""
+        with pytest.raises(FileNotFoundError):
+            MediaWatcher(tmp_path / "missing")